@@ -1,6 +1,10 @@
 # podcast_outreach/api/dependencies.py
 
+import os
+import asyncio
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Optional, Any
 from fastapi import Request, HTTPException, Depends
 from passlib.context import CryptContext
@@ -20,6 +24,47 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 def hash_password(password: str) -> str:
     return pwd_context.hash(password)
 
+# bcrypt takes ~100-300 ms per call and releases the GIL, so request handlers run it
+# on a small dedicated thread pool instead of the event loop. Admission is capped so a
+# login burst queues a bounded number of hashes and sheds the rest with a 429.
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", "2"))
+PASSWORD_HASH_MAX_PENDING = int(os.getenv("PASSWORD_HASH_MAX_PENDING", "32"))
+
+_password_executor = ThreadPoolExecutor(
+    max_workers=max(1, PASSWORD_HASH_WORKERS), thread_name_prefix="password-hash"
+)
+_password_pending = 0
+_password_pending_lock = threading.Lock()
+
+async def _run_password_job(func, *args):
+    global _password_pending
+    with _password_pending_lock:
+        if _password_pending >= PASSWORD_HASH_MAX_PENDING:
+            logger.warning(f"Password hashing queue full ({_password_pending} pending); rejecting request.")
+            raise HTTPException(
+                status_code=429,
+                detail="Too many login attempts right now. Please try again in a moment.",
+                headers={"Retry-After": "2"},
+            )
+        _password_pending += 1
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_password_executor, func, *args)
+    finally:
+        with _password_pending_lock:
+            _password_pending -= 1
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Non-blocking verify_password for use inside request handlers."""
+    return await _run_password_job(verify_password, plain_password, hashed_password)
+
+async def hash_password_async(password: str) -> str:
+    """Non-blocking hash_password for use inside request handlers."""
+    return await _run_password_job(hash_password, password)
+
+def shutdown_password_executor() -> None:
+    _password_executor.shutdown(wait=False)
+
 # --- Authentication Logic ---
 async def authenticate_user_details(email: str, password: str) -> Optional[Dict[str, Any]]:
     """
@@ -40,7 +85,7 @@ async def authenticate_user_details(email: str, password: str) -> Optional[Dict[
         logger.warning(f"Authentication failed: User with email '{email}' does not have a password hash set.")
         return None
 
-    if not verify_password(password, stored_password_hash):
+    if not await verify_password_async(password, stored_password_hash):
         logger.debug(f"Authentication failed: Invalid password for user with email '{email}'.")
         return None
 
@@ -26,7 +26,7 @@ async def get_verified_user(
         )
     
     # Check email verification status
-    verification_status = await email_verification_queries.get_verification_status(person_id)
+    verification_status = await email_verification_queries.get_verification_status_cached(person_id)
     
     if not verification_status.get("email_verified", False):
         raise HTTPException(
@@ -51,7 +51,7 @@ async def get_user_with_verification_status(
     
     if person_id:
         # Get verification status
-        verification_status = await email_verification_queries.get_verification_status(person_id)
+        verification_status = await email_verification_queries.get_verification_status_cached(person_id)
         current_user["email_verified"] = verification_status.get("email_verified", False)
         current_user["email_verified_at"] = verification_status.get("email_verified_at")
     else:
@@ -93,7 +93,7 @@ def require_email_verification(feature_name: Optional[str] = None):
                 )
             
             # Check email verification
-            verification_status = await email_verification_queries.get_verification_status(person_id)
+            verification_status = await email_verification_queries.get_verification_status_cached(person_id)
             
             if not verification_status.get("email_verified", False):
                 feature_msg = f" to use {feature_name}" if feature_name else ""
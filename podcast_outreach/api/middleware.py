@@ -7,6 +7,7 @@ from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import RedirectResponse
 
 from podcast_outreach.logging_config import get_logger
+from podcast_outreach.database.connection import use_read_your_writes_key
 
 logger = get_logger(__name__)
 
@@ -88,4 +89,24 @@ class AuthMiddleware(BaseHTTPMiddleware):
         # The dependencies in routers are the primary gatekeepers for roles.
 
         logger.debug(f"Path {path} is not public. Proceeding to next handler/endpoint dependencies.")
-        return await call_next(request)
\ No newline at end of file
+        return await call_next(request)
+
+class ReadYourWritesMiddleware:
+    """
+    Scopes replica read-your-writes to the logged-in person: after they write,
+    their own reads go to the primary for a few seconds while everyone else's
+    stay on the replicas. Must sit inside SessionMiddleware (added before it)
+    so scope["session"] is populated. Plain ASGI, so the context it sets reaches
+    the endpoint.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        person_id = (scope.get("session") or {}).get("person_id")
+        with use_read_your_writes_key(person_id):
+            await self.app(scope, receive, send)
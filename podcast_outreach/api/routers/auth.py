@@ -8,7 +8,6 @@ import secrets
 import asyncio
 from datetime import datetime, timedelta, timezone
 import logging
-import bcrypt
 
 logger = logging.getLogger(__name__)
 
@@ -16,7 +15,7 @@ logger = logging.getLogger(__name__)
 from podcast_outreach.api.dependencies import authenticate_user_details, prepare_session_data, get_current_user
 from pydantic import BaseModel, EmailStr, Field
 from podcast_outreach.database.queries import people as people_queries
-from podcast_outreach.api.dependencies import hash_password
+from podcast_outreach.api.dependencies import hash_password_async
 from podcast_outreach.database.queries import campaigns as campaign_queries
 from podcast_outreach.database.queries import client_profiles as client_profile_queries
 from ...services.email_service import email_service
@@ -48,7 +47,7 @@ async def register_user(registration_data: UserRegistration):
     """
     
     # Hash the password first
-    hashed_password = hash_password(registration_data.password)
+    hashed_password = await hash_password_async(registration_data.password)
     
     # Check if user already exists
     existing_user = await people_queries.get_person_by_email_from_db(registration_data.email)
@@ -312,7 +311,7 @@ async def reset_password_with_token(
             )
         
         # Hash the new password
-        hashed_password = bcrypt.hashpw(new_password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+        hashed_password = await hash_password_async(new_password)
         
         # Update user's password
         updated = await people_queries.update_person_password_hash(person_id, hashed_password)
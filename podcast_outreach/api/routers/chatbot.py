@@ -1,6 +1,7 @@
 # podcast_outreach/api/routers/chatbot.py
 
 from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, UUID4
 from typing import Optional, List, Dict, Any
 import json
@@ -126,25 +127,7 @@ async def send_chatbot_message(
 ):
     """Process a user message and return bot response"""
     try:
-        # Verify user owns this conversation
-        conv = await conv_queries.get_conversation_by_id(body.conversation_id)
-        if not conv:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Conversation not found"
-            )
-        
-        if conv['person_id'] != user.get("person_id"):
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Access denied"
-            )
-        
-        if str(conv['campaign_id']) != str(campaign_id):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Campaign ID mismatch"
-            )
+        await _verify_conversation_access(body.conversation_id, campaign_id, user)
         
         engine = get_conversation_engine()
         response = await engine.process_message(
@@ -171,6 +154,74 @@ async def send_chatbot_message(
             detail=f"Failed to process message: {str(e)}"
         )
 
+@router.post("/message/stream",
+             summary="Send Chatbot Message (Streaming)",
+             description="Process a user message and stream the bot response as server-sent events")
+async def stream_chatbot_message(
+    campaign_id: UUID4,
+    body: ChatbotMessageRequest,
+    request: Request,
+    user: Dict[str, Any] = Depends(get_current_user)
+):
+    """
+    Streams the turn as server-sent events:
+    - `status`: sent immediately once the message is accepted
+    - `stage`: each conversation step (classify, update_buckets, ...) as it finishes
+    - `response`: the bot message as soon as it has been generated
+    - `done`: the same payload POST /message returns; its bot_message is authoritative
+    - `error`: the turn failed
+    The conversation is saved after `done`, once the stream has closed, even if the
+    client disconnects mid-turn.
+    """
+    await _verify_conversation_access(body.conversation_id, campaign_id, user)
+    engine = get_conversation_engine()
+    
+    async def events():
+        yield _sse("status", {"stage": "received"})
+        try:
+            async for event, data in engine.stream_message(str(body.conversation_id), body.message):
+                if event == "stage":
+                    yield _sse("stage", {"stage": data})
+                elif event == "response":
+                    yield _sse("response", {"bot_message": data})
+                elif event == "done":
+                    yield _sse("done", ChatbotMessageResponse(**data).model_dump(mode="json"))
+        except Exception as e:
+            logger.exception(f"Error streaming chatbot message: {e}")
+            yield _sse("error", {"detail": f"Failed to process message: {str(e)}"})
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        # Keep proxies from buffering the stream
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+def _sse(event: str, data: Any) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+async def _verify_conversation_access(conversation_id: UUID4, campaign_id: UUID4, user: Dict[str, Any]) -> Dict[str, Any]:
+    """Loads the conversation and checks it belongs to the user and campaign"""
+    conv = await conv_queries.get_conversation_by_id(conversation_id)
+    if not conv:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Conversation not found"
+        )
+    
+    if conv['person_id'] != user.get("person_id"):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied"
+        )
+    
+    if str(conv['campaign_id']) != str(campaign_id):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Campaign ID mismatch"
+        )
+    return conv
+
 @router.get("/summary", response_model=ConversationSummaryResponse,
             summary="Get Conversation Summary",
             description="Get summary of extracted data from conversation")
@@ -8,11 +8,11 @@ from ..schemas.dashboard_schemas import DashboardStatsOverview, RecentPlacementI
 
 # Import modular queries
 from podcast_outreach.database.queries import campaigns as campaign_queries
-from podcast_outreach.database.queries import pitches as pitch_queries
 from podcast_outreach.database.queries import placements as placement_queries
 from podcast_outreach.database.queries import media as media_queries
-from podcast_outreach.database.queries import review_tasks as review_task_queries
 from podcast_outreach.database.queries import people as people_queries # For client name
+from podcast_outreach.database.queries import dashboard as dashboard_queries
+from podcast_outreach.services.dashboard_stats_cache import dashboard_stats_cache, ALL_PEOPLE_KEY
 
 # Import dependencies for authentication
 from ..dependencies import get_current_user # Clients and internal team can see their dashboard
@@ -33,39 +33,29 @@ async def get_dashboard_stats(user: Dict[str, Any] = Depends(get_current_user)):
         if not person_id_filter:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Client user not properly identified.")
 
-    try:
-        # Active Campaigns
-        # Assuming an "active" campaign is one without an end_date or end_date is in the future
-        # This logic might need to be more sophisticated in campaign_queries
-        active_campaigns_count = await campaign_queries.count_active_campaigns(person_id=person_id_filter)
-
-        # Approved Placements
-        # Assuming 'live' or 'paid' status means approved and successful
-        approved_placements_count = await placement_queries.count_placements_by_status(
-            statuses=["live", "paid", "recorded", "recording_booked"], # Define what "approved" means
-            person_id=person_id_filter
-        )
-
-        # Pending Reviews (e.g., match_suggestions or pitch_reviews)
-        pending_review_tasks_count = await review_task_queries.count_review_tasks_by_status(
-            status="pending",
-            person_id=person_id_filter # This assumes review_tasks can be linked to a person via campaign
-        )
-        
-        # Success Rate (Placements / Total Pitches Sent)
-        # This is a simplified example. You might need more specific pitch states.
-        total_pitches_sent = await pitch_queries.count_pitches_by_state(
-            pitch_states=["sent", "opened", "replied", "clicked", "replied_interested", "live", "paid"], # All states after 'generated'
-            person_id=person_id_filter
+    async def load_stats() -> DashboardStatsOverview:
+        # "Approved" placements are live or paid ones plus confirmed recordings; pitches count
+        # every state after 'generated'. All four counts come back from one query.
+        counts = await dashboard_queries.get_dashboard_counts(
+            placement_statuses=["live", "paid", "recorded", "recording_booked"],
+            review_status="pending",
+            pitch_states=["sent", "opened", "replied", "clicked", "replied_interested", "live", "paid"],
+            person_id=person_id_filter,
         )
+        approved_placements_count = counts["placements"]
+        total_pitches_sent = counts["pitches"]
         success_rate = (approved_placements_count / total_pitches_sent * 100) if total_pitches_sent > 0 else 0.0
 
         return DashboardStatsOverview(
-            active_campaigns=active_campaigns_count,
+            active_campaigns=counts["active_campaigns"],
             approved_placements=approved_placements_count,
-            pending_reviews=pending_review_tasks_count,
+            pending_reviews=counts["review_tasks"],
             success_rate_placements=round(success_rate, 2)
         )
+
+    try:
+        cache_key = person_id_filter if person_id_filter is not None else ALL_PEOPLE_KEY
+        return await dashboard_stats_cache.get(cache_key, load_stats)
     except Exception as e:
         logger.exception(f"Error fetching dashboard stats for user {user.get('person_id')}: {e}")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Could not fetch dashboard statistics.")
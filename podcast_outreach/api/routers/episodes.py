@@ -1,6 +1,6 @@
 import logging
 from typing import List, Optional
-from fastapi import APIRouter, HTTPException, Depends, Query, status
+from fastapi import APIRouter, HTTPException, Depends, Query, Response, status
 import uuid
 
 from podcast_outreach.api.schemas import episode_schemas # Assuming schemas exist or will be created
@@ -15,26 +15,46 @@ router = APIRouter(
     dependencies=[Depends(get_current_user)] # Basic auth for accessing episode data
 )
 
-@router.get("/", response_model=List[episode_schemas.EpisodeInDB])
+@router.get("/", response_model=List[episode_schemas.EpisodeInDB], response_model_exclude_unset=True)
 async def list_episodes_for_media(
+    response: Response,
     media_id: int = Query(..., description="The ID of the media to fetch episodes for."),
     skip: int = Query(0, ge=0, description="Number of records to skip for pagination."),
-    limit: int = Query(100, ge=1, le=200, description="Maximum number of records to return.")
+    limit: int = Query(100, ge=1, le=200, description="Maximum number of records to return."),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the previous page's X-Next-Cursor header (skip is ignored)"),
+    fields: Optional[str] = Query(
+        None,
+        description="Comma-separated extra fields to include: " + ", ".join(episode_queries.EPISODE_OPTIONAL_FIELDS)
+    )
 ):
-    """Retrieve episodes for a specific media ID with pagination."""
+    """
+    Retrieve episodes for a specific media ID, newest first.
+    Only IDs, title, dates, flags and duration are returned unless `fields` asks for more
+    (e.g. fields=transcript,ai_episode_summary). The X-Next-Cursor response header
+    continues the list without offset scans.
+    """
+    include_fields = [f.strip() for f in fields.split(",") if f.strip()] if fields else []
     try:
-        # Using the recently added paginated query function
-        episodes_db = await episode_queries.get_episodes_for_media_paginated(
-            media_id=media_id, 
-            offset=skip, 
-            limit=limit
-        )
+        try:
+            episodes_db, next_cursor = await episode_queries.get_episodes_for_media_keyset(
+                media_id=media_id,
+                limit=limit,
+                cursor=cursor,
+                offset=skip,
+                include_fields=include_fields
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
         
+        if next_cursor:
+            response.headers["X-Next-Cursor"] = next_cursor
         if not episodes_db:
             # It's not an error if a media has no episodes, return empty list.
             return []
             
         return [episode_schemas.EpisodeInDB(**ep) for ep in episodes_db]
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error fetching episodes for media_id {media_id}: {e}", exc_info=True)
         raise HTTPException(
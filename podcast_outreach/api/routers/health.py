@@ -1,7 +1,15 @@
 # podcast_outreach/api/routers/health.py
 
 from fastapi import APIRouter
-from podcast_outreach.database.connection import DB_POOL, BACKGROUND_TASK_POOL
+from podcast_outreach.database.connection import get_pool_stats
+from podcast_outreach.database.entity_cache import get_cache_stats
+from podcast_outreach.services.email.outbox_worker import email_outbox_worker
+from podcast_outreach.services.lead_magnet_service import lead_magnet_worker
+
+try:
+    from podcast_outreach.services.chatbot.agentic.fast_path_classifier import get_classification_tier_stats
+except ImportError:  # The agentic chatbot is optional (langgraph may not be installed)
+    get_classification_tier_stats = None
 
 router = APIRouter(tags=["General"])
 
@@ -10,21 +18,24 @@ async def health_check():
     """Checks if the API is running."""
     response = {"status": "healthy", "message": "API is up and running!"}
     
-    # Add pool statistics for monitoring
-    if DB_POOL and not DB_POOL._closed:
-        response["frontend_pool"] = {
-            "size": DB_POOL.get_size(),
-            "min_size": DB_POOL.get_min_size(),
-            "max_size": DB_POOL.get_max_size(),
-            "idle_connections": DB_POOL.get_idle_size(),
-        }
+    # Pool sizes and acquire wait times per workload class for monitoring
+    pool_stats = get_pool_stats()
+    response["db_pools"] = pool_stats
+    if pool_stats["interactive"]["open"]:
+        response["frontend_pool"] = pool_stats["interactive"]
+    if pool_stats["pipeline"]["open"]:
+        response["background_pool"] = pool_stats["pipeline"]
+    
+    response["entity_cache"] = get_cache_stats()
+    
+    # Background workers started in the app lifespan
+    response["workers"] = {
+        "email_outbox": email_outbox_worker.stats(),
+        "lead_magnet": lead_magnet_worker.stats(),
+    }
     
-    if BACKGROUND_TASK_POOL and not BACKGROUND_TASK_POOL._closed:
-        response["background_pool"] = {
-            "size": BACKGROUND_TASK_POOL.get_size(),
-            "min_size": BACKGROUND_TASK_POOL.get_min_size(), 
-            "max_size": BACKGROUND_TASK_POOL.get_max_size(),
-            "idle_connections": BACKGROUND_TASK_POOL.get_idle_size(),
-        }
+    # Share of chatbot turns answered by the rule, local-model and LLM classifier tiers
+    if get_classification_tier_stats:
+        response["chatbot_classification"] = get_classification_tier_stats()
     
     return response
\ No newline at end of file
@@ -11,6 +11,7 @@ from podcast_outreach.services.inbox.booking_assistant import BookingAssistantSe
 from podcast_outreach.api.routers.nylas_webhooks import store_email_classification
 from podcast_outreach.api.dependencies import get_current_user
 from podcast_outreach.logging_config import get_logger
+from podcast_outreach.utils.http_sessions import get_http_session
 
 logger = get_logger(__name__)
 
@@ -90,7 +91,7 @@ async def get_inbox_messages(
     
     offset = (page - 1) * size
     
-    async with get_db_async() as db:
+    async with get_db_async(read_replica=True) as db:
         query = """
             SELECT 
                 im.*,
@@ -221,7 +222,7 @@ async def get_classification_summary(
     
     since_date = datetime.now() - timedelta(days=days)
     
-    async with get_db_async() as db:
+    async with get_db_async(read_replica=True) as db:
         query = """
             SELECT 
                 classification,
@@ -354,7 +355,7 @@ async def get_inbox_threads(
     
     offset = (page - 1) * size
     
-    async with get_db_async() as db:
+    async with get_db_async(read_replica=True) as db:
         # First get valid grant_ids for this user
         user_grants = await db.fetch_all("""
             SELECT DISTINCT cea.nylas_grant_id 
@@ -637,7 +638,7 @@ async def nylas_oauth_callback(
     This is called after user authorizes their email account.
     """
     from podcast_outreach.config import NYLAS_API_KEY, NYLAS_API_URI, FRONTEND_ORIGIN
-    import httpx
+    import aiohttp
     
     if not NYLAS_API_KEY:
         raise HTTPException(status_code=500, detail="Nylas API key not configured")
@@ -658,35 +659,36 @@ async def nylas_oauth_callback(
     # Build the redirect URI - must match exactly what was used in the authorization request
     redirect_uri = f"{FRONTEND_ORIGIN}/nylas/callback"
     
-    async with httpx.AsyncClient(timeout=20) as client:
-        try:
-            # Nylas v3 token exchange - client_secret is the API key
-            response = await client.post(
-                f"{NYLAS_API_URI}/v3/connect/token",
-                headers={
-                    "Content-Type": "application/json"
-                },
-                json={
-                    "code": code,
-                    "client_id": NYLAS_CLIENT_ID,
-                    "client_secret": NYLAS_API_KEY,  # In v3, this is the API key
-                    "redirect_uri": redirect_uri,
-                    "grant_type": "authorization_code",
-                    "code_verifier": "nylas"  # Recommended per Nylas docs
-                }
-            )
+    session = get_http_session("nylas")
+    try:
+        # Nylas v3 token exchange - client_secret is the API key
+        async with session.post(
+            f"{NYLAS_API_URI}/v3/connect/token",
+            headers={
+                "Content-Type": "application/json"
+            },
+            json={
+                "code": code,
+                "client_id": NYLAS_CLIENT_ID,
+                "client_secret": NYLAS_API_KEY,  # In v3, this is the API key
+                "redirect_uri": redirect_uri,
+                "grant_type": "authorization_code",
+                "code_verifier": "nylas"  # Recommended per Nylas docs
+            }
+        ) as response:
+            response_text = await response.text()
             response.raise_for_status()
-        except httpx.HTTPStatusError as e:
-            logger.error(f"Nylas token exchange failed: {e.response.text}")
-            raise HTTPException(
-                status_code=400, 
-                detail=f"Failed to exchange code for grant: {e.response.text}"
-            )
-        except Exception as e:
-            logger.error(f"Unexpected error during token exchange: {e}")
-            raise HTTPException(status_code=500, detail="Token exchange failed")
+    except aiohttp.ClientResponseError:
+        logger.error(f"Nylas token exchange failed: {response_text}")
+        raise HTTPException(
+            status_code=400, 
+            detail=f"Failed to exchange code for grant: {response_text}"
+        )
+    except Exception as e:
+        logger.error(f"Unexpected error during token exchange: {e}")
+        raise HTTPException(status_code=500, detail="Token exchange failed")
     
-    data = response.json()
+    data = json.loads(response_text)
     grant_id = data.get("grant_id")
     email = data.get("email", "")
     provider = data.get("provider", "google")
@@ -801,7 +803,7 @@ async def disconnect_nylas_account(
     """Disconnect a Nylas email account and revoke the grant."""
     
     from podcast_outreach.config import NYLAS_API_KEY, NYLAS_API_URI
-    import httpx
+    import aiohttp
     
     person_id = current_user.get("person_id")
     if not person_id:
@@ -870,16 +872,16 @@ async def disconnect_nylas_account(
         # Revoke grant via Nylas API
         if NYLAS_API_KEY:
             try:
-                async with httpx.AsyncClient(timeout=10) as client:
-                    response = await client.delete(
-                        f"{NYLAS_API_URI}/v3/grants/{grant_id}",
-                        headers={"Authorization": f"Bearer {NYLAS_API_KEY}"}
-                    )
-                    
-                    if response.status_code == 200:
+                session = get_http_session("nylas")
+                async with session.delete(
+                    f"{NYLAS_API_URI}/v3/grants/{grant_id}",
+                    headers={"Authorization": f"Bearer {NYLAS_API_KEY}"},
+                    timeout=aiohttp.ClientTimeout(total=10)
+                ) as response:
+                    if response.status == 200:
                         logger.info(f"Successfully revoked Nylas grant {grant_id}")
                     else:
-                        logger.warning(f"Failed to revoke grant {grant_id}: {response.status_code}")
+                        logger.warning(f"Failed to revoke grant {grant_id}: {response.status}")
             except Exception as e:
                 logger.error(f"Error revoking Nylas grant: {e}")
                 # Continue even if revocation fails - we've already removed from our DB
@@ -1,7 +1,7 @@
 # podcast_outreach/api/routers/matches.py
 
 import uuid
-from fastapi import APIRouter, HTTPException, Depends, status, Query, BackgroundTasks
+from fastapi import APIRouter, HTTPException, Depends, status, Query, BackgroundTasks, Response
 from typing import List, Optional, Dict, Any
 import logging
 
@@ -263,13 +263,16 @@ async def create_match_suggestion_api(suggestion_data: MatchSuggestionCreate, us
 
 @router.get("/", response_model=List[MatchSuggestionInDB], summary="List All Match Suggestions (Enriched)")
 async def list_all_match_suggestions_api(
+    response: Response,
     status: Optional[str] = Query(None, description="Filter by status (e.g., pending, approved, rejected)"),
     campaign_id: Optional[uuid.UUID] = Query(None, description="Filter by campaign ID"),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=200),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the previous page's X-Next-Cursor header (skip is ignored)"),
     user: dict = Depends(get_current_user) # Staff or Admin access
 ):
-    """Lists all match suggestions with optional filters and enrichment."""
+    """Lists all match suggestions with optional filters and enrichment.
+    The X-Next-Cursor response header continues the list without offset scans."""
     # Add role check if necessary, e.g., if only staff/admin should see all without campaign_id
     if user.get("role") not in ["admin", "staff"] and not campaign_id:
         # If user is a client, they must provide a campaign_id they own
@@ -277,11 +280,24 @@ async def list_all_match_suggestions_api(
         pass # Current get_current_user doesn't prevent clients, but they won't see much if not filtered
 
     try:
-        suggestions_from_db = await match_queries.get_all_match_suggestions_enriched(
-            status=status, campaign_id=campaign_id, skip=skip, limit=limit
-        )
+        if cursor:
+            try:
+                suggestions_from_db, next_cursor = await match_queries.get_match_suggestions_keyset(
+                    status=status, campaign_id=campaign_id, cursor=cursor, limit=limit
+                )
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+        else:
+            suggestions_from_db = await match_queries.get_all_match_suggestions_enriched(
+                status=status, campaign_id=campaign_id, skip=skip, limit=limit
+            )
+            next_cursor = match_queries.match_suggestion_cursor(suggestions_from_db[-1]) if len(suggestions_from_db) >= limit else None
+        if next_cursor:
+            response.headers["X-Next-Cursor"] = next_cursor
         # The schema MatchSuggestionInDB already includes media_name, campaign_name, client_name
         return [MatchSuggestionInDB(**s) for s in suggestions_from_db]
+    except HTTPException:
+        raise
     except Exception as e:
         logger.exception(f"Error listing all match suggestions: {e}")
         raise HTTPException(status_code=500, detail=str(e))
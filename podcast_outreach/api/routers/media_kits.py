@@ -1,7 +1,11 @@
 # podcast_outreach/api/routers/media_kits.py
+import os
 import uuid
+import hashlib
 import logging
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from datetime import timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
 from typing import List, Optional, Dict, Any
 
 from podcast_outreach.api.schemas import media_kit_schemas as mk_schemas
@@ -11,11 +15,16 @@ from podcast_outreach.database.queries import campaigns as campaign_queries # Fo
 from podcast_outreach.database.queries import media_kits as media_kit_queries # ADDED THIS IMPORT
 from podcast_outreach.logging_config import get_logger
 from podcast_outreach.api.schemas.media_kit_schemas import MediaKitImageAddRequest
+from podcast_outreach.database.entity_cache import public_media_kit_cache
 
 logger = get_logger(__name__)
 router = APIRouter()
 media_kit_service = MediaKitService() # Instantiate the service
 
+# Browser/CDN caching of public kits; revalidation with the ETag returns 304 after max-age
+PUBLIC_MEDIA_KIT_MAX_AGE_SECONDS = int(os.getenv("PUBLIC_MEDIA_KIT_MAX_AGE_SECONDS", "60"))
+PUBLIC_MEDIA_KIT_STALE_SECONDS = int(os.getenv("PUBLIC_MEDIA_KIT_STALE_SECONDS", "300"))
+
 @router.post("/campaigns/{campaign_id}/media-kit", 
              response_model=mk_schemas.MediaKitInDB, 
              status_code=status.HTTP_201_CREATED,
@@ -152,12 +161,53 @@ async def get_media_kit_by_id(
             tags=["Media Kits - Public"],
             # No auth Depends here, this is public
             )
-async def get_public_media_kit_by_slug(slug: str):
-    """Retrieves a publicly available media kit by its slug."""
+async def get_public_media_kit_by_slug(slug: str, request: Request):
+    """
+    Retrieves a publicly available media kit by its slug.
+    The serialized kit is cached per slug and dropped whenever the kit is written.
+    """
+    payload = await public_media_kit_cache.get_or_load(
+        slug, lambda: _load_public_media_kit(slug), projection="public_json"
+    )
+    if payload is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Media kit not found or is not public.")
+
+    headers = {
+        "ETag": payload["etag"],
+        "Cache-Control": f"public, max-age={PUBLIC_MEDIA_KIT_MAX_AGE_SECONDS}, stale-while-revalidate={PUBLIC_MEDIA_KIT_STALE_SECONDS}",
+    }
+    if payload["last_modified"]:
+        headers["Last-Modified"] = payload["last_modified"]
+    if _is_not_modified(request, payload):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=payload["body"], media_type="application/json", headers=headers)
+
+async def _load_public_media_kit(slug: str) -> Optional[Dict[str, Any]]:
+    """Validates and serializes a public kit once, for the cache."""
     media_kit = await media_kit_service.get_media_kit_by_slug(slug)
     if not media_kit or not media_kit.get("is_public"):
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Media kit not found or is not public.")
-    return mk_schemas.MediaKitInDB(**media_kit) 
+        return None
+    body = mk_schemas.MediaKitInDB(**media_kit).model_dump_json().encode()
+    updated_at = media_kit.get("updated_at")
+    return {
+        "body": body,
+        "etag": f'"{hashlib.sha256(body).hexdigest()[:32]}"',
+        "last_modified": format_datetime(updated_at.astimezone(timezone.utc), usegmt=True) if updated_at else None,
+    }
+
+def _is_not_modified(request: Request, payload: Dict[str, Any]) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        # If-None-Match takes precedence over If-Modified-Since
+        tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        return "*" in tags or payload["etag"] in tags
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and payload["last_modified"]:
+        try:
+            return parsedate_to_datetime(payload["last_modified"]) <= parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+    return False
 
 @router.post("/campaigns/{campaign_id}/media-kit/images", response_model=mk_schemas.MediaKitInDB, tags=["Media Kits - Campaign Specific"])
 async def add_media_kit_image(
@@ -4,6 +4,7 @@ from fastapi import APIRouter, HTTPException, Query
 from typing import Optional, Dict, Any, List
 from datetime import datetime, timedelta
 from podcast_outreach.database.connection import get_db_async
+from podcast_outreach.database.queries import campaign_metrics as campaign_metrics_queries
 from podcast_outreach.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -133,13 +134,39 @@ async def get_pitch_event_timeline(pitch_id: str):
         }
 
 
+def _merge_campaign_days(days: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Sums daily rollup rows into one set of counts and merged breakdowns."""
+    totals: Dict[str, Any] = {col: 0 for col in campaign_metrics_queries.ROLLUP_COUNT_COLUMNS}
+    bounces: Dict[tuple, int] = {}
+    providers: Dict[str, Dict[str, float]] = {}
+    classifications: Dict[str, Dict[str, float]] = {}
+    for day in days:
+        for col in campaign_metrics_queries.ROLLUP_COUNT_COLUMNS:
+            totals[col] += day.get(col) or 0
+        for b in day.get("bounce_breakdown") or []:
+            key = (b.get("type"), b.get("reason"))
+            bounces[key] = bounces.get(key, 0) + b.get("count", 0)
+        for name, stats in (day.get("provider_breakdown") or {}).items():
+            merged = providers.setdefault(name, {})
+            for key, value in stats.items():
+                merged[key] = merged.get(key, 0) + (value or 0)
+        for name, stats in (day.get("classification_breakdown") or {}).items():
+            merged = classifications.setdefault(name, {})
+            for key, value in stats.items():
+                merged[key] = merged.get(key, 0) + (value or 0)
+    totals["bounces"] = bounces
+    totals["providers"] = providers
+    totals["classifications"] = classifications
+    return totals
+
+
 @router.get("/campaigns/{campaign_id}/metrics")
 async def get_campaign_metrics(
     campaign_id: str,
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None
 ):
-    """Get comprehensive metrics for a campaign."""
+    """Get comprehensive metrics for a campaign (aggregated per UTC day from the daily rollup)."""
     
     if not start_date:
         start_date = datetime.now() - timedelta(days=30)
@@ -149,138 +176,105 @@ async def get_campaign_metrics(
     async with get_db_async() as db:
         # Verify campaign exists
         campaign = await db.fetch_one("""
-            SELECT * FROM campaigns WHERE campaign_id = $1
+            SELECT campaign_id, name FROM campaigns WHERE campaign_id = $1
         """, campaign_id)
         
         if not campaign:
             raise HTTPException(status_code=404, detail="Campaign not found")
-        
-        # Get pitch statistics
-        pitch_stats = await db.fetch_one("""
-            SELECT 
-                COUNT(*) as total_pitches,
-                COUNT(CASE WHEN pitch_state = 'sent' THEN 1 END) as sent,
-                COUNT(CASE WHEN pitch_state = 'opened' THEN 1 END) as opened,
-                COUNT(CASE WHEN pitch_state = 'clicked' THEN 1 END) as clicked,
-                COUNT(CASE WHEN pitch_state = 'replied' THEN 1 END) as replied,
-                COUNT(CASE WHEN pitch_state = 'bounced' THEN 1 END) as bounced,
-                COUNT(placement_id) as placements_created,
-                AVG(open_count) as avg_opens_per_email,
-                AVG(click_count) as avg_clicks_per_email,
-                COUNT(CASE WHEN bounce_type = 'hard' THEN 1 END) as hard_bounces,
-                COUNT(CASE WHEN bounce_type = 'soft' THEN 1 END) as soft_bounces
-            FROM pitches
-            WHERE campaign_id = $1
-            AND created_at BETWEEN $2 AND $3
-        """, campaign_id, start_date, end_date)
-        
-        # Get email classifications breakdown
-        classifications = await db.fetch_all("""
-            SELECT 
-                ec.classification,
-                COUNT(*) as count,
-                AVG(ec.confidence_score) as avg_confidence
-            FROM email_classifications ec
-            JOIN pitches p ON ec.thread_id = p.nylas_thread_id
-            WHERE p.campaign_id = $1
-            AND ec.processed_at BETWEEN $2 AND $3
-            GROUP BY ec.classification
-            ORDER BY count DESC
-        """, campaign_id, start_date, end_date)
-        
-        # Get daily breakdown for chart
-        daily_stats = await db.fetch_all("""
-            SELECT 
-                DATE(send_ts) as date,
-                COUNT(*) as sent,
-                COUNT(CASE WHEN opened_ts IS NOT NULL THEN 1 END) as opened,
-                COUNT(CASE WHEN clicked_ts IS NOT NULL THEN 1 END) as clicked,
-                COUNT(CASE WHEN reply_ts IS NOT NULL THEN 1 END) as replied
-            FROM pitches
-            WHERE campaign_id = $1
-            AND send_ts BETWEEN $2 AND $3
-            GROUP BY DATE(send_ts)
-            ORDER BY date ASC
-        """, campaign_id, start_date, end_date)
-        
-        # Calculate conversion rates
-        total = pitch_stats["total_pitches"] or 1  # Avoid division by zero
-        sent = pitch_stats["sent"] or 0
-        
-        metrics = {
-            "campaign_id": str(campaign_id),
-            "campaign_name": campaign["name"],
-            "date_range": {
-                "start": start_date.isoformat(),
-                "end": end_date.isoformat()
-            },
-            "summary": {
-                "total_pitches": pitch_stats["total_pitches"],
-                "total_sent": sent,
-                "total_opened": pitch_stats["opened"],
-                "total_clicked": pitch_stats["clicked"],
-                "total_replied": pitch_stats["replied"],
-                "total_bounced": pitch_stats["bounced"],
-                "placements_created": pitch_stats["placements_created"]
-            },
-            "rates": {
-                "send_rate": round((sent / total) * 100, 2) if total > 0 else 0,
-                "open_rate": round((pitch_stats["opened"] / sent) * 100, 2) if sent > 0 else 0,
-                "click_rate": round((pitch_stats["clicked"] / sent) * 100, 2) if sent > 0 else 0,
-                "reply_rate": round((pitch_stats["replied"] / sent) * 100, 2) if sent > 0 else 0,
-                "bounce_rate": round((pitch_stats["bounced"] / sent) * 100, 2) if sent > 0 else 0,
-                "booking_rate": round((pitch_stats["placements_created"] / sent) * 100, 2) if sent > 0 else 0
-            },
-            "engagement": {
-                "avg_opens_per_email": round(pitch_stats["avg_opens_per_email"] or 0, 2),
-                "avg_clicks_per_email": round(pitch_stats["avg_clicks_per_email"] or 0, 2)
-            },
-            "deliverability": {
-                "hard_bounces": pitch_stats["hard_bounces"],
-                "soft_bounces": pitch_stats["soft_bounces"],
-                "total_bounces": pitch_stats["bounced"]
-            },
-            "classifications": [
-                {
-                    "type": cls["classification"],
-                    "count": cls["count"],
-                    "avg_confidence": round(cls["avg_confidence"], 2) if cls["avg_confidence"] else 0
-                }
-                for cls in classifications
-            ] if classifications else [],
-            "daily_breakdown": [
-                {
-                    "date": day["date"].isoformat() if day["date"] else None,
-                    "sent": day["sent"],
-                    "opened": day["opened"],
-                    "clicked": day["clicked"],
-                    "replied": day["replied"]
-                }
-                for day in daily_stats
-            ] if daily_stats else []
-        }
-        
-        return metrics
+    
+    # Past days come from the rollup, today is merged in live
+    days = await campaign_metrics_queries.get_campaign_daily_metrics(
+        campaign["campaign_id"], start_date.date(), end_date.date()
+    )
+    pitch_stats = _merge_campaign_days(days)
+    
+    # Calculate conversion rates
+    total = pitch_stats["total_pitches"] or 1  # Avoid division by zero
+    sent = pitch_stats["sent"] or 0
+    
+    classifications = sorted(
+        pitch_stats["classifications"].items(), key=lambda item: item[1].get("count", 0), reverse=True
+    )
+    
+    metrics = {
+        "campaign_id": str(campaign_id),
+        "campaign_name": campaign["name"],
+        "date_range": {
+            "start": start_date.isoformat(),
+            "end": end_date.isoformat()
+        },
+        "summary": {
+            "total_pitches": pitch_stats["total_pitches"],
+            "total_sent": sent,
+            "total_opened": pitch_stats["opened"],
+            "total_clicked": pitch_stats["clicked"],
+            "total_replied": pitch_stats["replied"],
+            "total_bounced": pitch_stats["bounced"],
+            "placements_created": pitch_stats["placements_created"]
+        },
+        "rates": {
+            "send_rate": round((sent / total) * 100, 2) if total > 0 else 0,
+            "open_rate": round((pitch_stats["opened"] / sent) * 100, 2) if sent > 0 else 0,
+            "click_rate": round((pitch_stats["clicked"] / sent) * 100, 2) if sent > 0 else 0,
+            "reply_rate": round((pitch_stats["replied"] / sent) * 100, 2) if sent > 0 else 0,
+            "bounce_rate": round((pitch_stats["bounced"] / sent) * 100, 2) if sent > 0 else 0,
+            "booking_rate": round((pitch_stats["placements_created"] / sent) * 100, 2) if sent > 0 else 0
+        },
+        "engagement": {
+            "avg_opens_per_email": round(pitch_stats["open_count_sum"] / pitch_stats["open_count_n"], 2) if pitch_stats["open_count_n"] else 0,
+            "avg_clicks_per_email": round(pitch_stats["click_count_sum"] / pitch_stats["click_count_n"], 2) if pitch_stats["click_count_n"] else 0
+        },
+        "deliverability": {
+            "hard_bounces": pitch_stats["hard_bounces"],
+            "soft_bounces": pitch_stats["soft_bounces"],
+            "total_bounces": pitch_stats["bounced"]
+        },
+        "classifications": [
+            {
+                "type": name,
+                "count": stats.get("count", 0),
+                "avg_confidence": round(stats["confidence_sum"] / stats["confidence_n"], 2) if stats.get("confidence_n") else 0
+            }
+            for name, stats in classifications
+        ],
+        "daily_breakdown": [
+            {
+                "date": day["day"].isoformat(),
+                "sent": day["day_sent"],
+                "opened": day["day_opened"],
+                "clicked": day["day_clicked"],
+                "replied": day["day_replied"]
+            }
+            for day in days
+            if day["day_sent"]
+        ]
+    }
+    
+    return metrics
 
 
 @router.get("/campaigns/{campaign_id}/deliverability")
 async def get_campaign_deliverability(campaign_id: str):
     """Get deliverability metrics for a campaign."""
     
-    async with get_db_async() as db:
-        # Get bounce analysis
-        bounce_analysis = await db.fetch_all("""
-            SELECT 
-                bounce_type,
-                bounce_reason,
-                COUNT(*) as count
-            FROM pitches
-            WHERE campaign_id = $1
-            AND bounce_type IS NOT NULL
-            GROUP BY bounce_type, bounce_reason
-            ORDER BY count DESC
-        """, campaign_id)
-        
+    # Bounce and provider breakdowns come from the daily rollup
+    rollup = _merge_campaign_days(await campaign_metrics_queries.get_campaign_daily_metrics(campaign_id))
+    bounce_analysis = sorted(
+        ({"bounce_type": t, "bounce_reason": r, "count": n} for (t, r), n in rollup["bounces"].items()),
+        key=lambda b: b["count"], reverse=True
+    )
+    provider_stats = [
+        {
+            "email_provider": name,
+            "total": stats.get("total", 0),
+            "sent": stats.get("sent", 0),
+            "bounced": stats.get("bounced", 0),
+            "avg_send_time_seconds": stats["send_seconds_sum"] / stats["send_seconds_n"] if stats.get("send_seconds_n") else None
+        }
+        for name, stats in rollup["providers"].items()
+    ]
+    
+    async with get_db_async(read_replica=True) as db:
         # Get domain-level stats
         domain_stats = await db.fetch_all("""
             SELECT 
@@ -296,21 +290,6 @@ async def get_campaign_deliverability(campaign_id: str):
             LIMIT 20
         """, campaign_id)
         
-        # Get provider performance if using multiple
-        provider_stats = await db.fetch_all("""
-            SELECT 
-                email_provider,
-                COUNT(*) as total,
-                COUNT(CASE WHEN pitch_state = 'sent' THEN 1 END) as sent,
-                COUNT(CASE WHEN pitch_state = 'bounced' THEN 1 END) as bounced,
-                AVG(CASE WHEN send_ts IS NOT NULL 
-                    THEN EXTRACT(EPOCH FROM (send_ts - created_at)) 
-                END) as avg_send_time_seconds
-            FROM pitches
-            WHERE campaign_id = $1
-            GROUP BY email_provider
-        """, campaign_id)
-        
         return {
             "campaign_id": str(campaign_id),
             "bounce_analysis": [
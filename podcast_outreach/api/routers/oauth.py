@@ -13,7 +13,7 @@ from pydantic import BaseModel
 from ...services.oauth_service import oauth_service
 from ...database.queries import people as people_queries
 from ...database.queries import oauth_queries
-from ..dependencies import get_current_user, prepare_session_data, verify_password
+from ..dependencies import get_current_user, prepare_session_data, verify_password_async
 from ...config import FRONTEND_ORIGIN
 
 logger = logging.getLogger(__name__)
@@ -184,8 +184,8 @@ async def disconnect_oauth_provider(
                 raise HTTPException(status_code=400, detail="Password must be at least 8 characters")
             
             # Set the password
-            from ..dependencies import hash_password
-            hashed_password = hash_password(password)
+            from ..dependencies import hash_password_async
+            hashed_password = await hash_password_async(password)
             await people_queries.update_person_in_db(person_id, {"dashboard_password_hash": hashed_password})
         
         # Disconnect the provider
@@ -259,7 +259,7 @@ async def switch_to_oauth(
         if not person.get("dashboard_password_hash"):
             raise HTTPException(status_code=400, detail="No password set for this account")
         
-        if not verify_password(password, person["dashboard_password_hash"]):
+        if not await verify_password_async(password, person["dashboard_password_hash"]):
             raise HTTPException(status_code=401, detail="Invalid password")
         
         # Check if already using OAuth
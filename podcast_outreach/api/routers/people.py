@@ -13,7 +13,7 @@ from ..schemas.person_schemas import PersonCreate, PersonUpdate, PersonInDB, Per
 from podcast_outreach.database.queries import people as people_queries
 
 # Import dependencies (for password hashing and user auth)
-from ..dependencies import get_current_user, get_admin_user, hash_password
+from ..dependencies import get_current_user, get_admin_user, hash_password_async
 
 logger = logging.getLogger(__name__)
 
@@ -178,7 +178,7 @@ async def set_person_password_api(person_id: int, password_data: PersonSetPasswo
     if not person_exists:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Person with ID {person_id} not found.")
 
-    hashed_password_value = hash_password(password_data.password)
+    hashed_password_value = await hash_password_async(password_data.password)
 
     try:
         success = await people_queries.update_person_password_hash(person_id, hashed_password_value)
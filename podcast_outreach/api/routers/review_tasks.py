@@ -50,20 +50,35 @@ async def list_review_tasks(
     task_status: Optional[str] = Query(None, description="Filter by task status (e.g., 'pending', 'approved', 'completed')"),
     assigned_to_id: Optional[int] = Query(None, description="Filter by ID of the person assigned"),
     campaign_id: Optional[str] = Query(None, description="Filter by campaign UUID"), # Keep as str for Query
-    page: int = Query(1, ge=1, description="Page number"),
-    size: int = Query(20, ge=1, le=100, description="Number of items per page")
+    page: int = Query(1, ge=1, description="Page number (ignored when cursor is given)"),
+    size: int = Query(20, ge=1, le=100, description="Number of items per page"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page's next_cursor")
 ):
-    """List review tasks with filtering and pagination."""
+    """List review tasks with filtering and pagination.
+    Follow next_cursor for constant-cost paging; total is a cached or estimated count."""
     try:
-        tasks, total_count = await review_task_queries.get_all_review_tasks_paginated(
-            page=page,
-            size=size,
-            task_type=task_type,
-            status=task_status,
-            assigned_to_id=assigned_to_id,
-            campaign_id=campaign_id
-        )
-        return {"items": tasks, "total": total_count, "page": page, "size": size}
+        if cursor:
+            tasks, next_cursor, total_count = await review_task_queries.get_review_tasks_keyset(
+                size=size,
+                cursor=cursor,
+                task_type=task_type,
+                status=task_status,
+                assigned_to_id=assigned_to_id,
+                campaign_id=campaign_id
+            )
+        else:
+            tasks, total_count = await review_task_queries.get_all_review_tasks_paginated(
+                page=page,
+                size=size,
+                task_type=task_type,
+                status=task_status,
+                assigned_to_id=assigned_to_id,
+                campaign_id=campaign_id
+            )
+            next_cursor = review_task_queries.review_task_cursor(tasks[-1]) if len(tasks) >= size else None
+        return {"items": tasks, "total": total_count, "page": page, "size": size, "next_cursor": next_cursor}
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         logger.exception(f"Error listing review tasks: {e}")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to list review tasks.")
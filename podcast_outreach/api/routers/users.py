@@ -1,19 +1,20 @@
 # podcast_outreach/api/routers/users.py (or people.py)
+import os
 import logging
 import asyncio
-import threading
-import json
 import uuid
 import secrets
 from datetime import datetime, timedelta, timezone
 
 from fastapi import APIRouter, Depends, HTTPException, status, Request, BackgroundTasks, Query, Form
+from fastapi.responses import FileResponse, RedirectResponse
 from typing import Dict, Any, Optional, List
 from pydantic import EmailStr, BaseModel, Field
 
 from ..schemas.person_schemas import PersonInDB, PersonCreate, PersonUpdate
 from ..schemas.settings_schemas import (
     UserDataExportResponse, 
+    DataExportJobStatus,
     AccountDeletionRequest, 
     AccountDeletionResponse,
     AccountDeletionConfirm,
@@ -22,18 +23,20 @@ from ..schemas.settings_schemas import (
 )
 from ..schemas import client_profile_schemas
 from podcast_outreach.database.queries import people as people_queries
-from ..dependencies import get_current_user, get_admin_user, hash_password, verify_password
+from ..dependencies import get_current_user, get_admin_user, hash_password_async, verify_password_async
 from podcast_outreach.logging_config import get_logger
 
 from podcast_outreach.database.queries import people as people_queries
-from podcast_outreach.database.queries import campaigns as campaign_queries
-from podcast_outreach.database.queries import placements as placement_queries
 from podcast_outreach.database.queries import client_profiles as client_profile_queries
-from podcast_outreach.database.queries import pitches as pitch_queries
 from podcast_outreach.config import ( # For default allowances
     FREE_PLAN_DAILY_DISCOVERY_LIMIT, FREE_PLAN_WEEKLY_DISCOVERY_LIMIT
 )
 from podcast_outreach.services.tasks.manager import task_manager
+from podcast_outreach.database.queries import data_exports as data_export_queries
+from podcast_outreach.services.data_export_service import (
+    DATA_EXPORT_STALE_SECONDS, export_download_url, export_filename
+)
+from podcast_outreach.services.storage_service import storage_service
 from ..schemas.settings_schemas import ProfileImageUpdateRequest # Import the new schema
 from ..schemas.person_schemas import PersonInDB # Ensure this is imported
 
@@ -93,7 +96,7 @@ async def create_person(
 ):
     # Hash password if provided
     if person_data.dashboard_password:
-        person_data.dashboard_password_hash = hash_password(person_data.dashboard_password)
+        person_data.dashboard_password_hash = await hash_password_async(person_data.dashboard_password)
     
     person_dict = person_data.model_dump(exclude_unset=True)
     # Remove plain password if hash was created, to avoid storing it if not handled by schema
@@ -132,7 +135,7 @@ async def update_person(
 ):
     update_data = person_update_data.model_dump(exclude_unset=True)
     if person_update_data.dashboard_password:
-        update_data["dashboard_password_hash"] = hash_password(person_update_data.dashboard_password)
+        update_data["dashboard_password_hash"] = await hash_password_async(person_update_data.dashboard_password)
         if 'dashboard_password' in update_data: # Ensure plain password isn't passed to DB query
             del update_data['dashboard_password']
     
@@ -221,11 +224,11 @@ async def change_my_password(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="User account issue or password not set.")
 
     # Verify current password
-    if not verify_password(current_password, user_record["dashboard_password_hash"]):
+    if not await verify_password_async(current_password, user_record["dashboard_password_hash"]):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Current password is incorrect.")
 
     # Hash new password and update
-    new_password_hash = hash_password(new_password)
+    new_password_hash = await hash_password_async(new_password)
     success = await people_queries.update_person_password_hash(person_id, new_password_hash)
 
     if not success:
@@ -235,113 +238,72 @@ async def change_my_password(
     logger.info(f"Password successfully changed for user {person_id} ({current_user.get('username')})")
     return {"message": "Password updated successfully."}
 
-# --- Data Export Endpoint ---
-async def perform_data_export_task(user_id: int, user_email: str, stop_flag: threading.Event):
-    """
-    Asynchronous task to gather user data and email it.
-    This function will be run by the task_manager in a separate thread.
-    """
-    try:
-        logger.info(f"[DataExportTask user_id={user_id}] Starting data export...")
-        if stop_flag.is_set(): logger.info(f"[DataExportTask user_id={user_id}] Task cancelled before start."); return
-
-        # 1. Fetch all related data
-        # IMPORTANT: Ensure these query functions are async and properly handle DB connections if called from a thread
-        # You might need to initialize/close DB pool within this task if task_manager runs it in a new thread context
-        # For simplicity, assuming queries can be called.
-        
-        # await init_db_pool() # If needed within the task thread
-
-        person_data = await people_queries.get_person_by_id_from_db(user_id)
-        if not person_data:
-            logger.error(f"[DataExportTask user_id={user_id}] User not found.")
-            await email_service.send_email(user_email, "Data Export Failed", "We could not find your user account to export data.")
-            return
-
-        campaigns_data = await campaign_queries.get_campaigns_by_person_id_for_export(user_id) # Needs new query
-        placements_data = await placement_queries.get_placements_for_person_for_export(user_id) # Needs new query
-        pitches_data = await pitch_queries.get_pitches_for_person_for_export(user_id) # Needs new query
-        # media_kits_data = await media_kit_queries.get_media_kits_for_person(user_id) # When implemented
-
-        if stop_flag.is_set(): logger.info(f"[DataExportTask user_id={user_id}] Task cancelled after data fetch."); return
-
-
-        # 2. Compile data into a structured format (e.g., JSON)
-        export_data = {
-            "profile": person_data,
-            "campaigns": campaigns_data,
-            "placements": placements_data,
-            "pitches": pitches_data,
-            # "media_kits": media_kits_data,
-            "export_timestamp": datetime.utcnow().isoformat()
-        }
-        
-        # Convert to JSON string (or create CSVs and zip them)
-        export_content_json = json.dumps(export_data, indent=2, default=str) # default=str for datetime/UUID
-
-        if stop_flag.is_set(): logger.info(f"[DataExportTask user_id={user_id}] Task cancelled before email send."); return
-
-        # 3. Email the data (or a link to it)
-        # For large data, upload to secure storage (e.g., S3 presigned URL) and email the link.
-        # For smaller data, can attach directly or include in email body (if very small).
-        email_subject = "Your PGL System Data Export"
-        email_body = f"""
-        <p>Hello {person_data.get('full_name', 'User')},</p>
-        <p>Your data export from the PGL System is ready. Please find your data attached (or download from the link below).</p>
-        <p><strong>Note:</strong> For security, if this is a download link, it may expire.</p>
-        <pre>{export_content_json[:2000]}...</pre> 
-        <p>If the data is too large to display here, it would be attached or linked.</p>
-        <p>Regards,<br>The PGL System Team</p>
-        """ # In a real scenario, attach as a file.
-
-        await email_service.send_email(user_email, email_subject, email_body)
-        logger.info(f"[DataExportTask user_id={user_id}] Data export email sent to {user_email}.")
-
-    except Exception as e:
-        logger.error(f"[DataExportTask user_id={user_id}] Error during data export: {e}", exc_info=True)
-        try:
-            await email_service.send_email(user_email, "Data Export Failed", f"An error occurred while processing your data export request: {str(e)}")
-        except Exception as email_err:
-            logger.error(f"[DataExportTask user_id={user_id}] Failed to send error email for data export: {email_err}")
-    finally:
-        # await close_db_pool() # If DB pool was initialized in this task
-        logger.info(f"[DataExportTask user_id={user_id}] Data export task finished.")
-        # task_manager.cleanup_task(task_id_from_manager) # If task_manager needs explicit cleanup signal
-
+# --- Data Export Endpoints ---
+def _export_job_status(job: Dict[str, Any]) -> DataExportJobStatus:
+    return DataExportJobStatus(
+        **{k: job.get(k) for k in DataExportJobStatus.model_fields if k != "download_url"},
+        download_url=export_download_url(job["export_id"]) if job["status"] == "completed" else None
+    )
 
 @router.post("/export-data", response_model=UserDataExportResponse, status_code=status.HTTP_202_ACCEPTED)
-async def request_data_export(
-    background_tasks: BackgroundTasks,
-    current_user: Dict[str, Any] = Depends(get_current_user)
-):
+async def request_data_export(current_user: Dict[str, Any] = Depends(get_current_user)):
+    """
+    Starts a GDPR data export job. Poll GET /users/export-data/{task_id} for its status;
+    when it completes, the ZIP is downloaded from its download_url (also emailed).
+    """
     person_id = current_user.get("person_id")
-    user_email = current_user.get("username") # Assuming username is email
-
-    if not person_id or not user_email:
+    if not person_id:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not properly identified.")
 
-    # Using FastAPI's BackgroundTasks for simplicity here.
-    # If using your custom task_manager, adapt this part.
-    task_id_for_response = str(uuid.uuid4()) # Generate a simple ID for response
-    
-    logger.info(f"User {person_id} ({user_email}) requested data export. Task ID for response: {task_id_for_response}")
+    active_job = await data_export_queries.get_active_export_job(person_id, DATA_EXPORT_STALE_SECONDS)
+    if active_job:
+        return UserDataExportResponse(
+            message="A data export is already in progress.",
+            task_id=str(active_job["export_id"])
+        )
 
-    # If your perform_data_export_task is truly async and handles its own DB connections:
-    background_tasks.add_task(perform_data_export_task, person_id, user_email, threading.Event()) # Pass a dummy event if not using task_manager's stop_flag
-
-    # If using your existing TaskManager:
-    # task_manager_id = str(uuid.uuid4())
-    # task_manager.start_task(task_manager_id, "data_export")
-    # thread = threading.Thread(target=asyncio.run, args=(perform_data_export_task(person_id, user_email, task_manager.get_stop_flag(task_manager_id)),))
-    # thread.start()
-    # task_id_for_response = task_manager_id
+    job = await data_export_queries.create_export_job(person_id)
+    if not job:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Could not start the data export.")
 
+    task_id = str(job["export_id"])
+    logger.info(f"User {person_id} requested data export {task_id}.")
+    task_manager.start_task(task_id, "data_export")
+    task_manager.run_data_export(task_id, job["export_id"])
 
     return UserDataExportResponse(
-        message="Data export process initiated. You will receive an email with your data shortly.",
-        task_id=task_id_for_response # Optional: return a task ID if you want frontend to poll status
+        message="Data export process initiated. You will receive an email with a download link when it is ready.",
+        task_id=task_id
     )
 
+@router.get("/export-data/{export_id}", response_model=DataExportJobStatus)
+async def get_data_export_status(export_id: uuid.UUID, current_user: Dict[str, Any] = Depends(get_current_user)):
+    job = await data_export_queries.get_export_job(export_id, person_id=current_user.get("person_id"))
+    if not job:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Data export not found.")
+    return _export_job_status(job)
+
+@router.get("/export-data/{export_id}/download")
+async def download_data_export(export_id: uuid.UUID, current_user: Dict[str, Any] = Depends(get_current_user)):
+    """Redirects to a short-lived S3 link for the export ZIP (or streams it from local storage)."""
+    job = await data_export_queries.get_export_job(export_id, person_id=current_user.get("person_id"))
+    if not job:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Data export not found.")
+    if job["status"] != "completed":
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=f"Data export is {job['status']}.")
+    if job["expires_at"] and job["expires_at"] < datetime.now(timezone.utc):
+        raise HTTPException(status_code=status.HTTP_410_GONE, detail="Data export has expired. Please request a new one.")
+
+    filename = export_filename(job)
+    if job["storage"] == "s3":
+        url = storage_service.generate_presigned_download_url(job["object_key"], expiration=300, filename=filename)
+        if not url:
+            raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Download is temporarily unavailable.")
+        return RedirectResponse(url, status_code=status.HTTP_307_TEMPORARY_REDIRECT)
+    if not os.path.exists(job["object_key"]):
+        raise HTTPException(status_code=status.HTTP_410_GONE, detail="Data export file is no longer available.")
+    return FileResponse(job["object_key"], media_type="application/zip", filename=filename)
+
 
 # --- Account Deletion Endpoints ---
 # Temporary storage for deletion tokens (IN PRODUCTION, USE A DATABASE OR REDIS)
@@ -362,7 +324,7 @@ async def request_account_deletion(
     if not user_record or not user_record.get("dashboard_password_hash"):
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Password not set or user record issue.")
 
-    if not verify_password(request_data.password, user_record["dashboard_password_hash"]):
+    if not await verify_password_async(request_data.password, user_record["dashboard_password_hash"]):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Incorrect password.")
 
     token = secrets.token_urlsafe(32)
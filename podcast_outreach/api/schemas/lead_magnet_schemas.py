@@ -1,5 +1,6 @@
 from pydantic import BaseModel, EmailStr, Field
 from typing import Dict, Any, Optional
+from datetime import datetime
 import uuid
 
 class LeadMagnetSubmission(BaseModel):
@@ -19,4 +20,17 @@ class LeadMagnetResponse(BaseModel):
     message: str
     person_id: Optional[int] = None
     campaign_id: Optional[uuid.UUID] = None
-    media_kit_slug: Optional[str] = None 
\ No newline at end of file
+    media_kit_slug: Optional[str] = None
+    # Set when the submission was queued; poll GET /public/lead-magnet/status/{tracking_token}
+    tracking_token: Optional[uuid.UUID] = None
+    status: Optional[str] = None
+
+class LeadMagnetJobStatus(BaseModel):
+    tracking_token: uuid.UUID
+    status: str = Field(..., description="pending, running, completed or failed")
+    message: str
+    person_id: Optional[int] = None
+    campaign_id: Optional[uuid.UUID] = None
+    media_kit_slug: Optional[str] = None
+    created_at: datetime
+    completed_at: Optional[datetime] = None 
\ No newline at end of file
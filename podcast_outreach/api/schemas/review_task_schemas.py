@@ -49,4 +49,5 @@ class PaginatedReviewTaskList(BaseModel):
     items: List[ReviewTaskResponse]
     total: int
     page: int
-    size: int 
\ No newline at end of file
+    size: int
+    next_cursor: Optional[str] = Field(None, description="Pass as `cursor` to fetch the next page; null on the last page") 
\ No newline at end of file
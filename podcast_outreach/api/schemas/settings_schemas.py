@@ -1,6 +1,8 @@
 # podcast_outreach/api/schemas/settings_schemas.py
+import uuid
+from datetime import datetime
 from pydantic import BaseModel, EmailStr, Field, HttpUrl
-from typing import Optional
+from typing import Dict, Optional
 
 class NotificationSettingsUpdate(BaseModel):
     emailNotifications: Optional[bool] = None
@@ -17,7 +19,19 @@ class PrivacySettingsUpdate(BaseModel):
 
 class UserDataExportResponse(BaseModel):
     message: str
-    task_id: Optional[str] = None # If using task_manager to track the async export
+    task_id: Optional[str] = None # The export_id; poll GET /users/export-data/{task_id}
+
+class DataExportJobStatus(BaseModel):
+    export_id: uuid.UUID
+    status: str # pending, running, completed, failed
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+    expires_at: Optional[datetime] = None
+    size_bytes: Optional[int] = None
+    row_counts: Optional[Dict[str, int]] = None
+    download_url: Optional[str] = None
+    error: Optional[str] = None
 
 class AccountDeletionRequest(BaseModel):
     password: str = Field(..., description="Current password for verification")
@@ -1,138 +1,546 @@
 # podcast_outreach/database/connection.py
 
 import os
+import time
+import asyncio
 import asyncpg
 import logging
-from typing import Optional
+import functools
+from enum import Enum
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+import itertools
+from typing import Any, Deque, Dict, List, Optional
+from cachetools import TTLCache
 
 logger = logging.getLogger(__name__)
 
+# --- Workload Classes ---
+
+class Workload(str, Enum):
+    """Workload classes, each served by its own pool sized and timed for it."""
+    INTERACTIVE = "interactive"  # API requests: short queries, fail fast
+    PIPELINE = "pipeline"        # Background pipelines (discovery, enrichment, vetting)
+    BULK = "bulk"                # Batch inserts/updates and large scans
+    REPORTING = "reporting"      # Aggregations for reports and metrics
+
+# Defaults per workload; any value can be overridden with DB_POOL_<WORKLOAD>_<SETTING>,
+# e.g. DB_POOL_BULK_MAX_SIZE=6. An acquire_timeout of 0 waits indefinitely.
+WORKLOAD_POOL_DEFAULTS: Dict[Workload, Dict[str, float]] = {
+    Workload.INTERACTIVE: {
+        "min_size": 3, "max_size": 10, "connect_timeout": 30, "command_timeout": 60,
+        "acquire_timeout": 30, "max_queries": 10000, "max_inactive_connection_lifetime": 300,
+    },
+    Workload.PIPELINE: {
+        "min_size": 2, "max_size": 8, "connect_timeout": 60, "command_timeout": 1800,
+        "acquire_timeout": 0, "max_queries": 50000, "max_inactive_connection_lifetime": 3600,
+    },
+    Workload.BULK: {
+        "min_size": 0, "max_size": 4, "connect_timeout": 60, "command_timeout": 1800,
+        "acquire_timeout": 0, "max_queries": 50000, "max_inactive_connection_lifetime": 600,
+    },
+    Workload.REPORTING: {
+        "min_size": 0, "max_size": 3, "connect_timeout": 30, "command_timeout": 300,
+        "acquire_timeout": 60, "max_queries": 10000, "max_inactive_connection_lifetime": 300,
+    },
+}
+
+# Acquires slower than this are logged as a sign the workload's pool is saturated
+SLOW_ACQUIRE_SECONDS = float(os.getenv("DB_POOL_SLOW_ACQUIRE_SECONDS", "1.0"))
+
+def _pool_settings(prefix: str, defaults: Dict[str, float]) -> Dict[str, float]:
+    settings = {}
+    for key, default in defaults.items():
+        raw = os.getenv(f"DB_POOL_{prefix}_{key.upper()}")
+        settings[key] = float(raw) if raw not in (None, "") else default
+    return settings
+
+def workload_pool_settings(workload: Workload) -> Dict[str, float]:
+    return _pool_settings(workload.name, WORKLOAD_POOL_DEFAULTS[workload])
+
+# The workload of the running task; get_db_pool() routes by it. Context variables are
+# task-local, so a pipeline declaring PIPELINE never moves API requests off their pool.
+_current_workload: ContextVar[Workload] = ContextVar("db_workload", default=Workload.INTERACTIVE)
+
+def current_workload() -> Workload:
+    return _current_workload.get()
+
+def set_workload(workload: Workload) -> Token:
+    """Routes this task's get_db_pool() calls to `workload`; undo with reset_workload(token)."""
+    return _current_workload.set(workload)
+
+def reset_workload(token: Token) -> None:
+    _current_workload.reset(token)
+
+@contextmanager
+def use_workload(workload: Workload):
+    """Routes get_db_pool() calls in this block (and tasks started from it) to `workload`."""
+    token = _current_workload.set(workload)
+    try:
+        yield
+    finally:
+        _current_workload.reset(token)
+
+def workload(kind: Workload):
+    """Declares the workload class of an async query function."""
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            with use_workload(kind):
+                return await func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+# --- Pool Wait Metrics ---
+
+class PoolWaitMetrics:
+    """Acquire wait-time statistics for one workload pool."""
+
+    def __init__(self, sample_size: int = 1000):
+        self.acquired = 0
+        self.timeouts = 0
+        self.waiting = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self._recent: Deque[float] = deque(maxlen=sample_size)
+
+    def record(self, wait: float) -> None:
+        self.acquired += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+        self._recent.append(wait)
+
+    def snapshot(self) -> Dict[str, Any]:
+        recent = sorted(self._recent)
+        p95 = recent[min(len(recent) - 1, int(len(recent) * 0.95))] if recent else 0.0
+        return {
+            "acquired": self.acquired,
+            "timeouts": self.timeouts,
+            "waiting": self.waiting,
+            "wait_ms_avg": round(1000 * self.total_wait / self.acquired, 2) if self.acquired else 0.0,
+            "wait_ms_p95": round(1000 * p95, 2),
+            "wait_ms_max": round(1000 * self.max_wait, 2),
+        }
+
+# Keyed by pool name: the workload value, or "replica<N>" for read replicas
+POOL_METRICS: Dict[str, PoolWaitMetrics] = {w.value: PoolWaitMetrics() for w in Workload}
+
+class _MeteredAcquire:
+    """Supports both `async with pool.acquire()` and `await pool.acquire()`."""
+
+    def __init__(self, metered: "MeteredPool", timeout: Optional[float]):
+        self._metered = metered
+        self._timeout = timeout
+        self._conn = None
+
+    async def _acquire(self):
+        metrics = POOL_METRICS.setdefault(self._metered.name, PoolWaitMetrics())
+        metrics.waiting += 1
+        start = time.perf_counter()
+        try:
+            conn = await self._metered.raw.acquire(timeout=self._timeout)
+        except asyncio.TimeoutError:
+            metrics.timeouts += 1
+            logger.warning(f"Timed out after {self._timeout}s acquiring a {self._metered.name} DB connection.")
+            raise
+        finally:
+            metrics.waiting -= 1
+        wait = time.perf_counter() - start
+        metrics.record(wait)
+        if wait >= SLOW_ACQUIRE_SECONDS:
+            logger.warning(f"Waited {wait:.2f}s for a {self._metered.name} DB connection.")
+        return conn
+
+    def __await__(self):
+        return self._acquire().__await__()
+
+    async def __aenter__(self):
+        self._conn = await self._acquire()
+        return self._conn
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        conn, self._conn = self._conn, None
+        await self._metered.raw.release(conn)
+
+class MeteredPool:
+    """asyncpg pool proxy that applies the pool's acquire timeout and records wait times."""
+
+    def __init__(self, pool: asyncpg.Pool, name: str, acquire_timeout: Optional[float]):
+        self.raw = pool
+        self.name = name
+        self.acquire_timeout = acquire_timeout
+
+    def acquire(self, *, timeout: Optional[float] = None) -> _MeteredAcquire:
+        return _MeteredAcquire(self, timeout if timeout is not None else self.acquire_timeout)
+
+    def __getattr__(self, name):
+        return getattr(self.raw, name)
+
 # --- Connection Pool Management ---
+_POOLS: Dict[Workload, asyncpg.Pool] = {}
+_METERED_POOLS: Dict[Workload, MeteredPool] = {}
+# Kept as module globals for monitoring code that reads them directly
 DB_POOL: Optional[asyncpg.Pool] = None
 BACKGROUND_TASK_POOL: Optional[asyncpg.Pool] = None
 
+def _sync_legacy_globals() -> None:
+    global DB_POOL, BACKGROUND_TASK_POOL
+    DB_POOL = _POOLS.get(Workload.INTERACTIVE)
+    BACKGROUND_TASK_POOL = _POOLS.get(Workload.PIPELINE)
+
+def _pool_is_open(pool: Optional[asyncpg.Pool]) -> bool:
+    return pool is not None and not pool._closed
+
+async def init_workload_pool(workload: Workload) -> asyncpg.Pool:
+    """Initializes the connection pool for `workload` if it is not already open."""
+    pool = _POOLS.get(workload)
+    if _pool_is_open(pool):
+        return pool
+    try:
+        user = os.getenv("PGUSER")
+        password = os.getenv("PGPASSWORD")
+        host = os.getenv("PGHOST")
+        port = os.getenv("PGPORT")
+        dbname = os.getenv("PGDATABASE")
+        settings = workload_pool_settings(workload)
+        connect_timeout_seconds = int(settings["connect_timeout"])
+        command_timeout_seconds = int(settings["command_timeout"])
+
+        if not all([user, password, host, port, dbname]):
+            logger.error("Database connection parameters missing.")
+            raise ValueError("DB connection parameters missing for DSN.")
+
+        dsn = f"postgresql://{user}:{password}@{host}:{port}/{dbname}?connect_timeout={connect_timeout_seconds}&command_timeout={command_timeout_seconds}"
+
+        logger.info(
+            f"Initializing {workload.value} DB pool (size={int(settings['min_size'])}-{int(settings['max_size'])}, "
+            f"connect_timeout={connect_timeout_seconds}s, acquire_timeout={settings['acquire_timeout'] or 'none'})"
+        )
+
+        pool = await asyncpg.create_pool(
+            dsn=dsn,
+            min_size=int(settings["min_size"]),
+            max_size=int(settings["max_size"]),
+            command_timeout=command_timeout_seconds,
+            timeout=connect_timeout_seconds,
+            max_queries=int(settings["max_queries"]),
+            max_inactive_connection_lifetime=settings["max_inactive_connection_lifetime"],
+        )
+        _POOLS[workload] = pool
+        _METERED_POOLS[workload] = MeteredPool(pool, workload.value, settings["acquire_timeout"] or None)
+        _sync_legacy_globals()
+        logger.info(f"{workload.value.capitalize()} database connection pool initialized successfully.")
+    except Exception as e:
+        logger.error(f"Error initializing {workload.value} database pool: {e}", exc_info=True)
+        raise
+    return pool
+
+async def get_pool(kind: Optional[Workload] = None) -> MeteredPool:
+    """Returns the (metered) pool for `kind`, defaulting to the current task's workload."""
+    kind = kind or _current_workload.get()
+    if not _pool_is_open(_POOLS.get(kind)):
+        await init_workload_pool(kind)
+    return _METERED_POOLS[kind]
+
 async def init_db_pool():
     """Initializes the global PostgreSQL connection pool for frontend requests."""
-    global DB_POOL
-    if DB_POOL is None or DB_POOL._closed:
-        try:
-            user = os.getenv("PGUSER")
-            password = os.getenv("PGPASSWORD")
-            host = os.getenv("PGHOST")
-            port = os.getenv("PGPORT")
-            dbname = os.getenv("PGDATABASE")
-            connect_timeout_seconds = 30
-            pool_acquire_timeout_seconds = 10 # Shorter timeout for frontend requests
-
-            if not all([user, password, host, port, dbname]):
-                logger.error("Database connection parameters missing.")
-                raise ValueError("DB connection parameters missing for DSN.")
-
-            dsn = f"postgresql://{user}:{password}@{host}:{port}/{dbname}?connect_timeout={connect_timeout_seconds}&command_timeout=60"
-            
-            logger.info(f"Initializing frontend DB pool with DSN (connect_timeout={connect_timeout_seconds}s, acquire_timeout={pool_acquire_timeout_seconds}s)")
-
-            DB_POOL = await asyncpg.create_pool(
-                dsn=dsn,
-                min_size=3,         # Smaller pool for frontend requests
-                max_size=10,        # Reasonable limit for web requests  
-                command_timeout=60, # Shorter timeout for frontend operations
-                timeout=pool_acquire_timeout_seconds, # Quick timeout for responsive UI
-                max_queries=10000,  # Reasonable limit per connection
-                max_inactive_connection_lifetime=300  # 5 minutes for frontend connections
-            )
-            logger.info("Frontend database connection pool initialized successfully.")
-        except Exception as e:
-            logger.error(f"Error initializing frontend database pool: {e}", exc_info=True)
-            raise
-    return DB_POOL
+    return await init_workload_pool(Workload.INTERACTIVE)
 
 async def init_background_task_pool():
     """Initializes a separate connection pool specifically for background tasks."""
-    global BACKGROUND_TASK_POOL
-    if BACKGROUND_TASK_POOL is None or BACKGROUND_TASK_POOL._closed:
-        try:
-            user = os.getenv("PGUSER")
-            password = os.getenv("PGPASSWORD")
-            host = os.getenv("PGHOST")
-            port = os.getenv("PGPORT")
-            dbname = os.getenv("PGDATABASE")
-            connect_timeout_seconds = 60
-            pool_acquire_timeout_seconds = 60 # Longer timeout for background tasks
-
-            if not all([user, password, host, port, dbname]):
-                logger.error("Database connection parameters missing.")
-                raise ValueError("DB connection parameters missing for DSN.")
-
-            dsn = f"postgresql://{user}:{password}@{host}:{port}/{dbname}?connect_timeout={connect_timeout_seconds}&command_timeout=1800"
-            
-            logger.info(f"Initializing background task DB pool with DSN (connect_timeout={connect_timeout_seconds}s, acquire_timeout={pool_acquire_timeout_seconds}s)")
-
-            BACKGROUND_TASK_POOL = await asyncpg.create_pool(
-                dsn=dsn,
-                min_size=2,         # Small dedicated pool for background tasks
-                max_size=8,         # Sufficient for concurrent background operations
-                command_timeout=1800, # Extended timeout for long AI operations (30 minutes)
-                timeout=pool_acquire_timeout_seconds, # Longer timeout for background tasks
-                max_queries=50000,  # Higher limit for background processing
-                max_inactive_connection_lifetime=3600  # 1 hour for long-running tasks
-            )
-            logger.info("Background task database connection pool initialized successfully.")
-        except Exception as e:
-            logger.error(f"Error initializing background task database pool: {e}", exc_info=True)
-            raise
-    return BACKGROUND_TASK_POOL
+    return await init_workload_pool(Workload.PIPELINE)
 
-async def get_db_pool() -> asyncpg.Pool:
-    """Returns the frontend PostgreSQL connection pool, initializing it if necessary."""
-    if DB_POOL is None or DB_POOL._closed:
-        return await init_db_pool()
-    return DB_POOL
+async def get_db_pool() -> MeteredPool:
+    """Returns the pool for the current workload: the frontend pool unless the running
+    query function or task declared another workload class. Inside @replica_read
+    functions this is a read replica when one is usable."""
+    if _prefer_replica.get():
+        return await get_read_pool()
+    return await get_pool()
 
-async def get_background_task_pool() -> asyncpg.Pool:
+async def get_background_task_pool() -> MeteredPool:
     """Returns the background task PostgreSQL connection pool, initializing it if necessary."""
-    if BACKGROUND_TASK_POOL is None or BACKGROUND_TASK_POOL._closed:
-        return await init_background_task_pool()
-    return BACKGROUND_TASK_POOL
+    return await get_pool(Workload.PIPELINE)
+
+async def close_workload_pool(workload: Workload) -> None:
+    pool = _POOLS.pop(workload, None)
+    _METERED_POOLS.pop(workload, None)
+    _sync_legacy_globals()
+    if _pool_is_open(pool):
+        await pool.close()
+        logger.info(f"{workload.value.capitalize()} database connection pool closed.")
 
 async def reset_db_pool():
     """Forces recreation of the frontend database pool with current configuration."""
-    global DB_POOL
-    if DB_POOL and not DB_POOL._closed:
-        await DB_POOL.close()
-        DB_POOL = None
-        logger.info("Frontend database connection pool reset.")
+    await close_workload_pool(Workload.INTERACTIVE)
     return await init_db_pool()
 
 async def reset_background_task_pool():
     """Forces recreation of the background task database pool with current configuration."""
-    global BACKGROUND_TASK_POOL
-    if BACKGROUND_TASK_POOL and not BACKGROUND_TASK_POOL._closed:
-        await BACKGROUND_TASK_POOL.close()
-        BACKGROUND_TASK_POOL = None
-        logger.info("Background task database connection pool reset.")
+    await close_workload_pool(Workload.PIPELINE)
     return await init_background_task_pool()
 
 async def close_db_pool():
     """Closes the frontend PostgreSQL connection pool."""
-    global DB_POOL
-    if DB_POOL and not DB_POOL._closed:
-        await DB_POOL.close()
-        DB_POOL = None
-        logger.info("Frontend database connection pool closed.")
+    await close_workload_pool(Workload.INTERACTIVE)
 
 async def close_background_task_pool():
     """Closes the background task PostgreSQL connection pool."""
-    global BACKGROUND_TASK_POOL
-    if BACKGROUND_TASK_POOL and not BACKGROUND_TASK_POOL._closed:
-        await BACKGROUND_TASK_POOL.close()
-        BACKGROUND_TASK_POOL = None
-        logger.info("Background task database connection pool closed.")
+    await close_workload_pool(Workload.PIPELINE)
 
 async def close_all_pools():
-    """Closes both frontend and background task connection pools."""
-    await close_db_pool()
-    await close_background_task_pool()
+    """Closes every workload connection pool and any read replica pools."""
+    for kind in list(_POOLS):
+        await close_workload_pool(kind)
+    for replica in _REPLICAS:
+        await replica.close()
+
+def get_pool_stats() -> Dict[str, Any]:
+    """Size and acquire wait-time statistics per workload pool."""
+    stats = {}
+    for kind in Workload:
+        entry: Dict[str, Any] = {"open": _pool_is_open(_POOLS.get(kind))}
+        if entry["open"]:
+            pool = _POOLS[kind]
+            entry.update({
+                "size": pool.get_size(),
+                "min_size": pool.get_min_size(),
+                "max_size": pool.get_max_size(),
+                "idle_connections": pool.get_idle_size(),
+            })
+        entry.update(POOL_METRICS[kind.value].snapshot())
+        stats[kind.value] = entry
+    for replica in _REPLICAS:
+        entry = {"open": replica.pool is not None and _pool_is_open(replica.pool.raw),
+                 "healthy": replica.healthy, "lag_seconds": replica.lag}
+        if replica.name in POOL_METRICS:
+            entry.update(POOL_METRICS[replica.name].snapshot())
+        stats[replica.name] = entry
+    return stats
+
+# --- Read Replicas ---
+# Read-only query functions opt in with @replica_read; everything else stays on the primary.
+# A replica is used only while its measured replay lag is within DB_REPLICA_MAX_LAG_SECONDS,
+# and any failure to get a replica connection falls back to the primary.
+
+REPLICA_DSNS = [dsn.strip() for dsn in os.getenv("DB_REPLICA_DSNS", "").split(",") if dsn.strip()]
+REPLICA_MAX_LAG_SECONDS = float(os.getenv("DB_REPLICA_MAX_LAG_SECONDS", "5"))
+REPLICA_LAG_CHECK_SECONDS = float(os.getenv("DB_REPLICA_LAG_CHECK_SECONDS", "10"))
+# After a user's @primary_write in an interactive request, that user's replica reads go to
+# the primary for this long so their next request sees their own change
+REPLICA_STICKY_SECONDS = float(os.getenv("DB_REPLICA_STICKY_SECONDS", str(REPLICA_MAX_LAG_SECONDS)))
+
+REPLICA_POOL_DEFAULTS: Dict[str, float] = {
+    "min_size": 0, "max_size": 5, "connect_timeout": 10, "command_timeout": 300,
+    "acquire_timeout": 10, "max_queries": 10000, "max_inactive_connection_lifetime": 300,
+}
+
+# Zero when the replica has replayed everything it received, otherwise time since last replay
+REPLICA_LAG_QUERY = """
+SELECT CASE
+    WHEN NOT pg_is_in_recovery() THEN 0
+    WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+    ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+END;
+"""
+
+_prefer_replica: ContextVar[bool] = ContextVar("db_prefer_replica", default=False)
+_pin_primary: ContextVar[bool] = ContextVar("db_pin_primary", default=False)
+# Who the current request acts for (the session's person_id); set by use_read_your_writes_key
+_read_your_writes_key: ContextVar[Optional[Any]] = ContextVar("db_read_your_writes_key", default=None)
+# Keys that wrote recently; entries expire after REPLICA_STICKY_SECONDS
+_recent_writers: TTLCache = TTLCache(maxsize=10000, ttl=max(REPLICA_STICKY_SECONDS, 0.001))
+
+class _Replica:
+    def __init__(self, index: int, dsn: str):
+        self.name = f"replica{index}"
+        self.dsn = dsn
+        self.pool: Optional[MeteredPool] = None
+        self.lag: Optional[float] = None
+        self.healthy = False
+        self.checked_at = float("-inf")
+        self._check: Optional[asyncio.Future] = None
+
+    async def open(self) -> MeteredPool:
+        if self.pool is None or not _pool_is_open(self.pool.raw):
+            settings = _pool_settings("REPLICA", REPLICA_POOL_DEFAULTS)
+            pool = await asyncpg.create_pool(
+                dsn=self.dsn,
+                min_size=int(settings["min_size"]),
+                max_size=int(settings["max_size"]),
+                command_timeout=settings["command_timeout"],
+                timeout=settings["connect_timeout"],
+                max_queries=int(settings["max_queries"]),
+                max_inactive_connection_lifetime=settings["max_inactive_connection_lifetime"],
+            )
+            self.pool = MeteredPool(pool, self.name, settings["acquire_timeout"] or None)
+            logger.info(f"Read replica pool {self.name} initialized.")
+        return self.pool
+
+    async def close(self) -> None:
+        pool, self.pool = self.pool, None
+        if pool is not None and _pool_is_open(pool.raw):
+            await pool.raw.close()
+            logger.info(f"Read replica pool {self.name} closed.")
+
+    async def check_lag(self) -> None:
+        try:
+            pool = await self.open()
+            async with pool.raw.acquire(timeout=5) as conn:
+                self.lag = float(await conn.fetchval(REPLICA_LAG_QUERY))
+            self.healthy = True
+        except Exception as e:
+            if self.healthy:
+                logger.warning(f"Read replica {self.name} unavailable, using the primary: {e}")
+            self.healthy = False
+        finally:
+            self.checked_at = time.monotonic()
+
+    def refresh_if_due(self) -> None:
+        """Starts a background lag check when the last one is older than the check interval."""
+        if time.monotonic() - self.checked_at < REPLICA_LAG_CHECK_SECONDS:
+            return
+        if self._check is None or self._check.done():
+            self._check = asyncio.ensure_future(self.check_lag())
+
+    def usable(self, max_lag: float) -> bool:
+        return self.healthy and self.lag is not None and self.lag <= max_lag
+
+    def mark_failed(self, error: Exception) -> None:
+        logger.warning(f"Read replica {self.name} failed, falling back to the primary: {error}")
+        self.healthy = False
+        self.checked_at = time.monotonic()
+
+_REPLICAS: List[_Replica] = [_Replica(i, dsn) for i, dsn in enumerate(REPLICA_DSNS)]
+_replica_turn = itertools.count()
+
+class _ReplicaAcquire:
+    """Acquires from the replica, or from the primary if the replica cannot serve it."""
+
+    def __init__(self, read_pool: "ReplicaReadPool", timeout: Optional[float]):
+        self._read_pool = read_pool
+        self._timeout = timeout
+        self._conn = None
+
+    async def _acquire(self):
+        read_pool = self._read_pool
+        replica_pool = read_pool.replica.pool
+        try:
+            if replica_pool is None:
+                # Closed (e.g. during shutdown) after this pool proxy was handed out
+                raise asyncpg.InterfaceError(f"{read_pool.replica.name} pool is closed")
+            conn = await replica_pool.acquire(timeout=self._timeout)
+            owner = replica_pool
+        except (OSError, asyncio.TimeoutError, asyncpg.PostgresError, asyncpg.InterfaceError) as e:
+            read_pool.replica.mark_failed(e)
+            conn = await read_pool.primary.acquire(timeout=self._timeout)
+            owner = read_pool.primary
+        read_pool._owners[id(conn)] = owner
+        return conn
+
+    def __await__(self):
+        return self._acquire().__await__()
+
+    async def __aenter__(self):
+        self._conn = await self._acquire()
+        return self._conn
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        conn, self._conn = self._conn, None
+        await self._read_pool.release(conn)
+
+class ReplicaReadPool:
+    """Pool proxy for replica reads with per-acquire fallback to the primary pool."""
+
+    def __init__(self, replica: _Replica, primary: MeteredPool):
+        self.replica = replica
+        self.primary = primary
+        self.name = replica.name
+        self._owners: Dict[int, MeteredPool] = {}
+
+    def acquire(self, *, timeout: Optional[float] = None) -> _ReplicaAcquire:
+        return _ReplicaAcquire(self, timeout)
+
+    async def release(self, conn, *, timeout: Optional[float] = None) -> None:
+        owner = self._owners.pop(id(conn), self.replica.pool)
+        await owner.raw.release(conn, timeout=timeout)
+
+    def __getattr__(self, name):
+        return getattr(self.replica.pool.raw, name)
+
+def _primary_pinned() -> bool:
+    if _pin_primary.get():
+        return True
+    key = _read_your_writes_key.get()
+    return key is not None and key in _recent_writers
+
+async def get_read_pool(max_lag_seconds: Optional[float] = None):
+    """
+    Returns a pool for read-only queries: a read replica whose lag is within
+    max_lag_seconds (DB_REPLICA_MAX_LAG_SECONDS by default), otherwise the current
+    workload's primary pool. Pinned tasks always get the primary.
+    """
+    primary = await get_pool()
+    if not _REPLICAS or _primary_pinned():
+        return primary
+    max_lag = REPLICA_MAX_LAG_SECONDS if max_lag_seconds is None else max_lag_seconds
+    for replica in _REPLICAS:
+        replica.refresh_if_due()
+    candidates = [replica for replica in _REPLICAS if replica.usable(max_lag)]
+    if not candidates:
+        return primary
+    replica = candidates[next(_replica_turn) % len(candidates)]
+    return ReplicaReadPool(replica, primary)
+
+def replica_read(func):
+    """Marks an async read-only query function as safe to serve from a lagging replica."""
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        token = _prefer_replica.set(True)
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            _prefer_replica.reset(token)
+    return wrapper
+
+def pin_to_primary() -> None:
+    """
+    Sends this task's remaining replica reads to the primary. In an interactive
+    request made for a user, that user's reads stay on the primary for
+    REPLICA_STICKY_SECONDS as well; pipeline writes pin only their own task.
+    """
+    _pin_primary.set(True)
+    key = _read_your_writes_key.get()
+    if key is not None and current_workload() is Workload.INTERACTIVE:
+        _recent_writers[key] = True
+
+@contextmanager
+def use_read_your_writes_key(key: Optional[Any]):
+    """Scopes read-your-writes stickiness in this block to `key` (e.g. the session's person_id)."""
+    token = _read_your_writes_key.set(key)
+    try:
+        yield
+    finally:
+        _read_your_writes_key.reset(token)
+
+def primary_write(func):
+    """Marks an async query function whose writes later reads must observe (read-your-writes)."""
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        # Set in the caller's context (not reset) so the rest of the request stays pinned
+        pin_to_primary()
+        return await func(*args, **kwargs)
+    return wrapper
+
+@contextmanager
+def use_primary():
+    """Keeps replica-eligible reads in this block on the primary."""
+    token = _pin_primary.set(True)
+    try:
+        yield
+    finally:
+        _pin_primary.reset(token)
 
 # FastAPI dependency (if needed for routers to inject a connection)
 # async def get_db_connection_dependency() -> asyncpg.Connection:
@@ -145,13 +553,14 @@ async def close_all_pools():
 class AsyncDatabaseConnection:
     """Context manager for async database operations with helper methods."""
     
-    def __init__(self, pool: asyncpg.Pool = None):
+    def __init__(self, pool: asyncpg.Pool = None, read_replica: bool = False):
         self.pool = pool
+        self.read_replica = read_replica
         self.connection = None
     
     async def __aenter__(self):
         if self.pool is None:
-            self.pool = await get_db_pool()
+            self.pool = await (get_read_pool() if self.read_replica else get_db_pool())
         self.connection = await self.pool.acquire()
         return self
     
@@ -175,6 +584,7 @@ class AsyncDatabaseConnection:
         """Fetch a single value."""
         return await self.connection.fetchval(query, *args)
 
-def get_db_async():
-    """Get an async database connection context manager."""
-    return AsyncDatabaseConnection()
+def get_db_async(read_replica: bool = False):
+    """Get an async database connection context manager.
+    Pass read_replica=True for read-only work that tolerates replica lag."""
+    return AsyncDatabaseConnection(read_replica=read_replica)
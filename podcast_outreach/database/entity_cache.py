@@ -0,0 +1,205 @@
+# podcast_outreach/database/entity_cache.py
+
+"""
+Process-local read-through cache for heavy entity rows (campaigns, media).
+
+Pipelines such as match creation, scoring, vetting and pitch generation fetch
+the same campaign/media rows over and over within one run. These caches keep
+recently loaded rows in a size-bounded TTL map so repeated lookups skip the
+database. The same cache class also holds serialized public media kits by
+slug, so anonymous views of a shared kit do not reach Postgres. Writes through
+the query modules invalidate the affected entries,
+and when ENTITY_CACHE_NOTIFY is enabled the invalidation is also broadcast
+with Postgres NOTIFY so other worker processes drop their copies.
+"""
+
+import os
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Set, Tuple
+
+import asyncpg
+from cachetools import TTLCache
+
+logger = logging.getLogger(__name__)
+
+ENTITY_CACHE_ENABLED = os.getenv("ENTITY_CACHE_ENABLED", "true").lower() == "true"
+ENTITY_CACHE_TTL_SECONDS = int(os.getenv("ENTITY_CACHE_TTL_SECONDS", "60"))
+ENTITY_CACHE_MAX_ENTRIES = int(os.getenv("ENTITY_CACHE_MAX_ENTRIES", "2000"))
+ENTITY_CACHE_NOTIFY = os.getenv("ENTITY_CACHE_NOTIFY", "false").lower() == "true"
+# Serialized public media kits keyed by slug (see the public media kit route)
+PUBLIC_MEDIA_KIT_CACHE_TTL_SECONDS = int(os.getenv("PUBLIC_MEDIA_KIT_CACHE_TTL_SECONDS", "300"))
+
+INVALIDATION_CHANNEL = "entity_cache_invalidation"
+
+
+class EntityCache:
+    """Size-bounded TTL cache keyed by (projection, entity key) with single-flight loads."""
+
+    def __init__(self, name: str, maxsize: int = ENTITY_CACHE_MAX_ENTRIES, ttl: int = ENTITY_CACHE_TTL_SECONDS):
+        self.name = name
+        self._cache: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._inflight: Dict[Tuple[str, Hashable], asyncio.Lock] = {}
+        self._projections: Set[str] = set()
+        # Bumped on every invalidation so a load that raced with a write is not stored
+        self._version = 0
+        self.hits = 0
+        self.misses = 0
+
+    async def get_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Optional[Dict[str, Any]]]],
+        projection: str = "full",
+    ) -> Optional[Dict[str, Any]]:
+        """Returns a copy of the cached row, calling `loader` on a miss."""
+        if not ENTITY_CACHE_ENABLED:
+            return await loader()
+
+        cache_key = (projection, key)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            self.hits += 1
+            return dict(cached)
+
+        lock = self._inflight.setdefault(cache_key, asyncio.Lock())
+        try:
+            async with lock:
+                cached = self._cache.get(cache_key)
+                if cached is not None:
+                    self.hits += 1
+                    return dict(cached)
+
+                self.misses += 1
+                version_before = self._version
+                row = await loader()
+                if row is not None and self._version == version_before:
+                    self._projections.add(projection)
+                    self._cache[cache_key] = row
+                return dict(row) if row is not None else None
+        finally:
+            if not lock.locked():
+                self._inflight.pop(cache_key, None)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drops every cached projection of `key`."""
+        self._version += 1
+        for projection in list(self._projections):
+            self._cache.pop((projection, key), None)
+
+    def clear(self) -> None:
+        self._version += 1
+        self._cache.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "name": self.name,
+            "size": len(self._cache),
+            "maxsize": self._cache.maxsize,
+            "ttl_seconds": self._cache.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+        }
+
+
+campaign_cache = EntityCache("campaigns")
+media_cache = EntityCache("media")
+public_media_kit_cache = EntityCache("public_media_kits", ttl=PUBLIC_MEDIA_KIT_CACHE_TTL_SECONDS)
+
+_CACHES: Dict[str, EntityCache] = {
+    "campaign": campaign_cache,
+    "media": media_cache,
+    "media_kit": public_media_kit_cache,
+}
+
+
+def _coerce_key(entity: str, raw_key: str) -> Hashable:
+    if entity == "media":
+        return int(raw_key)
+    if entity == "media_kit":
+        return raw_key
+    import uuid
+    return uuid.UUID(raw_key)
+
+
+async def invalidate_entity(entity: str, key: Hashable, conn: Optional[asyncpg.Connection] = None) -> None:
+    """
+    Invalidates a cached entity locally and, if enabled, broadcasts the
+    invalidation to other processes over the same connection that wrote it.
+    """
+    cache = _CACHES.get(entity)
+    if cache is None:
+        return
+    if isinstance(key, str):
+        key = _coerce_key(entity, key)
+    cache.invalidate(key)
+
+    if ENTITY_CACHE_NOTIFY and conn is not None:
+        try:
+            await conn.execute("SELECT pg_notify($1, $2)", INVALIDATION_CHANNEL, f"{entity}:{key}")
+        except Exception as e:
+            logger.warning(f"Failed to publish cache invalidation for {entity} {key}: {e}")
+
+
+async def invalidate_campaign(campaign_id: Hashable, conn: Optional[asyncpg.Connection] = None) -> None:
+    await invalidate_entity("campaign", campaign_id, conn)
+
+
+async def invalidate_media(media_id: int, conn: Optional[asyncpg.Connection] = None) -> None:
+    await invalidate_entity("media", media_id, conn)
+
+
+async def invalidate_media_kit(slug: str, conn: Optional[asyncpg.Connection] = None) -> None:
+    await invalidate_entity("media_kit", slug, conn)
+
+
+def get_cache_stats() -> Dict[str, Dict[str, Any]]:
+    return {entity: cache.stats() for entity, cache in _CACHES.items()}
+
+
+# --- Cross-process invalidation via LISTEN/NOTIFY ---
+_listener_conn: Optional[asyncpg.Connection] = None
+
+
+def _on_invalidation(connection, pid, channel, payload: str) -> None:
+    try:
+        entity, raw_key = payload.split(":", 1)
+        cache = _CACHES.get(entity)
+        if cache is not None:
+            cache.invalidate(_coerce_key(entity, raw_key))
+    except Exception as e:
+        logger.warning(f"Ignoring malformed cache invalidation payload '{payload}': {e}")
+
+
+async def start_invalidation_listener() -> None:
+    """Opens a dedicated connection that LISTENs for invalidations from other processes."""
+    global _listener_conn
+    if not (ENTITY_CACHE_ENABLED and ENTITY_CACHE_NOTIFY):
+        return
+    if _listener_conn is not None and not _listener_conn.is_closed():
+        return
+    try:
+        _listener_conn = await asyncpg.connect(
+            user=os.getenv("PGUSER"),
+            password=os.getenv("PGPASSWORD"),
+            host=os.getenv("PGHOST"),
+            port=os.getenv("PGPORT"),
+            database=os.getenv("PGDATABASE"),
+        )
+        await _listener_conn.add_listener(INVALIDATION_CHANNEL, _on_invalidation)
+        logger.info(f"Entity cache listening for invalidations on '{INVALIDATION_CHANNEL}'.")
+    except Exception as e:
+        logger.error(f"Could not start entity cache invalidation listener: {e}")
+        _listener_conn = None
+
+
+async def stop_invalidation_listener() -> None:
+    global _listener_conn
+    if _listener_conn is not None and not _listener_conn.is_closed():
+        try:
+            await _listener_conn.remove_listener(INVALIDATION_CHANNEL, _on_invalidation)
+        finally:
+            await _listener_conn.close()
+    _listener_conn = None
@@ -282,6 +282,7 @@ async def update_media_episode_summaries_compiled(media_id: int) -> bool:
     )
     UPDATE media m
     SET episode_summaries_compiled = es.compiled_summaries,
+        episode_summaries_compiled_at = NOW(),
         updated_at = NOW()
     FROM episode_summaries es
     WHERE m.media_id = es.media_id
@@ -319,6 +320,7 @@ async def bulk_update_episode_summaries_compiled(media_ids: List[int]) -> int:
     )
     UPDATE media m
     SET episode_summaries_compiled = es.compiled_summaries,
+        episode_summaries_compiled_at = NOW(),
         updated_at = NOW()
     FROM episode_summaries es
     WHERE m.media_id = es.media_id;
@@ -711,4 +713,76 @@ async def update_vetting_results_enhanced(
             return True
         except Exception as e:
             logger.error(f"Error updating enhanced vetting results for discovery {discovery_id}: {e}", exc_info=True)
-            raise  # Re-raise to trigger fallback in orchestrator
\ No newline at end of file
+            raise  # Re-raise to trigger fallback in orchestrator
+
+
+async def bulk_update_vetting_results(results: List[Dict[str, Any]]) -> int:
+    """
+    Write vetting results for many discoveries in one statement.
+
+    Each item needs `discovery_id`, `vetting_score`, `vetting_reasoning` and `status`;
+    `vetting_criteria_met`, `topic_match_analysis`, `vetting_criteria_scores` and
+    `client_expertise_matched` are optional. Failed items keep their reasoning in
+    vetting_error. Falls back to per-row updates if the enhanced columns are missing.
+    """
+    if not results:
+        return 0
+
+    payload = []
+    for item in results:
+        criteria_met = item.get('vetting_criteria_met') or {}
+        if isinstance(criteria_met, str):
+            try:
+                criteria_met = json.loads(criteria_met)
+            except json.JSONDecodeError:
+                criteria_met = {}
+        payload.append({
+            'id': item['discovery_id'],
+            'status': item.get('status', 'completed'),
+            'score': item.get('vetting_score', 0),
+            'reasoning': item.get('vetting_reasoning', ''),
+            'criteria_met': criteria_met,
+            'topic_match_analysis': item.get('topic_match_analysis'),
+            'criteria_scores': item.get('vetting_criteria_scores') or [],
+            'expertise': item.get('client_expertise_matched') or [],
+        })
+
+    query = """
+    UPDATE campaign_media_discoveries cmd
+    SET vetting_status = r.status,
+        vetting_score = r.score,
+        vetting_reasoning = r.reasoning,
+        vetting_criteria_met = r.criteria_met,
+        topic_match_analysis = r.topic_match_analysis,
+        vetting_criteria_scores = r.criteria_scores,
+        client_expertise_matched = ARRAY(SELECT jsonb_array_elements_text(r.expertise)),
+        vetting_error = CASE WHEN r.status = 'failed' THEN r.reasoning ELSE NULL END,
+        vetted_at = NOW(),
+        updated_at = NOW()
+    FROM jsonb_to_recordset($1::jsonb) AS r(
+        id INTEGER, status TEXT, score NUMERIC, reasoning TEXT, criteria_met JSONB,
+        topic_match_analysis TEXT, criteria_scores JSONB, expertise JSONB
+    )
+    WHERE cmd.id = r.id;
+    """
+    pool = await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            result = await conn.execute(query, json.dumps(payload, default=str))
+            count = int(result.split()[-1]) if result else 0
+            logger.info(f"Bulk updated vetting results for {count} discoveries")
+            return count
+        except Exception as e:
+            logger.warning(f"Bulk vetting update failed, falling back to per-row updates: {e}")
+
+    count = 0
+    for item in results:
+        if await update_vetting_results(
+            item['discovery_id'],
+            item.get('vetting_score', 0),
+            item.get('vetting_reasoning', ''),
+            item.get('vetting_criteria_met') or {},
+            item.get('status', 'completed')
+        ):
+            count += 1
+    return count
@@ -0,0 +1,211 @@
+# podcast_outreach/database/queries/campaign_metrics.py
+
+"""
+Daily per-campaign metrics rollup (campaign_daily_metrics, migration 010).
+
+Past days are served from the rollup; triggers mark (campaign, day) keys dirty when
+pitches, message events or reply classifications change, and those days are
+recomputed here before reading. Today is always computed live from the source
+tables so it reflects activity since the last refresh.
+"""
+
+import json
+import uuid
+from datetime import date, datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from podcast_outreach.logging_config import get_logger
+from podcast_outreach.database.connection import get_db_pool, workload, Workload
+
+logger = get_logger(__name__)
+
+ROLLUP_COUNT_COLUMNS = (
+    "total_pitches", "sent", "opened", "clicked", "replied", "bounced", "placements_created",
+    "open_count_sum", "open_count_n", "click_count_sum", "click_count_n",
+    "hard_bounces", "soft_bounces",
+    "day_sent", "day_opened", "day_clicked", "day_replied",
+)
+ROLLUP_JSON_COLUMNS = ("bounce_breakdown", "provider_breakdown", "classification_breakdown")
+
+# Computes rollup rows for the (campaign_id, day) keys given as $1 (uuid[]) and $2 (date[]).
+_DAY_BOUNDS = "{col} >= (k.day::timestamp AT TIME ZONE 'UTC') AND {col} < ((k.day + 1)::timestamp AT TIME ZONE 'UTC')"
+COMPUTE_DAYS_CTE = f"""
+keys AS (
+    SELECT DISTINCT * FROM unnest($1::uuid[], $2::date[]) AS k(campaign_id, day)
+), created AS (
+    SELECT k.campaign_id, k.day,
+           COUNT(p.pitch_id) AS total_pitches,
+           COUNT(*) FILTER (WHERE p.pitch_state = 'sent') AS sent,
+           COUNT(*) FILTER (WHERE p.pitch_state = 'opened') AS opened,
+           COUNT(*) FILTER (WHERE p.pitch_state = 'clicked') AS clicked,
+           COUNT(*) FILTER (WHERE p.pitch_state = 'replied') AS replied,
+           COUNT(*) FILTER (WHERE p.pitch_state = 'bounced') AS bounced,
+           COUNT(p.placement_id) AS placements_created,
+           COALESCE(SUM(p.open_count), 0) AS open_count_sum,
+           COUNT(p.open_count) AS open_count_n,
+           COALESCE(SUM(p.click_count), 0) AS click_count_sum,
+           COUNT(p.click_count) AS click_count_n,
+           COUNT(*) FILTER (WHERE p.bounce_type = 'hard') AS hard_bounces,
+           COUNT(*) FILTER (WHERE p.bounce_type = 'soft') AS soft_bounces
+    FROM keys k
+    LEFT JOIN pitches p ON p.campaign_id = k.campaign_id AND {_DAY_BOUNDS.format(col="p.created_at")}
+    GROUP BY k.campaign_id, k.day
+), sends AS (
+    SELECT k.campaign_id, k.day,
+           COUNT(p.pitch_id) AS day_sent,
+           COUNT(p.opened_ts) AS day_opened,
+           COUNT(p.clicked_ts) AS day_clicked,
+           COUNT(p.reply_ts) AS day_replied
+    FROM keys k
+    LEFT JOIN pitches p ON p.campaign_id = k.campaign_id AND {_DAY_BOUNDS.format(col="p.send_ts")}
+    GROUP BY k.campaign_id, k.day
+), bounces AS (
+    SELECT campaign_id, day,
+           jsonb_agg(jsonb_build_object('type', bounce_type, 'reason', bounce_reason, 'count', n)) AS bounce_breakdown
+    FROM (
+        SELECT k.campaign_id, k.day, p.bounce_type, p.bounce_reason, COUNT(*) AS n
+        FROM keys k
+        JOIN pitches p ON p.campaign_id = k.campaign_id AND {_DAY_BOUNDS.format(col="p.created_at")}
+        WHERE p.bounce_type IS NOT NULL
+        GROUP BY 1, 2, 3, 4
+    ) b
+    GROUP BY campaign_id, day
+), providers AS (
+    SELECT campaign_id, day,
+           jsonb_object_agg(provider, jsonb_build_object(
+               'total', total, 'sent', sent, 'bounced', bounced,
+               'send_seconds_sum', send_seconds_sum, 'send_seconds_n', send_seconds_n
+           )) AS provider_breakdown
+    FROM (
+        SELECT k.campaign_id, k.day,
+               COALESCE(p.email_provider, 'unknown') AS provider,
+               COUNT(*) AS total,
+               COUNT(*) FILTER (WHERE p.pitch_state = 'sent') AS sent,
+               COUNT(*) FILTER (WHERE p.pitch_state = 'bounced') AS bounced,
+               COALESCE(SUM(EXTRACT(EPOCH FROM (p.send_ts - p.created_at))), 0) AS send_seconds_sum,
+               COUNT(p.send_ts) AS send_seconds_n
+        FROM keys k
+        JOIN pitches p ON p.campaign_id = k.campaign_id AND {_DAY_BOUNDS.format(col="p.created_at")}
+        GROUP BY 1, 2, 3
+    ) pr
+    GROUP BY campaign_id, day
+), classifications AS (
+    SELECT campaign_id, day,
+           jsonb_object_agg(classification, jsonb_build_object(
+               'count', n, 'confidence_sum', confidence_sum, 'confidence_n', confidence_n
+           )) AS classification_breakdown
+    FROM (
+        SELECT k.campaign_id, k.day,
+               COALESCE(ec.classification, 'unknown') AS classification,
+               COUNT(*) AS n,
+               COALESCE(SUM(ec.confidence_score), 0) AS confidence_sum,
+               COUNT(ec.confidence_score) AS confidence_n
+        FROM keys k
+        JOIN email_classifications ec ON {_DAY_BOUNDS.format(col="ec.processed_at")}
+        JOIN pitches p ON p.nylas_thread_id = ec.thread_id AND p.campaign_id = k.campaign_id
+        GROUP BY 1, 2, 3
+    ) cl
+    GROUP BY campaign_id, day
+), computed AS (
+    SELECT c.campaign_id, c.day,
+           {", ".join(f"c.{col}" for col in ROLLUP_COUNT_COLUMNS[:13])},
+           {", ".join(f"s.{col}" for col in ROLLUP_COUNT_COLUMNS[13:])},
+           COALESCE(b.bounce_breakdown, '[]'::jsonb) AS bounce_breakdown,
+           COALESCE(pr.provider_breakdown, '{{}}'::jsonb) AS provider_breakdown,
+           COALESCE(cl.classification_breakdown, '{{}}'::jsonb) AS classification_breakdown
+    FROM created c
+    JOIN sends s USING (campaign_id, day)
+    LEFT JOIN bounces b USING (campaign_id, day)
+    LEFT JOIN providers pr USING (campaign_id, day)
+    LEFT JOIN classifications cl USING (campaign_id, day)
+)
+"""
+
+_ALL_COLUMNS = ROLLUP_COUNT_COLUMNS + ROLLUP_JSON_COLUMNS
+UPSERT_DAYS_QUERY = f"""
+WITH {COMPUTE_DAYS_CTE}
+INSERT INTO campaign_daily_metrics (campaign_id, day, {", ".join(_ALL_COLUMNS)}, refreshed_at)
+SELECT campaign_id, day, {", ".join(_ALL_COLUMNS)}, NOW() FROM computed
+ON CONFLICT (campaign_id, day) DO UPDATE SET
+    {", ".join(f"{col} = EXCLUDED.{col}" for col in _ALL_COLUMNS)},
+    refreshed_at = NOW();
+"""
+
+LIVE_DAYS_QUERY = f"WITH {COMPUTE_DAYS_CTE} SELECT * FROM computed;"
+
+
+def _utc_today() -> date:
+    return datetime.now(timezone.utc).date()
+
+
+def _decode_row(row) -> Dict[str, Any]:
+    data = dict(row)
+    for col in ROLLUP_JSON_COLUMNS:
+        value = data.get(col)
+        if isinstance(value, str):
+            data[col] = json.loads(value)
+    return data
+
+
+@workload(Workload.REPORTING)
+async def refresh_campaign_daily_metrics(campaign_id: Optional[uuid.UUID] = None, limit: int = 2000) -> int:
+    """
+    Recomputes dirty past days (optionally for one campaign) and clears their dirty marks.
+    Today's marks are left in place; today is always computed live. Returns days refreshed.
+    """
+    claim_query = """
+    DELETE FROM campaign_metrics_dirty
+    WHERE (campaign_id, day) IN (
+        SELECT campaign_id, day FROM campaign_metrics_dirty
+        WHERE day < $1 AND ($2::uuid IS NULL OR campaign_id = $2)
+        LIMIT $3
+        FOR UPDATE SKIP LOCKED
+    )
+    RETURNING campaign_id, day;
+    """
+    pool = await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            async with conn.transaction():
+                claimed = await conn.fetch(claim_query, _utc_today(), campaign_id, limit)
+                if claimed:
+                    await conn.execute(
+                        UPSERT_DAYS_QUERY,
+                        [row["campaign_id"] for row in claimed],
+                        [row["day"] for row in claimed],
+                    )
+            if claimed:
+                logger.info(f"Refreshed {len(claimed)} campaign metric day(s).")
+            return len(claimed)
+        except Exception as e:
+            # The rollup must never break the metrics endpoints; stale days are retried next time
+            logger.warning(f"Error refreshing campaign daily metrics: {e}")
+            return 0
+
+
+@workload(Workload.REPORTING)
+async def get_campaign_daily_metrics(campaign_id: uuid.UUID, start_day: Optional[date] = None, end_day: Optional[date] = None) -> List[Dict[str, Any]]:
+    """
+    Returns rollup rows for campaign days in [start_day, end_day] (open-ended when None),
+    with past days read from campaign_daily_metrics and today computed live.
+    """
+    if isinstance(campaign_id, str):
+        campaign_id = uuid.UUID(campaign_id)
+    today = _utc_today()
+    await refresh_campaign_daily_metrics(campaign_id)
+
+    stored_query = """
+    SELECT * FROM campaign_daily_metrics
+    WHERE campaign_id = $1
+    AND ($2::date IS NULL OR day >= $2)
+    AND day <= $3
+    AND day < $4
+    ORDER BY day;
+    """
+    pool = await get_db_pool()
+    async with pool.acquire() as conn:
+        rows = [_decode_row(row) for row in await conn.fetch(stored_query, campaign_id, start_day, end_day or today, today)]
+        if (end_day is None or end_day >= today) and (start_day is None or start_day <= today):
+            live = await conn.fetch(LIVE_DAYS_QUERY, [campaign_id], [today])
+            rows.extend(_decode_row(row) for row in live)
+    return rows
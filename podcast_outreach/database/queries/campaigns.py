@@ -6,10 +6,25 @@ from datetime import date, datetime, timezone # Ensure timezone is imported
 
 from podcast_outreach.logging_config import get_logger
 from podcast_outreach.database.connection import get_db_pool, get_background_task_pool
+from podcast_outreach.database.entity_cache import campaign_cache, invalidate_campaign
+from podcast_outreach.database.queries.vetting_checklists import delete_checklists_for_campaign
 import asyncpg
 
 logger = get_logger(__name__)
 
+# Campaign fields the vetting checklist is derived from; changing them invalidates cached checklists
+VETTING_PROFILE_FIELDS = {'questionnaire_responses', 'ideal_podcast_description'}
+
+# Columns for callers that don't need the embedding vector or the large free-text fields
+CAMPAIGN_LIGHT_COLUMNS = [
+    'campaign_id', 'person_id', 'attio_client_id', 'campaign_name', 'campaign_type',
+    'campaign_bio', 'campaign_angles', 'campaign_keywords', 'questionnaire_keywords',
+    'gdoc_keywords', 'podcast_transcript_link', 'compiled_articles_link', 'start_date',
+    'end_date', 'goal_note', 'media_kit_url', 'created_at', 'instantly_campaign_id',
+    'ideal_podcast_description', 'auto_discovery_enabled', 'auto_discovery_status',
+    'nylas_grant_id', 'email_account', 'email_provider'
+]
+
 def _process_campaign_row(row: dict, campaign_id: Optional[uuid.UUID] = None) -> dict:
     """Helper function to process campaign row data, handling JSONB deserialization."""
     processed_row = dict(row)
@@ -143,6 +158,38 @@ async def get_campaign_by_id(campaign_id: uuid.UUID, pool: Optional[asyncpg.Pool
             logger.exception(f"Error fetching campaign {campaign_id}: {e}")
             raise
 
+async def get_campaign_light_by_id(campaign_id: uuid.UUID, pool: Optional[asyncpg.Pool] = None) -> Optional[Dict[str, Any]]:
+    """Fetches a campaign without the embedding, questionnaire JSON and transcript columns."""
+    query = f"SELECT {', '.join(CAMPAIGN_LIGHT_COLUMNS)} FROM campaigns WHERE campaign_id = $1;"
+    if pool is None:
+        pool = await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            row = await conn.fetchrow(query, campaign_id)
+            if not row:
+                logger.warning(f"Campaign not found: {campaign_id}")
+                return None
+            return dict(row)
+        except Exception as e:
+            logger.exception(f"Error fetching light campaign {campaign_id}: {e}")
+            raise
+
+async def get_campaign_by_id_cached(campaign_id: uuid.UUID, pool: Optional[asyncpg.Pool] = None) -> Optional[Dict[str, Any]]:
+    """Read-through cached variant of get_campaign_by_id for pipelines that re-read the same campaign."""
+    if isinstance(campaign_id, str):
+        campaign_id = uuid.UUID(campaign_id)
+    return await campaign_cache.get_or_load(
+        campaign_id, lambda: get_campaign_by_id(campaign_id, pool=pool)
+    )
+
+async def get_campaign_light_by_id_cached(campaign_id: uuid.UUID, pool: Optional[asyncpg.Pool] = None) -> Optional[Dict[str, Any]]:
+    """Read-through cached variant of get_campaign_light_by_id."""
+    if isinstance(campaign_id, str):
+        campaign_id = uuid.UUID(campaign_id)
+    return await campaign_cache.get_or_load(
+        campaign_id, lambda: get_campaign_light_by_id(campaign_id, pool=pool), projection="light"
+    )
+
 async def get_campaigns_by_person_id(person_id: int, limit: int = 1000) -> List[Dict[str, Any]]:
     """Get campaigns for a specific person with a safety limit."""
     query = """
@@ -294,6 +341,9 @@ async def update_campaign(campaign_id: uuid.UUID, update_fields: Dict[str, Any],
                 logger.warning(f"Campaign {campaign_id} not found after update or update returned no rows.")
                 return None
             
+            await invalidate_campaign(campaign_id, conn)
+            if VETTING_PROFILE_FIELDS.intersection(update_fields):
+                await delete_checklists_for_campaign(campaign_id, conn)
             processed_row = _process_campaign_row(row, campaign_id)
             logger.info(f"Campaign updated: {campaign_id} with fields: {list(update_fields.keys())}")
             return processed_row
@@ -310,6 +360,7 @@ async def delete_campaign_from_db(campaign_id: uuid.UUID) -> bool:
             result = await conn.execute(query, campaign_id)
             deleted_count = int(result.split(" ")[1]) if result.startswith("DELETE ") else 0
             if deleted_count > 0:
+                await invalidate_campaign(campaign_id, conn)
                 logger.info(f"Campaign deleted: {campaign_id}")
                 return True
             logger.warning(f"Campaign not found for deletion or delete failed: {campaign_id}")
@@ -416,6 +467,8 @@ async def update_campaign_questionnaire_data(campaign_id: str, questionnaire_dat
             )
             
             if row:
+                await invalidate_campaign(uuid.UUID(campaign_id), conn)
+                await delete_checklists_for_campaign(campaign_id, conn)
                 logger.info(f"Updated questionnaire data for campaign {campaign_id}")
                 return True
             return False
@@ -457,6 +510,7 @@ async def update_campaign_keywords(campaign_id: str, keywords: List[str]) -> boo
             row = await conn.fetchrow(update_query, unique_keywords, uuid.UUID(campaign_id))
             
             if row:
+                await invalidate_campaign(uuid.UUID(campaign_id), conn)
                 logger.info(f"Updated keywords for campaign {campaign_id}: {len(unique_keywords)} total")
                 return True
             return False
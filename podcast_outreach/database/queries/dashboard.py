@@ -0,0 +1,50 @@
+# podcast_outreach/database/queries/dashboard.py
+
+import logging
+from typing import Dict, List, Optional
+from datetime import date
+
+from podcast_outreach.database.connection import get_db_pool
+
+logger = logging.getLogger(__name__)
+
+async def get_dashboard_counts(
+    placement_statuses: List[str],
+    review_status: str,
+    pitch_states: List[str],
+    person_id: Optional[int] = None,
+) -> Dict[str, int]:
+    """
+    Returns active campaigns, placements in `placement_statuses`, review tasks in
+    `review_status` and pitches in `pitch_states` with one round trip. When person_id is
+    given, every count is limited to that person's campaigns.
+    """
+    query = """
+    WITH scoped_campaigns AS (
+        SELECT campaign_id, end_date
+        FROM campaigns
+        WHERE $1::int IS NULL OR person_id = $1
+    )
+    SELECT
+        (SELECT COUNT(*) FROM scoped_campaigns
+         WHERE end_date IS NULL OR end_date >= $2) AS active_campaigns,
+        (SELECT COUNT(*) FROM placements p
+         WHERE p.current_status = ANY($3::text[])
+         AND ($1::int IS NULL OR p.campaign_id IN (SELECT campaign_id FROM scoped_campaigns))) AS placements,
+        (SELECT COUNT(*) FROM review_tasks rt
+         WHERE rt.status = $4
+         AND ($1::int IS NULL OR rt.campaign_id IN (SELECT campaign_id FROM scoped_campaigns))) AS review_tasks,
+        (SELECT COUNT(*) FROM pitches pi
+         WHERE pi.pitch_state = ANY($5::text[])
+         AND ($1::int IS NULL OR pi.campaign_id IN (SELECT campaign_id FROM scoped_campaigns))) AS pitches;
+    """
+    pool = await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            row = await conn.fetchrow(
+                query, person_id, date.today(), placement_statuses, review_status, pitch_states
+            )
+            return {key: row[key] or 0 for key in ("active_campaigns", "placements", "review_tasks", "pitches")}
+        except Exception as e:
+            logger.exception(f"Error fetching dashboard counts (person_id: {person_id}): {e}")
+            raise
@@ -0,0 +1,146 @@
+# podcast_outreach/database/queries/data_exports.py
+
+"""
+Queries for GDPR data export jobs (data_export_jobs, migration 014) and the
+row streams that make up an export.
+"""
+
+import json
+import uuid
+import logging
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+
+from podcast_outreach.database.connection import get_db_pool, get_pool, Workload
+
+logger = logging.getLogger(__name__)
+
+# Export sections in artifact order. Each query returns one JSON document per row,
+# rendered by Postgres, so rows go straight to the NDJSON file without model building.
+EXPORT_SECTIONS: Dict[str, str] = {
+    "profile": """
+        SELECT (to_jsonb(p) - 'dashboard_password_hash' - 'nylas_grant_id')::text
+        FROM people p WHERE p.person_id = $1
+    """,
+    "client_profile": """
+        SELECT to_jsonb(cp)::text FROM client_profiles cp WHERE cp.person_id = $1
+    """,
+    "campaigns": """
+        SELECT to_jsonb(c)::text FROM campaigns c
+        WHERE c.person_id = $1 ORDER BY c.created_at
+    """,
+    "media_kits": """
+        SELECT to_jsonb(mk)::text FROM media_kits mk
+        WHERE mk.person_id = $1 ORDER BY mk.created_at
+    """,
+    "placements": """
+        SELECT to_jsonb(pl)::text FROM placements pl
+        JOIN campaigns c ON pl.campaign_id = c.campaign_id
+        WHERE c.person_id = $1 ORDER BY pl.placement_id
+    """,
+    "pitches": """
+        SELECT to_jsonb(pi)::text FROM pitches pi
+        JOIN campaigns c ON pi.campaign_id = c.campaign_id
+        WHERE c.person_id = $1 ORDER BY pi.pitch_id
+    """,
+}
+
+
+async def stream_person_export(person_id: int, prefetch: int = 500) -> AsyncIterator[Tuple[str, str]]:
+    """
+    Yields (section, row_json) for every export section through server-side cursors,
+    `prefetch` rows at a time, inside one read-only repeatable-read transaction so all
+    sections come from the same snapshot.
+    """
+    pool = await get_pool(Workload.BULK)
+    async with pool.acquire() as conn:
+        async with conn.transaction(isolation="repeatable_read", readonly=True):
+            for section, query in EXPORT_SECTIONS.items():
+                async for row in conn.cursor(query, person_id, prefetch=prefetch):
+                    yield section, row[0]
+
+
+async def create_export_job(person_id: int) -> Optional[Dict[str, Any]]:
+    query = """
+    INSERT INTO data_export_jobs (person_id) VALUES ($1)
+    RETURNING *;
+    """
+    pool = await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            row = await conn.fetchrow(query, person_id)
+            return _process_export_row(row)
+        except Exception as e:
+            logger.exception(f"Error creating data export job for person {person_id}: {e}")
+            return None
+
+
+async def get_export_job(export_id: uuid.UUID, person_id: Optional[int] = None) -> Optional[Dict[str, Any]]:
+    """Fetches an export job, optionally only if it belongs to person_id."""
+    query = "SELECT * FROM data_export_jobs WHERE export_id = $1 AND ($2::int IS NULL OR person_id = $2);"
+    pool = await get_db_pool()
+    async with pool.acquire() as conn:
+        row = await conn.fetchrow(query, export_id, person_id)
+        return _process_export_row(row)
+
+
+async def get_active_export_job(person_id: int, stale_after_seconds: int) -> Optional[Dict[str, Any]]:
+    """Returns the person's pending/running export unless it has been stuck longer than stale_after_seconds."""
+    query = """
+    SELECT * FROM data_export_jobs
+    WHERE person_id = $1
+    AND status IN ('pending', 'running')
+    AND created_at > NOW() - make_interval(secs => $2::float8)
+    ORDER BY created_at DESC
+    LIMIT 1;
+    """
+    pool = await get_db_pool()
+    async with pool.acquire() as conn:
+        row = await conn.fetchrow(query, person_id, stale_after_seconds)
+        return _process_export_row(row)
+
+
+async def mark_export_running(export_id: uuid.UUID) -> None:
+    pool = await get_db_pool()
+    async with pool.acquire() as conn:
+        await conn.execute(
+            "UPDATE data_export_jobs SET status = 'running', started_at = NOW() WHERE export_id = $1;",
+            export_id
+        )
+
+
+async def mark_export_completed(
+    export_id: uuid.UUID,
+    storage: str,
+    object_key: str,
+    size_bytes: int,
+    row_counts: Dict[str, int],
+    expires_at: datetime,
+) -> None:
+    query = """
+    UPDATE data_export_jobs
+    SET status = 'completed', storage = $2, object_key = $3, size_bytes = $4,
+        row_counts = $5::jsonb, expires_at = $6, completed_at = NOW(), error = NULL
+    WHERE export_id = $1;
+    """
+    pool = await get_db_pool()
+    async with pool.acquire() as conn:
+        await conn.execute(query, export_id, storage, object_key, size_bytes, json.dumps(row_counts), expires_at)
+
+
+async def mark_export_failed(export_id: uuid.UUID, error: str) -> None:
+    pool = await get_db_pool()
+    async with pool.acquire() as conn:
+        await conn.execute(
+            "UPDATE data_export_jobs SET status = 'failed', error = $2, completed_at = NOW() WHERE export_id = $1;",
+            export_id, error[:1000]
+        )
+
+
+def _process_export_row(row) -> Optional[Dict[str, Any]]:
+    if not row:
+        return None
+    job = dict(row)
+    if isinstance(job.get("row_counts"), str):
+        job["row_counts"] = json.loads(job["row_counts"])
+    return job
@@ -0,0 +1,43 @@
+# podcast_outreach/database/queries/document_summaries.py
+"""Persistent cache of LLM summaries of long documents, keyed by document revision."""
+from typing import Optional
+
+from podcast_outreach.logging_config import get_logger
+from podcast_outreach.database.connection import get_db_pool
+
+logger = get_logger(__name__)
+
+async def get_summary(cache_key: str) -> Optional[str]:
+    """Returns the cached summary for a key and bumps its last_used_at."""
+    query = """
+    UPDATE document_summaries
+    SET last_used_at = NOW()
+    WHERE cache_key = $1
+    RETURNING summary;
+    """
+    pool = await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            return await conn.fetchval(query, cache_key)
+        except Exception as e:
+            # The cache is an optimization; a missing table must not break generation
+            logger.warning(f"Could not read cached document summary {cache_key}: {e}")
+            return None
+
+async def upsert_summary(cache_key: str, summary: str) -> bool:
+    """Stores a summary for a document revision."""
+    query = """
+    INSERT INTO document_summaries (cache_key, summary)
+    VALUES ($1, $2)
+    ON CONFLICT (cache_key) DO UPDATE
+    SET summary = EXCLUDED.summary,
+        last_used_at = NOW();
+    """
+    pool = await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            await conn.execute(query, cache_key, summary)
+            return True
+        except Exception as e:
+            logger.warning(f"Could not persist document summary {cache_key}: {e}")
+            return False
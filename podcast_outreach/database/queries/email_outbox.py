@@ -0,0 +1,122 @@
+# podcast_outreach/database/queries/email_outbox.py
+
+"""
+Queries for the transactional email outbox (email_outbox, migration 012).
+"""
+
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+from podcast_outreach.database.connection import get_db_pool, get_pool, Workload
+
+logger = logging.getLogger(__name__)
+
+
+async def enqueue_email(
+    to_email: str,
+    subject: str,
+    html_body: str,
+    text_body: str,
+    category: Optional[str] = None,
+) -> Optional[int]:
+    """Queues an email for the outbox worker and returns its outbox_id."""
+    query = """
+    INSERT INTO email_outbox (to_email, subject, html_body, text_body, category)
+    VALUES ($1, $2, $3, $4, $5)
+    RETURNING outbox_id;
+    """
+    pool = await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            return await conn.fetchval(query, to_email, subject, html_body, text_body, category)
+        except Exception as e:
+            logger.exception(f"Error queueing email to {to_email}: {e}")
+            return None
+
+
+async def claim_due_emails(limit: int, stale_after_seconds: int, max_attempts: int) -> List[Dict[str, Any]]:
+    """
+    Marks up to `limit` due emails as sending and returns them. Rows left in 'sending'
+    longer than stale_after_seconds (a worker died mid-batch) are claimed again until
+    they have been attempted max_attempts times.
+    """
+    query = """
+    UPDATE email_outbox o
+    SET status = 'sending', locked_at = NOW(), attempts = o.attempts + 1
+    WHERE o.outbox_id IN (
+        SELECT outbox_id FROM email_outbox
+        WHERE (status = 'pending' AND next_attempt_at <= NOW())
+           OR (status = 'sending' AND locked_at < NOW() - make_interval(secs => $2::float8) AND attempts < $3)
+        ORDER BY next_attempt_at
+        LIMIT $1
+        FOR UPDATE SKIP LOCKED
+    )
+    RETURNING o.outbox_id, o.to_email, o.subject, o.html_body, o.text_body, o.category, o.attempts;
+    """
+    pool = await get_pool(Workload.PIPELINE)
+    async with pool.acquire() as conn:
+        rows = await conn.fetch(query, limit, stale_after_seconds, max_attempts)
+        return [dict(row) for row in rows]
+
+
+async def fail_abandoned_emails(stale_after_seconds: int, max_attempts: int) -> int:
+    """Fails emails that stalled in 'sending' on their last allowed attempt. Returns how many."""
+    query = """
+    UPDATE email_outbox
+    SET status = 'failed', locked_at = NULL, last_error = 'Delivery was interrupted.'
+    WHERE status = 'sending'
+    AND locked_at < NOW() - make_interval(secs => $1::float8)
+    AND attempts >= $2;
+    """
+    pool = await get_pool(Workload.PIPELINE)
+    async with pool.acquire() as conn:
+        result = await conn.execute(query, stale_after_seconds, max_attempts)
+        return int(result.split()[-1])
+
+
+async def mark_emails_sent(outbox_ids: List[int]) -> None:
+    if not outbox_ids:
+        return
+    query = """
+    UPDATE email_outbox
+    SET status = 'sent', sent_at = NOW(), locked_at = NULL, last_error = NULL
+    WHERE outbox_id = ANY($1::bigint[]);
+    """
+    pool = await get_pool(Workload.PIPELINE)
+    async with pool.acquire() as conn:
+        await conn.execute(query, outbox_ids)
+
+
+async def mark_emails_failed(
+    failures: List[Tuple[int, str]],
+    max_attempts: int,
+    backoff_base_seconds: float,
+    backoff_max_seconds: float,
+) -> None:
+    """
+    Reschedules failed emails with exponential backoff on their attempt count; rows
+    that reached max_attempts become 'failed'. `failures` is [(outbox_id, error)].
+    """
+    if not failures:
+        return
+    query = """
+    UPDATE email_outbox o
+    SET status = CASE WHEN o.attempts >= $3 THEN 'failed' ELSE 'pending' END,
+        next_attempt_at = NOW() + make_interval(
+            secs => LEAST($5::float8, $4::float8 * power(2, GREATEST(o.attempts - 1, 0)))
+        ),
+        locked_at = NULL,
+        last_error = f.error
+    FROM unnest($1::bigint[], $2::text[]) AS f(outbox_id, error)
+    WHERE o.outbox_id = f.outbox_id;
+    """
+    pool = await get_pool(Workload.PIPELINE)
+    async with pool.acquire() as conn:
+        await conn.execute(
+            query,
+            [outbox_id for outbox_id, _ in failures],
+            [error[:1000] for _, error in failures],
+            max_attempts,
+            backoff_base_seconds,
+            backoff_max_seconds,
+        )
@@ -2,14 +2,26 @@
 Database queries for email verification tokens
 """
 
+import os
 import logging
 from typing import Optional, Dict, Any
 from datetime import datetime, timedelta, timezone
 import secrets
+from cachetools import TTLCache
 from ..connection import get_db_pool
 
 logger = logging.getLogger(__name__)
 
+# Opt-in cache of verified statuses used by the auth dependencies; 0 disables it.
+# Only positive results are cached, so a user who just verified is never held
+# back by a stale entry on another worker.
+USER_CACHE_TTL_SECONDS = int(os.getenv("USER_CACHE_TTL_SECONDS", "0"))
+USER_CACHE_MAX_ENTRIES = int(os.getenv("USER_CACHE_MAX_ENTRIES", "5000"))
+
+_verified_status_cache: Optional[TTLCache] = (
+    TTLCache(maxsize=USER_CACHE_MAX_ENTRIES, ttl=USER_CACHE_TTL_SECONDS) if USER_CACHE_TTL_SECONDS > 0 else None
+)
+
 async def create_verification_token(
     person_id: int, 
     client_ip: Optional[str] = None,
@@ -225,6 +237,28 @@ async def get_verification_status(person_id: int) -> Dict[str, Any]:
             "email_verified_at": None
         }
 
+async def get_verification_status_cached(person_id: int) -> Dict[str, Any]:
+    """
+    Same as get_verification_status, served from the short-TTL user cache when
+    USER_CACHE_TTL_SECONDS is set.
+    """
+    if _verified_status_cache is None:
+        return await get_verification_status(person_id)
+
+    cached = _verified_status_cache.get(person_id)
+    if cached is not None:
+        return dict(cached)
+
+    status = await get_verification_status(person_id)
+    if status.get("email_verified"):
+        _verified_status_cache[person_id] = dict(status)
+    return status
+
+def invalidate_cached_verification(person_id: int) -> None:
+    """Drops the cached verification status for a person."""
+    if _verified_status_cache is not None:
+        _verified_status_cache.pop(person_id, None)
+
 async def get_verification_stats() -> Dict[str, int]:
     """
     Get statistics about email verification.
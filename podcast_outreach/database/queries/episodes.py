@@ -7,9 +7,23 @@ from typing import Any, Dict, Optional, List, Set, Tuple
 from datetime import datetime, date
 import asyncpg
  
-from podcast_outreach.database.connection import get_db_pool, get_background_task_pool
+from podcast_outreach.database.connection import get_db_pool, get_background_task_pool, workload, Workload
+from podcast_outreach.database.queries.pagination import encode_cursor, decode_cursor
  
 logger = logging.getLogger(__name__)
+
+# Default projection for episode listings; none of these grow with transcript length
+EPISODE_LIST_FIELDS = (
+    "episode_id", "media_id", "title", "publish_date", "duration_sec", "episode_url",
+    "source_api", "api_episode_id", "transcribe", "downloaded", "ai_analysis_done",
+    "created_at", "updated_at",
+)
+# Columns a listing caller may opt into
+EPISODE_OPTIONAL_FIELDS = (
+    "episode_summary", "ai_episode_summary", "transcript", "guest_names",
+    "episode_themes", "episode_keywords",
+)
+EPISODE_LIST_KEY = ("publish_date", "episode_id")
  
 async def insert_episode(episode_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """Insert a single episode record and return it."""
@@ -52,6 +66,7 @@ async def insert_episode(episode_data: Dict[str, Any]) -> Optional[Dict[str, Any
             logger.exception("Error inserting episode for media_id %s: %s", episode_data.get("media_id"), e)
             return None
 
+@workload(Workload.BULK)
 async def insert_episodes_batch(episodes_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """Inserts multiple episode records in a single batch operation."""
     if not episodes_data:
@@ -571,6 +586,60 @@ async def get_episodes_for_media_paginated(media_id: int, offset: int = 0, limit
             logger.error(f"Error fetching paginated episodes for media_id {media_id}: {e}", exc_info=True)
             return []
 
+def episode_cursor(episode: Dict[str, Any]) -> str:
+    return encode_cursor([episode[k] for k in EPISODE_LIST_KEY])
+
+async def get_episodes_for_media_keyset(
+    media_id: int,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    offset: int = 0,
+    include_fields: Optional[List[str]] = None,
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    Lists a media's episodes newest first with only EPISODE_LIST_FIELDS plus the requested
+    EPISODE_OPTIONAL_FIELDS. Continues after `cursor` when given (offset is then ignored).
+    Returns (episodes, next_cursor); next_cursor is None on the last page.
+    Raises ValueError for a malformed cursor or an unknown field.
+    """
+    unknown = set(include_fields or []) - set(EPISODE_OPTIONAL_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown episode field(s): {', '.join(sorted(unknown))}")
+    columns = list(EPISODE_LIST_FIELDS) + [f for f in EPISODE_OPTIONAL_FIELDS if f in (include_fields or [])]
+
+    conditions = ["media_id = $1"]
+    params: List[Any] = [media_id]
+    if cursor:
+        after_date, after_id = decode_cursor(cursor, len(EPISODE_LIST_KEY), types=(None, int))
+        params.append(after_id)
+        if after_date is None:
+            # Undated episodes sort first (DESC puts NULLs first); then all dated ones follow
+            conditions.append(f"(publish_date IS NOT NULL OR episode_id < ${len(params)})")
+        else:
+            params.append(after_date)
+            conditions.append(f"(publish_date, episode_id) < (${len(params)}::date, ${len(params) - 1}::int)")
+        offset = 0
+
+    params.extend([limit, offset])
+    query = f"""
+    SELECT {', '.join(columns)}
+    FROM episodes
+    WHERE {' AND '.join(conditions)}
+    ORDER BY publish_date DESC, episode_id DESC
+    LIMIT ${len(params) - 1} OFFSET ${len(params)};
+    """
+    pool = await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            rows = await conn.fetch(query, *params)
+        except Exception as e:
+            logger.error(f"Error listing episodes for media_id {media_id}: {e}", exc_info=True)
+            return [], None
+
+    episodes = [dict(row) for row in rows]
+    next_cursor = episode_cursor(episodes[-1]) if len(episodes) == limit else None
+    return episodes, next_cursor
+
 async def get_episode_by_api_id(api_episode_id: str, media_id: int, source_api: str) -> Optional[Dict[str, Any]]:
     """Fetches a single episode by its API-specific ID, media_id, and source_api."""
     query = """
@@ -660,6 +729,7 @@ async def get_most_recent_episode_for_media(media_id: int) -> Optional[Dict[str,
             return None
 
 
+@workload(Workload.PIPELINE)
 async def get_episodes_with_embeddings_for_media(media_id: int, limit: int = 1000) -> List[Dict[str, Any]]:
     """Get episodes with embeddings for a specific media with a safety limit."""
     query = """
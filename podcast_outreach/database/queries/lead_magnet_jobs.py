@@ -0,0 +1,176 @@
+# podcast_outreach/database/queries/lead_magnet_jobs.py
+
+"""
+Queries for queued public lead magnet submissions (lead_magnet_jobs, migration 015).
+
+Updates made by a worker on a job it claimed take the attempt number it claimed
+and only apply while the job is still running that attempt: a job that ran past
+the stale timeout may have been claimed again, and the slower worker must not
+overwrite the newer attempt's state. They return False when nothing was updated.
+"""
+
+import json
+import uuid
+import logging
+from typing import Any, Dict, Optional
+
+from podcast_outreach.database.connection import get_db_pool, get_pool, Workload
+
+logger = logging.getLogger(__name__)
+
+
+async def create_lead_magnet_job(
+    email: str,
+    full_name: str,
+    questionnaire_data: Dict[str, Any],
+    client_ip: Optional[str],
+) -> Optional[Dict[str, Any]]:
+    query = """
+    INSERT INTO lead_magnet_jobs (email, full_name, questionnaire_data, client_ip)
+    VALUES ($1, $2, $3::jsonb, $4)
+    RETURNING *;
+    """
+    pool = await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            row = await conn.fetchrow(query, email, full_name, json.dumps(questionnaire_data or {}), client_ip)
+            return _process_job_row(row)
+        except Exception as e:
+            logger.exception(f"Error queueing lead magnet submission for {email}: {e}")
+            return None
+
+
+async def get_lead_magnet_job(job_id: uuid.UUID) -> Optional[Dict[str, Any]]:
+    pool = await get_db_pool()
+    async with pool.acquire() as conn:
+        row = await conn.fetchrow("SELECT * FROM lead_magnet_jobs WHERE job_id = $1;", job_id)
+        return _process_job_row(row)
+
+
+async def get_active_job_for_email(email: str) -> Optional[Dict[str, Any]]:
+    """Returns a pending/running submission for the email, so a resubmit reuses its token."""
+    query = """
+    SELECT * FROM lead_magnet_jobs
+    WHERE lower(email) = lower($1) AND status IN ('pending', 'running')
+    ORDER BY created_at DESC
+    LIMIT 1;
+    """
+    pool = await get_db_pool()
+    async with pool.acquire() as conn:
+        row = await conn.fetchrow(query, email)
+        return _process_job_row(row)
+
+
+async def count_recent_jobs_for_ip(client_ip: str, window_seconds: int) -> int:
+    query = """
+    SELECT COUNT(*) FROM lead_magnet_jobs
+    WHERE client_ip = $1 AND created_at > NOW() - make_interval(secs => $2::float8);
+    """
+    pool = await get_db_pool()
+    async with pool.acquire() as conn:
+        return await conn.fetchval(query, client_ip, window_seconds)
+
+
+async def claim_next_lead_magnet_job(stale_after_seconds: int, max_attempts: int) -> Optional[Dict[str, Any]]:
+    """
+    Marks the oldest pending job running and returns it. Jobs left running longer
+    than stale_after_seconds (a worker died mid-job) are claimed again until they
+    have been attempted max_attempts times.
+    """
+    query = """
+    UPDATE lead_magnet_jobs j
+    SET status = 'running', locked_at = NOW(), attempts = j.attempts + 1
+    WHERE j.job_id = (
+        SELECT job_id FROM lead_magnet_jobs
+        WHERE (status = 'pending' AND next_attempt_at <= NOW())
+           OR (status = 'running' AND locked_at < NOW() - make_interval(secs => $1::float8) AND attempts < $2)
+        ORDER BY next_attempt_at
+        LIMIT 1
+        FOR UPDATE SKIP LOCKED
+    )
+    RETURNING j.*;
+    """
+    pool = await get_pool(Workload.PIPELINE)
+    async with pool.acquire() as conn:
+        row = await conn.fetchrow(query, stale_after_seconds, max_attempts)
+        return _process_job_row(row)
+
+
+async def fail_abandoned_lead_magnet_jobs(stale_after_seconds: int, max_attempts: int) -> int:
+    """Fails jobs that stalled on their last allowed attempt. Returns how many."""
+    query = """
+    UPDATE lead_magnet_jobs
+    SET status = 'failed', error = 'Processing was interrupted.', completed_at = NOW()
+    WHERE status = 'running'
+    AND locked_at < NOW() - make_interval(secs => $1::float8)
+    AND attempts >= $2;
+    """
+    pool = await get_pool(Workload.PIPELINE)
+    async with pool.acquire() as conn:
+        result = await conn.execute(query, stale_after_seconds, max_attempts)
+        return int(result.split()[-1])
+
+
+async def record_lead_magnet_progress(
+    job_id: uuid.UUID,
+    attempt: int,
+    person_id: Optional[int] = None,
+    campaign_id: Optional[uuid.UUID] = None,
+) -> bool:
+    """Stores the person/campaign as soon as they exist, so a retried job resumes instead of duplicating them."""
+    query = """
+    UPDATE lead_magnet_jobs
+    SET person_id = COALESCE($3, person_id), campaign_id = COALESCE($4, campaign_id)
+    WHERE job_id = $1 AND status = 'running' AND attempts = $2;
+    """
+    pool = await get_pool(Workload.PIPELINE)
+    async with pool.acquire() as conn:
+        result = await conn.execute(query, job_id, attempt, person_id, campaign_id)
+        return int(result.split()[-1]) > 0
+
+
+async def mark_lead_magnet_completed(job_id: uuid.UUID, attempt: int, media_kit_slug: str) -> bool:
+    query = """
+    UPDATE lead_magnet_jobs
+    SET status = 'completed', media_kit_slug = $3, completed_at = NOW(), locked_at = NULL, error = NULL
+    WHERE job_id = $1 AND status = 'running' AND attempts = $2;
+    """
+    pool = await get_pool(Workload.PIPELINE)
+    async with pool.acquire() as conn:
+        result = await conn.execute(query, job_id, attempt, media_kit_slug)
+        return int(result.split()[-1]) > 0
+
+
+async def retry_lead_magnet_job(job_id: uuid.UUID, attempt: int, error: str, delay_seconds: float) -> bool:
+    """Puts a job whose attempt failed back in the queue; it keeps its recorded person/campaign."""
+    query = """
+    UPDATE lead_magnet_jobs
+    SET status = 'pending', error = $3, locked_at = NULL,
+        next_attempt_at = NOW() + make_interval(secs => $4::float8)
+    WHERE job_id = $1 AND status = 'running' AND attempts = $2;
+    """
+    pool = await get_pool(Workload.PIPELINE)
+    async with pool.acquire() as conn:
+        result = await conn.execute(query, job_id, attempt, error[:1000], delay_seconds)
+        return int(result.split()[-1]) > 0
+
+
+async def mark_lead_magnet_failed(job_id: uuid.UUID, attempt: int, error: str) -> bool:
+    query = """
+    UPDATE lead_magnet_jobs
+    SET status = 'failed', error = $3, completed_at = NOW(), locked_at = NULL
+    WHERE job_id = $1 AND status = 'running' AND attempts = $2;
+    """
+    pool = await get_pool(Workload.PIPELINE)
+    async with pool.acquire() as conn:
+        result = await conn.execute(query, job_id, attempt, error[:1000])
+        return int(result.split()[-1]) > 0
+
+
+def _process_job_row(row) -> Optional[Dict[str, Any]]:
+    if not row:
+        return None
+    job = dict(row)
+    if isinstance(job.get("questionnaire_data"), str):
+        job["questionnaire_data"] = json.loads(job["questionnaire_data"])
+    return job
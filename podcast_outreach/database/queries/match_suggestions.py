@@ -2,12 +2,13 @@
 
 import logging
 import json
-from typing import Any, Dict, Optional, List
+from typing import Any, Dict, Optional, List, Tuple
 import uuid # For UUID types
 
 from podcast_outreach.logging_config import get_logger
-from podcast_outreach.database.connection import get_db_pool
+from podcast_outreach.database.connection import get_db_pool, primary_write, replica_read
 from podcast_outreach.database.queries import review_tasks # For process_match_suggestion_approval
+from podcast_outreach.database.queries.pagination import decode_cursor, encode_cursor
 
 logger = get_logger(__name__)
 
@@ -111,6 +112,7 @@ async def get_match_suggestions_for_campaign_from_db(campaign_id: uuid.UUID, ski
             logger.exception(f"Error fetching match suggestions for campaign {campaign_id}: {e}")
             raise
 
+@primary_write
 async def update_match_suggestion_in_db(match_id: int, update_fields: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     if not update_fields:
         logger.warning(f"No update data for match suggestion {match_id}. Fetching current.")
@@ -142,6 +144,7 @@ async def update_match_suggestion_in_db(match_id: int, update_fields: Dict[str,
             logger.exception(f"Error updating match suggestion {match_id}: {e}")
             raise
 
+@primary_write
 async def delete_match_suggestion_from_db(match_id: int) -> bool:
     query = "DELETE FROM match_suggestions WHERE match_id = $1;"
     pool = await get_db_pool()
@@ -172,6 +175,7 @@ async def get_match_suggestion_by_campaign_and_media_ids(campaign_id: uuid.UUID,
             logger.exception(f"Error fetching match suggestion for campaign {campaign_id} and media {media_id}: {e}")
             raise
 
+@primary_write
 async def approve_match_and_create_pitch_task(match_id: int) -> Optional[Dict[str, Any]]:
     """Mark a match suggestion as approved and create a pitch review task."""
     update_query = """
@@ -201,39 +205,20 @@ async def approve_match_and_create_pitch_task(match_id: int) -> Optional[Dict[st
 
     return match
 
-async def get_all_match_suggestions_enriched(
-    status: Optional[str] = None, 
-    campaign_id: Optional[uuid.UUID] = None,
-    skip: int = 0, 
-    limit: int = 100
-) -> List[Dict[str, Any]]:
-    """Fetches all match suggestions, optionally filtered by status or campaign_id, and enriches them."""
-    conditions = []
-    params = []
-    param_idx = 1
-
-    if status:
-        conditions.append(f"ms.status = ${param_idx}")
-        params.append(status)
-        param_idx += 1
-    
-    if campaign_id:
-        conditions.append(f"ms.campaign_id = ${param_idx}")
-        params.append(campaign_id)
-        param_idx += 1
+MATCH_SUGGESTION_ORDER = "ms.created_at DESC, ms.match_id DESC"
+MATCH_SUGGESTION_KEY = ("created_at", "match_id")
 
+async def _fetch_match_suggestion_page(conn, conditions: List[str], params: List[Any], limit: int, skip: int = 0) -> List[Dict[str, Any]]:
+    """Picks the page from match_suggestions alone (index order), then enriches only those rows."""
     where_clause = " AND ".join(conditions) if conditions else "1=1"
-    
-    # Add skip and limit to params and get their positions
-    params.append(skip)
-    skip_param_idx = param_idx
-    param_idx += 1
-    
-    params.append(limit)
-    limit_param_idx = param_idx
-    param_idx += 1
-
     query = f"""
+    WITH page AS (
+        SELECT ms.match_id
+        FROM match_suggestions ms
+        WHERE {where_clause}
+        ORDER BY {MATCH_SUGGESTION_ORDER}
+        LIMIT ${len(params) + 1} OFFSET ${len(params) + 2}
+    )
     SELECT 
         ms.*,
         m.name AS media_name,
@@ -241,25 +226,82 @@ async def get_all_match_suggestions_enriched(
         c.campaign_name AS campaign_name,
         p.full_name AS client_name,
         rt.review_task_id
-    FROM match_suggestions ms
+    FROM page
+    JOIN match_suggestions ms ON ms.match_id = page.match_id
     JOIN media m ON ms.media_id = m.media_id
     JOIN campaigns c ON ms.campaign_id = c.campaign_id
     LEFT JOIN people p ON c.person_id = p.person_id -- LEFT JOIN in case person_id is nullable or person is deleted
     LEFT JOIN review_tasks rt ON ms.match_id = rt.related_id AND rt.task_type = 'match_suggestion'
-    WHERE {where_clause}
-    ORDER BY ms.created_at DESC
-    OFFSET ${skip_param_idx} LIMIT ${limit_param_idx};
+    ORDER BY {MATCH_SUGGESTION_ORDER};
     """
+    rows = await conn.fetch(query, *params, limit, skip)
+    return [dict(row) for row in rows]
+
+def _match_suggestion_filters(status: Optional[str], campaign_id: Optional[uuid.UUID]):
+    conditions = []
+    params: List[Any] = []
+    if status:
+        params.append(status)
+        conditions.append(f"ms.status = ${len(params)}")
+    if campaign_id:
+        params.append(campaign_id)
+        conditions.append(f"ms.campaign_id = ${len(params)}")
+    return conditions, params
+
+@replica_read
+async def get_all_match_suggestions_enriched(
+    status: Optional[str] = None, 
+    campaign_id: Optional[uuid.UUID] = None,
+    skip: int = 0, 
+    limit: int = 100
+) -> List[Dict[str, Any]]:
+    """Fetches all match suggestions, optionally filtered by status or campaign_id, and enriches them.
+    Deep pages still skip rows; prefer get_match_suggestions_keyset for walking the list."""
+    conditions, params = _match_suggestion_filters(status, campaign_id)
 
     pool = await get_db_pool()
     async with pool.acquire() as conn:
         try:
-            rows = await conn.fetch(query, *params)
-            return [dict(row) for row in rows]
+            return await _fetch_match_suggestion_page(conn, conditions, params, limit, skip)
         except Exception as e:
             logger.exception(f"Error fetching all enriched match_suggestions: {e}")
             return []
 
+def match_suggestion_cursor(suggestion: Dict[str, Any]) -> str:
+    """Cursor continuing the match suggestion list after `suggestion`."""
+    return encode_cursor([suggestion.get(col) for col in MATCH_SUGGESTION_KEY])
+
+@replica_read
+async def get_match_suggestions_keyset(
+    status: Optional[str] = None,
+    campaign_id: Optional[uuid.UUID] = None,
+    cursor: Optional[str] = None,
+    limit: int = 100
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    Fetches enriched match suggestions (newest first) after `cursor`, first page when None.
+    Returns (suggestions, next_cursor); next_cursor is None on the last page.
+    Raises ValueError for a malformed cursor.
+    """
+    conditions, params = _match_suggestion_filters(status, campaign_id)
+    if cursor:
+        after_created_at, after_id = decode_cursor(cursor, len(MATCH_SUGGESTION_KEY), types=(None, int))
+        params.extend([after_created_at, after_id])
+        n = len(params)
+        conditions.append(f"(ms.created_at, ms.match_id) < (${n - 1}::timestamptz, ${n}::int)")
+
+    pool = await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            results = await _fetch_match_suggestion_page(conn, conditions, params, limit)
+        except Exception as e:
+            logger.exception(f"Error fetching match_suggestions by cursor: {e}")
+            return [], None
+
+    page_ids = {r['match_id'] for r in results}
+    next_cursor = match_suggestion_cursor(results[-1]) if len(page_ids) == limit else None
+    return results, next_cursor
+
 async def get_match_suggestion_by_id_enriched(match_id: int) -> Optional[Dict[str, Any]]:
     """Fetches a single match suggestion by its ID and enriches it."""
     query = """
@@ -1,16 +1,20 @@
 # podcast_outreach/database/queries/media.py
 
 import logging
-from typing import Any, Dict, Optional, List
+from typing import Any, Dict, Optional, List, Tuple
 from datetime import datetime, date
 import uuid # For UUID types if needed for related entities
 
 from podcast_outreach.logging_config import get_logger
-from podcast_outreach.database.connection import get_db_pool, get_background_task_pool
+from podcast_outreach.database.connection import get_db_pool, get_background_task_pool, get_pool, workload, Workload
+from podcast_outreach.database.entity_cache import media_cache, invalidate_media
 import asyncpg
 
 logger = get_logger(__name__)
 
+# Columns excluded from the light projection: the embedding vector and large compiled text
+MEDIA_HEAVY_COLUMNS = {'embedding', 'episode_summaries_compiled'}
+
 async def get_media_by_ids(media_ids: List[int]) -> Dict[int, Dict[str, Any]]:
     """Batch fetch media by multiple IDs for performance optimization."""
     if not media_ids:
@@ -48,6 +52,51 @@ async def get_media_by_id_from_db(media_id: int, pool: Optional[asyncpg.Pool] =
             logger.exception(f"Error fetching media {media_id}: {e}")
             raise
 
+_media_light_columns: Optional[List[str]] = None
+
+async def _get_media_light_columns(conn: asyncpg.Connection) -> List[str]:
+    """Resolves (once per process) the media columns minus the heavy ones."""
+    global _media_light_columns
+    if _media_light_columns is None:
+        rows = await conn.fetch(
+            """
+            SELECT column_name FROM information_schema.columns
+            WHERE table_name = 'media' AND table_schema = current_schema()
+            ORDER BY ordinal_position;
+            """
+        )
+        _media_light_columns = [r['column_name'] for r in rows if r['column_name'] not in MEDIA_HEAVY_COLUMNS]
+    return _media_light_columns
+
+async def get_media_light_by_id(media_id: int, pool: Optional[asyncpg.Pool] = None) -> Optional[Dict[str, Any]]:
+    """Fetches a media row without the embedding and compiled episode summaries."""
+    if pool is None:
+        pool = await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            columns = await _get_media_light_columns(conn)
+            query = f"SELECT {', '.join(columns)} FROM media WHERE media_id = $1;"
+            row = await conn.fetchrow(query, media_id)
+            if not row:
+                logger.debug(f"Media not found: {media_id}")
+                return None
+            return dict(row)
+        except Exception as e:
+            logger.exception(f"Error fetching light media {media_id}: {e}")
+            raise
+
+async def get_media_by_id_cached(media_id: int, pool: Optional[asyncpg.Pool] = None) -> Optional[Dict[str, Any]]:
+    """Read-through cached variant of get_media_by_id_from_db for pipelines that re-read the same media."""
+    return await media_cache.get_or_load(
+        media_id, lambda: get_media_by_id_from_db(media_id, pool=pool)
+    )
+
+async def get_media_light_by_id_cached(media_id: int, pool: Optional[asyncpg.Pool] = None) -> Optional[Dict[str, Any]]:
+    """Read-through cached variant of get_media_light_by_id."""
+    return await media_cache.get_or_load(
+        media_id, lambda: get_media_light_by_id(media_id, pool=pool), projection="light"
+    )
+
 async def get_media_by_rss_url_from_db(rss_url: str, pool: Optional[asyncpg.Pool] = None) -> Optional[Dict[str, Any]]:
     query = "SELECT * FROM media WHERE rss_url = $1;"
     if pool is None:
@@ -82,6 +131,7 @@ async def delete_media_from_db(media_id: int) -> bool:
             result = await conn.execute(query, media_id)
             deleted_count = int(result.split(" ")[1]) if result.startswith("DELETE ") else 0
             if deleted_count > 0:
+                await invalidate_media(media_id, conn)
                 logger.info(f"Media deleted: {media_id}")
                 return True
             logger.warning(f"Media not found for deletion or delete failed: {media_id}")
@@ -161,6 +211,7 @@ async def upsert_media_in_db(media_data: Dict[str, Any], pool: Optional[asyncpg.
             # matches the number of placeholders in the query string.
             row = await conn.fetchrow(query, *values)
             if row:
+                await invalidate_media(row['media_id'], conn)
                 logger.info(f"Media upserted successfully: '{row['name']}' (ID: {row['media_id']})")
                 return dict(row)
             else:
@@ -184,6 +235,7 @@ async def update_media_after_sync(media_id: int) -> Optional[Dict[str, Any]]:
         try:
             row = await conn.fetchrow(query, media_id)
             if row:
+                await invalidate_media(media_id, conn)
                 logger.info(f"Media {media_id} last_fetched_at updated.")
                 return dict(row)
             logger.warning(f"Media {media_id} not found for last_fetched_at update.")
@@ -207,6 +259,7 @@ async def update_media_latest_episode_date(media_id: int) -> Optional[Dict[str,
         try:
             row = await conn.fetchrow(query, media_id)
             if row:
+                await invalidate_media(media_id, conn)
                 logger.info(f"Media {media_id} latest_episode_date updated to {row.get('latest_episode_date')}.")
                 return dict(row)
             logger.warning(f"Media {media_id} not found for latest_episode_date update.")
@@ -280,6 +333,57 @@ async def get_media_for_enrichment(batch_size: int = 10, enriched_before_hours:
                 logger.exception(f"Error fetching media for enrichment: {e}")
                 raise
 
+SOCIAL_STAT_COLUMNS = ("twitter_followers", "instagram_followers", "tiktok_followers", "linkedin_connections")
+
+@workload(Workload.BULK)
+async def bulk_update_media_social_stats(stats_rows: List[Dict[str, Any]]) -> List[int]:
+    """
+    Writes refreshed follower counts for many media in one statement.
+    Each row is {"media_id": ..., <SOCIAL_STAT_COLUMNS>...}; missing or None counts keep
+    the stored value. Every listed media gets social_stats_last_fetched_at bumped, so
+    rows with no new data are not re-checked immediately. Returns the updated media_ids.
+    """
+    if not stats_rows:
+        return []
+    import json
+    payload = [
+        {"media_id": row["media_id"], **{col: row.get(col) for col in SOCIAL_STAT_COLUMNS}}
+        for row in stats_rows
+    ]
+    set_stats = ",\n        ".join(f"{col} = COALESCE(v.{col}, m.{col})" for col in SOCIAL_STAT_COLUMNS)
+    record_columns = ", ".join(f"{col} INTEGER" for col in SOCIAL_STAT_COLUMNS)
+    query = f"""
+    UPDATE media m SET
+        {set_stats},
+        social_stats_last_fetched_at = NOW(),
+        last_enriched_timestamp = NOW()
+    FROM jsonb_to_recordset($1::jsonb) AS v(media_id INTEGER, {record_columns})
+    WHERE m.media_id = v.media_id
+    RETURNING m.media_id;
+    """
+    discovery_update_query = """
+    UPDATE campaign_media_discoveries 
+    SET enrichment_status = 'completed',
+        enrichment_completed_at = NOW(),
+        updated_at = NOW()
+    WHERE media_id = ANY($1::int[]) AND enrichment_status = 'pending';
+    """
+    pool = await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            async with conn.transaction():
+                rows = await conn.fetch(query, json.dumps(payload))
+                updated_ids = [row["media_id"] for row in rows]
+                if updated_ids:
+                    await conn.execute(discovery_update_query, updated_ids)
+            for media_id in updated_ids:
+                await invalidate_media(media_id, conn)
+            logger.info(f"Bulk-updated social stats for {len(updated_ids)} media.")
+            return updated_ids
+        except Exception as e:
+            logger.exception(f"Error bulk updating social stats for {len(stats_rows)} media: {e}")
+            raise
+
 async def get_media_for_social_refresh(batch_size: int = 20, stale_hours: int = 24 * 7) -> List[Dict[str, Any]]:
     """
     Fetches media items that need social stats refresh (weekly updates).
@@ -417,6 +521,7 @@ async def update_media_enrichment_data(media_id: int, update_fields: Dict[str, A
         try:
             row = await conn.fetchrow(query, *values)
             if row:
+                await invalidate_media(media_id, conn)
                 logger.info(f"Media {media_id} enrichment data updated.")
                 
                 # Update all pending discovery statuses for this media to 'completed'
@@ -586,59 +691,189 @@ async def update_media_manual_override(media_id: int, update_fields: Dict[str, A
         media_id, update_fields, source="manual", confidence=1.0
     )
 
+@workload(Workload.PIPELINE)
 async def update_media_quality_score(media_id: int, quality_score: float) -> bool:
-    """Updates the quality_score for a media item and compiles episode summaries."""
-    # First, compile episode summaries
-    compile_query = """
-    WITH episode_summaries AS (
-        SELECT 
-            media_id,
-            string_agg(
-                COALESCE(ai_episode_summary, episode_summary, ''), 
-                E'\n\n---\n\n'
-                ORDER BY publish_date DESC
-            ) as compiled_summaries
-        FROM episodes
-        WHERE media_id = $1
-        AND (ai_episode_summary IS NOT NULL OR episode_summary IS NOT NULL)
-        GROUP BY media_id
-    )
-    UPDATE media m
-    SET quality_score = $2,
-        episode_summaries_compiled = es.compiled_summaries,
-        updated_at = NOW()
-    FROM episode_summaries es
-    WHERE m.media_id = $1 AND m.media_id = es.media_id
-    RETURNING m.media_id;
-    """
-    
-    # Fallback query if no episodes have summaries
-    fallback_query = """
+    """Updates the quality_score for a media item and recompiles episode summaries if its episodes changed."""
+    query = """
     UPDATE media
     SET quality_score = $1,
         updated_at = NOW()
     WHERE media_id = $2
     RETURNING media_id;
     """
-    
     pool = await get_db_pool()
     async with pool.acquire() as conn:
         try:
-            # Try to update with episode summaries compilation
-            row = await conn.fetchrow(compile_query, media_id, quality_score)
-            
-            # If no row returned (no episodes with summaries), use fallback
+            row = await conn.fetchrow(query, quality_score, media_id)
             if not row:
-                row = await conn.fetchrow(fallback_query, quality_score, media_id)
-            
-            if row:
-                logger.info(f"Media {media_id} quality score updated to {quality_score} and episode summaries compiled.")
-                return True
-            logger.warning(f"Media {media_id} not found for quality score update.")
-            return False
+                logger.warning(f"Media {media_id} not found for quality score update.")
+                return False
+            await invalidate_media(media_id, conn)
         except Exception as e:
             logger.exception(f"Error updating media {media_id} quality score: {e}")
             raise
+    await compile_episode_summaries_if_changed([media_id])
+    logger.info(f"Media {media_id} quality score updated to {quality_score}.")
+    return True
+
+# Inputs for the vectorized quality scorer. Dates are reduced to day counts in SQL so
+# the scorer only deals with numeric columns (NULL becomes NaN).
+QUALITY_SCORE_INPUT_QUERY = """
+SELECT m.media_id,
+       (CURRENT_DATE - COALESCE(m.latest_episode_date, m.last_posted_at::date)) AS days_since_last,
+       (m.latest_episode_date - m.first_episode_date) AS active_days,
+       m.total_episodes, m.publishing_frequency_days,
+       m.listen_score, m.audience_size,
+       m.itunes_rating_average, m.itunes_rating_count,
+       m.spotify_rating_average, m.spotify_rating_count,
+       m.twitter_followers, m.instagram_followers, m.youtube_subscribers,
+       m.tiktok_followers, m.facebook_likes
+FROM media m
+"""
+
+async def get_media_quality_inputs(
+    media_ids: Optional[List[int]] = None,
+    stale_hours: Optional[int] = None,
+    min_transcribed_episodes: Optional[int] = None,
+    after_media_id: int = 0,
+    limit: Optional[int] = None,
+) -> List[asyncpg.Record]:
+    """
+    Loads the columns needed for quality scoring, ordered by media_id.
+    With stale_hours, only enriched media whose score is missing or older than that are
+    returned (same selection as get_media_for_quality_score_update), stalest first, so a
+    limited refresh recomputes the oldest scores. Use after_media_id to page through the
+    whole catalog (without stale_hours).
+    """
+    conditions = ["m.media_id > $1"]
+    params: List[Any] = [after_media_id]
+    if media_ids is not None:
+        params.append(media_ids)
+        conditions.append(f"m.media_id = ANY(${len(params)}::int[])")
+    if stale_hours is not None:
+        params.append(stale_hours)
+        conditions.append(f"""m.last_enriched_timestamp IS NOT NULL
+        AND (m.quality_score IS NULL OR m.updated_at < NOW() - make_interval(hours => ${len(params)}))
+        AND EXISTS (
+            SELECT 1 FROM episodes e
+            WHERE e.media_id = m.media_id
+            AND (e.transcript IS NOT NULL OR e.ai_episode_summary IS NOT NULL)
+        )""")
+    if min_transcribed_episodes:
+        params.append(min_transcribed_episodes)
+        conditions.append(f"""(
+            SELECT COUNT(*) FROM episodes e
+            WHERE e.media_id = m.media_id AND e.transcript IS NOT NULL AND e.transcript != ''
+        ) >= ${len(params)}""")
+    order_by = "m.updated_at ASC NULLS FIRST, m.media_id" if stale_hours is not None else "m.media_id"
+    query = QUALITY_SCORE_INPUT_QUERY + "WHERE " + "\nAND ".join(conditions) + f"\nORDER BY {order_by}"
+    if limit:
+        params.append(limit)
+        query += f"\nLIMIT ${len(params)}"
+
+    pool = await get_pool(Workload.BULK)
+    async with pool.acquire() as conn:
+        try:
+            return await conn.fetch(query, *params)
+        except Exception as e:
+            logger.exception(f"Error loading quality score inputs: {e}")
+            raise
+
+QUALITY_SCORE_WRITE_CHUNK = 2000  # 6 parameters per row keeps each statement well under asyncpg's limit
+
+async def bulk_update_media_quality_scores(scores: List[Tuple[int, float, float, float, float, float]]) -> int:
+    """
+    Writes (media_id, quality_score, recency, frequency, audience, social) rows with one
+    UPDATE ... FROM (VALUES ...) per chunk. Returns the number of media updated.
+    """
+    if not scores:
+        return 0
+    updated = 0
+    pool = await get_pool(Workload.BULK)
+    async with pool.acquire() as conn:
+        try:
+            for start in range(0, len(scores), QUALITY_SCORE_WRITE_CHUNK):
+                chunk = scores[start:start + QUALITY_SCORE_WRITE_CHUNK]
+                values_sql = ", ".join(
+                    f"(${i * 6 + 1}::int, ${i * 6 + 2}::numeric, ${i * 6 + 3}::numeric, "
+                    f"${i * 6 + 4}::numeric, ${i * 6 + 5}::numeric, ${i * 6 + 6}::numeric)"
+                    for i in range(len(chunk))
+                )
+                query = f"""
+                UPDATE media m SET
+                    quality_score = v.score,
+                    quality_score_recency = v.recency,
+                    quality_score_frequency = v.frequency,
+                    quality_score_audience = v.audience,
+                    quality_score_social = v.social,
+                    quality_score_last_calculated = NOW(),
+                    updated_at = NOW()
+                FROM (VALUES {values_sql}) AS v(media_id, score, recency, frequency, audience, social)
+                WHERE m.media_id = v.media_id;
+                """
+                params = [value for row in chunk for value in row]
+                result = await conn.execute(query, *params)
+                updated += int(result.split()[-1]) if result else 0
+                for row in chunk:
+                    await invalidate_media(row[0], conn)
+            return updated
+        except Exception as e:
+            logger.exception(f"Error bulk updating quality scores for {len(scores)} media: {e}")
+            raise
+
+async def compile_episode_summaries_if_changed(media_ids: Optional[List[int]] = None, limit: int = 500) -> int:
+    """
+    Recompiles episode_summaries_compiled only for media whose episodes were added or
+    updated since the last compilation. Without media_ids, processes up to `limit` such media.
+    Returns the number of media recompiled.
+    """
+    query = """
+    WITH changed AS (
+        SELECT m.media_id
+        FROM media m
+        WHERE ($1::int[] IS NULL OR m.media_id = ANY($1::int[]))
+        AND EXISTS (
+            SELECT 1 FROM episodes e
+            WHERE e.media_id = m.media_id
+            AND (
+                m.episode_summaries_compiled_at IS NULL
+                OR GREATEST(e.created_at, e.updated_at) > m.episode_summaries_compiled_at
+            )
+        )
+        LIMIT $2
+    ), episode_summaries AS (
+        SELECT 
+            e.media_id,
+            string_agg(
+                COALESCE(e.ai_episode_summary, e.episode_summary, ''), 
+                E'\n\n---\n\n'
+                ORDER BY e.publish_date DESC
+            ) as compiled_summaries
+        FROM episodes e
+        JOIN changed c ON c.media_id = e.media_id
+        WHERE e.ai_episode_summary IS NOT NULL OR e.episode_summary IS NOT NULL
+        GROUP BY e.media_id
+    )
+    UPDATE media m
+    SET episode_summaries_compiled = COALESCE(es.compiled_summaries, m.episode_summaries_compiled),
+        episode_summaries_compiled_at = NOW()
+    FROM changed c
+    LEFT JOIN episode_summaries es ON es.media_id = c.media_id
+    WHERE m.media_id = c.media_id
+    RETURNING m.media_id;
+    """
+    pool = await get_background_task_pool()
+    async with pool.acquire() as conn:
+        try:
+            rows = await conn.fetch(query, media_ids, limit)
+            for row in rows:
+                await invalidate_media(row['media_id'], conn)
+            if rows:
+                logger.info(f"Recompiled episode summaries for {len(rows)} media with changed episodes.")
+            return len(rows)
+        except Exception as e:
+            logger.exception(f"Error compiling episode summaries: {e}")
+            return 0
 
 async def count_transcribed_episodes_for_media(media_id: int) -> int:
     """Counts the number of episodes for a media item that have a transcript."""
@@ -799,6 +1034,7 @@ async def update_media_ai_description(media_id: int, ai_description: str) -> boo
     async with pool.acquire() as conn:
         try:
             await conn.execute(query, ai_description, media_id)
+            await invalidate_media(media_id, conn)
             logger.info(f"Updated AI description for media {media_id}")
             return True
         except Exception as e:
@@ -822,6 +1058,7 @@ async def update_media_embedding(media_id: int, embedding: list) -> bool:
                 embedding_str = str(embedding)
             
             await conn.execute(query, embedding_str, media_id)
+            await invalidate_media(media_id, conn)
             logger.info(f"Updated embedding for media {media_id}")
             return True
         except Exception as e:
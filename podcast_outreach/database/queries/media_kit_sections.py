@@ -0,0 +1,60 @@
+# podcast_outreach/database/queries/media_kit_sections.py
+"""Cache of generated media kit sections, keyed by campaign and section name."""
+import json
+import uuid
+from typing import Any, Dict
+
+from podcast_outreach.logging_config import get_logger
+from podcast_outreach.database.connection import get_db_pool
+
+logger = get_logger(__name__)
+
+async def get_section_cache(campaign_id: uuid.UUID) -> Dict[str, Dict[str, Any]]:
+    """Returns {section: {"hash": input_hash, "output": output}} for a campaign."""
+    query = "SELECT section, input_hash, output FROM media_kit_section_cache WHERE campaign_id = $1;"
+    if isinstance(campaign_id, str):
+        campaign_id = uuid.UUID(campaign_id)
+    pool = await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            rows = await conn.fetch(query, campaign_id)
+            cache = {}
+            for row in rows:
+                output = row["output"]
+                cache[row["section"]] = {
+                    "hash": row["input_hash"],
+                    "output": json.loads(output) if isinstance(output, str) else output,
+                }
+            return cache
+        except Exception as e:
+            # The cache is an optimization; a missing table must not break generation
+            logger.warning(f"Could not read media kit section cache for campaign {campaign_id}: {e}")
+            return {}
+
+async def upsert_section_cache(campaign_id: uuid.UUID, entries: Dict[str, Dict[str, Any]]) -> bool:
+    """Stores freshly generated sections ({section: {"hash", "output"}}) in one statement."""
+    if not entries:
+        return True
+    query = """
+    INSERT INTO media_kit_section_cache (campaign_id, section, input_hash, output)
+    SELECT $1, e.section, e.input_hash, e.output
+    FROM jsonb_to_recordset($2::jsonb) AS e(section VARCHAR, input_hash VARCHAR, output JSONB)
+    ON CONFLICT (campaign_id, section) DO UPDATE
+    SET input_hash = EXCLUDED.input_hash,
+        output = EXCLUDED.output,
+        updated_at = NOW();
+    """
+    if isinstance(campaign_id, str):
+        campaign_id = uuid.UUID(campaign_id)
+    payload = [
+        {"section": section, "input_hash": entry["hash"], "output": entry["output"]}
+        for section, entry in entries.items()
+    ]
+    pool = await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            await conn.execute(query, campaign_id, json.dumps(payload, default=str))
+            return True
+        except Exception as e:
+            logger.warning(f"Could not persist media kit section cache for campaign {campaign_id}: {e}")
+            return False
@@ -5,6 +5,7 @@ from typing import Dict, Any, Optional, List
 from datetime import datetime
 
 from podcast_outreach.database.connection import get_db_pool
+from podcast_outreach.database.entity_cache import invalidate_media_kit
 from podcast_outreach.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -62,6 +63,7 @@ async def create_media_kit_in_db(kit_data: Dict[str, Any]) -> Optional[Dict[str,
             )
             if row:
                 logger.info(f"MediaKit created with ID: {row['media_kit_id']} for campaign {kit_data['campaign_id']}")
+                await invalidate_media_kit(row['slug'], conn)
                 # Deserialize fields when returning
                 return _process_media_kit_row(row)
             return None
@@ -126,9 +128,16 @@ async def update_media_kit_in_db(media_kit_id: uuid.UUID, update_data: Dict[str,
     pool = await get_db_pool()
     async with pool.acquire() as conn:
         try:
+            previous_slug = None
+            if "slug" in update_data:
+                # The public cache is keyed by slug, so a rename must also drop the old key
+                previous_slug = await conn.fetchval("SELECT slug FROM media_kits WHERE media_kit_id = $1;", media_kit_id)
             row = await conn.fetchrow(query, *values)
             if row:
                 logger.info(f"MediaKit updated: {media_kit_id}")
+                await invalidate_media_kit(row['slug'], conn)
+                if previous_slug and previous_slug != row['slug']:
+                    await invalidate_media_kit(previous_slug, conn)
                 return _process_media_kit_row(row) # Deserialize fields when returning
             logger.warning(f"MediaKit {media_kit_id} not found for update.")
             return None
@@ -0,0 +1,107 @@
+# podcast_outreach/database/queries/pagination.py
+
+"""
+Helpers for keyset (cursor) pagination and cheap total counts.
+
+A cursor is the sort key of the last row on a page, encoded as opaque URL-safe
+base64. Counts are exact up to COUNT_EXACT_LIMIT rows and fall back to the
+planner's row estimate beyond that; either way they are cached for
+COUNT_CACHE_TTL_SECONDS per query and filter set.
+"""
+
+import os
+import json
+import base64
+import logging
+from decimal import Decimal
+from datetime import date, datetime
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+from cachetools import TTLCache
+
+logger = logging.getLogger(__name__)
+
+COUNT_CACHE_TTL_SECONDS = int(os.getenv("COUNT_CACHE_TTL_SECONDS", "30"))
+COUNT_EXACT_LIMIT = int(os.getenv("COUNT_EXACT_LIMIT", "10000"))
+
+_count_cache: Optional[TTLCache] = (
+    TTLCache(maxsize=2048, ttl=COUNT_CACHE_TTL_SECONDS) if COUNT_CACHE_TTL_SECONDS > 0 else None
+)
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"t": value.isoformat()}
+    if isinstance(value, date):
+        return {"D": value.isoformat()}
+    if isinstance(value, Decimal):
+        return {"d": str(value)}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        if "t" in value:
+            return datetime.fromisoformat(value["t"])
+        if "D" in value:
+            return date.fromisoformat(value["D"])
+        if "d" in value:
+            return Decimal(value["d"])
+    return value
+
+
+def encode_cursor(key: Sequence[Any]) -> str:
+    """Encodes a row's sort key as an opaque cursor string."""
+    raw = json.dumps([_encode_value(v) for v in key], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(
+    cursor: str, size: int, types: Optional[Sequence[Optional[Callable[[Any], Any]]]] = None
+) -> List[Any]:
+    """
+    Decodes a cursor from encode_cursor. `types` optionally converts each key value
+    (None leaves it as decoded). Raises ValueError if the cursor or any value is malformed.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {e}") from e
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError("Invalid cursor")
+    try:
+        decoded = [_decode_value(v) for v in values]
+        if types is not None:
+            decoded = [v if convert is None else convert(v) for v, convert in zip(decoded, types)]
+        return decoded
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {e}") from e
+
+
+async def cached_count(conn, from_where: str, params: Sequence[Any]) -> int:
+    """
+    Counts rows of `FROM ... WHERE ...` (from_where), exactly up to COUNT_EXACT_LIMIT
+    and by planner estimate above it, caching the result briefly.
+    """
+    cache_key: Tuple = (from_where, tuple(str(p) for p in params))
+    if _count_cache is not None and cache_key in _count_cache:
+        return _count_cache[cache_key]
+
+    limit_idx = len(params) + 1
+    total = await conn.fetchval(
+        f"SELECT COUNT(*) FROM (SELECT 1 {from_where} LIMIT ${limit_idx}) capped;",
+        *params, COUNT_EXACT_LIMIT + 1
+    ) or 0
+    if total > COUNT_EXACT_LIMIT:
+        try:
+            plan = await conn.fetchval(f"EXPLAIN (FORMAT JSON) SELECT 1 {from_where};", *params)
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            total = max(int(plan[0]["Plan"]["Plan Rows"]), total)
+        except Exception as e:
+            logger.warning(f"Row estimate failed, reporting capped count: {e}")
+
+    if _count_cache is not None:
+        _count_cache[cache_key] = total
+    return total
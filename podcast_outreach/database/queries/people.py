@@ -8,6 +8,8 @@ import json # ADD THIS IMPORT
 
 from podcast_outreach.logging_config import get_logger
 from podcast_outreach.database.connection import get_db_pool
+from podcast_outreach.database.entity_cache import invalidate_media_kit
+from podcast_outreach.database.queries.email_verification_queries import invalidate_cached_verification
 
 logger = get_logger(__name__)
 
@@ -174,6 +176,8 @@ async def update_person_in_db(person_id: int, update_fields: Dict[str, Any]) ->
     async with pool.acquire() as conn:
         try:
             row = await conn.fetchrow(query, *values)
+            if "email_verified" in update_fields:
+                invalidate_cached_verification(person_id)
             logger.info(f"Person updated: {person_id} with fields: {list(update_fields.keys())}")
             return _process_person_row(row) # Correctly using _process_person_row
         except asyncpg.exceptions.UniqueViolationError:
@@ -317,11 +321,14 @@ async def delete_person_from_db(person_id: int) -> bool:
                     logger.debug(f"Deleted {result} chatbot conversations")
                     
                     # Delete media_kits
-                    result = await conn.execute("""
+                    deleted_kits = await conn.fetch("""
                         DELETE FROM media_kits 
                         WHERE campaign_id = ANY($1::uuid[])
+                        RETURNING slug
                     """, campaign_id_list)
-                    logger.debug(f"Deleted {result} media kits")
+                    for kit in deleted_kits:
+                        await invalidate_media_kit(kit['slug'], conn)
+                    logger.debug(f"Deleted {len(deleted_kits)} media kits")
                     
                     # Delete match_notification_log
                     result = await conn.execute("""
@@ -352,8 +359,10 @@ async def delete_person_from_db(person_id: int) -> bool:
                 logger.debug(f"Deleted {result} direct chatbot conversations")
                 
                 # Delete media kits that might be directly linked to person (not through campaign)
-                result = await conn.execute("DELETE FROM media_kits WHERE person_id = $1", person_id)
-                logger.debug(f"Deleted {result} direct media kits")
+                deleted_kits = await conn.fetch("DELETE FROM media_kits WHERE person_id = $1 RETURNING slug", person_id)
+                for kit in deleted_kits:
+                    await invalidate_media_kit(kit['slug'], conn)
+                logger.debug(f"Deleted {len(deleted_kits)} direct media kits")
                 
                 # Check for and delete from tables that might exist
                 tables_to_check = [
@@ -386,6 +395,7 @@ async def delete_person_from_db(person_id: int) -> bool:
                 result = await conn.execute("DELETE FROM people WHERE person_id = $1", person_id)
                 logger.info(f"Deleted person record: {result}")
                 
+                invalidate_cached_verification(person_id)
                 logger.info(f"Successfully deleted person and all related data: {person_id} ({person['full_name']}, {person['email']})")
                 return True
                 
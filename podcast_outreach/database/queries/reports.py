@@ -0,0 +1,94 @@
+# podcast_outreach/database/queries/reports.py
+
+from typing import Dict, List, Optional
+from datetime import date, datetime, time, timedelta, timezone
+from collections import Counter, defaultdict
+
+from podcast_outreach.logging_config import get_logger
+from podcast_outreach.database.connection import get_read_pool, use_workload, Workload
+
+logger = get_logger(__name__)
+
+# Display name -> (source, condition). Pitches are bucketed by the week they were sent,
+# placements by the week of their last status change.
+WEEKLY_STATUS_METRICS = {
+    "Messages sent": ("pitches", "p.pitch_state = 'sent'"),
+    "Total replies": ("pitches", "p.reply_bool IS TRUE"),
+    "Positive replies": ("pitches", "p.pitch_state = 'replied_interested'"),
+    "Lost": ("pitches", "p.pitch_state = 'lost'"),
+    "Form Submitted": ("placements", "pl.current_status = 'form_submitted'"),
+    "Meetings booked": ("placements", "pl.current_status = 'meeting_booked'"),
+}
+TOTAL_PITCHES_SENT = "total_pitches_sent"
+
+
+def _filter_columns(source: str) -> str:
+    columns = [
+        f"COUNT(*) FILTER (WHERE {condition}) AS \"{name}\""
+        for name, (metric_source, condition) in WEEKLY_STATUS_METRICS.items()
+        if metric_source == source
+    ]
+    if source == "pitches":
+        columns.insert(0, f"COUNT(*) AS {TOTAL_PITCHES_SENT}")
+    return ",\n           ".join(columns)
+
+
+# Weekly reports cover whole past weeks, so a replica minutes behind is fine
+REPORT_REPLICA_MAX_LAG_SECONDS = 300
+
+
+async def get_weekly_status_counts(
+    first_week_start: date,
+    num_weeks: int,
+    person_ids: Optional[List[int]] = None,
+) -> Dict[int, Dict[date, Counter]]:
+    """
+    Weekly pitch and placement status counts per client, for `num_weeks` Monday-start weeks
+    beginning at `first_week_start`. Aggregated in the database with date_trunc('week', ...),
+    so the cost depends on the rows inside the window rather than the full pitch history.
+
+    Returns {person_id: {week_start: Counter({metric: count, TOTAL_PITCHES_SENT: n})}}.
+    """
+    window_start = datetime.combine(first_week_start, time.min, tzinfo=timezone.utc)
+    window_end = window_start + timedelta(weeks=num_weeks)
+    query = f"""
+    WITH pitch_weeks AS (
+        SELECT c.person_id,
+               date_trunc('week', p.send_ts AT TIME ZONE 'UTC')::date AS week_start,
+               {_filter_columns("pitches")}
+        FROM pitches p
+        JOIN campaigns c ON c.campaign_id = p.campaign_id
+        WHERE p.send_ts >= $1 AND p.send_ts < $2
+        AND c.person_id IS NOT NULL
+        AND ($3::int[] IS NULL OR c.person_id = ANY($3::int[]))
+        GROUP BY 1, 2
+    ), placement_weeks AS (
+        SELECT c.person_id,
+               date_trunc('week', pl.status_ts AT TIME ZONE 'UTC')::date AS week_start,
+               {_filter_columns("placements")}
+        FROM placements pl
+        JOIN campaigns c ON c.campaign_id = pl.campaign_id
+        WHERE pl.status_ts >= $1 AND pl.status_ts < $2
+        AND c.person_id IS NOT NULL
+        AND ($3::int[] IS NULL OR c.person_id = ANY($3::int[]))
+        GROUP BY 1, 2
+    )
+    SELECT *
+    FROM pitch_weeks
+    FULL OUTER JOIN placement_weeks USING (person_id, week_start);
+    """
+    metric_columns = [TOTAL_PITCHES_SENT] + list(WEEKLY_STATUS_METRICS)
+    counts: Dict[int, Dict[date, Counter]] = defaultdict(dict)
+    with use_workload(Workload.REPORTING):
+        pool = await get_read_pool(max_lag_seconds=REPORT_REPLICA_MAX_LAG_SECONDS)
+    async with pool.acquire() as conn:
+        try:
+            rows = await conn.fetch(query, window_start, window_end, person_ids)
+        except Exception as e:
+            logger.exception(f"Error aggregating weekly status counts: {e}")
+            raise
+    for row in rows:
+        counts[row["person_id"]][row["week_start"]] = Counter(
+            {metric: row[metric] or 0 for metric in metric_columns}
+        )
+    return counts
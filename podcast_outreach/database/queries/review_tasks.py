@@ -1,9 +1,11 @@
 import logging
-from typing import Any, Dict, Optional, List
+from typing import Any, Dict, Optional, List, Tuple
 from datetime import datetime
+from decimal import Decimal
 
-from podcast_outreach.database.connection import get_db_pool
+from podcast_outreach.database.connection import get_db_pool, primary_write, replica_read
 from podcast_outreach.database.queries import match_suggestions # For process_match_suggestion_approval
+from podcast_outreach.database.queries.pagination import cached_count, decode_cursor, encode_cursor
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +37,7 @@ async def create_review_task_in_db(task_data: Dict[str, Any]) -> Optional[Dict[s
             logger.exception(f"Error creating ReviewTask in DB: {e}")
             raise
 
+@primary_write
 async def update_review_task_status_in_db(review_task_id: int, status: str, notes: Optional[str] = None) -> Optional[Dict[str, Any]]:
     """Updates the status and completed_at timestamp of a review task. Optionally updates notes."""
     set_clauses = ["status = $1", "completed_at = NOW()"]
@@ -79,6 +82,7 @@ async def get_review_task_by_id_from_db(review_task_id: int) -> Optional[Dict[st
             logger.exception(f"Error fetching ReviewTask by ID {review_task_id}: {e}")
             raise
 
+@primary_write
 async def process_match_suggestion_approval(review_task_id: int, new_status: str, approver_notes: Optional[str] = None) -> bool:
     """Processes the approval/rejection of a review task, specifically handling match_suggestion approvals."""
     
@@ -122,118 +126,162 @@ async def process_match_suggestion_approval(review_task_id: int, new_status: str
 
     return True
 
-async def get_all_review_tasks_paginated(
-    page: int = 1,
-    size: int = 20,
-    task_type: Optional[str] = None,
-    status: Optional[str] = None,
-    assigned_to_id: Optional[int] = None,
-    campaign_id: Optional[str] = None 
-) -> tuple[List[Dict[str, Any]], int]:
-    """Fetches review tasks with filtering, pagination, and enrichment for pitch_review tasks."""
-    offset = (page - 1) * size
-    
-    select_clauses = [
-        "rt.*",
-        "c.campaign_name",
-        "p.full_name AS client_name",
-        # Media name - from either pitch or match suggestion
-        "COALESCE(m_pitch.name, m_match.name) AS media_name",
-        # Pitch review fields
-        "pg.draft_text",
-        "pch.subject_line", 
-        "pg.media_id AS pitch_media_id",
-        # Match suggestion AI fields
-        "ms.ai_reasoning",
-        "ms.vetting_score",
-        "ms.vetting_reasoning",
-        "ms.vetting_checklist",
-        "ms.match_score",
-        "ms.media_id AS match_media_id"
-    ]
-    
-    joins = [
-        "LEFT JOIN campaigns c ON rt.campaign_id = c.campaign_id",
-        "LEFT JOIN people p ON c.person_id = p.person_id",
-        # Conditional joins for pitch_review related data
-        "LEFT JOIN pitch_generations pg ON rt.task_type = 'pitch_review' AND rt.related_id = pg.pitch_gen_id",
-        "LEFT JOIN pitches pch ON pg.pitch_gen_id = pch.pitch_gen_id",
-        "LEFT JOIN media m_pitch ON pg.media_id = m_pitch.media_id",
-        # Conditional joins for match_suggestion related data
-        "LEFT JOIN match_suggestions ms ON rt.task_type = 'match_suggestion' AND rt.related_id = ms.match_id",
-        "LEFT JOIN media m_match ON ms.media_id = m_match.media_id"
-    ]
-    
-    # Note: If task_type is 'match_suggestion', media_name would come from a different join:
-    # LEFT JOIN match_suggestions ms ON rt.task_type = 'match_suggestion' AND rt.related_id = ms.match_id
-    # LEFT JOIN media m_match ON ms.media_id = m_match.media_id (and select m_match.name)
-    # For simplicity, this query prioritizes enrichment for 'pitch_review'. 
-    # A more complex query or separate functions might be needed for fully polymorphic enrichment.
+# Review queue order; backed by review_tasks.sort_score indexes (migration 011)
+REVIEW_QUEUE_ORDER = "rt.sort_score DESC, rt.created_at DESC, rt.review_task_id DESC"
+REVIEW_QUEUE_KEY = ("sort_score", "created_at", "review_task_id")
 
-    conditions = []
-    params = []
-    param_idx = 1
+_REVIEW_TASK_SELECT = """
+    rt.*,
+    c.campaign_name,
+    p.full_name AS client_name,
+    COALESCE(m_pitch.name, m_match.name) AS media_name,
+    pg.draft_text,
+    pch.subject_line,
+    pg.media_id AS pitch_media_id,
+    ms.ai_reasoning,
+    ms.vetting_score,
+    ms.vetting_reasoning,
+    ms.vetting_checklist,
+    ms.match_score,
+    ms.media_id AS match_media_id
+"""
+
+_REVIEW_TASK_JOINS = """
+    LEFT JOIN campaigns c ON rt.campaign_id = c.campaign_id
+    LEFT JOIN people p ON c.person_id = p.person_id
+    LEFT JOIN pitch_generations pg ON rt.task_type = 'pitch_review' AND rt.related_id = pg.pitch_gen_id
+    LEFT JOIN pitches pch ON pg.pitch_gen_id = pch.pitch_gen_id
+    LEFT JOIN media m_pitch ON pg.media_id = m_pitch.media_id
+    LEFT JOIN match_suggestions ms ON rt.task_type = 'match_suggestion' AND rt.related_id = ms.match_id
+    LEFT JOIN media m_match ON ms.media_id = m_match.media_id
+"""
 
+def _review_task_filters(
+    task_type: Optional[str],
+    status: Optional[str],
+    assigned_to_id: Optional[int],
+    campaign_id: Optional[str]
+) -> Tuple[List[str], List[Any]]:
+    conditions = []
+    params: List[Any] = []
     if task_type:
-        conditions.append(f"rt.task_type = ${param_idx}")
         params.append(task_type)
-        param_idx += 1
+        conditions.append(f"rt.task_type = ${len(params)}")
     if status:
-        conditions.append(f"rt.status = ${param_idx}")
         params.append(status)
-        param_idx += 1
+        conditions.append(f"rt.status = ${len(params)}")
     if assigned_to_id is not None:
-        conditions.append(f"rt.assigned_to = ${param_idx}")
         params.append(assigned_to_id)
-        param_idx += 1
+        conditions.append(f"rt.assigned_to = ${len(params)}")
     if campaign_id:
-        conditions.append(f"rt.campaign_id = ${param_idx}") # campaign_id on review_tasks table
         params.append(campaign_id)
-        param_idx += 1
+        conditions.append(f"rt.campaign_id = ${len(params)}")
+    return conditions, params
 
-    where_clause = " AND ".join(conditions) if conditions else "1=1"
+def _adapt_review_task_row(row) -> Dict[str, Any]:
+    """Exposes the IDs and media_id appropriate to each task type."""
+    r = dict(row)
+    if r.get('task_type') == 'pitch_review':
+        r['pitch_gen_id'] = r.get('related_id')
+        r['media_id'] = r.get('pitch_media_id')
+    elif r.get('task_type') == 'match_suggestion':
+        r['media_id'] = r.get('match_media_id')
+    return r
 
-    query_string = f"""
-    SELECT {', '.join(select_clauses)}
-    FROM review_tasks rt
-    {' '.join(joins)}
-    WHERE {where_clause}
-    ORDER BY COALESCE(ms.vetting_score, ms.match_score, 0) DESC, rt.created_at DESC
-    LIMIT ${param_idx} OFFSET ${param_idx + 1};
-    """
-    params_for_query = params + [size, offset]
-    
-    count_query_string = f"""
-    SELECT COUNT(rt.*) AS total
-    FROM review_tasks rt
-    {' '.join(joins)}  -- Apply same joins for accurate count if filters span joined tables, though less critical for base count
-    WHERE {where_clause};
+async def _fetch_review_task_page(conn, conditions: List[str], params: List[Any], size: int, offset: int = 0) -> List[Dict[str, Any]]:
+    """Picks the page from review_tasks alone (index order), then enriches only those rows."""
+    where_clause = " AND ".join(conditions) if conditions else "1=1"
+    query = f"""
+    WITH page AS (
+        SELECT rt.review_task_id
+        FROM review_tasks rt
+        WHERE {where_clause}
+        ORDER BY {REVIEW_QUEUE_ORDER}
+        LIMIT ${len(params) + 1} OFFSET ${len(params) + 2}
+    )
+    SELECT {_REVIEW_TASK_SELECT}
+    FROM page
+    JOIN review_tasks rt ON rt.review_task_id = page.review_task_id
+    {_REVIEW_TASK_JOINS}
+    ORDER BY {REVIEW_QUEUE_ORDER};
     """
-    params_for_count = params # Count query doesn't need limit/offset params
+    rows = await conn.fetch(query, *params, size, offset)
+    return [_adapt_review_task_row(row) for row in rows]
+
+def review_task_cursor(task: Dict[str, Any]) -> str:
+    """Cursor continuing the review queue after `task`."""
+    return encode_cursor([task.get(col) for col in REVIEW_QUEUE_KEY])
+
+@replica_read
+async def get_all_review_tasks_paginated(
+    page: int = 1,
+    size: int = 20,
+    task_type: Optional[str] = None,
+    status: Optional[str] = None,
+    assigned_to_id: Optional[int] = None,
+    campaign_id: Optional[str] = None 
+) -> tuple[List[Dict[str, Any]], int]:
+    """Fetches review tasks with filtering, pagination, and enrichment for pitch_review tasks.
+    Deep pages still skip rows; prefer get_review_tasks_keyset for walking the queue."""
+    offset = (page - 1) * size
+    conditions, params = _review_task_filters(task_type, status, assigned_to_id, campaign_id)
+    where_clause = " AND ".join(conditions) if conditions else "1=1"
 
     pool = await get_db_pool()
     async with pool.acquire() as conn:
         try:
-            rows = await conn.fetch(query_string, *params_for_query)
-            total_record = await conn.fetchrow(count_query_string, *params_for_count)
-            total = total_record['total'] if total_record else 0
-            
-            # Adapt the returned dictionary to include appropriate IDs and media_id for different task types
-            results = []
-            for row in rows:
-                r = dict(row)
-                if r.get('task_type') == 'pitch_review':
-                    r['pitch_gen_id'] = r.get('related_id')
-                    r['media_id'] = r.get('pitch_media_id')
-                elif r.get('task_type') == 'match_suggestion':
-                    r['media_id'] = r.get('match_media_id')
-                    # The AI fields are already included from the SELECT clause
-                results.append(r)
+            results = await _fetch_review_task_page(conn, conditions, params, size, offset)
+            total = await cached_count(conn, f"FROM review_tasks rt WHERE {where_clause}", params)
             return results, total
         except Exception as e:
             logger.exception(f"Error fetching paginated and enriched review tasks: {e}")
             return [], 0
 
+@replica_read
+async def get_review_tasks_keyset(
+    size: int = 20,
+    cursor: Optional[str] = None,
+    task_type: Optional[str] = None,
+    status: Optional[str] = None,
+    assigned_to_id: Optional[int] = None,
+    campaign_id: Optional[str] = None,
+    include_total: bool = True
+) -> Tuple[List[Dict[str, Any]], Optional[str], Optional[int]]:
+    """
+    Fetches the enriched review queue page after `cursor` (first page when None).
+    Returns (tasks, next_cursor, total); next_cursor is None on the last page and total
+    is a cached/estimated count (None when include_total is False).
+    Raises ValueError for a malformed cursor.
+    """
+    conditions, params = _review_task_filters(task_type, status, assigned_to_id, campaign_id)
+    where_clause = " AND ".join(conditions) if conditions else "1=1"
+    page_conditions = list(conditions)
+    page_params = list(params)
+    if cursor:
+        after_score, after_created_at, after_id = decode_cursor(
+            cursor, len(REVIEW_QUEUE_KEY), types=(lambda v: Decimal(str(v)), None, int)
+        )
+        page_params.extend([after_score, after_created_at, after_id])
+        n = len(page_params)
+        page_conditions.append(
+            f"(rt.sort_score, rt.created_at, rt.review_task_id) < (${n - 2}::numeric, ${n - 1}::timestamptz, ${n}::int)"
+        )
+
+    pool = await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            results = await _fetch_review_task_page(conn, page_conditions, page_params, size)
+            total = None
+            if include_total:
+                total = await cached_count(conn, f"FROM review_tasks rt WHERE {where_clause}", params)
+        except Exception as e:
+            logger.exception(f"Error fetching review tasks by cursor: {e}")
+            return [], None, 0 if include_total else None
+
+    page_ids = {r['review_task_id'] for r in results}
+    next_cursor = review_task_cursor(results[-1]) if len(page_ids) == size else None
+    return results, next_cursor, total
+
 async def count_review_tasks_by_status(status: str, person_id: Optional[int] = None) -> int:
     """Counts review tasks by status, optionally filtered by person_id (via campaign)."""
     pool = await get_db_pool()
@@ -277,6 +325,7 @@ async def get_pending_review_task_by_related_id_and_type(
             logger.exception(f"Error fetching pending review task by related_id {related_id} and type {task_type}: {e}")
             return None
 
+@primary_write
 async def complete_review_tasks_for_match(match_id: int, completion_notes: str = None) -> bool:
     """Complete all pending review tasks for a specific match."""
     pool = await get_db_pool()
@@ -0,0 +1,71 @@
+# podcast_outreach/database/queries/vetting_checklists.py
+"""Persistent cache of LLM-generated vetting checklists, keyed by client profile hash."""
+import json
+import uuid
+from typing import Any, Dict, Optional
+
+from podcast_outreach.logging_config import get_logger
+from podcast_outreach.database.connection import get_db_pool
+
+logger = get_logger(__name__)
+
+async def get_checklist_by_hash(profile_hash: str) -> Optional[Dict[str, Any]]:
+    """Returns the cached checklist JSON for a profile hash and bumps its last_used_at."""
+    query = """
+    UPDATE vetting_checklists
+    SET last_used_at = NOW()
+    WHERE profile_hash = $1
+    RETURNING checklist;
+    """
+    pool = await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            checklist = await conn.fetchval(query, profile_hash)
+            if checklist is None:
+                return None
+            return json.loads(checklist) if isinstance(checklist, str) else checklist
+        except Exception as e:
+            # The cache is an optimization; a missing table must not break vetting
+            logger.warning(f"Could not read cached vetting checklist {profile_hash[:12]}: {e}")
+            return None
+
+async def upsert_checklist(profile_hash: str, campaign_id: Optional[uuid.UUID], checklist: Dict[str, Any]) -> bool:
+    """Stores a generated checklist for a profile hash."""
+    query = """
+    INSERT INTO vetting_checklists (profile_hash, campaign_id, checklist)
+    VALUES ($1, $2, $3::jsonb)
+    ON CONFLICT (profile_hash) DO UPDATE
+    SET checklist = EXCLUDED.checklist,
+        campaign_id = EXCLUDED.campaign_id,
+        last_used_at = NOW();
+    """
+    if isinstance(campaign_id, str):
+        campaign_id = uuid.UUID(campaign_id)
+    pool = await get_db_pool()
+    async with pool.acquire() as conn:
+        try:
+            await conn.execute(query, profile_hash, campaign_id, json.dumps(checklist))
+            return True
+        except Exception as e:
+            logger.warning(f"Could not persist vetting checklist {profile_hash[:12]}: {e}")
+            return False
+
+async def delete_checklists_for_campaign(campaign_id: uuid.UUID, conn=None) -> int:
+    """Drops cached checklists for a campaign, e.g. after its questionnaire changes."""
+    query = "DELETE FROM vetting_checklists WHERE campaign_id = $1;"
+    if isinstance(campaign_id, str):
+        campaign_id = uuid.UUID(campaign_id)
+    try:
+        if conn is not None:
+            result = await conn.execute(query, campaign_id)
+        else:
+            pool = await get_db_pool()
+            async with pool.acquire() as pooled_conn:
+                result = await pooled_conn.execute(query, campaign_id)
+        deleted = int(result.split(" ")[1]) if result.startswith("DELETE ") else 0
+        if deleted:
+            logger.info(f"Invalidated {deleted} cached vetting checklist(s) for campaign {campaign_id}")
+        return deleted
+    except Exception as e:
+        logger.warning(f"Could not invalidate vetting checklists for campaign {campaign_id}: {e}")
+        return 0
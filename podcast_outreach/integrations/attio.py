@@ -10,6 +10,7 @@ import html
 import re
 
 from podcast_outreach.utils.exceptions import APIClientError
+from podcast_outreach.utils.http_sessions import get_sync_session, get_upstream_timeout
 from podcast_outreach.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -28,6 +29,8 @@ class AttioClient:
         }
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.session = get_sync_session("attio")
+        self.timeout = get_upstream_timeout("attio")
 
     def create_record(self, object_type: str, attributes: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -103,16 +106,12 @@ class AttioClient:
                 if data:
                     logger.debug(f"Payload: {data}") # Use debug for sensitive payload
                 
-                if method.lower() == "post":
-                    response = requests.post(url, json=data, headers=self.headers, timeout=10)
-                elif method.lower() == "put":
-                    response = requests.put(url, json=data, headers=self.headers, timeout=10)
-                elif method.lower() == "patch":
-                    response = requests.patch(url, json=data, headers=self.headers, timeout=10)
+                if method.lower() in ("post", "put", "patch"):
+                    response = self.session.request(method.upper(), url, json=data, headers=self.headers, timeout=self.timeout)
                 elif method.lower() == "delete":
-                    response = requests.delete(url, headers=self.headers, timeout=10)
+                    response = self.session.delete(url, headers=self.headers, timeout=self.timeout)
                 else:  # Default to GET
-                    response = requests.get(url, headers=self.headers, timeout=10)
+                    response = self.session.get(url, headers=self.headers, timeout=self.timeout)
                 
                 try:
                     response_data = response.json()
@@ -15,6 +15,47 @@ SCOPES = [
 SERVICE_ACCOUNT_FILE = os.getenv('GOOGLE_APPLICATION_CREDENTIALS')
 FOLDER_ID = os.getenv('GOOGLE_PODCAST_INFO_FOLDER_ID')
 
+
+def read_structural_elements(elements):
+    """Plain text of a Docs API body: paragraphs, table cells and the table of contents."""
+    text = ''
+    for element in elements:
+        if 'paragraph' in element:
+            text += _read_paragraph_elements([element])
+        elif 'table' in element:
+            text += _read_table_elements([element])
+        elif 'tableOfContents' in element:
+            text += _read_tableOfContents_elements([element])
+    return text
+
+def _read_paragraph_elements(elements):
+    text = ''
+    for element in elements:
+        if 'paragraph' in element:
+            for run in element.get('paragraph').get('elements'):
+                if 'textRun' in run:
+                    text += run.get('textRun').get('content')
+    return text
+
+def _read_table_elements(elements):
+    text = ''
+    for element in elements:
+        if 'table' in element:
+            for row in element.get('table').get('tableRows', []):
+                for cell in row.get('tableCells', []):
+                    text += _read_paragraph_elements(cell.get('content',[]))
+
+    return text
+
+def _read_tableOfContents_elements(elements):
+    text = ''
+    for element in elements:
+        if 'tableOfContents' in element:
+            toc = element.get('tableOfContents')
+            text += _read_paragraph_elements(toc.get('content', []))
+
+    return text
+
 class GoogleDocsService:
     def __init__(self):
         credentials = service_account.Credentials.from_service_account_file(
@@ -23,48 +64,17 @@ class GoogleDocsService:
         self.drive_service = build('drive', 'v3', credentials=credentials)
 
     def get_document_content(self, document_id):
+        content, _ = self.get_document_content_with_revision(document_id)
+        return content
+
+    def get_document_content_with_revision(self, document_id):
+        """Returns (text content, revisionId) so callers can cache work derived from the text."""
         doc = self.docs_service.documents().get(documentId=document_id).execute()
         content = self._read_structural_elements(doc.get('body').get('content'))
-        return content
+        return content, doc.get('revisionId')
 
     def _read_structural_elements(self, elements):
-        text = ''
-        for element in elements:
-            if 'paragraph' in element:
-                text += self._read_paragraph_elements([element])
-            elif 'table' in element:
-                text += self._read_table_elements([element])
-            elif 'tableOfContents' in element:
-                text += self._read_tableOfContents_elements([element])
-        return text
-
-    def _read_paragraph_elements(self, elements):
-        text = ''
-        for element in elements:
-            if 'paragraph' in element:
-                for run in element.get('paragraph').get('elements'):
-                    if 'textRun' in run:
-                        text += run.get('textRun').get('content')
-        return text
-
-    def _read_table_elements(self, elements):
-        text = ''
-        for element in elements:
-            if 'table' in element:
-                for row in element.get('table').get('tableRows', []):
-                    for cell in row.get('tableCells', []):
-                        text += self._read_paragraph_elements(cell.get('content',[]))
-
-        return text
-    
-    def _read_tableOfContents_elements(self, elements):
-        text = ''
-        for element in elements:
-            if 'tableOfContents' in element:
-                toc = element.get('tableOfContent')
-                text += self._read_paragraph_elements(toc.get('content', []))
-
-        return text    
+        return read_structural_elements(elements)
 
     def create_document_without_content(self, title, folder_id):
         # Create the Google Doc
@@ -170,11 +180,21 @@ class GoogleDocsService:
         results = self.drive_service.files().list(q=query, 
                                     spaces='drive', 
                                     fields='files(id, name)').execute()
-        for file in results.get('files', []):
+        files = results.get('files', [])
+
+        def on_deleted(request_id, response, exception):
+            if exception is not None:
+                print(f"Error deleting file {files[int(request_id)]['name']}: {exception}")
+
+        # One batch request per 100 files instead of one request per file
+        for start in range(0, len(files), 100):
+            batch = self.drive_service.new_batch_http_request(callback=on_deleted)
+            for i, file in enumerate(files[start:start + 100], start):
+                batch.add(self.drive_service.files().delete(fileId=file['id'], supportsAllDrives=True), request_id=str(i))
             try:
-                self.drive_service.files().delete(fileId=file['id'], supportsAllDrives=True).execute()
+                batch.execute()
             except Exception as e:
-                print(f"Error deleting file {file['name']}: {e}")
+                print(f"Error deleting files from folder {folder_id}: {e}")
 
     def delete_file_by_id(self, file_id):
         """Deletes a specific file by its Google Drive ID."""
@@ -68,6 +68,22 @@ class GoogleSheetsService:
         print(f"{result.get('updatedCells')} cells updated.")
         return result
 
+    def batch_write_sheet(self, spreadsheet_id, data):
+        """Writes several ranges of a spreadsheet in a single API request.
+
+        Args:
+            spreadsheet_id (str): The ID of the spreadsheet.
+            data (dict): Maps A1 ranges (e.g., 'Sheet1!A1') to lists of lists of values.
+        """
+        body = {
+            'valueInputOption': 'USER_ENTERED',
+            'data': [{'range': range_name, 'values': values} for range_name, values in data.items()]
+        }
+        result = self.sheets_service.spreadsheets().values().batchUpdate(
+            spreadsheetId=spreadsheet_id, body=body).execute()
+        print(f"{result.get('totalUpdatedCells')} cells updated.")
+        return result
+
     def append_sheet(self, spreadsheet_id, range_name, values):
         """Appends data to a table within a sheet. Finds the first empty row.
 
@@ -0,0 +1,490 @@
+# podcast_outreach/integrations/google_workspace.py
+
+"""
+Async client for Google Docs, Drive and Sheets.
+
+GoogleDocsService and GoogleSheetsService call googleapiclient's blocking
+.execute() once per operation, and async callers had to push every call onto a
+thread. This client talks to the REST endpoints directly over the shared
+"google" aiohttp session (utils/http_sessions.py), with one set of
+service-account credentials per process whose token is refreshed off the loop
+only when it expires. It also cuts round trips:
+
+- create_document uploads the text to Drive with conversion, so create, insert
+  and move to the folder are a single request.
+- create_spreadsheet creates the file directly in its folder.
+- Drive operations on many files (sharing, deleting) go out through the Drive
+  batch endpoint, up to GOOGLE_BATCH_MAX_CALLS calls per request.
+- GoogleWriteBatch collects document and spreadsheet writes and sends one
+  documents.batchUpdate per document and one values.batchUpdate per
+  spreadsheet.
+
+GOOGLE_API_ROOT_URL points every API at another host, such as the replay stub
+in scripts/google_api_stub.py (recorded responses in scripts/google_api_fixtures);
+pass token_provider to skip the service account.
+"""
+
+import os
+import json
+import uuid
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import quote, urlencode
+
+from google.oauth2 import service_account
+from google.auth.transport.requests import Request as GoogleAuthRequest
+
+from podcast_outreach.integrations.google_docs import SCOPES, read_structural_elements
+from podcast_outreach.utils.exceptions import APIClientError, APIRequestError, NotFoundError, RateLimitError, ServerError
+from podcast_outreach.utils.http_sessions import get_http_session, get_sync_session
+from podcast_outreach.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+SERVICE_ACCOUNT_FILE = os.getenv('GOOGLE_APPLICATION_CREDENTIALS')
+GOOGLE_API_ROOT_URL = os.getenv('GOOGLE_API_ROOT_URL')
+# Drive accepts at most 100 calls per batch request
+GOOGLE_BATCH_MAX_CALLS = min(100, int(os.getenv('GOOGLE_BATCH_MAX_CALLS', '100')))
+GOOGLE_API_MAX_RETRIES = int(os.getenv('GOOGLE_API_MAX_RETRIES', '3'))
+
+GOOGLE_DOC_MIME_TYPE = 'application/vnd.google-apps.document'
+GOOGLE_SHEET_MIME_TYPE = 'application/vnd.google-apps.spreadsheet'
+
+_RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class GoogleApiError(APIClientError):
+    """A Google API call failed; status_code is the HTTP status of the call."""
+
+
+class _ServiceAccountToken:
+    """Service-account credentials shared by every client in the process."""
+
+    def __init__(self, scopes: List[str]):
+        self._scopes = scopes
+        self._credentials = None
+        self._lock = threading.Lock()
+
+    def _refresh(self) -> str:
+        with self._lock:
+            if self._credentials is None:
+                if not SERVICE_ACCOUNT_FILE:
+                    raise ValueError("GOOGLE_APPLICATION_CREDENTIALS is required for Google API access.")
+                self._credentials = service_account.Credentials.from_service_account_file(
+                    SERVICE_ACCOUNT_FILE, scopes=self._scopes)
+            if not self._credentials.valid:
+                self._credentials.refresh(GoogleAuthRequest(session=get_sync_session("google")))
+            return self._credentials.token
+
+    async def __call__(self) -> str:
+        credentials = self._credentials
+        if credentials is not None and credentials.valid:
+            return credentials.token
+        return await asyncio.to_thread(self._refresh)
+
+
+_service_account_token = _ServiceAccountToken(SCOPES)
+
+
+class BatchCall:
+    """One call inside a Drive batch request."""
+
+    def __init__(self, method: str, path: str, params: Optional[Dict[str, Any]] = None, body: Optional[Dict[str, Any]] = None):
+        self.method = method
+        self.path = path
+        self.params = params
+        self.body = body
+
+    def encode(self) -> str:
+        target = self.path + (f"?{urlencode(self.params)}" if self.params else "")
+        lines = [f"{self.method} {target} HTTP/1.1"]
+        if self.body is not None:
+            lines += ["Content-Type: application/json; charset=UTF-8", "", json.dumps(self.body)]
+        else:
+            lines.append("")
+        return "\r\n".join(lines)
+
+
+def _encode_batch(calls: List[BatchCall], boundary: str) -> bytes:
+    parts = []
+    for i, call in enumerate(calls):
+        parts.append(
+            f"--{boundary}\r\n"
+            "Content-Type: application/http\r\n"
+            f"Content-ID: <item{i}>\r\n\r\n"
+            f"{call.encode()}\r\n"
+        )
+    parts.append(f"--{boundary}--\r\n")
+    return "".join(parts).encode("utf-8")
+
+
+def _split_head(text: str) -> Tuple[str, str]:
+    for separator in ("\r\n\r\n", "\n\n"):
+        if separator in text:
+            head, rest = text.split(separator, 1)
+            return head, rest
+    return text, ""
+
+
+def _decode_batch(content_type: str, payload: str, count: int) -> List[Tuple[int, Any]]:
+    """Parses a multipart/mixed batch response into (status, body) per call, in call order."""
+    boundary = None
+    for param in content_type.split(";")[1:]:
+        key, _, value = param.strip().partition("=")
+        if key.lower() == "boundary":
+            boundary = value.strip('"')
+    if not boundary:
+        raise GoogleApiError(f"Batch response has no boundary ({content_type})")
+
+    results: List[Tuple[int, Any]] = [(0, None)] * count
+    for part in payload.split(f"--{boundary}")[1:]:
+        if part.startswith("--"):
+            break
+        part_head, response = _split_head(part.strip("\r\n"))
+        content_id = ""
+        for line in part_head.splitlines():
+            name, _, value = line.partition(":")
+            if name.strip().lower() == "content-id":
+                content_id = value.strip().strip("<>")
+        index = content_id.rsplit("item", 1)[-1]
+        if not index.isdigit() or int(index) >= count:
+            continue
+        status_line, _, _ = response.partition("\n")
+        response_head, body = _split_head(response)
+        try:
+            status = int(status_line.split()[1])
+        except (IndexError, ValueError):
+            status = 0
+        body = body.strip()
+        try:
+            parsed = json.loads(body) if body else None
+        except ValueError:
+            parsed = body
+        results[int(index)] = (status, parsed)
+    return results
+
+
+def _error_message(body: Any) -> str:
+    if isinstance(body, dict) and isinstance(body.get("error"), dict):
+        return body["error"].get("message", "")
+    return str(body)[:500] if body else ""
+
+
+def _raise_for_status(status: int, body: Any, what: str) -> None:
+    if status < 400:
+        return
+    message = f"{what} failed ({status}): {_error_message(body)}"
+    if status == 404:
+        raise NotFoundError(message, status_code=status)
+    if status == 429:
+        raise RateLimitError(message, status_code=status)
+    if status >= 500:
+        raise ServerError(message, status_code=status)
+    raise APIRequestError(message, status_code=status)
+
+
+class GoogleWorkspaceClient:
+    """
+    Async Google Docs/Drive/Sheets client. Cheap to construct: the HTTP session
+    and credentials are shared, so call sites may create one per use.
+    """
+
+    def __init__(
+        self,
+        token_provider: Optional[Callable[[], Awaitable[str]]] = None,
+        root_url: Optional[str] = GOOGLE_API_ROOT_URL,
+    ):
+        self._token = token_provider or _service_account_token
+        root = root_url.rstrip('/') if root_url else None
+        self.drive_url = root or 'https://www.googleapis.com'
+        self.docs_url = root or 'https://docs.googleapis.com'
+        self.sheets_url = root or 'https://sheets.googleapis.com'
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        json_body: Optional[Dict[str, Any]] = None,
+        data: Optional[bytes] = None,
+        content_type: Optional[str] = None,
+    ) -> Tuple[int, Dict[str, str], str]:
+        """Sends one request, retrying rate limits and server errors with backoff."""
+        session = get_http_session("google")
+        backoff = 1.0
+        for attempt in range(GOOGLE_API_MAX_RETRIES + 1):
+            headers = {"Authorization": f"Bearer {await self._token()}"}
+            if content_type:
+                headers["Content-Type"] = content_type
+            async with session.request(method, url, params=params, json=json_body, data=data, headers=headers) as response:
+                text = await response.text()
+                if response.status not in _RETRY_STATUSES or attempt == GOOGLE_API_MAX_RETRIES:
+                    return response.status, dict(response.headers), text
+                retry_after = response.headers.get("Retry-After")
+            delay = float(retry_after) if retry_after and retry_after.isdigit() else backoff
+            logger.warning(f"Google API {method} {url} returned {response.status}; retrying in {delay}s")
+            await asyncio.sleep(delay)
+            backoff *= 2
+        raise GoogleApiError(f"Google API {method} {url} failed")  # unreachable; the loop always returns
+
+    async def _request(self, method: str, url: str, **kwargs) -> Any:
+        status, _, text = await self._send(method, url, **kwargs)
+        try:
+            body = json.loads(text) if text else {}
+        except ValueError:
+            body = text
+        _raise_for_status(status, body, f"{method} {url}")
+        return body
+
+    # --- Drive batch endpoint ---
+
+    async def execute_drive_batch(self, calls: List[BatchCall]) -> List[Tuple[int, Any]]:
+        """
+        Runs Drive calls through the batch endpoint and returns (status, body)
+        per call, in order. Calls that were rate limited or hit a server error
+        are retried in a later batch; other failures are returned, not raised.
+        """
+        results: List[Tuple[int, Any]] = [(0, None)] * len(calls)
+        for start in range(0, len(calls), GOOGLE_BATCH_MAX_CALLS):
+            chunk = list(range(start, min(start + GOOGLE_BATCH_MAX_CALLS, len(calls))))
+            backoff = 1.0
+            for attempt in range(GOOGLE_API_MAX_RETRIES + 1):
+                boundary = f"batch_{uuid.uuid4().hex}"
+                status, headers, text = await self._send(
+                    "POST", f"{self.drive_url}/batch/drive/v3",
+                    data=_encode_batch([calls[i] for i in chunk], boundary),
+                    content_type=f"multipart/mixed; boundary={boundary}",
+                )
+                _raise_for_status(status, text, "Drive batch request")
+                content_type = next((v for k, v in headers.items() if k.lower() == "content-type"), "")
+                retry = []
+                for index, result in zip(chunk, _decode_batch(content_type, text, len(chunk))):
+                    results[index] = result
+                    if result[0] in _RETRY_STATUSES or result[0] == 0:
+                        retry.append(index)
+                if not retry or attempt == GOOGLE_API_MAX_RETRIES:
+                    break
+                logger.warning(f"Retrying {len(retry)} of {len(chunk)} Drive batch calls in {backoff}s")
+                await asyncio.sleep(backoff)
+                backoff *= 2
+                chunk = retry
+        return results
+
+    # --- Drive ---
+
+    async def list_files(self, query: str, fields: str = "id, name") -> List[Dict[str, Any]]:
+        files: List[Dict[str, Any]] = []
+        params = {
+            "q": query,
+            "spaces": "drive",
+            "fields": f"nextPageToken, files({fields})",
+            "pageSize": 1000,
+            "supportsAllDrives": "true",
+            "includeItemsFromAllDrives": "true",
+        }
+        while True:
+            page = await self._request("GET", f"{self.drive_url}/drive/v3/files", params=params)
+            files.extend(page.get("files", []))
+            if not page.get("nextPageToken"):
+                return files
+            params["pageToken"] = page["nextPageToken"]
+
+    async def list_files_in_folder(self, folder_id: str, mime_type: Optional[str] = None, fields: str = "id, name") -> List[Dict[str, Any]]:
+        query = f"'{folder_id}' in parents and trashed = false"
+        if mime_type:
+            query += f" and mimeType = '{mime_type}'"
+        return await self.list_files(query, fields)
+
+    async def create_file(self, name: str, mime_type: str, folder_id: Optional[str] = None) -> str:
+        """Creates an empty Drive file (a blank Doc or Sheet for Google mime types) and returns its ID."""
+        metadata: Dict[str, Any] = {"name": name, "mimeType": mime_type}
+        if folder_id:
+            metadata["parents"] = [folder_id]
+        created = await self._request(
+            "POST", f"{self.drive_url}/drive/v3/files",
+            params={"fields": "id", "supportsAllDrives": "true"}, json_body=metadata,
+        )
+        return created["id"]
+
+    async def share_files(self, file_ids: Iterable[str], role: str = "writer") -> Dict[str, bool]:
+        """Gives anyone with the link `role` on each file, in batch requests. Returns success per file."""
+        file_ids = list(file_ids)
+        permission = {"type": "anyone", "role": role, "allowFileDiscovery": False}
+        results = await self.execute_drive_batch([
+            BatchCall("POST", f"/drive/v3/files/{quote(file_id)}/permissions",
+                      {"fields": "id", "supportsAllDrives": "true"}, permission)
+            for file_id in file_ids
+        ])
+        return self._batch_outcome("share", file_ids, results)
+
+    async def delete_files(self, file_ids: Iterable[str]) -> Dict[str, bool]:
+        """Deletes files in batch requests. Returns success per file."""
+        file_ids = list(file_ids)
+        results = await self.execute_drive_batch([
+            BatchCall("DELETE", f"/drive/v3/files/{quote(file_id)}", {"supportsAllDrives": "true"})
+            for file_id in file_ids
+        ])
+        return self._batch_outcome("delete", file_ids, results)
+
+    async def delete_files_in_folder(self, folder_id: str) -> Dict[str, bool]:
+        files = await self.list_files_in_folder(folder_id)
+        return await self.delete_files(f["id"] for f in files)
+
+    @staticmethod
+    def _batch_outcome(action: str, file_ids: List[str], results: List[Tuple[int, Any]]) -> Dict[str, bool]:
+        outcome = {}
+        for file_id, (status, body) in zip(file_ids, results):
+            outcome[file_id] = 200 <= status < 300
+            if not outcome[file_id]:
+                logger.error(f"Google Drive {action} failed for {file_id} ({status}): {_error_message(body)}")
+        return outcome
+
+    # --- Docs ---
+
+    async def get_document(self, document_id: str) -> Dict[str, Any]:
+        return await self._request("GET", f"{self.docs_url}/v1/documents/{quote(document_id)}")
+
+    async def get_document_content_with_revision(self, document_id: str) -> Tuple[str, Optional[str]]:
+        """Returns (text content, revisionId), like GoogleDocsService.get_document_content_with_revision."""
+        doc = await self.get_document(document_id)
+        return read_structural_elements(doc.get("body", {}).get("content", [])), doc.get("revisionId")
+
+    async def get_document_content(self, document_id: str) -> str:
+        content, _ = await self.get_document_content_with_revision(document_id)
+        return content
+
+    async def create_document(self, title: str, content: str, folder_id: Optional[str] = None) -> str:
+        """
+        Creates a Google Doc holding `content` in one request (a Drive upload
+        converted to a Doc, placed in `folder_id`) and returns its edit link.
+        """
+        metadata: Dict[str, Any] = {"name": title, "mimeType": GOOGLE_DOC_MIME_TYPE}
+        if folder_id:
+            metadata["parents"] = [folder_id]
+        boundary = f"upload_{uuid.uuid4().hex}"
+        body = (
+            f"--{boundary}\r\n"
+            "Content-Type: application/json; charset=UTF-8\r\n\r\n"
+            f"{json.dumps(metadata)}\r\n"
+            f"--{boundary}\r\n"
+            "Content-Type: text/plain; charset=UTF-8\r\n\r\n"
+            f"{content}\r\n"
+            f"--{boundary}--\r\n"
+        ).encode("utf-8")
+        created = await self._request(
+            "POST", f"{self.drive_url}/upload/drive/v3/files",
+            params={"uploadType": "multipart", "fields": "id", "supportsAllDrives": "true"},
+            data=body, content_type=f"multipart/related; boundary={boundary}",
+        )
+        return f"https://docs.google.com/document/d/{created['id']}/edit"
+
+    async def batch_update_document(self, document_id: str, requests: List[Dict[str, Any]]) -> Dict[str, Any]:
+        return await self._request(
+            "POST", f"{self.docs_url}/v1/documents/{quote(document_id)}:batchUpdate",
+            json_body={"requests": requests},
+        )
+
+    # --- Sheets ---
+
+    async def create_spreadsheet(self, title: str, folder_id: Optional[str] = None) -> str:
+        """Creates a blank spreadsheet, directly inside `folder_id` when given, and returns its ID."""
+        return await self.create_file(title, GOOGLE_SHEET_MIME_TYPE, folder_id)
+
+    async def read_values(self, spreadsheet_id: str, range_name: str) -> List[List[Any]]:
+        result = await self._request(
+            "GET", f"{self.sheets_url}/v4/spreadsheets/{quote(spreadsheet_id)}/values/{quote(range_name)}")
+        return result.get("values", [])
+
+    async def batch_update_values(self, spreadsheet_id: str, data: Dict[str, List[List[Any]]]) -> Dict[str, Any]:
+        """Writes several A1 ranges in one values.batchUpdate (USER_ENTERED, like GoogleSheetsService)."""
+        return await self._request(
+            "POST", f"{self.sheets_url}/v4/spreadsheets/{quote(spreadsheet_id)}/values:batchUpdate",
+            json_body={
+                "valueInputOption": "USER_ENTERED",
+                "data": [{"range": range_name, "values": values} for range_name, values in data.items()],
+            },
+        )
+
+    def batch(self) -> "GoogleWriteBatch":
+        return GoogleWriteBatch(self)
+
+
+class GoogleWriteBatch:
+    """
+    Collects writes and sends them together on flush():
+
+        async with client.batch() as batch:
+            batch.update_values(sheet_id, "Sheet1!A1", rows)
+            batch.update_values(sheet_id, "Sheet1!A10", footer)
+            batch.share(doc_id)
+
+    Document requests are kept in the order they were added, so the result is
+    the same as sending them one at a time. A range written twice keeps the
+    last values.
+    """
+
+    def __init__(self, client: GoogleWorkspaceClient):
+        self.client = client
+        self._document_requests: Dict[str, List[Dict[str, Any]]] = {}
+        self._sheet_values: Dict[str, Dict[str, List[List[Any]]]] = {}
+        self._shares: List[str] = []
+        self._deletes: List[str] = []
+
+    def update_document(self, document_id: str, requests: List[Dict[str, Any]]) -> None:
+        self._document_requests.setdefault(document_id, []).extend(requests)
+
+    def insert_text(self, document_id: str, text: str, index: int = 1) -> None:
+        self.update_document(document_id, [{"insertText": {"location": {"index": index}, "text": text}}])
+
+    def update_values(self, spreadsheet_id: str, range_name: str, values: List[List[Any]]) -> None:
+        self._sheet_values.setdefault(spreadsheet_id, {})[range_name] = values
+
+    def share(self, file_id: str) -> None:
+        if file_id not in self._shares:
+            self._shares.append(file_id)
+
+    def delete(self, file_id: str) -> None:
+        if file_id not in self._deletes:
+            self._deletes.append(file_id)
+
+    async def flush(self) -> Dict[str, Any]:
+        """
+        Sends everything collected so far, one request per document and per
+        spreadsheet plus the Drive batches, all concurrently. Returns the result
+        (or exception) keyed by document/spreadsheet ID, with "shared" and
+        "deleted" holding the per-file outcome of the Drive calls.
+        """
+        document_requests, self._document_requests = self._document_requests, {}
+        sheet_values, self._sheet_values = self._sheet_values, {}
+        shares, self._shares = self._shares, []
+        deletes, self._deletes = self._deletes, []
+
+        keys: List[str] = []
+        calls = []
+        for document_id, requests in document_requests.items():
+            keys.append(document_id)
+            calls.append(self.client.batch_update_document(document_id, requests))
+        for spreadsheet_id, data in sheet_values.items():
+            keys.append(spreadsheet_id)
+            calls.append(self.client.batch_update_values(spreadsheet_id, data))
+        if shares:
+            keys.append("shared")
+            calls.append(self.client.share_files(shares))
+        if deletes:
+            keys.append("deleted")
+            calls.append(self.client.delete_files(deletes))
+
+        results = dict(zip(keys, await asyncio.gather(*calls, return_exceptions=True)))
+        for key, result in results.items():
+            if isinstance(result, Exception):
+                logger.error(f"Google batched write for {key} failed: {result}")
+        return results
+
+    async def __aenter__(self) -> "GoogleWriteBatch":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            await self.flush()
@@ -11,6 +11,7 @@ from nylas.models.messages import Message
 from nylas.models.drafts import Draft
 
 from podcast_outreach.utils.exceptions import APIClientError
+from podcast_outreach.utils.http_sessions import get_sync_session, get_upstream_timeout
 
 logger = logging.getLogger(__name__)
 
@@ -85,7 +86,6 @@ class NylasAPIClient:
         Returns:
             Dict with message details or raises exception on error
         """
-        import httpx
         from podcast_outreach.config import NYLAS_API_KEY, NYLAS_API_URI
         
         if not self.grant_id:
@@ -143,18 +143,18 @@ class NylasAPIClient:
         
         logger.info(f"Sending email via Nylas v3 to {to_emails}")
         
-        with httpx.Client(timeout=20) as client:
-            response = client.post(url, json=payload, headers=headers)
-            
-            if response.status_code != 200:
-                logger.error(f"Failed to send email: {response.status_code} - {response.text}")
-                response.raise_for_status()
-                
-            result = response.json()
-            payload = self._normalize_send_result(result)
-            logger.info(f"Email sent successfully. nylas_message_id={payload['id']} thread_id={payload['thread_id']}")
+        session = get_sync_session("nylas")
+        response = session.post(url, json=payload, headers=headers, timeout=get_upstream_timeout("nylas"))
+        
+        if response.status_code != 200:
+            logger.error(f"Failed to send email: {response.status_code} - {response.text}")
+            response.raise_for_status()
             
-            return payload  # Return normalized shape
+        result = response.json()
+        payload = self._normalize_send_result(result)
+        logger.info(f"Email sent successfully. nylas_message_id={payload['id']} thread_id={payload['thread_id']}")
+        
+        return payload  # Return normalized shape
     
     def send_email(self, 
                    to_email: str,
@@ -24,13 +24,19 @@ from podcast_outreach.api.dependencies import (
     authenticate_user_details, 
     prepare_session_data, 
     get_current_user,
-    get_admin_user
+    get_admin_user,
+    shutdown_password_executor
 )
-from podcast_outreach.api.middleware import AuthMiddleware 
+from podcast_outreach.api.middleware import AuthMiddleware, ReadYourWritesMiddleware
 from podcast_outreach.database.connection import init_db_pool, close_db_pool  
+from podcast_outreach.database.entity_cache import start_invalidation_listener as start_entity_cache_listener, stop_invalidation_listener as stop_entity_cache_listener
+from podcast_outreach.utils.http_sessions import init_http_sessions, close_http_sessions
+from podcast_outreach.services.email.outbox_worker import start_email_outbox_worker, stop_email_outbox_worker
+from podcast_outreach.services.lead_magnet_service import start_lead_magnet_worker, stop_lead_magnet_worker
 from podcast_outreach.services.tasks.manager import task_manager # New path for task_manager
 from podcast_outreach.services.scheduler.task_scheduler import initialize_scheduler
 from podcast_outreach.services.events.event_bus import initialize_event_handlers
+from podcast_outreach.services.dashboard_stats_cache import register_dashboard_cache_invalidation
 
 # Import the AI usage tracker from its new location
 from podcast_outreach.services.ai.tracker import tracker as ai_tracker
@@ -81,12 +87,25 @@ async def lifespan(app: FastAPI):
     await init_db_pool()
     logger.info("Database connection pool initialized.")
     
+    # Cross-process invalidation for the campaign/media entity cache (no-op unless ENTITY_CACHE_NOTIFY=true)
+    await start_entity_cache_listener()
+    
+    # Pooled outbound HTTP sessions shared by integrations and in-process background tasks
+    await init_http_sessions("default", "booking_assistant", "rss", "audio")
+    
+    # Delivers queued transactional emails over a reused SMTP session
+    await start_email_outbox_worker()
+    
+    # Generates media kits for queued public lead magnet submissions
+    await start_lead_magnet_worker()
+    
     # Initialize TaskManager database resources
     await task_manager.initialize()
     logger.info("TaskManager initialized.")
     
     # Initialize event-driven workflow orchestration
     initialize_event_handlers()
+    register_dashboard_cache_invalidation()
     logger.info("Event handlers initialized.")
     
     # Initialize notification service for real-time updates
@@ -159,6 +178,11 @@ async def lifespan(app: FastAPI):
             await task_manager.cleanup()
         
         # Close any open database connections or services
+        await stop_entity_cache_listener()
+        await stop_email_outbox_worker()
+        await stop_lead_magnet_worker()
+        shutdown_password_executor()
+        await close_http_sessions()
         await close_db_pool()  # Close DB pool
         logger.info("Database connection pool closed.")
         
@@ -190,6 +214,9 @@ if IS_PRODUCTION:
     app.add_middleware(ProxyHeadersMiddleware, trusted_hosts="*")
     logger.info("ProxyHeadersMiddleware added for production environment (Render)")
 
+# Runs inside SessionMiddleware (added before it) so it can read the session's person_id
+app.add_middleware(ReadYourWritesMiddleware)
+
 app.add_middleware(
     SessionMiddleware,
     secret_key=SESSION_SECRET_KEY,
@@ -0,0 +1,32 @@
+#!/usr/bin/env python
+"""
+Migration to add a persistent cache of generated vetting checklists.
+Checklists depend only on the campaign's client profile, so they are keyed by a
+hash of the normalized profile and reused across every podcast vetted for it.
+"""
+import asyncpg
+
+async def migrate_up(conn: asyncpg.Connection):
+    """Apply the migration."""
+    print("[005] Adding vetting_checklists table...")
+    
+    await conn.execute("""
+    CREATE TABLE IF NOT EXISTS vetting_checklists (
+        profile_hash    VARCHAR(64) PRIMARY KEY,
+        campaign_id     UUID REFERENCES campaigns(campaign_id) ON DELETE CASCADE,
+        checklist       JSONB NOT NULL,
+        created_at      TIMESTAMPTZ DEFAULT NOW(),
+        last_used_at    TIMESTAMPTZ DEFAULT NOW()
+    );
+    
+    CREATE INDEX IF NOT EXISTS idx_vetting_checklists_campaign
+        ON vetting_checklists(campaign_id);
+    """)
+    
+    print("[005] Vetting checklist cache migration completed successfully!")
+
+async def migrate_down(conn: asyncpg.Connection):
+    """Rollback the migration."""
+    print("[005] Rolling back vetting checklist cache...")
+    await conn.execute("DROP TABLE IF EXISTS vetting_checklists;")
+    print("[005] Vetting checklist cache rolled back successfully!")
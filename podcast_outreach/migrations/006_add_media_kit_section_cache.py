@@ -0,0 +1,31 @@
+#!/usr/bin/env python
+"""
+Migration to add a cache of generated media kit sections.
+Each section is stored with a hash of the inputs it was generated from, so a
+re-save with unchanged questionnaire content reuses the previous output
+instead of calling the LLM again.
+"""
+import asyncpg
+
+async def migrate_up(conn: asyncpg.Connection):
+    """Apply the migration."""
+    print("[006] Adding media_kit_section_cache table...")
+    
+    await conn.execute("""
+    CREATE TABLE IF NOT EXISTS media_kit_section_cache (
+        campaign_id     UUID NOT NULL REFERENCES campaigns(campaign_id) ON DELETE CASCADE,
+        section         VARCHAR(64) NOT NULL,
+        input_hash      VARCHAR(64) NOT NULL,
+        output          JSONB NOT NULL,
+        updated_at      TIMESTAMPTZ DEFAULT NOW(),
+        PRIMARY KEY (campaign_id, section)
+    );
+    """)
+    
+    print("[006] Media kit section cache migration completed successfully!")
+
+async def migrate_down(conn: asyncpg.Connection):
+    """Rollback the migration."""
+    print("[006] Rolling back media kit section cache...")
+    await conn.execute("DROP TABLE IF EXISTS media_kit_section_cache;")
+    print("[006] Media kit section cache rolled back successfully!")
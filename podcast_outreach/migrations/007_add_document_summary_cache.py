@@ -0,0 +1,29 @@
+#!/usr/bin/env python
+"""
+Migration to add a cache of LLM summaries of long client documents.
+Summaries are keyed by the source document ID and revision (or a content hash
+for inline text), so unchanged documents are not re-summarized every time a
+campaign's bio and angles are regenerated.
+"""
+import asyncpg
+
+async def migrate_up(conn: asyncpg.Connection):
+    """Apply the migration."""
+    print("[007] Adding document_summaries table...")
+    
+    await conn.execute("""
+    CREATE TABLE IF NOT EXISTS document_summaries (
+        cache_key       VARCHAR(255) PRIMARY KEY,
+        summary         TEXT NOT NULL,
+        created_at      TIMESTAMPTZ DEFAULT NOW(),
+        last_used_at    TIMESTAMPTZ DEFAULT NOW()
+    );
+    """)
+    
+    print("[007] Document summary cache migration completed successfully!")
+
+async def migrate_down(conn: asyncpg.Connection):
+    """Rollback the migration."""
+    print("[007] Rolling back document summary cache...")
+    await conn.execute("DROP TABLE IF EXISTS document_summaries;")
+    print("[007] Document summary cache rolled back successfully!")
@@ -0,0 +1,34 @@
+#!/usr/bin/env python
+"""
+Migration to track when a media's episode summaries were last compiled.
+Quality scoring no longer re-aggregates every episode summary; compilation runs
+as its own step and only for media whose episodes changed since this timestamp.
+"""
+import asyncpg
+
+async def migrate_up(conn: asyncpg.Connection):
+    """Apply the migration."""
+    print("[008] Adding media.episode_summaries_compiled_at...")
+
+    await conn.execute("""
+    ALTER TABLE media ADD COLUMN IF NOT EXISTS episode_summaries_compiled_at TIMESTAMPTZ;
+    """)
+
+    # Media already compiled count as compiled at their last update
+    await conn.execute("""
+    UPDATE media SET episode_summaries_compiled_at = updated_at
+    WHERE episode_summaries_compiled IS NOT NULL AND episode_summaries_compiled_at IS NULL;
+    """)
+
+    await conn.execute("""
+    CREATE INDEX IF NOT EXISTS idx_episodes_media_id_updated_at ON episodes (media_id, updated_at);
+    """)
+
+    print("[008] Episode summary compilation tracking migration completed successfully!")
+
+async def migrate_down(conn: asyncpg.Connection):
+    """Rollback the migration."""
+    print("[008] Rolling back episode summary compilation tracking...")
+    await conn.execute("DROP INDEX IF EXISTS idx_episodes_media_id_updated_at;")
+    await conn.execute("ALTER TABLE media DROP COLUMN IF EXISTS episode_summaries_compiled_at;")
+    print("[008] Episode summary compilation tracking rolled back successfully!")
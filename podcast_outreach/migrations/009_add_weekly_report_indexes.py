@@ -0,0 +1,27 @@
+#!/usr/bin/env python
+"""
+Migration to index the timestamps the weekly campaign status report buckets by.
+The report aggregates only the pitches and placements inside its week window, so
+range indexes keep it proportional to the window instead of the full history.
+"""
+import asyncpg
+
+async def migrate_up(conn: asyncpg.Connection):
+    """Apply the migration."""
+    print("[009] Adding weekly report indexes...")
+
+    await conn.execute("""
+    CREATE INDEX IF NOT EXISTS idx_pitches_send_ts ON pitches (send_ts) WHERE send_ts IS NOT NULL;
+    """)
+    await conn.execute("""
+    CREATE INDEX IF NOT EXISTS idx_placements_status_ts ON placements (status_ts);
+    """)
+
+    print("[009] Weekly report indexes migration completed successfully!")
+
+async def migrate_down(conn: asyncpg.Connection):
+    """Rollback the migration."""
+    print("[009] Rolling back weekly report indexes...")
+    await conn.execute("DROP INDEX IF EXISTS idx_pitches_send_ts;")
+    await conn.execute("DROP INDEX IF EXISTS idx_placements_status_ts;")
+    print("[009] Weekly report indexes rolled back successfully!")
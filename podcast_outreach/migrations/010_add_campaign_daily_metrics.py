@@ -0,0 +1,163 @@
+#!/usr/bin/env python
+"""
+Migration to add a daily per-campaign metrics rollup.
+
+campaign_daily_metrics holds one row per campaign and UTC day with pitch state
+counts (by creation day), send-day engagement, bounces, provider and reply
+classification breakdowns. Triggers on pitches, message_events and
+email_classifications record the (campaign, day) keys they touch in
+campaign_metrics_dirty; those days are recomputed incrementally before the
+metrics endpoints read the rollup.
+"""
+import asyncpg
+
+async def migrate_up(conn: asyncpg.Connection):
+    """Apply the migration."""
+    print("[010] Adding campaign daily metrics rollup...")
+
+    await conn.execute("""
+    CREATE TABLE IF NOT EXISTS campaign_daily_metrics (
+        campaign_id             UUID NOT NULL REFERENCES campaigns(campaign_id) ON DELETE CASCADE,
+        day                     DATE NOT NULL,
+        -- Pitches created on this day, by current state
+        total_pitches           INTEGER NOT NULL DEFAULT 0,
+        sent                    INTEGER NOT NULL DEFAULT 0,
+        opened                  INTEGER NOT NULL DEFAULT 0,
+        clicked                 INTEGER NOT NULL DEFAULT 0,
+        replied                 INTEGER NOT NULL DEFAULT 0,
+        bounced                 INTEGER NOT NULL DEFAULT 0,
+        placements_created      INTEGER NOT NULL DEFAULT 0,
+        open_count_sum          BIGINT NOT NULL DEFAULT 0,
+        open_count_n            INTEGER NOT NULL DEFAULT 0,
+        click_count_sum         BIGINT NOT NULL DEFAULT 0,
+        click_count_n           INTEGER NOT NULL DEFAULT 0,
+        hard_bounces            INTEGER NOT NULL DEFAULT 0,
+        soft_bounces            INTEGER NOT NULL DEFAULT 0,
+        -- Pitches sent on this day, by engagement reached
+        day_sent                INTEGER NOT NULL DEFAULT 0,
+        day_opened              INTEGER NOT NULL DEFAULT 0,
+        day_clicked             INTEGER NOT NULL DEFAULT 0,
+        day_replied             INTEGER NOT NULL DEFAULT 0,
+        -- Breakdowns: [{type, reason, count}], {provider: {...}}, {classification: {...}}
+        bounce_breakdown        JSONB NOT NULL DEFAULT '[]'::jsonb,
+        provider_breakdown      JSONB NOT NULL DEFAULT '{}'::jsonb,
+        classification_breakdown JSONB NOT NULL DEFAULT '{}'::jsonb,
+        refreshed_at            TIMESTAMPTZ DEFAULT NOW(),
+        PRIMARY KEY (campaign_id, day)
+    );
+
+    CREATE TABLE IF NOT EXISTS campaign_metrics_dirty (
+        campaign_id UUID NOT NULL,
+        day         DATE NOT NULL,
+        PRIMARY KEY (campaign_id, day)
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_pitches_campaign_created_at ON pitches (campaign_id, created_at);
+    CREATE INDEX IF NOT EXISTS idx_pitches_campaign_send_ts ON pitches (campaign_id, send_ts) WHERE send_ts IS NOT NULL;
+    CREATE INDEX IF NOT EXISTS idx_email_classifications_processed_at ON email_classifications (processed_at);
+    """)
+
+    print("[010] Creating dirty-day triggers...")
+    await conn.execute("""
+    CREATE OR REPLACE FUNCTION mark_campaign_days_dirty(p_campaign_id UUID, p_days DATE[])
+    RETURNS VOID AS $$
+    BEGIN
+        IF p_campaign_id IS NULL THEN
+            RETURN;
+        END IF;
+        INSERT INTO campaign_metrics_dirty (campaign_id, day)
+        SELECT DISTINCT p_campaign_id, d FROM unnest(p_days) AS d WHERE d IS NOT NULL
+        ON CONFLICT DO NOTHING;
+    END;
+    $$ LANGUAGE plpgsql;
+
+    CREATE OR REPLACE FUNCTION pitches_mark_metrics_dirty()
+    RETURNS TRIGGER AS $$
+    BEGIN
+        IF TG_OP IN ('UPDATE', 'DELETE') THEN
+            PERFORM mark_campaign_days_dirty(OLD.campaign_id, ARRAY[
+                (OLD.created_at AT TIME ZONE 'UTC')::date, (OLD.send_ts AT TIME ZONE 'UTC')::date]);
+        END IF;
+        IF TG_OP IN ('INSERT', 'UPDATE') THEN
+            PERFORM mark_campaign_days_dirty(NEW.campaign_id, ARRAY[
+                (NEW.created_at AT TIME ZONE 'UTC')::date, (NEW.send_ts AT TIME ZONE 'UTC')::date]);
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+
+    DROP TRIGGER IF EXISTS trigger_pitches_metrics_dirty ON pitches;
+    CREATE TRIGGER trigger_pitches_metrics_dirty
+    AFTER INSERT OR DELETE OR UPDATE OF
+        campaign_id, created_at, send_ts, pitch_state, opened_ts, clicked_ts, reply_ts,
+        open_count, click_count, bounce_type, bounce_reason, placement_id, email_provider, nylas_thread_id
+    ON pitches
+    FOR EACH ROW EXECUTE FUNCTION pitches_mark_metrics_dirty();
+
+    CREATE OR REPLACE FUNCTION message_events_mark_metrics_dirty()
+    RETURNS TRIGGER AS $$
+    BEGIN
+        PERFORM mark_campaign_days_dirty(p.campaign_id, ARRAY[
+            (p.created_at AT TIME ZONE 'UTC')::date, (p.send_ts AT TIME ZONE 'UTC')::date])
+        FROM pitches p WHERE p.pitch_id = NEW.pitch_id;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+
+    DROP TRIGGER IF EXISTS trigger_message_events_metrics_dirty ON message_events;
+    CREATE TRIGGER trigger_message_events_metrics_dirty
+    AFTER INSERT ON message_events
+    FOR EACH ROW EXECUTE FUNCTION message_events_mark_metrics_dirty();
+
+    CREATE OR REPLACE FUNCTION email_classifications_mark_metrics_dirty()
+    RETURNS TRIGGER AS $$
+    BEGIN
+        IF NEW.thread_id IS NOT NULL THEN
+            PERFORM mark_campaign_days_dirty(p.campaign_id, ARRAY[(NEW.processed_at AT TIME ZONE 'UTC')::date])
+            FROM pitches p WHERE p.nylas_thread_id = NEW.thread_id;
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+
+    DROP TRIGGER IF EXISTS trigger_email_classifications_metrics_dirty ON email_classifications;
+    CREATE TRIGGER trigger_email_classifications_metrics_dirty
+    AFTER INSERT OR UPDATE OF classification, confidence_score, processed_at, thread_id ON email_classifications
+    FOR EACH ROW EXECUTE FUNCTION email_classifications_mark_metrics_dirty();
+    """)
+
+    print("[010] Marking existing campaign days for backfill...")
+    await conn.execute("""
+    INSERT INTO campaign_metrics_dirty (campaign_id, day)
+    SELECT campaign_id, (created_at AT TIME ZONE 'UTC')::date FROM pitches
+    WHERE campaign_id IS NOT NULL AND created_at IS NOT NULL
+    UNION
+    SELECT campaign_id, (send_ts AT TIME ZONE 'UTC')::date FROM pitches
+    WHERE campaign_id IS NOT NULL AND send_ts IS NOT NULL
+    UNION
+    SELECT p.campaign_id, (ec.processed_at AT TIME ZONE 'UTC')::date
+    FROM email_classifications ec JOIN pitches p ON p.nylas_thread_id = ec.thread_id
+    WHERE p.campaign_id IS NOT NULL AND ec.processed_at IS NOT NULL
+    ON CONFLICT DO NOTHING;
+    """)
+
+    print("[010] Campaign daily metrics migration completed successfully!")
+
+async def migrate_down(conn: asyncpg.Connection):
+    """Rollback the migration."""
+    print("[010] Rolling back campaign daily metrics rollup...")
+    await conn.execute("""
+    DROP TRIGGER IF EXISTS trigger_pitches_metrics_dirty ON pitches;
+    DROP TRIGGER IF EXISTS trigger_message_events_metrics_dirty ON message_events;
+    DROP TRIGGER IF EXISTS trigger_email_classifications_metrics_dirty ON email_classifications;
+    DROP FUNCTION IF EXISTS pitches_mark_metrics_dirty();
+    DROP FUNCTION IF EXISTS message_events_mark_metrics_dirty();
+    DROP FUNCTION IF EXISTS email_classifications_mark_metrics_dirty();
+    DROP FUNCTION IF EXISTS mark_campaign_days_dirty(UUID, DATE[]);
+    DROP TABLE IF EXISTS campaign_metrics_dirty;
+    DROP TABLE IF EXISTS campaign_daily_metrics;
+    DROP INDEX IF EXISTS idx_pitches_campaign_created_at;
+    DROP INDEX IF EXISTS idx_pitches_campaign_send_ts;
+    DROP INDEX IF EXISTS idx_email_classifications_processed_at;
+    """)
+    print("[010] Campaign daily metrics rollup rolled back successfully!")
@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+"""
+Migration to support keyset pagination of the review queue and match suggestions.
+
+The review queue is ordered by COALESCE(ms.vetting_score, ms.match_score, 0) of the
+related match suggestion, which lives on another table and cannot be indexed from
+review_tasks. review_tasks.sort_score stores that value (0 for other task types) and
+is kept current by triggers on both tables, so the queue can be read straight off
+indexes matching its ORDER BY and the common status/task_type/campaign_id filters.
+"""
+import asyncpg
+
+async def migrate_up(conn: asyncpg.Connection):
+    """Apply the migration."""
+    print("[011] Adding review_tasks.sort_score...")
+
+    await conn.execute("""
+    ALTER TABLE review_tasks ADD COLUMN IF NOT EXISTS sort_score NUMERIC NOT NULL DEFAULT 0;
+    """)
+
+    print("[011] Creating sort_score triggers...")
+    await conn.execute("""
+    CREATE OR REPLACE FUNCTION review_tasks_set_sort_score()
+    RETURNS TRIGGER AS $$
+    BEGIN
+        NEW.sort_score := 0;
+        IF NEW.task_type = 'match_suggestion' THEN
+            SELECT COALESCE(ms.vetting_score, ms.match_score, 0) INTO NEW.sort_score
+            FROM match_suggestions ms WHERE ms.match_id = NEW.related_id;
+            NEW.sort_score := COALESCE(NEW.sort_score, 0);
+        END IF;
+        RETURN NEW;
+    END;
+    $$ LANGUAGE plpgsql;
+
+    DROP TRIGGER IF EXISTS trigger_review_tasks_sort_score ON review_tasks;
+    CREATE TRIGGER trigger_review_tasks_sort_score
+    BEFORE INSERT OR UPDATE OF task_type, related_id ON review_tasks
+    FOR EACH ROW EXECUTE FUNCTION review_tasks_set_sort_score();
+
+    CREATE OR REPLACE FUNCTION match_suggestions_sync_review_sort_score()
+    RETURNS TRIGGER AS $$
+    BEGIN
+        IF TG_OP = 'DELETE' THEN
+            UPDATE review_tasks SET sort_score = 0
+            WHERE task_type = 'match_suggestion' AND related_id = OLD.match_id AND sort_score <> 0;
+            RETURN NULL;
+        END IF;
+        UPDATE review_tasks SET sort_score = COALESCE(NEW.vetting_score, NEW.match_score, 0)
+        WHERE task_type = 'match_suggestion' AND related_id = NEW.match_id
+        AND sort_score IS DISTINCT FROM COALESCE(NEW.vetting_score, NEW.match_score, 0);
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+
+    DROP TRIGGER IF EXISTS trigger_match_suggestions_review_sort_score ON match_suggestions;
+    CREATE TRIGGER trigger_match_suggestions_review_sort_score
+    AFTER INSERT OR DELETE OR UPDATE OF vetting_score, match_score ON match_suggestions
+    FOR EACH ROW EXECUTE FUNCTION match_suggestions_sync_review_sort_score();
+    """)
+
+    print("[011] Backfilling sort_score...")
+    await conn.execute("""
+    UPDATE review_tasks rt
+    SET sort_score = COALESCE(ms.vetting_score, ms.match_score, 0)
+    FROM match_suggestions ms
+    WHERE rt.task_type = 'match_suggestion' AND rt.related_id = ms.match_id
+    AND rt.sort_score IS DISTINCT FROM COALESCE(ms.vetting_score, ms.match_score, 0);
+    """)
+
+    print("[011] Creating keyset indexes...")
+    await conn.execute("""
+    CREATE INDEX IF NOT EXISTS idx_review_tasks_queue_order
+        ON review_tasks (sort_score DESC, created_at DESC, review_task_id DESC);
+    CREATE INDEX IF NOT EXISTS idx_review_tasks_status_queue_order
+        ON review_tasks (status, sort_score DESC, created_at DESC, review_task_id DESC);
+    CREATE INDEX IF NOT EXISTS idx_review_tasks_type_status_queue_order
+        ON review_tasks (task_type, status, sort_score DESC, created_at DESC, review_task_id DESC);
+    CREATE INDEX IF NOT EXISTS idx_review_tasks_campaign_status_queue_order
+        ON review_tasks (campaign_id, status, sort_score DESC, created_at DESC, review_task_id DESC);
+    CREATE INDEX IF NOT EXISTS idx_review_tasks_related_type
+        ON review_tasks (related_id, task_type) INCLUDE (review_task_id);
+
+    CREATE INDEX IF NOT EXISTS idx_match_suggestions_created_order
+        ON match_suggestions (created_at DESC, match_id DESC);
+    CREATE INDEX IF NOT EXISTS idx_match_suggestions_status_created_order
+        ON match_suggestions (status, created_at DESC, match_id DESC);
+    CREATE INDEX IF NOT EXISTS idx_match_suggestions_campaign_status_created_order
+        ON match_suggestions (campaign_id, status, created_at DESC, match_id DESC);
+    """)
+
+    print("[011] Review queue keyset migration completed successfully!")
+
+async def migrate_down(conn: asyncpg.Connection):
+    """Rollback the migration."""
+    print("[011] Rolling back review queue keyset support...")
+    await conn.execute("""
+    DROP TRIGGER IF EXISTS trigger_review_tasks_sort_score ON review_tasks;
+    DROP TRIGGER IF EXISTS trigger_match_suggestions_review_sort_score ON match_suggestions;
+    DROP FUNCTION IF EXISTS review_tasks_set_sort_score();
+    DROP FUNCTION IF EXISTS match_suggestions_sync_review_sort_score();
+    DROP INDEX IF EXISTS idx_review_tasks_queue_order;
+    DROP INDEX IF EXISTS idx_review_tasks_status_queue_order;
+    DROP INDEX IF EXISTS idx_review_tasks_type_status_queue_order;
+    DROP INDEX IF EXISTS idx_review_tasks_campaign_status_queue_order;
+    DROP INDEX IF EXISTS idx_review_tasks_related_type;
+    DROP INDEX IF EXISTS idx_match_suggestions_created_order;
+    DROP INDEX IF EXISTS idx_match_suggestions_status_created_order;
+    DROP INDEX IF EXISTS idx_match_suggestions_campaign_status_created_order;
+    ALTER TABLE review_tasks DROP COLUMN IF EXISTS sort_score;
+    """)
+    print("[011] Review queue keyset support rolled back successfully!")
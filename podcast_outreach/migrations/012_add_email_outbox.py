@@ -0,0 +1,44 @@
+#!/usr/bin/env python
+"""
+Migration to add the transactional email outbox.
+
+Request handlers insert rows into email_outbox instead of talking to SMTP; the
+outbox worker claims due rows, sends them over a reused SMTP session and marks
+them sent, or reschedules them with exponential backoff until the attempt limit.
+"""
+import asyncpg
+
+async def migrate_up(conn: asyncpg.Connection):
+    """Apply the migration."""
+    print("[012] Adding email outbox...")
+
+    await conn.execute("""
+    CREATE TABLE IF NOT EXISTS email_outbox (
+        outbox_id       BIGSERIAL PRIMARY KEY,
+        to_email        TEXT NOT NULL,
+        subject         TEXT NOT NULL,
+        html_body       TEXT NOT NULL,
+        text_body       TEXT NOT NULL,
+        category        VARCHAR(50),
+        status          VARCHAR(20) NOT NULL DEFAULT 'pending', -- pending, sending, sent, failed
+        attempts        INTEGER NOT NULL DEFAULT 0,
+        next_attempt_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+        locked_at       TIMESTAMPTZ,
+        last_error      TEXT,
+        created_at      TIMESTAMPTZ DEFAULT NOW(),
+        sent_at         TIMESTAMPTZ
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_email_outbox_due
+        ON email_outbox (next_attempt_at) WHERE status = 'pending';
+    CREATE INDEX IF NOT EXISTS idx_email_outbox_sending
+        ON email_outbox (locked_at) WHERE status = 'sending';
+    """)
+
+    print("[012] Email outbox migration completed successfully!")
+
+async def migrate_down(conn: asyncpg.Connection):
+    """Rollback the migration."""
+    print("[012] Rolling back email outbox...")
+    await conn.execute("DROP TABLE IF EXISTS email_outbox;")
+    print("[012] Email outbox rolled back successfully!")
@@ -0,0 +1,26 @@
+#!/usr/bin/env python
+"""
+Migration to support keyset pagination of episode listings.
+
+GET /episodes/ pages a podcast's episodes newest first on (publish_date, episode_id).
+This index matches that ORDER BY within one media_id, so each page is a short index
+range scan instead of a sort of every episode row of the podcast.
+"""
+import asyncpg
+
+async def migrate_up(conn: asyncpg.Connection):
+    """Apply the migration."""
+    print("[013] Creating episode listing index...")
+
+    await conn.execute("""
+    CREATE INDEX IF NOT EXISTS idx_episodes_media_publish_order
+        ON episodes (media_id, publish_date DESC, episode_id DESC);
+    """)
+
+    print("[013] Episode listing index migration completed successfully!")
+
+async def migrate_down(conn: asyncpg.Connection):
+    """Rollback the migration."""
+    print("[013] Rolling back episode listing index...")
+    await conn.execute("DROP INDEX IF EXISTS idx_episodes_media_publish_order;")
+    print("[013] Episode listing index rolled back successfully!")
@@ -0,0 +1,40 @@
+#!/usr/bin/env python
+"""
+Migration to add data export jobs.
+
+A GDPR export is now a tracked job: the client polls its status and downloads the
+finished ZIP artifact from storage instead of receiving the data in an email.
+"""
+import asyncpg
+
+async def migrate_up(conn: asyncpg.Connection):
+    """Apply the migration."""
+    print("[014] Adding data_export_jobs...")
+
+    await conn.execute("""
+    CREATE TABLE IF NOT EXISTS data_export_jobs (
+        export_id     UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+        person_id     INTEGER NOT NULL REFERENCES people(person_id) ON DELETE CASCADE,
+        status        VARCHAR(20) NOT NULL DEFAULT 'pending', -- pending, running, completed, failed
+        storage       VARCHAR(10),                            -- s3 or local
+        object_key    TEXT,
+        size_bytes    BIGINT,
+        row_counts    JSONB,
+        error         TEXT,
+        created_at    TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+        started_at    TIMESTAMPTZ,
+        completed_at  TIMESTAMPTZ,
+        expires_at    TIMESTAMPTZ
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_data_export_jobs_person_created
+        ON data_export_jobs (person_id, created_at DESC);
+    """)
+
+    print("[014] Data export jobs migration completed successfully!")
+
+async def migrate_down(conn: asyncpg.Connection):
+    """Rollback the migration."""
+    print("[014] Rolling back data_export_jobs...")
+    await conn.execute("DROP TABLE IF EXISTS data_export_jobs;")
+    print("[014] Data export jobs rolled back successfully!")
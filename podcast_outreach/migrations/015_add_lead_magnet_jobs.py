@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+"""
+Migration to add lead magnet jobs.
+
+Public lead magnet submissions are queued here instead of generating the media
+kit inside the request. The job_id is the tracking token the form polls, and
+the lead magnet worker claims pending rows and records the person, campaign and
+media kit it creates. client_ip backs the per-IP submission limit.
+"""
+import asyncpg
+
+async def migrate_up(conn: asyncpg.Connection):
+    """Apply the migration."""
+    print("[015] Adding lead_magnet_jobs...")
+
+    await conn.execute("""
+    CREATE TABLE IF NOT EXISTS lead_magnet_jobs (
+        job_id             UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+        email              TEXT NOT NULL,
+        full_name          TEXT NOT NULL,
+        questionnaire_data JSONB NOT NULL DEFAULT '{}'::jsonb,
+        client_ip          TEXT,
+        status             VARCHAR(20) NOT NULL DEFAULT 'pending', -- pending, running, completed, failed
+        attempts           INTEGER NOT NULL DEFAULT 0,
+        next_attempt_at    TIMESTAMPTZ NOT NULL DEFAULT NOW(), -- pushed back when a failed attempt is retried
+        person_id          INTEGER REFERENCES people(person_id) ON DELETE SET NULL,
+        campaign_id        UUID REFERENCES campaigns(campaign_id) ON DELETE SET NULL,
+        media_kit_slug     TEXT,
+        error              TEXT,
+        created_at         TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+        locked_at          TIMESTAMPTZ,
+        completed_at       TIMESTAMPTZ
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_lead_magnet_jobs_pending
+        ON lead_magnet_jobs (next_attempt_at) WHERE status = 'pending';
+    CREATE INDEX IF NOT EXISTS idx_lead_magnet_jobs_running
+        ON lead_magnet_jobs (locked_at) WHERE status = 'running';
+    CREATE INDEX IF NOT EXISTS idx_lead_magnet_jobs_ip_created
+        ON lead_magnet_jobs (client_ip, created_at DESC);
+    CREATE INDEX IF NOT EXISTS idx_lead_magnet_jobs_active_email
+        ON lead_magnet_jobs (lower(email)) WHERE status IN ('pending', 'running');
+    """)
+
+    print("[015] Lead magnet jobs migration completed successfully!")
+
+async def migrate_down(conn: asyncpg.Connection):
+    """Rollback the migration."""
+    print("[015] Rolling back lead_magnet_jobs...")
+    await conn.execute("DROP TABLE IF EXISTS lead_magnet_jobs;")
+    print("[015] Lead magnet jobs rolled back successfully!")
@@ -4,7 +4,6 @@ import os
 import sys
 import json
 import argparse
-import datetime
 from pathlib import Path
 from tabulate import tabulate
 from typing import Optional, Dict, Any, List
@@ -16,12 +15,12 @@ from datetime import date, timedelta
 from podcast_outreach.services.ai.tracker import tracker
 from podcast_outreach.logging_config import get_logger
 from podcast_outreach.database.connection import init_db_pool, close_db_pool # <--- UPDATED IMPORT
+from podcast_outreach.utils.http_sessions import close_http_sessions
 
 # Import new DB query functions for campaign status
 from podcast_outreach.database.queries import campaigns as campaign_queries
-from podcast_outreach.database.queries import pitches as pitch_queries
-from podcast_outreach.database.queries import placements as placement_queries # Now exists
 from podcast_outreach.database.queries import people as people_queries # Now exists
+from podcast_outreach.database.queries import reports as report_queries
 
 logger = get_logger(__name__)
 
@@ -160,9 +159,9 @@ class CampaignStatusReporter:
     Generates status reports for campaigns, fetching data from PostgreSQL.
     """
     def __init__(self):
-        # GoogleSheetsService is still needed for writing reports
-        from podcast_outreach.integrations.google_sheets import GoogleSheetsService
-        self.sheets_service = GoogleSheetsService()
+        # Sheets and Drive calls go through the async Google client (shared session and credentials)
+        from podcast_outreach.integrations.google_workspace import GoogleWorkspaceClient
+        self.google = GoogleWorkspaceClient()
 
         # Google Drive/Sheets Config (from original campaign_status_tracker.py)
         self.CLIENT_SPREADSHEETS_TRACKING_FOLDER_ID = os.getenv('CLIENT_SPREADSHEETS_TRACKING_FOLDER_ID')
@@ -170,72 +169,42 @@ class CampaignStatusReporter:
             logger.error("CLIENT_SPREADSHEETS_TRACKING_FOLDER_ID environment variable not set.")
             raise ValueError("CLIENT_SPREADSHEETS_TRACKING_FOLDER_ID is required.")
         
-        # Initialize Google Drive service for finding/moving spreadsheets
-        from google.oauth2 import service_account
-        from googleapiclient.discovery import build
-        SERVICE_ACCOUNT_FILE = os.getenv('GOOGLE_APPLICATION_CREDENTIALS')
-        SHEETS_API_SCOPES = [
-            'https://www.googleapis.com/auth/spreadsheets',
-            'https://www.googleapis.com/auth/drive.file'
-        ]
-        if not SERVICE_ACCOUNT_FILE:
+        if not os.getenv('GOOGLE_APPLICATION_CREDENTIALS') and not os.getenv('GOOGLE_API_ROOT_URL'):
             logger.error("GOOGLE_APPLICATION_CREDENTIALS environment variable not set.")
             raise ValueError("GOOGLE_APPLICATION_CREDENTIALS is required for Google Drive access.")
-        
-        try:
-            drive_credentials = service_account.Credentials.from_service_account_file(
-                SERVICE_ACCOUNT_FILE, scopes=SHEETS_API_SCOPES)
-            self.drive_service = build('drive', 'v3', credentials=drive_credentials)
-            logger.info("CampaignStatusReporter initialized with Sheets and Drive services.")
-        except Exception as e:
-            logger.error(f"Failed to initialize Google Drive/Sheets credentials: {e}")
-            raise
+        logger.info("CampaignStatusReporter initialized with Sheets and Drive services.")
 
-    async def _find_spreadsheet_in_folder(self, name: str, folder_id: str) -> Optional[str]:
-        """Finds a spreadsheet by name within a specific Google Drive folder."""
-        safe_name = name.replace("'", "\\'")
-        query = f"name = '{safe_name}' and mimeType = 'application/vnd.google-apps.spreadsheet' and '{folder_id}' in parents and trashed = false"
+    async def _list_spreadsheets_in_folder(self, folder_id: str) -> Dict[str, str]:
+        """Maps spreadsheet name to ID for the tracking folder, in one listing instead of a search per client."""
+        from podcast_outreach.integrations.google_workspace import GOOGLE_SHEET_MIME_TYPE
         try:
-            # Use asyncio.to_thread for blocking API calls
-            response = await asyncio.to_thread(self.drive_service.files().list(q=query, spaces='drive', fields='files(id, name)').execute)
-            files = response.get('files', [])
-            if files:
-                logger.info(f"Found spreadsheet '{name}' with ID {files[0]['id']} in folder '{folder_id}'.")
-                return files[0]['id']
-            return None
+            files = await self.google.list_files_in_folder(folder_id, mime_type=GOOGLE_SHEET_MIME_TYPE)
         except Exception as e:
-            logger.error(f"Error finding spreadsheet '{name}' in folder '{folder_id}': {e}")
-            return None
-
-    async def _get_or_create_spreadsheet_for_client(self, client_name: str) -> Optional[str]:
+            logger.error(f"Error listing spreadsheets in folder '{folder_id}': {e}")
+            return {}
+        spreadsheets: Dict[str, str] = {}
+        for file in files:
+            spreadsheets.setdefault(file['name'], file['id'])
+        logger.info(f"Found {len(spreadsheets)} spreadsheets in folder '{folder_id}'.")
+        return spreadsheets
+
+    async def _get_or_create_spreadsheet_for_client(self, client_name: str, existing_spreadsheets: Dict[str, str]) -> Optional[str]:
         """Gets existing or creates new spreadsheet for the client."""
         spreadsheet_title = f"{client_name} - Campaign Status Tracker"
-        spreadsheet_id = await self._find_spreadsheet_in_folder(spreadsheet_title, self.CLIENT_SPREADSHEETS_TRACKING_FOLDER_ID)
+        spreadsheet_id = existing_spreadsheets.get(spreadsheet_title)
 
         if spreadsheet_id:
             return spreadsheet_id
-        else:
-            logger.info(f"Creating new spreadsheet titled '{spreadsheet_title}'...")
-            new_sheet_id = await asyncio.to_thread(self.sheets_service.create_spreadsheet, title=spreadsheet_title)
-            if new_sheet_id:
-                logger.info(f"Spreadsheet created with ID: {new_sheet_id}. Moving to folder {self.CLIENT_SPREADSHEETS_TRACKING_FOLDER_ID}...")
-                try:
-                    file_metadata = await asyncio.to_thread(self.drive_service.files().get, fileId=new_sheet_id, fields='parents')
-                    file_metadata = file_metadata.execute()
-                    previous_parents = ",".join(file_metadata.get('parents', []))
-                    await asyncio.to_thread(self.drive_service.files().update,
-                        fileId=new_sheet_id,
-                        addParents=self.CLIENT_SPREADSHEETS_TRACKING_FOLDER_ID,
-                        removeParents=previous_parents if previous_parents else None,
-                        fields='id, parents'
-                    )
-                    return new_sheet_id
-                except Exception as e:
-                    logger.error(f"Error moving spreadsheet {new_sheet_id} to folder {self.CLIENT_SPREADSHEETS_TRACKING_FOLDER_ID}: {e}")
-                    return None
-            else:
-                logger.error(f"Failed to create spreadsheet for {client_name} via GoogleSheetsService.")
-                return None
+        logger.info(f"Creating new spreadsheet titled '{spreadsheet_title}' in folder {self.CLIENT_SPREADSHEETS_TRACKING_FOLDER_ID}...")
+        try:
+            # Created directly in the tracking folder, so there is no separate move
+            new_sheet_id = await self.google.create_spreadsheet(spreadsheet_title, self.CLIENT_SPREADSHEETS_TRACKING_FOLDER_ID)
+        except Exception as e:
+            logger.error(f"Failed to create spreadsheet for {client_name}: {e}")
+            return None
+        logger.info(f"Spreadsheet created with ID: {new_sheet_id}.")
+        existing_spreadsheets[spreadsheet_title] = new_sheet_id
+        return new_sheet_id
 
     def _get_week_date_ranges(self, num_weeks: int) -> List[Dict[str, date]]:
         """Generates date ranges (Monday to Sunday) for the last num_weeks."""
@@ -250,77 +219,20 @@ class CampaignStatusReporter:
         
         return date_ranges[::-1] # Return in chronological order (oldest first)
 
-    async def _calculate_weekly_metrics(self, client_campaigns: List[Dict[str, Any]], weekly_ranges: List[Dict[str, date]]) -> List[Dict[str, Any]]:
+    def _calculate_weekly_metrics(self, weekly_counts: Dict[date, Counter], weekly_ranges: List[Dict[str, date]]) -> List[Dict[str, Any]]:
         """
-        Calculates status counts for each week for a specific client based on PostgreSQL data.
+        Lays out a client's pre-aggregated weekly status counts (see
+        report_queries.get_weekly_status_counts) over the reported week ranges.
         """
         weekly_data = []
-
-        # Fetch all pitches and placements related to these campaigns
-        all_pitches = []
-        all_placements = []
-        for campaign in client_campaigns:
-            campaign_id = campaign['campaign_id']
-            # Assuming these queries exist and return lists of dicts
-            pitches_for_campaign = await pitch_queries.get_pitches_for_campaign(campaign_id)
-            placements_for_campaign = await placement_queries.get_placements_for_campaign(campaign_id)
-            all_pitches.extend(pitches_for_campaign)
-            all_placements.extend(placements_for_campaign)
-
-        # Define the statuses to track and how they map from DB fields
-        STATUS_MAPPING = {
-            "Messages sent": {"table": "pitches", "field": "send_ts", "status_field": "pitch_state", "status_value": "sent"},
-            "Total replies": {"table": "pitches", "field": "reply_ts", "status_field": "reply_bool", "status_value": True},
-            "Positive replies": {"table": "pitches", "field": "reply_ts", "status_field": "pitch_state", "status_value": "replied_interested"}, # Example custom status
-            "Form Submitted": {"table": "placements", "field": "created_at", "status_field": "current_status", "status_value": "form_submitted"}, # Example
-            "Meetings booked": {"table": "placements", "field": "meeting_date", "status_field": "current_status", "status_value": "meeting_booked"},
-            "Lost": {"table": "pitches", "field": "send_ts", "status_field": "pitch_state", "status_value": "lost"}, # Example
-        }
-        
         for week in weekly_ranges:
-            week_start = week["start"]
-            week_end = week["end"]
-            
-            status_counts = Counter()
-            total_pitches_sent_in_week = 0
-            
-            # Count pitches
-            for pitch in all_pitches:
-                pitch_send_date = pitch.get('send_ts')
-                if pitch_send_date and isinstance(pitch_send_date, datetime):
-                    pitch_send_date = pitch_send_date.date()
-                    if week_start <= pitch_send_date <= week_end:
-                        # Count total pitches sent
-                        total_pitches_sent_in_week += 1
-                        
-                        # Count specific statuses
-                        for display_name, mapping in STATUS_MAPPING.items():
-                            if mapping["table"] == "pitches":
-                                if mapping["status_field"] == "pitch_state" and pitch.get("pitch_state") == mapping["status_value"]:
-                                    status_counts[display_name] += 1
-                                elif mapping["status_field"] == "reply_bool" and pitch.get("reply_bool") == mapping["status_value"]:
-                                    status_counts[display_name] += 1
-                                # Add more conditions for other pitch fields if needed
-
-            # Count placements (e.g., for "Form Submitted", "Meetings booked")
-            for placement in all_placements:
-                placement_date = placement.get('status_ts') # Or specific date field like meeting_date
-                if placement_date and isinstance(placement_date, datetime):
-                    placement_date = placement_date.date()
-                    if week_start <= placement_date <= week_end:
-                        for display_name, mapping in STATUS_MAPPING.items():
-                            if mapping["table"] == "placements":
-                                if mapping["status_field"] == "current_status" and placement.get("current_status") == mapping["status_value"]:
-                                    status_counts[display_name] += 1
-                                # Add more conditions for other placement fields if needed
-
+            counts = weekly_counts.get(week["start"], Counter())
             weekly_data.append({
-                "week_start": week_start,
-                "week_end": week_end,
-                "status_counts": status_counts,
-                "total_records": total_pitches_sent_in_week # Using pitches sent as total for now
+                "week_start": week["start"],
+                "week_end": week["end"],
+                "status_counts": counts,
+                "total_records": counts.get(report_queries.TOTAL_PITCHES_SENT, 0) # Using pitches sent as total for now
             })
-            
         return weekly_data
 
     def _prepare_sheet_data(self, weekly_metric_data: List[Dict[str, Any]]) -> List[List[Any]]:
@@ -394,6 +306,17 @@ class CampaignStatusReporter:
         weekly_ranges = self._get_week_date_ranges(WEEKS_TO_REPORT)
         logger.info(f"Reporting for weeks starting: {[r['start'] for r in weekly_ranges]}")
 
+        # Weekly counts for every client in one aggregate query
+        weekly_counts_by_client = await report_queries.get_weekly_status_counts(
+            weekly_ranges[0]["start"], WEEKS_TO_REPORT, person_ids=list(campaigns_by_client)
+        )
+
+        existing_spreadsheets = await self._list_spreadsheets_in_folder(self.CLIENT_SPREADSHEETS_TRACKING_FOLDER_ID)
+
+        # Writes for every client are collected and sent together: one batchUpdate per spreadsheet, concurrently
+        sheet_batch = self.google.batch()
+        clients_by_spreadsheet: Dict[str, str] = {}
+
         # Iterate through each client group and update/create spreadsheet
         for person_id, client_campaigns in campaigns_by_client.items():
             # Fetch client name from the person_id
@@ -402,26 +325,26 @@ class CampaignStatusReporter:
 
             logger.info(f"\nProcessing client: {client_name} (Person ID: {person_id})")
 
-            spreadsheet_id = await self._get_or_create_spreadsheet_for_client(client_name)
+            spreadsheet_id = await self._get_or_create_spreadsheet_for_client(client_name, existing_spreadsheets)
             if not spreadsheet_id:
                 logger.error(f"Could not get or create spreadsheet for {client_name}. Skipping.")
                 continue
 
-            logger.info(f"Calculating weekly metrics for {len(client_campaigns)} campaigns for {client_name}.")
-            weekly_metric_data = await self._calculate_weekly_metrics(client_campaigns, weekly_ranges)
-
-            if not weekly_metric_data:
-                 logger.info(f"No weekly data calculated for {client_name}. Skipping sheet update.")
-                 continue
+            logger.info(f"Preparing weekly metrics for {len(client_campaigns)} campaigns for {client_name}.")
+            weekly_metric_data = self._calculate_weekly_metrics(weekly_counts_by_client.get(person_id, {}), weekly_ranges)
 
             sheet_data = self._prepare_sheet_data(weekly_metric_data)
-
-            logger.info(f"Writing data to spreadsheet for {client_name} (Sheet ID: {spreadsheet_id})")
-            try:
-                await asyncio.to_thread(self.sheets_service.write_sheet, spreadsheet_id, "Sheet1!A1", sheet_data)
+            sheet_batch.update_values(spreadsheet_id, "Sheet1!A1", sheet_data)
+            clients_by_spreadsheet[spreadsheet_id] = client_name
+
+        logger.info(f"Writing data to {len(clients_by_spreadsheet)} spreadsheets...")
+        results = await sheet_batch.flush()
+        for spreadsheet_id, client_name in clients_by_spreadsheet.items():
+            result = results.get(spreadsheet_id)
+            if isinstance(result, Exception):
+                logger.error(f"Error writing to spreadsheet for {client_name} (ID: {spreadsheet_id}): {result}")
+            else:
                 logger.info(f"Successfully updated spreadsheet for {client_name}.")
-            except Exception as e:
-                logger.error(f"Error writing to spreadsheet for {client_name} (ID: {spreadsheet_id}): {e}")
 
         logger.info("\nCampaign status tracking update finished.")
 
@@ -505,6 +428,7 @@ async def main_reports_async():
 
     finally:
         await close_db_pool() # Close DB pool after all reports are done
+        await close_http_sessions()
 
 if __name__ == "__main__":
     asyncio.run(main_reports_async())
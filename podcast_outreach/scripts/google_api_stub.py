@@ -0,0 +1,158 @@
+# podcast_outreach/scripts/google_api_stub.py
+
+"""
+Local stand-in for the Google Docs, Drive and Sheets APIs that replays recorded
+responses, so GoogleWorkspaceClient (integrations/google_workspace.py) can run
+without credentials or network access.
+
+Fixtures are JSON files holding a list of recorded exchanges:
+
+    [{"method": "GET", "path": "/v1/documents/*", "status": 200, "body": {...}}]
+
+`path` is matched against the decoded request path (query string ignored) with
+shell-style wildcards; the first matching entry wins and `status` defaults to
+200. Calls sent through the Drive batch endpoint (/batch/drive/v3) are matched
+one by one and answered in a multipart/mixed response, like Drive does. Calls
+without a fixture get a 404 in Google's error format.
+
+GET /_stub/requests lists the requests received so far (one entry per round
+trip, with the number of calls it carried); DELETE /_stub/requests clears it.
+
+    python -m podcast_outreach.scripts.google_api_stub --port 8765
+
+    async def token():
+        return "stub-token"
+
+    client = GoogleWorkspaceClient(token_provider=token, root_url="http://localhost:8765")
+"""
+
+import os
+import json
+import glob
+import uuid
+import fnmatch
+import logging
+import argparse
+from http import HTTPStatus
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import unquote, urlsplit
+
+from aiohttp import web
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "google_api_fixtures")
+
+
+def load_fixtures(fixtures_dir: str = DEFAULT_FIXTURES_DIR) -> List[Dict[str, Any]]:
+    """Loads every *.json fixture file in `fixtures_dir`, in file name order."""
+    fixtures: List[Dict[str, Any]] = []
+    for path in sorted(glob.glob(os.path.join(fixtures_dir, "*.json"))):
+        with open(path, encoding="utf-8") as f:
+            fixtures.extend(json.load(f))
+    return fixtures
+
+
+def _replay(fixtures: List[Dict[str, Any]], method: str, path: str) -> Tuple[int, Any]:
+    for fixture in fixtures:
+        if fixture["method"].upper() == method.upper() and fnmatch.fnmatchcase(path, fixture["path"]):
+            return fixture.get("status", 200), fixture.get("body")
+    logger.warning(f"No fixture for {method} {path}")
+    return 404, {"error": {"code": 404, "message": f"No fixture for {method} {path}", "status": "NOT_FOUND"}}
+
+
+def _split_head(text: str) -> Tuple[str, str]:
+    for separator in ("\r\n\r\n", "\n\n"):
+        if separator in text:
+            head, rest = text.split(separator, 1)
+            return head, rest
+    return text, ""
+
+
+def _batch_calls(content_type: str, payload: str) -> List[Tuple[str, str, str]]:
+    """Splits a Drive batch request into (content_id, method, path) per call."""
+    boundary = None
+    for param in content_type.split(";")[1:]:
+        key, _, value = param.strip().partition("=")
+        if key.lower() == "boundary":
+            boundary = value.strip('"')
+    if not boundary:
+        return []
+
+    calls = []
+    for part in payload.split(f"--{boundary}")[1:]:
+        if part.startswith("--"):
+            break
+        part_head, request = _split_head(part.strip("\r\n"))
+        content_id = ""
+        for line in part_head.splitlines():
+            name, _, value = line.partition(":")
+            if name.strip().lower() == "content-id":
+                content_id = value.strip().strip("<>")
+        method, target = (request.split("\n", 1)[0].split() + ["", ""])[:2]
+        calls.append((content_id, method, unquote(urlsplit(target).path)))
+    return calls
+
+
+def _batch_response(results: List[Tuple[str, int, Any]], boundary: str) -> str:
+    parts = []
+    for content_id, status, body in results:
+        payload = json.dumps(body) if body is not None else ""
+        parts.append(
+            f"--{boundary}\r\n"
+            "Content-Type: application/http\r\n"
+            f"Content-ID: <response-{content_id}>\r\n\r\n"
+            f"HTTP/1.1 {status} {HTTPStatus(status).phrase}\r\n"
+            "Content-Type: application/json; charset=UTF-8\r\n\r\n"
+            f"{payload}\r\n"
+        )
+    parts.append(f"--{boundary}--\r\n")
+    return "".join(parts)
+
+
+def create_app(fixtures: Optional[List[Dict[str, Any]]] = None) -> web.Application:
+    """Builds the stub application; `fixtures` defaults to the bundled recordings."""
+    fixtures = load_fixtures() if fixtures is None else fixtures
+    received: List[Dict[str, Any]] = []
+
+    async def list_requests(request: web.Request) -> web.Response:
+        return web.json_response(received)
+
+    async def clear_requests(request: web.Request) -> web.Response:
+        received.clear()
+        return web.Response(status=204)
+
+    async def drive_batch(request: web.Request) -> web.Response:
+        calls = _batch_calls(request.headers.get("Content-Type", ""), await request.text())
+        received.append({"method": request.method, "path": request.path, "calls": len(calls)})
+        results = [(content_id, *_replay(fixtures, method, path)) for content_id, method, path in calls]
+        boundary = f"batch_{uuid.uuid4().hex}"
+        return web.Response(
+            text=_batch_response(results, boundary),
+            headers={"Content-Type": f"multipart/mixed; boundary={boundary}"},
+        )
+
+    async def replay(request: web.Request) -> web.Response:
+        received.append({"method": request.method, "path": request.path, "calls": 1})
+        status, body = _replay(fixtures, request.method, request.path)
+        if body is None:
+            return web.Response(status=status)
+        return web.json_response(body, status=status)
+
+    app = web.Application()
+    app.router.add_get("/_stub/requests", list_requests)
+    app.router.add_delete("/_stub/requests", clear_requests)
+    app.router.add_post("/batch/drive/v3", drive_batch)
+    app.router.add_route("*", "/{path:.*}", replay)
+    return app
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Replay recorded Google Docs/Drive/Sheets responses.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--fixtures", default=DEFAULT_FIXTURES_DIR, help="Directory of *.json fixture files")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    web.run_app(create_app(load_fixtures(args.fixtures)), host=args.host, port=args.port)
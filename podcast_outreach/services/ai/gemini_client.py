@@ -17,6 +17,7 @@ from google.generativeai.types import HarmCategory, HarmBlockThreshold
 
 # Import our AI usage tracker from its new location
 from podcast_outreach.services.ai.tracker import tracker as ai_tracker
+from podcast_outreach.services.ai.rate_limiter import get_llm_limiter
 from podcast_outreach.logging_config import get_logger # Use new logging config
 
 
@@ -93,10 +94,11 @@ class GeminiService:
                 # Assuming model_instance.generate_content is blocking and needs to_thread
                 # Apply timeout using asyncio.wait_for
                 try:
-                    response_obj = await asyncio.wait_for(
-                        asyncio.to_thread(model_instance.generate_content, prompt),
-                        timeout=timeout
-                    )
+                    async with get_llm_limiter().slot():
+                        response_obj = await asyncio.wait_for(
+                            asyncio.to_thread(model_instance.generate_content, prompt),
+                            timeout=timeout
+                        )
                 except asyncio.TimeoutError:
                     raise google_exceptions.DeadlineExceeded(f"Request timed out after {timeout} seconds")
 
@@ -282,7 +284,8 @@ class GeminiService:
                 chain = prompt_template | llm_for_structured_output.with_structured_output(output_model)
                 
                 # The input to invoke should match the input_variables of the prompt_template
-                response_obj = await asyncio.to_thread(chain.invoke, {"user_query": user_query})
+                async with get_llm_limiter().slot():
+                    response_obj = await asyncio.to_thread(chain.invoke, {"user_query": user_query})
 
                 execution_time = time.time() - start_time
                 tokens_in = len(approx_input_for_logging) // 4 
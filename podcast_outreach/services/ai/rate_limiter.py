@@ -0,0 +1,85 @@
+# podcast_outreach/services/ai/rate_limiter.py
+
+"""
+Process-wide limiter for outbound LLM calls.
+
+Every concurrent pipeline (vetting, media kit generation, summarization) draws
+from the same budget, so raising concurrency in one place cannot exceed what
+the provider allows. The limiter combines a concurrency cap with an optional
+requests-per-minute pace. Background tasks may run on their own event loops
+(TaskManager falls back to asyncio.run in a thread), so semaphores are kept
+per loop while the pace is shared.
+"""
+
+import os
+import time
+import asyncio
+import threading
+import weakref
+from contextlib import asynccontextmanager
+from typing import Optional
+
+from podcast_outreach.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", os.getenv("GEMINI_API_CONCURRENCY", "10")))
+LLM_REQUESTS_PER_MINUTE = int(os.getenv("LLM_REQUESTS_PER_MINUTE", "0"))  # 0 disables pacing
+
+
+class LLMRateLimiter:
+    """Concurrency cap plus optional minimum spacing between request starts."""
+
+    def __init__(self, max_concurrency: int = LLM_MAX_CONCURRENCY, requests_per_minute: int = LLM_REQUESTS_PER_MINUTE):
+        self.max_concurrency = max(1, max_concurrency)
+        self.requests_per_minute = max(0, requests_per_minute)
+        self._semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+        self._pace_lock = threading.Lock()
+        self._next_start = 0.0
+        self.in_flight = 0
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphores[loop] = semaphore
+        return semaphore
+
+    async def _wait_for_pace(self) -> None:
+        if not self.requests_per_minute:
+            return
+        interval = 60.0 / self.requests_per_minute
+        with self._pace_lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_start)
+            self._next_start = start_at + interval
+        delay = start_at - now
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    @asynccontextmanager
+    async def slot(self):
+        """Holds one LLM slot for the duration of a request."""
+        async with self._semaphore():
+            await self._wait_for_pace()
+            self.in_flight += 1
+            try:
+                yield
+            finally:
+                self.in_flight -= 1
+
+
+_llm_limiter: Optional[LLMRateLimiter] = None
+
+
+def get_llm_limiter() -> LLMRateLimiter:
+    """Returns the shared LLM limiter."""
+    global _llm_limiter
+    if _llm_limiter is None:
+        _llm_limiter = LLMRateLimiter()
+        logger.info(
+            f"LLM rate limiter initialized (max_concurrency={_llm_limiter.max_concurrency}, "
+            f"requests_per_minute={_llm_limiter.requests_per_minute or 'unlimited'})"
+        )
+    return _llm_limiter
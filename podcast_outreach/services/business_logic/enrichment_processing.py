@@ -2,6 +2,7 @@
 
 import logging
 from podcast_outreach.services.database_service import DatabaseService
+from podcast_outreach.database.connection import Workload, set_workload, reset_workload
 from podcast_outreach.services.enrichment.enrichment_orchestrator import EnrichmentOrchestrator
 from podcast_outreach.services.matches.enhanced_vetting_orchestrator import EnhancedVettingOrchestrator
 from podcast_outreach.services.ai.gemini_client import GeminiService
@@ -18,10 +19,8 @@ async def run_enrichment_pipeline(db_service: DatabaseService, media_id: int = N
     Assumes database resources are available via db_service.
     Can run for all media or a specific media_id.
     """
-    # Temporarily set the global pool for this event loop
-    from podcast_outreach.database import connection
-    original_pool = connection.DB_POOL
-    connection.DB_POOL = db_service.pool
+    # Queries made by this task (and tasks it starts) use the pipeline pool
+    workload_token = set_workload(Workload.PIPELINE)
     
     try:
         if media_id:
@@ -45,8 +44,7 @@ async def run_enrichment_pipeline(db_service: DatabaseService, media_id: int = N
         logger.error(f"Error during enrichment pipeline: {e}", exc_info=True)
         return False
     finally:
-        # Restore original pool
-        connection.DB_POOL = original_pool
+        reset_workload(workload_token)
 
 async def run_single_media_enrichment(db_service: DatabaseService, media_id: int) -> bool:
     """
@@ -173,10 +171,8 @@ async def run_vetting_pipeline(db_service: DatabaseService) -> bool:
     Pure business logic function for vetting pipeline.
     Assumes database resources are available via db_service.
     """
-    # Temporarily set the global pool for this event loop
-    from podcast_outreach.database import connection
-    original_pool = connection.DB_POOL
-    connection.DB_POOL = db_service.pool
+    # Queries made by this task (and tasks it starts) use the pipeline pool
+    workload_token = set_workload(Workload.PIPELINE)
     
     try:
         logger.info("Running Enhanced Vetting Orchestrator pipeline")
@@ -188,5 +184,4 @@ async def run_vetting_pipeline(db_service: DatabaseService) -> bool:
         logger.error(f"Error during vetting pipeline: {e}", exc_info=True)
         return False
     finally:
-        # Restore original pool
-        connection.DB_POOL = original_pool
\ No newline at end of file
+        reset_workload(workload_token)
\ No newline at end of file
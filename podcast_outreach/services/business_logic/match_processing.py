@@ -1,9 +1,11 @@
 # podcast_outreach/services/business_logic/match_processing.py
 
 import uuid
+import asyncio
 import logging
 from typing import Optional
 from podcast_outreach.services.database_service import DatabaseService
+from podcast_outreach.database.connection import Workload, set_workload, reset_workload
 from podcast_outreach.services.matches.scorer import DetermineFitProcessor
 from podcast_outreach.services.matches.match_creation import MatchCreationService
 from podcast_outreach.database.queries import review_tasks as rt_queries
@@ -17,10 +19,8 @@ async def run_qualitative_match_assessment(db_service: DatabaseService) -> bool:
     Pure business logic function for qualitative match assessment.
     Assumes database resources are available via db_service.
     """
-    # Temporarily set the global pool for this event loop
-    from podcast_outreach.database import connection
-    original_pool = connection.DB_POOL
-    connection.DB_POOL = db_service.pool
+    # Queries made by this task (and tasks it starts) use the pipeline pool
+    workload_token = set_workload(Workload.PIPELINE)
     
     try:
         processor = DetermineFitProcessor()
@@ -48,18 +48,15 @@ async def run_qualitative_match_assessment(db_service: DatabaseService) -> bool:
         logger.error(f"Error during qualitative match assessment: {e}", exc_info=True)
         return False
     finally:
-        # Restore original pool
-        connection.DB_POOL = original_pool
+        reset_workload(workload_token)
 
 async def create_matches_for_enriched_media(db_service: DatabaseService) -> bool:
     """
     Create match suggestions for media that have completed enrichment and episode analysis.
     This runs as part of the new workflow: Discovery → Enrichment → Match Creation → Vetting
     """
-    # Temporarily set the global pool for this event loop
-    from podcast_outreach.database import connection
-    original_pool = connection.DB_POOL
-    connection.DB_POOL = db_service.pool
+    # Queries made by this task (and tasks it starts) use the pipeline pool
+    workload_token = set_workload(Workload.PIPELINE)
     
     try:
         # Get media that are ready for match creation
@@ -71,61 +68,58 @@ async def create_matches_for_enriched_media(db_service: DatabaseService) -> bool
         
         logger.info(f"Found {len(ready_media)} enriched media ready for match creation")
         
-        match_creator = MatchCreationService()
-        created_count = 0
+        from podcast_outreach.services.matches.enhanced_vetting_agent import EnhancedVettingAgent
+        from podcast_outreach.services.media.podcast_fetcher import MediaFetcher
+        from podcast_outreach.services.matches.enhanced_vetting_orchestrator import VETTING_CONCURRENCY
+        from podcast_outreach.services.ai.rate_limiter import get_llm_limiter
         
-        for item in ready_media:
+        # One agent and fetcher for the whole run; vetting calls share the LLM limiter
+        vetting_agent = EnhancedVettingAgent()
+        fetcher = MediaFetcher()
+        min_vetting_score = 60  # Only create matches for well-vetted podcasts
+        semaphore = asyncio.Semaphore(max(1, min(VETTING_CONCURRENCY, get_llm_limiter().max_concurrency)))
+        
+        async def _vet_and_create(item) -> bool:
             campaign_id = item['campaign_id']
             media_id = item['media_id']
             keyword = item['discovery_keyword']
             media_name = item['media_name']
             
-            try:
-                logger.info(f"Creating match suggestion for media '{media_name}' (ID: {media_id}) and campaign {campaign_id}")
-                
-                # NEW WORKFLOW: Vet first, then create match suggestion if approved
-                from podcast_outreach.services.matches.enhanced_vetting_agent import EnhancedVettingAgent
-                from podcast_outreach.database.queries import campaigns as campaign_queries
-                
-                # Get campaign details for vetting
-                campaign_data = await campaign_queries.get_campaign_by_id(campaign_id)
-                if not campaign_data:
-                    logger.error(f"Campaign {campaign_id} not found for vetting")
-                    continue
-                
-                # Run AI vetting before creating match
-                vetting_agent = EnhancedVettingAgent()
-                vetting_result = await vetting_agent.vet_media_for_campaign(media_id, campaign_data)
-                
-                if vetting_result.get('status') == 'success':
-                    vetting_score = vetting_result.get('vetting_score', 0)
-                    min_vetting_score = 60  # Only create matches for well-vetted podcasts
+            async with semaphore:
+                try:
+                    logger.info(f"Creating match suggestion for media '{media_name}' (ID: {media_id}) and campaign {campaign_id}")
                     
-                    if vetting_score >= min_vetting_score:
-                        # Create match suggestion only if vetting passes
-                        from podcast_outreach.services.media.podcast_fetcher import MediaFetcher
-                        fetcher = MediaFetcher()
-                        success = await fetcher.create_match_suggestions(media_id, campaign_id, keyword)
-                        
-                        if success:
-                            logger.info(f"Created match suggestion for well-vetted media {media_id} (score: {vetting_score}) and campaign {campaign_id}")
-                        else:
-                            logger.warning(f"Failed to create match suggestion despite good vetting score for media {media_id}")
-                    else:
+                    # NEW WORKFLOW: Vet first, then create match suggestion if approved
+                    campaign_data = await campaign_queries.get_campaign_by_id_cached(campaign_id)
+                    if not campaign_data:
+                        logger.error(f"Campaign {campaign_id} not found for vetting")
+                        return False
+                    
+                    # Run AI vetting before creating match
+                    vetting_result = await vetting_agent.vet_media_for_campaign(media_id, campaign_data)
+                    
+                    if vetting_result.get('status') != 'success':
+                        logger.warning(f"Vetting failed for media {media_id} and campaign {campaign_id}: {vetting_result.get('message')}")
+                        return False
+                    
+                    vetting_score = vetting_result.get('vetting_score', 0)
+                    if vetting_score < min_vetting_score:
                         logger.info(f"Media {media_id} did not pass vetting for campaign {campaign_id} (score: {vetting_score} < {min_vetting_score})")
-                        success = False
-                else:
-                    logger.warning(f"Vetting failed for media {media_id} and campaign {campaign_id}: {vetting_result.get('message')}")
-                    success = False
-                
-                if success:
-                    created_count += 1
-                    logger.info(f"Successfully created match suggestion for media {media_id} and campaign {campaign_id}")
-                else:
-                    logger.warning(f"Failed to create match suggestion for media {media_id} and campaign {campaign_id}")
+                        return False
                     
-            except Exception as e:
-                logger.error(f"Error creating match for media {media_id} and campaign {campaign_id}: {e}", exc_info=True)
+                    # Create match suggestion only if vetting passes
+                    success = await fetcher.create_match_suggestions(media_id, campaign_id, keyword)
+                    if success:
+                        logger.info(f"Created match suggestion for well-vetted media {media_id} (score: {vetting_score}) and campaign {campaign_id}")
+                    else:
+                        logger.warning(f"Failed to create match suggestion despite good vetting score for media {media_id}")
+                    return bool(success)
+                except Exception as e:
+                    logger.error(f"Error creating match for media {media_id} and campaign {campaign_id}: {e}", exc_info=True)
+                    return False
+        
+        outcomes = await asyncio.gather(*(_vet_and_create(item) for item in ready_media))
+        created_count = sum(1 for created in outcomes if created)
         
         logger.info(f"Match creation completed. Created {created_count} new match suggestions from {len(ready_media)} ready media")
         return True
@@ -134,8 +128,7 @@ async def create_matches_for_enriched_media(db_service: DatabaseService) -> bool
         logger.error(f"Error during enriched media match creation: {e}", exc_info=True)
         return False
     finally:
-        # Restore original pool
-        connection.DB_POOL = original_pool
+        reset_workload(workload_token)
 
 async def score_potential_matches(
     db_service: DatabaseService,
@@ -2,6 +2,7 @@
 
 import logging
 from podcast_outreach.services.database_service import DatabaseService
+from podcast_outreach.database.connection import Workload, set_workload, reset_workload
 from podcast_outreach.services.media.episode_sync import main_episode_sync_orchestrator
 
 logger = logging.getLogger(__name__)
@@ -11,10 +12,8 @@ async def sync_episodes(db_service: DatabaseService) -> bool:
     Pure business logic function for episode synchronization.
     Assumes database resources are available via db_service.
     """
-    # Temporarily set the global pool for this event loop
-    from podcast_outreach.database import connection
-    original_pool = connection.DB_POOL
-    connection.DB_POOL = db_service.pool
+    # Queries made by this task (and tasks it starts) use the pipeline pool
+    workload_token = set_workload(Workload.PIPELINE)
     
     try:
         logger.info("Running episode sync")
@@ -25,8 +24,7 @@ async def sync_episodes(db_service: DatabaseService) -> bool:
         logger.error(f"Error during episode sync: {e}", exc_info=True)
         return False
     finally:
-        # Restore original pool
-        connection.DB_POOL = original_pool
+        reset_workload(workload_token)
 
 async def transcribe_episodes(db_service: DatabaseService) -> bool:
     """
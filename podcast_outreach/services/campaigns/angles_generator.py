@@ -4,10 +4,10 @@ import concurrent.futures
 import logging
 import time
 import os
-import random
 import json
 import traceback
 import re
+import hashlib
 from typing import Dict, Any, Optional, Tuple
 from datetime import datetime
 import uuid
@@ -19,10 +19,12 @@ from langchain.text_splitter import RecursiveCharacterTextSplitter
 
 # Project-specific services (UPDATED IMPORTS)
 from podcast_outreach.database.queries import campaigns as campaign_queries # Use modular query
+from podcast_outreach.database.queries import document_summaries as summary_queries
 from podcast_outreach.services.campaigns.questionnaire_social_processor import QuestionnaireSocialProcessor
-from podcast_outreach.integrations.google_docs import GoogleDocsService # Use new integration path
+from podcast_outreach.integrations.google_workspace import GoogleWorkspaceClient
 from podcast_outreach.services.ai.openai_client import OpenAIService # Use new AI service path
 from podcast_outreach.services.ai.tracker import tracker as ai_tracker # Use new AI tracker path
+from podcast_outreach.services.ai.rate_limiter import get_llm_limiter
 from podcast_outreach.utils.data_processor import extract_document_id # Use new utils path
 from podcast_outreach.services.campaigns.content_processor import ClientContentProcessor # Import ClientContentProcessor
 
@@ -33,6 +35,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Bump when the summarization prompts change so cached summaries are regenerated
+SUMMARY_PROMPT_VERSION = "v1"
+
 class AnglesProcessorPG:
     """
     Processes campaign data from PostgreSQL to generate bios and angles,
@@ -41,7 +46,7 @@ class AnglesProcessorPG:
     
     def __init__(self):
         # Initialize services
-        self.google_docs_service = GoogleDocsService()
+        self.google_workspace = GoogleWorkspaceClient()
         self.openai_service = OpenAIService() # Used for structuring Gemini's output
         
         self.gemini_model = ChatGoogleGenerativeAI(
@@ -129,13 +134,14 @@ class AnglesProcessorPG:
         loop = asyncio.get_running_loop()
         return await loop.run_in_executor(self.executor, func, *args)
 
-    async def _call_gemini_langchain(self, prompt: str, workflow_name: str, delay_seconds: float = 1.0) -> str:
+    async def _call_gemini_langchain(self, prompt: str, workflow_name: str) -> str:
         """Generates text using LangChain Gemini model with error handling and tracking."""
-        await asyncio.sleep(delay_seconds)
         start_time = time.time()
         try:
             messages = [HumanMessage(content=prompt)]
-            response = await self._run_in_executor(self.gemini_model.invoke, messages)
+            # Paced by the shared LLM limiter rather than fixed per-call sleeps
+            async with get_llm_limiter().slot():
+                response = await self._run_in_executor(self.gemini_model.invoke, messages)
             text_response = response.content
             
             execution_time = time.time() - start_time
@@ -157,36 +163,56 @@ class AnglesProcessorPG:
         except Exception as e:
             logger.error(f"Error during Gemini LangChain call for workflow '{workflow_name}': {e}")
             if "429" in str(e) or "quota" in str(e).lower() or "rate limit" in str(e).lower():
-                logger.warning("Rate limit hit. Consider increasing delay or checking quotas.")
+                logger.warning("Rate limit hit. Consider lowering LLM_MAX_CONCURRENCY/LLM_REQUESTS_PER_MINUTE or checking quotas.")
             # Depending on retry strategy, you might re-raise or return an error indicator
             raise # Re-raise for the caller to handle or for a potential outer retry mechanism
 
-    async def _get_gdoc_content_async(self, doc_link_or_id: Optional[str], doc_title_for_log: str) -> str:
-        """Fetches Google Doc content asynchronously given a link or ID."""
+    async def _get_gdoc_content_async(self, doc_link_or_id: Optional[str], doc_title_for_log: str) -> Tuple[str, Optional[str]]:
+        """
+        Fetches Google Doc content asynchronously given a link or ID.
+        Returns (content, summary cache key); the key is tied to the document revision.
+        """
         if not doc_link_or_id:
             logger.info(f"No document link/ID provided for {doc_title_for_log}, skipping fetch.")
-            return ""
+            return "", None
         
         doc_id = extract_document_id(doc_link_or_id)
         if not doc_id:
             logger.warning(f"Could not extract Google Doc ID from '{doc_link_or_id}' for {doc_title_for_log}.")
-            return ""
+            return "", None
         
         try:
             logger.info(f"Fetching content from Google Doc: {doc_title_for_log} (ID: {doc_id})")
-            await asyncio.sleep(random.uniform(0.5, 1.5)) # Small random delay
-            content = await self._run_in_executor(self.google_docs_service.get_document_content, doc_id)
+            content, revision_id = await self.google_workspace.get_document_content_with_revision(doc_id)
             logger.info(f"Successfully fetched content for {doc_title_for_log} (Length: {len(content)}).")
-            return content if content else ""
+            cache_key = f"gdoc:{doc_id}:{revision_id}" if revision_id else None
+            return (content if content else ""), cache_key
         except Exception as e:
             logger.error(f"Error fetching Google Doc {doc_title_for_log} (ID: {doc_id}): {e}\n{traceback.format_exc()}")
-            return "" # Return empty string on error to allow process to continue if possible
+            return "", None # Return empty string on error to allow process to continue if possible
 
-    async def _summarize_content_if_needed(self, content: str, title_for_log: str, max_length: int = 70000) -> str:
-        """Summarizes content if it exceeds max_length to prevent token overruns."""
+    async def _get_source_content_async(self, source: Optional[str], doc_title_for_log: str) -> Tuple[str, Optional[str]]:
+        """Resolves a source that is either a Google Doc link or inline text."""
+        if source and not source.startswith("https://docs.google.com/document/d/"):
+            return source, f"text:{hashlib.sha256(source.encode('utf-8')).hexdigest()}"
+        return await self._get_gdoc_content_async(source, doc_title_for_log)
+
+    async def _summarize_content_if_needed(self, content: str, title_for_log: str, max_length: int = 70000, cache_key: Optional[str] = None) -> str:
+        """
+        Summarizes content if it exceeds max_length to prevent token overruns.
+        Chunks are summarized concurrently (map) and then combined (reduce); the result
+        is cached per document revision when a cache_key is given.
+        """
         if not content or len(content) <= max_length:
             return content
         
+        summary_key = f"{cache_key}:{max_length}:{SUMMARY_PROMPT_VERSION}" if cache_key else None
+        if summary_key:
+            cached_summary = await summary_queries.get_summary(summary_key)
+            if cached_summary:
+                logger.info(f"Using cached summary for '{title_for_log}' ({summary_key}).")
+                return cached_summary
+
         logger.info(f"Content for '{title_for_log}' (length {len(content)}) exceeds max_length {max_length}. Summarizing...")
         try:
             # Using RecursiveCharacterTextSplitter for potentially better semantic chunking
@@ -195,19 +221,26 @@ class AnglesProcessorPG:
                 chunk_overlap=max_length//10, # 10% overlap
                 length_function=len
             )
-            chunks = text_splitter.split_text(content)
-            summarized_chunks = []
-
-            for i, chunk in enumerate(chunks):
-                if not chunk.strip(): continue
-                prompt = f"Summarize the following text for '{title_for_log}' (Part {i+1}/{len(chunks)}). Retain all key information, topics, unique perspectives, and important quotes:\n\n{chunk}"
-                summary_piece = await self._call_gemini_langchain(prompt, f"summarize_{title_for_log}", delay_seconds=1.0 + i*0.5)
-                summarized_chunks.append(summary_piece)
-                if len(summarized_chunks) > 1 and i < len(chunks) -1 : # Add some delay between summary calls
-                    await asyncio.sleep(1.0)
+            chunks = [chunk for chunk in text_splitter.split_text(content) if chunk.strip()]
+
+            # Map: summarize every chunk concurrently
+            summarized_chunks = await asyncio.gather(*(
+                self._call_gemini_langchain(
+                    f"Summarize the following text for '{title_for_log}' (Part {i+1}/{len(chunks)}). Retain all key information, topics, unique perspectives, and important quotes:\n\n{chunk}",
+                    f"summarize_{title_for_log}"
+                )
+                for i, chunk in enumerate(chunks)
+            ))
             
+            # Reduce: join the partial summaries, condensing them once more only if still too long
             final_summary = "\n\n---\n\n".join(summarized_chunks) # Join summaries with a clear separator
+            if len(final_summary) > max_length:
+                reduce_prompt = f"Combine the following partial summaries of '{title_for_log}' into a single summary under {max_length} characters. Retain all key information, topics, unique perspectives, and important quotes:\n\n{final_summary}"
+                final_summary = await self._call_gemini_langchain(reduce_prompt, f"summarize_{title_for_log}")
             logger.info(f"Summarized '{title_for_log}': Original length {len(content)}, Summary length {len(final_summary)}")
+
+            if summary_key and final_summary:
+                await summary_queries.upsert_summary(summary_key, final_summary)
             return final_summary
         except Exception as e:
             logger.error(f"Error summarizing content for '{title_for_log}': {e}. Returning truncated original.")
@@ -447,22 +480,23 @@ Generate the angles now:"""
             
             logger.info(f"Generating bio and angles for {extracted_data['full_name']} (Campaign: {campaign_id})")
             
-            # Also fetch any supplementary content if available
-            social_posts_input = campaign_pg.get("compiled_social_posts", "")
-            social_posts_content = ""
-            if social_posts_input:
-                if social_posts_input.startswith("https://docs.google.com/document/d/"):
-                        social_posts_content = await self._get_gdoc_content_async(social_posts_input, f"{campaign_name} - Social Posts")
-                else: # Assume direct text
-                    social_posts_content = social_posts_input
-            
-            podcast_transcripts_content = await self._get_gdoc_content_async(campaign_pg.get("podcast_transcript_link"), f"{campaign_name} - Podcast Transcripts")
-            articles_content = await self._get_gdoc_content_async(campaign_pg.get("compiled_articles_link"), f"{campaign_name} - Articles")
+            # Also fetch any supplementary content if available (all documents at once)
+            (
+                (social_posts_content, social_posts_key),
+                (podcast_transcripts_content, podcast_transcripts_key),
+                (articles_content, articles_key),
+            ) = await asyncio.gather(
+                self._get_source_content_async(campaign_pg.get("compiled_social_posts", ""), f"{campaign_name} - Social Posts"),
+                self._get_gdoc_content_async(campaign_pg.get("podcast_transcript_link"), f"{campaign_name} - Podcast Transcripts"),
+                self._get_gdoc_content_async(campaign_pg.get("compiled_articles_link"), f"{campaign_name} - Articles"),
+            )
 
             # Summarize supplementary content if necessary
-            summarized_social = await self._summarize_content_if_needed(social_posts_content, f"{campaign_name} - Social Posts", max_length=30000)
-            summarized_podcasts = await self._summarize_content_if_needed(podcast_transcripts_content, f"{campaign_name} - Podcast Transcripts", max_length=50000)
-            summarized_articles = await self._summarize_content_if_needed(articles_content, f"{campaign_name} - Articles", max_length=50000)
+            summarized_social, summarized_podcasts, summarized_articles = await asyncio.gather(
+                self._summarize_content_if_needed(social_posts_content, f"{campaign_name} - Social Posts", max_length=30000, cache_key=social_posts_key),
+                self._summarize_content_if_needed(podcast_transcripts_content, f"{campaign_name} - Podcast Transcripts", max_length=50000, cache_key=podcast_transcripts_key),
+                self._summarize_content_if_needed(articles_content, f"{campaign_name} - Articles", max_length=50000, cache_key=articles_key),
+            )
 
             # 2. Generate Bio using actual questionnaire data
             bio_prompt = self._create_bio_generation_prompt(extracted_data)
@@ -477,9 +511,6 @@ Generate the angles now:"""
                 if summarized_articles:
                     bio_prompt += f"\nArticles:\n{summarized_articles[:2000]}..."
             
-            logger.info(f"Generating Bio for '{campaign_name}' using Gemini...")
-            bio_response = await self._call_gemini_langchain(bio_prompt, "generate_bio", delay_seconds=1.5)
-
             # 3. Generate Angles using actual questionnaire data
             angles_prompt = self._create_angles_generation_prompt(extracted_data)
             
@@ -493,8 +524,12 @@ Generate the angles now:"""
                 if summarized_articles:
                     angles_prompt += f"\nArticles:\n{summarized_articles[:2000]}..."
             
-            logger.info(f"Generating Angles for '{campaign_name}' using Gemini...")
-            angles_response = await self._call_gemini_langchain(angles_prompt, "generate_angles", delay_seconds=1.5)
+            # Bio and angles are independent of each other; generate them together
+            logger.info(f"Generating Bio and Angles for '{campaign_name}' using Gemini...")
+            bio_response, angles_response = await asyncio.gather(
+                self._call_gemini_langchain(bio_prompt, "generate_bio"),
+                self._call_gemini_langchain(angles_prompt, "generate_angles"),
+            )
             
             # Format and clean the responses
             bio_text_content = bio_response if bio_response else "Bio generation failed."
@@ -523,27 +558,26 @@ Additional Context:
 """
 
             # 4. Create Google Docs for Bio and Angles
+            # Both docs are created concurrently (one request each) and shared in a single Drive batch
             logger.info(f"Creating Google Docs for '{campaign_name}'...")
-            await asyncio.sleep(1.0) # Small delay
             bio_gdoc_title = f"{extracted_data['full_name']} - Professional Bio"
-            bio_gdoc_link = await self._run_in_executor(self.google_docs_service.create_document, bio_gdoc_title, formatted_bio_content)
-            if bio_gdoc_link:
-                    bio_gdoc_id = extract_document_id(bio_gdoc_link)
-                    await self._run_in_executor(self.google_docs_service.share_document, bio_gdoc_id) # Share it
-                    logger.info(f"Bio GDoc created and shared: {bio_gdoc_link}")
-            else:
-                logger.error(f"Failed to create Bio GDoc for {campaign_name}")
-                # Handle GDoc creation failure - perhaps proceed without link or log error
-
-            await asyncio.sleep(1.5) # Small delay
             angles_gdoc_title = f"{extracted_data['full_name']} - Podcast Angles"
-            angles_gdoc_link = await self._run_in_executor(self.google_docs_service.create_document, angles_gdoc_title, formatted_angles_content)
-            if angles_gdoc_link:
-                angles_gdoc_id = extract_document_id(angles_gdoc_link)
-                await self._run_in_executor(self.google_docs_service.share_document, angles_gdoc_id) # Share it
-                logger.info(f"Angles GDoc created and shared: {angles_gdoc_link}")
-            else:
-                logger.error(f"Failed to create Angles GDoc for {campaign_name}")
+            bio_gdoc_link, angles_gdoc_link = await asyncio.gather(
+                self.google_workspace.create_document(bio_gdoc_title, formatted_bio_content),
+                self.google_workspace.create_document(angles_gdoc_title, formatted_angles_content),
+                return_exceptions=True
+            )
+            created_links = {}
+            for label, link in (("Bio", bio_gdoc_link), ("Angles", angles_gdoc_link)):
+                if isinstance(link, Exception) or not link:
+                    logger.error(f"Failed to create {label} GDoc for {campaign_name}: {link}")
+                else:
+                    created_links[label] = link
+            bio_gdoc_link = created_links.get("Bio")
+            angles_gdoc_link = created_links.get("Angles")
+            if created_links:
+                await self.google_workspace.share_files(extract_document_id(link) for link in created_links.values())
+                logger.info(f"GDocs created and shared: {', '.join(created_links.values())}")
 
             # 5. Generate Keywords based on actual content
             logger.info(f"Generating keywords for '{campaign_name}'...")
@@ -566,7 +600,7 @@ Client Angles:
 {angles_text_content[:3000]}
 
 Please respond with exactly 20 keywords separated by commas, no numbering or additional text:"""
-            generated_keywords = await self._call_gemini_langchain(keyword_generation_prompt, "generate_keywords", delay_seconds=1.0)
+            generated_keywords = await self._call_gemini_langchain(keyword_generation_prompt, "generate_keywords")
             # Clean up keywords: remove "Keywords:", newlines, excessive spacing.
             cleaned_keywords = generated_keywords.replace("Keywords:", "").strip()
             logger.info(f"Keywords generated for '{campaign_name}': {cleaned_keywords}")
@@ -16,6 +16,7 @@ from .bucket_manager import BucketManager, UpdateResult
 from .graph_state import GraphState, GraphStateManager, create_initial_graph_state
 from .graph_builder import build_conversation_graph, compile_conversation_graph
 from .conversation_orchestrator import ConversationOrchestrator
+from .runtime import ChatbotRuntime, get_chatbot_runtime
 
 # Phase 4: Intelligent Response Generation
 from .response_strategies import ResponseStrategyEngine, ConversationStyle, ResponseStrategy
@@ -48,6 +49,8 @@ __all__ = [
     'build_conversation_graph',
     'compile_conversation_graph',
     'ConversationOrchestrator',
+    'ChatbotRuntime',
+    'get_chatbot_runtime',
     # Phase 4
     'ResponseStrategyEngine',
     'ConversationStyle',
@@ -1,6 +1,6 @@
 # podcast_outreach/services/chatbot/agentic/agentic_adapter.py
 
-from typing import Dict, List, Optional, Any, Tuple
+from typing import AsyncIterator, Dict, List, Optional, Any, Tuple
 from uuid import UUID
 from datetime import datetime
 import json
@@ -8,6 +8,7 @@ import logging
 import os
 
 from .conversation_orchestrator import ConversationOrchestrator
+from .runtime import get_chatbot_runtime
 from .state_converter import StateConverter
 from .fallback_handler import FallbackHandler
 # from ..enhanced_nlp_processor import EnhancedNLPProcessor  # REMOVED - not needed
@@ -53,7 +54,7 @@ class AgenticChatbotAdapter:
         # Initialize components
         if self.use_agentic:
             try:
-                self.orchestrator = ConversationOrchestrator()
+                self.orchestrator = ConversationOrchestrator(get_chatbot_runtime(gemini_service))
                 self.state_converter = StateConverter()
                 self.fallback_handler = FallbackHandler()
                 logger.info("Agentic chatbot system initialized")
@@ -174,6 +175,58 @@ class AgenticChatbotAdapter:
                 )
             raise
     
+    async def stream_message(
+        self,
+        conversation_id: str,
+        message: str,
+        conversation_data: Dict[str, Any]
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Streaming variant of process_message
+        
+        Yields the orchestrator's ("stage", node) and ("response", text) events, then
+        ("done", legacy_response). Yields nothing if the conversation is not agentic.
+        """
+        if not self._should_use_agentic(conversation_data):
+            return
+        
+        try:
+            agentic_state = self.state_converter.legacy_to_agentic(
+                conversation_data
+            )
+            
+            async for event, data in self.orchestrator.stream_message(
+                message=message,
+                person_id=conversation_data['person_id'],
+                company_id=conversation_data['campaign_id'],
+                session_id=str(conversation_id),
+                existing_state=agentic_state
+            ):
+                if event != "result":
+                    yield event, data
+                    continue
+                
+                response, new_state = data
+                yield "done", self.state_converter.agentic_to_legacy_response(
+                    response=response,
+                    new_state=new_state,
+                    old_conversation_data=conversation_data
+                )
+            
+        except Exception as e:
+            logger.error(f"Error in agentic message streaming: {e}")
+            
+            if not self.fallback_enabled:
+                raise
+            fallback_response = await self.fallback_handler.handle_error(
+                error=e,
+                conversation_id=conversation_id,
+                message=message,
+                conversation_data=conversation_data
+            )
+            if fallback_response:
+                yield "done", fallback_response
+    
     async def complete_conversation(
         self,
         conversation_id: str,
@@ -1,16 +1,19 @@
 # podcast_outreach/services/chatbot/agentic/conversation_orchestrator.py
 
-from typing import Dict, Any, Optional, Tuple
+from typing import AsyncIterator, Dict, Any, Optional, Tuple
 from datetime import datetime
 import json
 import logging
 
-from .graph_builder import compile_conversation_graph
+from .runtime import ChatbotRuntime, get_chatbot_runtime
 from .graph_state import GraphState, create_initial_graph_state
 from .state_manager import StateManager, ChatbotState
 
 logger = logging.getLogger(__name__)
 
+# Graph nodes that write this turn's reply to generated_response
+REPLY_NODES = {"generate_response", "verify", "check_completion", "handle_error"}
+
 class ConversationOrchestrator:
     """
     Main orchestrator for agentic chatbot conversations using LangGraph
@@ -22,9 +25,11 @@ class ConversationOrchestrator:
     - Tracks analytics and performance
     """
     
-    def __init__(self):
+    def __init__(self, runtime: Optional[ChatbotRuntime] = None):
         """Initialize the conversation orchestrator"""
-        self.graph = compile_conversation_graph()
+        # The graph and its collaborators are shared process-wide; only sessions are per orchestrator
+        self.runtime = runtime or get_chatbot_runtime()
+        self.graph = self.runtime.graph
         self._active_sessions: Dict[str, GraphState] = {}
     
     async def process_message(
@@ -49,112 +54,187 @@ class ConversationOrchestrator:
             Tuple of (response_message, updated_state_dict)
         """
         try:
-            # Get or create session
-            if session_id and session_id in self._active_sessions:
-                graph_state = self._active_sessions[session_id]
-                logger.info(f"Resuming session {session_id}")
-            else:
-                # Create new or restore from existing state
-                if existing_state:
-                    # Restore from saved state
-                    logger.info(f"Existing state keys: {list(existing_state.keys())}")
-                    if 'buckets' in existing_state:
-                        bucket_count = len(existing_state.get('buckets', {}))
-                        logger.info(f"Existing state has {bucket_count} buckets: {list(existing_state['buckets'].keys())[:5]}...")
-                    
-                    # Ensure all buckets are present
-                    from .bucket_definitions import INFORMATION_BUCKETS
-                    if 'buckets' not in existing_state:
-                        existing_state['buckets'] = {}
-                    
-                    # Initialize missing buckets
-                    for bucket_id in INFORMATION_BUCKETS:
-                        if bucket_id not in existing_state['buckets']:
-                            existing_state['buckets'][bucket_id] = []
-                    
-                    logger.info(f"After initialization, state has {len(existing_state['buckets'])} buckets")
-                    
-                    chatbot_state = ChatbotState(**existing_state)
-                    graph_state = create_initial_graph_state(
-                        person_id, company_id, chatbot_state
-                    )
-                    # Preserve db_extracted_data if available
-                    if 'db_extracted_data' in existing_state:
-                        graph_state['db_extracted_data'] = existing_state['db_extracted_data']
-                    logger.info(f"Restored state for person {person_id}")
-                else:
-                    # Brand new conversation
-                    graph_state = create_initial_graph_state(person_id, company_id)
-                    logger.info(f"Started new conversation for person {person_id}")
-                
-                # Cache the session
-                if session_id:
-                    self._active_sessions[session_id] = graph_state
-            
-            # Update current message
-            graph_state['current_message'] = message
-            graph_state['current_message_timestamp'] = datetime.utcnow()
-            graph_state['total_messages'] += 1
-            
-            # Add message to conversation history
-            state_manager = StateManager(
-                conversation_id=session_id or graph_state['chatbot_state']['session_id'],
-                campaign_id=company_id,
-                person_id=person_id
+            graph_state, state_manager = self._start_turn(
+                message, person_id, company_id, session_id, existing_state
             )
-            state_manager.state = graph_state['chatbot_state']
-            state_manager.add_message("user", message)
-            graph_state['chatbot_state'] = state_manager.state
             
             # Process through graph
             logger.info(f"Processing message through graph: '{message[:50]}...'")
-            result = await self.graph.ainvoke(graph_state)
-            
-            # Extract response
-            response = result.get('generated_response', "I'm sorry, I couldn't process that message. Could you please try again?")
-            
-            # Add assistant message to history
-            state_manager.state = result['chatbot_state']
-            state_manager.add_message("assistant", response)
-            result['chatbot_state'] = state_manager.state
+            result = await self.graph.ainvoke(graph_state, config=self.runtime.config())
             
-            # Update momentum
-            result['conversation_momentum'] = self._calculate_momentum(result)
-            
-            # Cache updated state
-            if session_id:
-                self._active_sessions[session_id] = result
-            
-            # Prepare state for serialization
-            serializable_state = self._prepare_state_for_storage(result['chatbot_state'])
-            
-            # Log analytics
-            self._log_analytics(result)
-            
-            return response, serializable_state
+            return self._finish_turn(result, state_manager, session_id)
             
         except Exception as e:
             logger.error(f"Error processing message: {e}", exc_info=True)
-            
-            # Return graceful error response
-            error_response = (
-                "I apologize, but I encountered an error processing your message. "
-                "Your information has been saved, and you can continue where you left off."
+            return self._error_turn(person_id, company_id, existing_state)
+    
+    async def stream_message(
+        self,
+        message: str,
+        person_id: int,
+        company_id: str,
+        session_id: Optional[str] = None,
+        existing_state: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Streaming variant of process_message
+        
+        Yields ("stage", node_name) as each graph node finishes and ("response", text)
+        as soon as a node has produced the reply, before the turn is wrapped up.
+        The last item is ("result", (response_message, updated_state_dict)).
+        """
+        try:
+            graph_state, state_manager = self._start_turn(
+                message, person_id, company_id, session_id, existing_state
             )
             
-            # Return existing state if available
+            logger.info(f"Streaming message through graph: '{message[:50]}...'")
+            result = None
+            response_sent = False
+            async for mode, chunk in self.graph.astream(
+                graph_state, config=self.runtime.config(), stream_mode=["updates", "values"]
+            ):
+                if mode == "values":
+                    result = chunk
+                    continue
+                for node_name, update in chunk.items():
+                    yield "stage", node_name
+                    # Earlier nodes still carry a resumed session's previous reply, and a
+                    # reply followed by an error is replaced by the error node's reply
+                    if (not response_sent and node_name in REPLY_NODES and update
+                            and update.get('generated_response') and update.get('next_action') != 'error'):
+                        response_sent = True
+                        yield "response", update['generated_response']
+            
+            yield "result", self._finish_turn(result, state_manager, session_id)
+            
+        except Exception as e:
+            logger.error(f"Error streaming message: {e}", exc_info=True)
+            yield "result", self._error_turn(person_id, company_id, existing_state)
+    
+    def _start_turn(
+        self,
+        message: str,
+        person_id: int,
+        company_id: str,
+        session_id: Optional[str],
+        existing_state: Optional[Dict[str, Any]]
+    ) -> Tuple[GraphState, StateManager]:
+        """Restore or create the session's graph state and record the user message"""
+        # Get or create session
+        if session_id and session_id in self._active_sessions:
+            graph_state = self._active_sessions[session_id]
+            logger.info(f"Resuming session {session_id}")
+        else:
+            # Create new or restore from existing state
             if existing_state:
-                return error_response, existing_state
+                # Restore from saved state
+                logger.info(f"Existing state keys: {list(existing_state.keys())}")
+                if 'buckets' in existing_state:
+                    bucket_count = len(existing_state.get('buckets', {}))
+                    logger.info(f"Existing state has {bucket_count} buckets: {list(existing_state['buckets'].keys())[:5]}...")
+                
+                # Ensure all buckets are present
+                from .bucket_definitions import INFORMATION_BUCKETS
+                if 'buckets' not in existing_state:
+                    existing_state['buckets'] = {}
+                
+                # Initialize missing buckets
+                for bucket_id in INFORMATION_BUCKETS:
+                    if bucket_id not in existing_state['buckets']:
+                        existing_state['buckets'][bucket_id] = []
+                
+                logger.info(f"After initialization, state has {len(existing_state['buckets'])} buckets")
+                
+                chatbot_state = ChatbotState(**existing_state)
+                graph_state = create_initial_graph_state(
+                    person_id, company_id, chatbot_state
+                )
+                # Preserve db_extracted_data if available
+                if 'db_extracted_data' in existing_state:
+                    graph_state['db_extracted_data'] = existing_state['db_extracted_data']
+                logger.info(f"Restored state for person {person_id}")
             else:
-                # Create minimal state
-                minimal_state = {
-                    'person_id': person_id,
-                    'company_id': company_id,
-                    'buckets': {},
-                    'messages': [],
-                    'last_updated': datetime.utcnow().isoformat()
-                }
-                return error_response, minimal_state
+                # Brand new conversation
+                graph_state = create_initial_graph_state(person_id, company_id)
+                logger.info(f"Started new conversation for person {person_id}")
+            
+            # Cache the session
+            if session_id:
+                self._active_sessions[session_id] = graph_state
+        
+        # Update current message
+        graph_state['current_message'] = message
+        graph_state['current_message_timestamp'] = datetime.utcnow()
+        graph_state['total_messages'] += 1
+        
+        # Add message to conversation history
+        state_manager = StateManager(
+            conversation_id=session_id or graph_state['chatbot_state']['session_id'],
+            campaign_id=company_id,
+            person_id=person_id
+        )
+        state_manager.state = graph_state['chatbot_state']
+        state_manager.add_message("user", message)
+        graph_state['chatbot_state'] = state_manager.state
+        
+        return graph_state, state_manager
+    
+    def _finish_turn(
+        self,
+        result: GraphState,
+        state_manager: StateManager,
+        session_id: Optional[str]
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Record the reply and return (response_message, serializable_state)"""
+        # Extract response
+        response = result.get('generated_response', "I'm sorry, I couldn't process that message. Could you please try again?")
+        
+        # Add assistant message to history
+        state_manager.state = result['chatbot_state']
+        state_manager.add_message("assistant", response)
+        result['chatbot_state'] = state_manager.state
+        
+        # Update momentum
+        result['conversation_momentum'] = self._calculate_momentum(result)
+        
+        # Cache updated state
+        if session_id:
+            self._active_sessions[session_id] = result
+        
+        # Prepare state for serialization
+        serializable_state = self._prepare_state_for_storage(result['chatbot_state'])
+        
+        # Log analytics
+        self._log_analytics(result)
+        
+        return response, serializable_state
+    
+    def _error_turn(
+        self,
+        person_id: int,
+        company_id: str,
+        existing_state: Optional[Dict[str, Any]]
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Graceful error response with the state to keep"""
+        error_response = (
+            "I apologize, but I encountered an error processing your message. "
+            "Your information has been saved, and you can continue where you left off."
+        )
+        
+        # Return existing state if available
+        if existing_state:
+            return error_response, existing_state
+        else:
+            # Create minimal state
+            minimal_state = {
+                'person_id': person_id,
+                'company_id': company_id,
+                'buckets': {},
+                'messages': [],
+                'last_updated': datetime.utcnow().isoformat()
+            }
+            return error_response, minimal_state
     
     async def get_conversation_summary(
         self,
@@ -188,9 +268,7 @@ class ConversationOrchestrator:
             completion_percentage = (filled_required / total_required * 100) if total_required > 0 else 0
             
             # Get quality scores
-            from .bucket_manager import BucketManager
-            bucket_manager = BucketManager()
-            quality_scores = bucket_manager.get_bucket_quality_score(state_manager)
+            quality_scores = self.runtime.bucket_manager.get_bucket_quality_score(state_manager)
             
             # Build summary
             summary = {
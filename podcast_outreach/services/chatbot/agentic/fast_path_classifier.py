@@ -0,0 +1,256 @@
+# podcast_outreach/services/chatbot/agentic/fast_path_classifier.py
+
+"""
+Deterministic tiers in front of the AI message classifier.
+
+Most onboarding turns are either a bare contact detail ("jane@acme.com",
+"555-123-4567", a LinkedIn URL) or a short reply such as "yes", "looks good" or
+"show me what you have". Those are classified locally:
+
+1. rules        - the message is nothing but extracted entities (plus filler
+                  words like "my email is"), mapped straight to their buckets
+2. local_model  - a TF-IDF nearest-neighbour model over labelled example
+                  phrases recognises short acknowledgment/completion/review turns
+3. llm          - everything else, and anything the first two tiers are unsure
+                  about, goes to Gemini as before
+
+Per-tier counts and hit rates are kept process-wide and exposed on /health.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+from collections import Counter
+import math
+import os
+import re
+import threading
+
+from .message_classifier import ClassificationResult
+from .state_manager import StateManager
+
+CHATBOT_FAST_PATH_ENABLED = os.getenv("CHATBOT_FAST_PATH_ENABLED", "true").lower() == "true"
+# Cosine similarity the nearest labelled example must reach for the local model to answer
+CHATBOT_FAST_PATH_MIN_SIMILARITY = float(os.getenv("CHATBOT_FAST_PATH_MIN_SIMILARITY", "0.75"))
+# Longer messages usually carry information and always go to the LLM
+CHATBOT_FAST_PATH_MAX_WORDS = int(os.getenv("CHATBOT_FAST_PATH_MAX_WORDS", "6"))
+
+TIER_RULES = "rules"
+TIER_LOCAL_MODEL = "local_model"
+TIER_LLM = "llm"
+TIERS = (TIER_RULES, TIER_LOCAL_MODEL, TIER_LLM)
+
+# Entity -> (bucket, confidence); the same mapping the AI-failure fallback uses
+ENTITY_BUCKETS = {
+    'email': ('email', 0.95),
+    'phone': ('phone', 0.9),
+    'linkedin': ('linkedin_url', 0.95),
+}
+
+# Words that may surround a contact detail without adding meaning
+FILLER_WORDS = {
+    'my', 'email', 'e', 'mail', 'address', 'is', 'its', 'it', 'here', 'heres', 'phone',
+    'number', 'cell', 'mobile', 'linkedin', 'profile', 'url', 'link', 'you', 'can',
+    'reach', 'me', 'at', 'on', 'and', 'the', 'sure', 'ok', 'okay', 'yes', 'yeah',
+}
+
+# Words that flip or qualify a short reply; such turns are left to the LLM
+NEGATION_WORDS = {
+    'no', 'not', 'nope', 'dont', 'don', 'never', 'wait', 'but', 'change', 'actually',
+    'wrong', 'incorrect', 'fix', 'update', 'instead', 'except', 'without',
+}
+
+INTENT_EXAMPLES: Dict[str, List[str]] = {
+    'acknowledgment': [
+        "yes", "yeah", "yep", "yup", "sure", "ok", "okay", "sounds good", "looks good",
+        "looks great", "all good", "that's right", "that is correct", "correct", "perfect",
+        "great", "got it", "thanks", "thank you", "yes that's correct", "everything looks good",
+        "confirmed", "yes please", "that works", "looks good to me", "sounds great", "ok sure",
+    ],
+    'completion': [
+        "i'm done", "done", "complete", "submit", "finalize", "finish", "let's finish",
+        "that's all", "that's everything", "submit my profile", "complete my profile",
+        "finalize my media kit", "i'm finished", "wrap it up", "ready to submit",
+    ],
+    'review': [
+        "review", "summary", "show summary", "show me what you have", "what do you have so far",
+        "review my information", "show my profile", "can i see my profile", "show me my info",
+        "what have i told you", "let me review", "show me my details", "review please",
+    ],
+}
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+_ENTITY_SPAN_RES = [
+    re.compile(r'\S*linkedin\.com/in/[\w-]+\S*', re.I),
+    re.compile(r'\b[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\b'),
+    re.compile(r'(?:\+?1[-.\s]?)?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}'),
+]
+
+
+def _words(text: str) -> List[str]:
+    return _WORD_RE.findall(text.lower().replace("'", ""))
+
+
+class LocalIntentModel:
+    """TF-IDF (word unigrams and character trigrams) nearest neighbour over labelled phrases"""
+
+    def __init__(self, examples: Dict[str, List[str]]):
+        docs = [
+            (intent, self._features(text))
+            for intent, texts in examples.items()
+            for text in texts
+        ]
+        document_frequency = Counter(feature for _, features in docs for feature in features)
+        n = len(docs)
+        self.idf = {
+            feature: math.log((1 + n) / (1 + count)) + 1
+            for feature, count in document_frequency.items()
+        }
+        # Features never seen in training still count towards the query's norm
+        self.unseen_idf = math.log(1 + n) + 1
+        self.examples = [(intent, self._vector(features)) for intent, features in docs]
+
+    @staticmethod
+    def _features(text: str) -> Counter:
+        words = _words(text)
+        features = Counter(f"w:{word}" for word in words)
+        padded = f" {' '.join(words)} "
+        features.update(f"c:{padded[i:i + 3]}" for i in range(len(padded) - 2))
+        return features
+
+    def _vector(self, features: Counter) -> Tuple[Dict[str, float], float]:
+        vector = {
+            feature: count * self.idf.get(feature, self.unseen_idf)
+            for feature, count in features.items()
+        }
+        norm = math.sqrt(sum(weight * weight for weight in vector.values())) or 1.0
+        return vector, norm
+
+    def predict(self, text: str) -> Tuple[Optional[str], float]:
+        """Returns (intent, cosine similarity) of the closest labelled example"""
+        query, query_norm = self._vector(self._features(text))
+        best_intent, best_score = None, 0.0
+        for intent, (vector, norm) in self.examples:
+            dot = sum(weight * vector[feature] for feature, weight in query.items() if feature in vector)
+            score = dot / (query_norm * norm)
+            if score > best_score:
+                best_intent, best_score = intent, score
+        return best_intent, best_score
+
+
+class ClassificationTierStats:
+    """Process-wide counters of which tier answered each classification"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counts = Counter({tier: 0 for tier in TIERS})
+        self.llm_errors = 0
+
+    def record(self, tier: str) -> None:
+        with self._lock:
+            self.counts[tier] += 1
+
+    def record_llm_error(self) -> None:
+        with self._lock:
+            self.llm_errors += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            total = sum(self.counts.values())
+            return {
+                "total": total,
+                "tiers": {
+                    tier: {
+                        "count": self.counts[tier],
+                        "hit_rate": round(self.counts[tier] / total, 4) if total else 0.0,
+                    }
+                    for tier in TIERS
+                },
+                "llm_errors": self.llm_errors,
+            }
+
+
+classification_tier_stats = ClassificationTierStats()
+
+
+def get_classification_tier_stats() -> Dict[str, Any]:
+    return classification_tier_stats.snapshot()
+
+
+class FastPathClassifier:
+    """Rule and local-model tiers; returns None when the message should go to the LLM"""
+
+    def __init__(self, min_similarity: float = CHATBOT_FAST_PATH_MIN_SIMILARITY, max_words: int = CHATBOT_FAST_PATH_MAX_WORDS):
+        self.intent_model = LocalIntentModel(INTENT_EXAMPLES)
+        self.min_similarity = min_similarity
+        self.max_words = max_words
+
+    def classify(
+        self,
+        message: str,
+        state: StateManager,
+        entities: Dict[str, Any]
+    ) -> Optional[Tuple[str, ClassificationResult]]:
+        """Returns (tier, result) for a confidently classified message, else None"""
+        if entities:
+            result = self._classify_entities(message, state, entities)
+            return (TIER_RULES, result) if result else None
+        result = self._classify_short_reply(message, state)
+        return (TIER_LOCAL_MODEL, result) if result else None
+
+    def _classify_entities(
+        self,
+        message: str,
+        state: StateManager,
+        entities: Dict[str, Any]
+    ) -> Optional[ClassificationResult]:
+        # Only contact details map unambiguously to a bucket; websites, years etc. need context
+        unsupported = set(entities) - set(ENTITY_BUCKETS)
+        if 'linkedin' in entities:
+            unsupported.discard('website')  # A LinkedIn URL also matches the website pattern
+        if unsupported:
+            return None
+
+        remainder = message
+        for pattern in _ENTITY_SPAN_RES:
+            remainder = pattern.sub(" ", remainder)
+        if any(word not in FILLER_WORDS for word in _words(remainder)):
+            return None
+
+        bucket_updates = {}
+        for entity, value in entities.items():
+            if entity not in ENTITY_BUCKETS:
+                continue
+            bucket_id, confidence = ENTITY_BUCKETS[entity]
+            # Replacing a value already given may be a correction; the LLM decides that
+            if state.get_bucket_value(bucket_id):
+                return None
+            bucket_updates[bucket_id] = (value, confidence)
+
+        return ClassificationResult(
+            bucket_updates=bucket_updates,
+            user_intent='provide_info',
+            intent_confidence=0.95,
+            ambiguous=False,
+            detected_entities=entities
+        )
+
+    def _classify_short_reply(self, message: str, state: StateManager) -> Optional[ClassificationResult]:
+        words = _words(message)
+        if not words or len(words) > self.max_words or any(word.isdigit() for word in words):
+            return None
+        if NEGATION_WORDS.intersection(words):
+            return None
+        # "Type 'yes' to submit" after the completion check: acknowledgment and
+        # completion lead to different nodes there, so keep the LLM's judgement
+        if state.state.get('awaiting_confirmation') == 'completion':
+            return None
+
+        intent, score = self.intent_model.predict(message)
+        if intent is None or score < self.min_similarity:
+            return None
+        return ClassificationResult(
+            bucket_updates={},
+            user_intent=intent,
+            intent_confidence=round(score, 3),
+            ambiguous=False,
+            detected_entities={}
+        )
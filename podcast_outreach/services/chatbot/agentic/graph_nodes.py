@@ -4,18 +4,23 @@ from typing import Dict, Any, List, Optional
 from datetime import datetime
 import logging
 
+from langchain_core.runnables import RunnableConfig
+
 from .graph_state import GraphState, GraphStateManager
 from .state_manager import StateManager
-from .message_classifier import MessageClassifier, ClassificationResult
-from .bucket_manager import BucketManager
+from .message_classifier import ClassificationResult
 from .bucket_definitions import INFORMATION_BUCKETS
-from .response_builder import ResponseBuilder
+from .runtime import get_chatbot_runtime, runtime_from_config
 
 logger = logging.getLogger(__name__)
 
 # Node functions for LangGraph
+#
+# Nodes take their classifier, bucket manager and response builder from the
+# ChatbotRuntime passed in the LangGraph config (see runtime.py) instead of
+# constructing them per message.
 
-async def classification_node(state: GraphState) -> GraphState:
+async def classification_node(state: GraphState, config: Optional[RunnableConfig] = None) -> GraphState:
     """
     Classify the current message to extract intents and bucket updates
     
@@ -26,8 +31,7 @@ async def classification_node(state: GraphState) -> GraphState:
     4. Determines the next action
     """
     try:
-        # Initialize classifier
-        classifier = MessageClassifier()
+        classifier = runtime_from_config(config).classifier
         
         # Create state manager from chatbot state
         state_manager = StateManager(
@@ -65,7 +69,7 @@ async def classification_node(state: GraphState) -> GraphState:
         return state
 
 
-async def bucket_update_node(state: GraphState) -> GraphState:
+async def bucket_update_node(state: GraphState, config: Optional[RunnableConfig] = None) -> GraphState:
     """
     Update buckets based on classification results
     
@@ -81,8 +85,8 @@ async def bucket_update_node(state: GraphState) -> GraphState:
             state['next_action'] = 'generate_response'
             return state
         
-        # Initialize bucket manager
-        manager = BucketManager()
+        runtime = runtime_from_config(config)
+        manager = runtime.bucket_manager
         
         # Create state manager
         state_manager = StateManager(
@@ -169,9 +173,7 @@ async def bucket_update_node(state: GraphState) -> GraphState:
             if linkedin_url:
                 logger.info(f"LinkedIn URL provided: {linkedin_url}. Analyzing profile...")
                 
-                # Import LinkedIn analyzer
-                from podcast_outreach.services.chatbot.linkedin_analyzer import LinkedInAnalyzer
-                analyzer = LinkedInAnalyzer()
+                analyzer = runtime.linkedin_analyzer
                 
                 try:
                     # Analyze the LinkedIn profile
@@ -242,7 +244,7 @@ async def bucket_update_node(state: GraphState) -> GraphState:
         return state
 
 
-async def response_generation_node(state: GraphState) -> GraphState:
+async def response_generation_node(state: GraphState, config: Optional[RunnableConfig] = None) -> GraphState:
     """
     Generate an appropriate response based on current state
     
@@ -261,8 +263,7 @@ async def response_generation_node(state: GraphState) -> GraphState:
         )
         state_manager.state = state['chatbot_state']
         
-        # Use the new ResponseBuilder
-        response_builder = ResponseBuilder()
+        response_builder = runtime_from_config(config).response_builder
         response = await response_builder.build_response(state, state_manager)
         
         # Ensure response is a string
@@ -297,7 +298,7 @@ async def response_generation_node(state: GraphState) -> GraphState:
         return state
 
 
-async def verification_node(state: GraphState) -> GraphState:
+async def verification_node(state: GraphState, config: Optional[RunnableConfig] = None) -> GraphState:
     """
     Verify ambiguous input or confirm user intent
     
@@ -311,7 +312,7 @@ async def verification_node(state: GraphState) -> GraphState:
             state['next_action'] = 'generate_response'
             return state
         
-        classifier = MessageClassifier()
+        classifier = runtime_from_config(config).classifier
         
         # Generate clarification message
         clarification = classifier.create_clarification_message(
@@ -538,7 +539,7 @@ def _determine_response_strategy(state: GraphState, state_manager: StateManager)
         return 'ask_required'
     
     # Optional buckets
-    bucket_manager = BucketManager()
+    bucket_manager = get_chatbot_runtime().bucket_manager
     suggestions = bucket_manager.suggest_next_buckets(state_manager)
     if suggestions:
         return 'ask_optional'
@@ -554,7 +555,7 @@ async def _generate_response(
 ) -> str:
     """Generate response based on strategy"""
     
-    bucket_manager = BucketManager()
+    bucket_manager = get_chatbot_runtime().bucket_manager
     
     if strategy == 'acknowledge_correction':
         corrected = state['update_result'].corrections_applied
@@ -23,13 +23,45 @@ class ClassificationResult:
     needs_clarification: Optional[str] = None
     detected_entities: Dict[str, Any] = None
 
+def render_bucket_info() -> str:
+    """Render INFORMATION_BUCKETS as the bucket list used in the classification prompt"""
+    bucket_lines = []
+    
+    try:
+        for bucket_id, bucket_def in INFORMATION_BUCKETS.items():
+            if hasattr(bucket_def, 'example_inputs') and bucket_def.example_inputs:
+                examples = " | ".join(bucket_def.example_inputs[:2])
+            else:
+                examples = "No examples available"
+            
+            if hasattr(bucket_def, 'description'):
+                description = bucket_def.description
+            else:
+                description = f"Information about {bucket_id}"
+            
+            bucket_lines.append(
+                f"- {bucket_id}: {description} (Examples: {examples})"
+            )
+    except Exception as e:
+        logger.error(f"Error preparing bucket info: {e}")
+        raise
+    
+    return "\n".join(bucket_lines)
+
 class MessageClassifier:
     """AI-powered message classifier for bucket routing and intent detection"""
     
-    def __init__(self, gemini_service: Optional[GeminiService] = None):
+    def __init__(self, gemini_service: Optional[GeminiService] = None, bucket_info: Optional[str] = None):
         self.gemini_service = gemini_service or GeminiService()
+        # The bucket definitions are static, so the prompt fragment is rendered once
+        self.bucket_info = bucket_info or render_bucket_info()
         self.model_name = "gemini-2.0-flash"
         
+        # Rule and local-model tiers that answer clear-cut turns without a Gemini call
+        from .fast_path_classifier import CHATBOT_FAST_PATH_ENABLED, FastPathClassifier, classification_tier_stats
+        self.fast_path = FastPathClassifier() if CHATBOT_FAST_PATH_ENABLED else None
+        self.tier_stats = classification_tier_stats
+        
         # Entity extractors for objective patterns (emails, URLs, etc)
         # These are kept because they extract specific formatted data
         self.entity_extractors = {
@@ -60,13 +92,24 @@ class MessageClassifier:
         # Extract entities (emails, phone numbers, etc) - these are objective
         entities = self._extract_entities(message)
         
-        # Use AI for all intent classification and bucket mapping
+        # Bare contact details and short confirmations never need the LLM
+        if self.fast_path:
+            fast_result = self.fast_path.classify(message, state, entities)
+            if fast_result:
+                tier, result = fast_result
+                self.tier_stats.record(tier)
+                logger.debug(f"Classified via {tier} tier - Intent: {result.user_intent}")
+                return result
+        
+        # Use AI for everything else
+        self.tier_stats.record('llm')
         try:
             ai_result = await self._ai_classification(message, state, context_window, entities)
             return ai_result
             
         except Exception as e:
             logger.error(f"AI classification failed: {e}", exc_info=True)
+            self.tier_stats.record_llm_error()
             # Fallback: if we at least extracted entities, use them
             bucket_updates = {}
             if entities.get('email'):
@@ -183,28 +226,7 @@ class MessageClassifier:
     
     def _prepare_bucket_info(self) -> str:
         """Prepare bucket information for AI context"""
-        bucket_lines = []
-        
-        try:
-            for bucket_id, bucket_def in INFORMATION_BUCKETS.items():
-                if hasattr(bucket_def, 'example_inputs') and bucket_def.example_inputs:
-                    examples = " | ".join(bucket_def.example_inputs[:2])
-                else:
-                    examples = "No examples available"
-                
-                if hasattr(bucket_def, 'description'):
-                    description = bucket_def.description
-                else:
-                    description = f"Information about {bucket_id}"
-                
-                bucket_lines.append(
-                    f"- {bucket_id}: {description} (Examples: {examples})"
-                )
-        except Exception as e:
-            logger.error(f"Error preparing bucket info: {e}")
-            raise
-        
-        return "\n".join(bucket_lines)
+        return self.bucket_info
     
     def _build_classification_prompt(
         self,
@@ -0,0 +1,76 @@
+# podcast_outreach/services/chatbot/agentic/runtime.py
+
+"""
+Process-wide chatbot runtime.
+
+Everything the conversation graph needs that does not depend on a particular
+conversation lives here and is built once per process: the compiled LangGraph
+app, the LLM client, the message classifier, the bucket manager, the response
+builder, the LinkedIn analyzer and the rendered INFORMATION_BUCKETS prompt
+fragment. The orchestrator passes the runtime to graph nodes through the
+LangGraph config, so handling a message no longer constructs any of them.
+"""
+
+from typing import Any, Optional
+import logging
+
+from podcast_outreach.services.ai.gemini_client import GeminiService
+from .message_classifier import MessageClassifier, render_bucket_info
+from .bucket_manager import BucketManager
+from .response_builder import ResponseBuilder
+
+logger = logging.getLogger(__name__)
+
+
+class ChatbotRuntime:
+    """Shared, conversation-independent collaborators for the agentic chatbot"""
+
+    def __init__(self, gemini_service: Optional[GeminiService] = None):
+        self.gemini_service = gemini_service or GeminiService()
+        self.bucket_info = render_bucket_info()
+        self.classifier = MessageClassifier(self.gemini_service, bucket_info=self.bucket_info)
+        self.bucket_manager = BucketManager()
+        self.response_builder = ResponseBuilder()
+        self._linkedin_analyzer = None
+        self._graph = None
+
+    @property
+    def linkedin_analyzer(self):
+        """Created on first use; it needs the Apify key and most conversations never reach it"""
+        if self._linkedin_analyzer is None:
+            from podcast_outreach.services.chatbot.linkedin_analyzer import LinkedInAnalyzer
+            self._linkedin_analyzer = LinkedInAnalyzer(gemini_service=self.gemini_service)
+        return self._linkedin_analyzer
+
+    @property
+    def graph(self):
+        """The compiled conversation graph, compiled once per process"""
+        if self._graph is None:
+            from .graph_builder import compile_conversation_graph
+            self._graph = compile_conversation_graph()
+            logger.info("Compiled chatbot conversation graph")
+        return self._graph
+
+    def config(self) -> dict:
+        """LangGraph invoke config that hands this runtime to the graph nodes"""
+        return {"configurable": {"runtime": self}}
+
+
+_runtime: Optional[ChatbotRuntime] = None
+
+
+def get_chatbot_runtime(gemini_service: Optional[GeminiService] = None) -> ChatbotRuntime:
+    """
+    Returns the process-wide runtime, creating it on first call. The first caller
+    may hand over its LLM client so the runtime reuses it instead of opening another.
+    """
+    global _runtime
+    if _runtime is None:
+        _runtime = ChatbotRuntime(gemini_service)
+    return _runtime
+
+
+def runtime_from_config(config: Optional[Any]) -> ChatbotRuntime:
+    """Runtime injected through the LangGraph config, or the process-wide one"""
+    configurable = (config or {}).get("configurable") or {}
+    return configurable.get("runtime") or get_chatbot_runtime()
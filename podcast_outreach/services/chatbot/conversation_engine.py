@@ -4,7 +4,7 @@ import asyncio
 import json
 import os
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple, Any
+from typing import AsyncIterator, Dict, List, Optional, Tuple, Any
 from uuid import UUID
 
 from podcast_outreach.logging_config import get_logger
@@ -21,6 +21,9 @@ from podcast_outreach.services.campaigns.angles_generator import AnglesProcessor
 
 logger = get_logger(__name__)
 
+# Marks the end of a streamed turn's event queue
+_STREAM_END = object()
+
 class ConversationEngine:
     def __init__(self, gemini_service: GeminiService = None, use_ai: bool = False):
         self.gemini_service = gemini_service or GeminiService()
@@ -31,6 +34,8 @@ class ConversationEngine:
         self.model_name = "gemini-2.0-flash"
         # Track asked questions per conversation
         self.conversation_states = {}
+        # Conversation writes still running after a streamed reply, keyed by conversation_id
+        self._pending_writes: Dict[str, asyncio.Task] = {}
         
         # AI integration layer removed - using agentic system exclusively
         
@@ -152,6 +157,9 @@ class ConversationEngine:
     async def process_message(self, conversation_id: str, message: str) -> Dict:
         """Process a user message and generate response"""
         try:
+            # A streamed turn may still be saving; load only after it lands
+            await self._wait_for_pending_write(conversation_id)
+            
             # Load conversation with campaign data
             conv = await conv_queries.get_conversation_with_campaign_data(UUID(conversation_id))
             if not conv:
@@ -166,44 +174,7 @@ class ConversationEngine:
                 )
                 
                 if agentic_response:
-                    # Update conversation with agentic response
-                    messages = json.loads(conv['messages'])
-                    messages.extend([
-                        {
-                            "type": "user",
-                            "content": message,
-                            "timestamp": datetime.utcnow().isoformat()
-                        },
-                        {
-                            "type": "bot",
-                            "content": agentic_response['bot_message'],
-                            "timestamp": datetime.utcnow().isoformat()
-                        }
-                    ])
-                    
-                    # Update metadata with state flags from agentic response
-                    metadata = json.loads(conv.get('conversation_metadata', '{}'))
-                    
-                    # Get metadata from agentic response
-                    response_metadata = agentic_response.get('metadata', {})
-                    
-                    # Simple update - merge response metadata into existing metadata
-                    # This preserves existing fields and adds/updates from response
-                    metadata.update(response_metadata)
-                    
-                    # Also check top-level fields for backward compatibility
-                    if 'awaiting_confirmation' in agentic_response:
-                        metadata['awaiting_confirmation'] = agentic_response['awaiting_confirmation']
-                    
-                    await conv_queries.update_conversation(
-                        UUID(conversation_id),
-                        messages,
-                        agentic_response.get('extracted_data', {}),
-                        metadata,
-                        agentic_response.get('phase', 'processing'),
-                        agentic_response.get('progress', 0)
-                    )
-                    
+                    await self._save_agentic_turn(conversation_id, conv, message, agentic_response)
                     return agentic_response
             
             # Agentic system is required
@@ -213,9 +184,123 @@ class ConversationEngine:
             logger.exception(f"Error processing message: {e}")
             raise
     
+    async def stream_message(self, conversation_id: str, message: str) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Streaming variant of process_message. Yields ("stage", node) and ("response", text)
+        while the turn runs and ("done", response) with the same payload process_message
+        returns. The conversation row is written after "done", off the request's path.
+        
+        The turn itself runs in a separate task that feeds this generator through a queue.
+        A client disconnect cancels the generator but not the turn, so the agentic session
+        state and the saved messages cannot drift apart.
+        """
+        await self._wait_for_pending_write(conversation_id)
+        
+        conv = await conv_queries.get_conversation_with_campaign_data(UUID(conversation_id))
+        if not conv:
+            raise ValueError("Active conversation not found")
+        if not self.agentic_adapter:
+            raise ValueError("Agentic adapter not available")
+        
+        events: asyncio.Queue = asyncio.Queue()
+        turn = asyncio.create_task(self._run_streamed_turn(conversation_id, conv, message, events))
+        self._track_pending_write(conversation_id, turn)
+        
+        while True:
+            item = await events.get()
+            if item is _STREAM_END:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    
+    async def _run_streamed_turn(self, conversation_id: str, conv: Dict, message: str, events: asyncio.Queue) -> None:
+        """Runs one streamed turn to completion and saves it, whether or not anyone is still reading `events`."""
+        agentic_response = None
+        try:
+            async for event, data in self.agentic_adapter.stream_message(
+                conversation_id=conversation_id,
+                message=message,
+                conversation_data=conv
+            ):
+                if event == "done":
+                    agentic_response = data
+                events.put_nowait((event, data))
+            if agentic_response is None:
+                raise ValueError("Agentic adapter not available")
+        except asyncio.CancelledError:
+            events.put_nowait(ValueError("Chatbot turn was cancelled"))
+            raise
+        except Exception as e:
+            events.put_nowait(e)
+            return
+        
+        events.put_nowait(_STREAM_END)
+        await self._save_agentic_turn(conversation_id, conv, message, agentic_response)
+    
+    def _track_pending_write(self, conversation_id: str, task: asyncio.Task) -> None:
+        """Registers the task that will save the conversation's latest turn, so the next turn waits for it."""
+        self._pending_writes[conversation_id] = task
+        
+        def _done(finished: asyncio.Task) -> None:
+            if self._pending_writes.get(conversation_id) is finished:
+                del self._pending_writes[conversation_id]
+            if not finished.cancelled() and finished.exception():
+                logger.error(f"Saving streamed turn for conversation {conversation_id} failed: {finished.exception()}")
+        
+        task.add_done_callback(_done)
+    
+    async def _wait_for_pending_write(self, conversation_id: str) -> None:
+        task = self._pending_writes.get(conversation_id)
+        if task:
+            # Failures are logged by the task's callback; the next turn proceeds either way
+            await asyncio.wait([task])
+    
+    async def _save_agentic_turn(self, conversation_id: str, conv: Dict, message: str, agentic_response: Dict) -> None:
+        """Append the exchange to the conversation and store the new state"""
+        # Update conversation with agentic response
+        messages = json.loads(conv['messages'])
+        messages.extend([
+            {
+                "type": "user",
+                "content": message,
+                "timestamp": datetime.utcnow().isoformat()
+            },
+            {
+                "type": "bot",
+                "content": agentic_response['bot_message'],
+                "timestamp": datetime.utcnow().isoformat()
+            }
+        ])
+        
+        # Update metadata with state flags from agentic response
+        metadata = json.loads(conv.get('conversation_metadata', '{}'))
+        
+        # Get metadata from agentic response
+        response_metadata = agentic_response.get('metadata', {})
+        
+        # Simple update - merge response metadata into existing metadata
+        # This preserves existing fields and adds/updates from response
+        metadata.update(response_metadata)
+        
+        # Also check top-level fields for backward compatibility
+        if 'awaiting_confirmation' in agentic_response:
+            metadata['awaiting_confirmation'] = agentic_response['awaiting_confirmation']
+        
+        await conv_queries.update_conversation(
+            UUID(conversation_id),
+            messages,
+            agentic_response.get('extracted_data', {}),
+            metadata,
+            agentic_response.get('phase', 'processing'),
+            agentic_response.get('progress', 0)
+        )
+    
     async def complete_conversation(self, conversation_id: str) -> Dict:
         """Complete the conversation and process final data"""
         try:
+            await self._wait_for_pending_write(conversation_id)
+            
             # Get full conversation
             conv = await conv_queries.get_conversation_by_id(UUID(conversation_id))
             if not conv:
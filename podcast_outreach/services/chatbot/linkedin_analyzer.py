@@ -10,9 +10,9 @@ from podcast_outreach.logging_config import get_logger
 logger = get_logger(__name__)
 
 class LinkedInAnalyzer:
-    def __init__(self):
+    def __init__(self, gemini_service: Optional[GeminiService] = None):
         self.social_scraper = SocialDiscoveryService()
-        self.gemini_service = GeminiService()
+        self.gemini_service = gemini_service or GeminiService()
         
     async def analyze_profile(self, linkedin_url: str) -> Dict:
         """Analyze LinkedIn profile and extract relevant data for chatbot"""
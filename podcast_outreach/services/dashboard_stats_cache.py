@@ -0,0 +1,113 @@
+# podcast_outreach/services/dashboard_stats_cache.py
+
+"""
+Short-lived per-person cache for dashboard statistics.
+
+Entries are fresh for DASHBOARD_STATS_TTL_SECONDS. After that, and until
+DASHBOARD_STATS_STALE_SECONDS, the stale value is served immediately while a
+single background refresh reloads it (stale-while-revalidate). Match, vetting
+and review events on the event bus drop cached entries so dashboards pick up
+those changes on the next request.
+"""
+
+import os
+import time
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+from podcast_outreach.services.events.event_bus import Event, EventType, get_event_bus
+
+logger = logging.getLogger(__name__)
+
+DASHBOARD_STATS_TTL_SECONDS = float(os.getenv("DASHBOARD_STATS_TTL_SECONDS", "5"))
+DASHBOARD_STATS_STALE_SECONDS = float(os.getenv("DASHBOARD_STATS_STALE_SECONDS", "30"))
+
+# Events that change what the dashboard counts
+INVALIDATING_EVENTS = (
+    EventType.MATCH_CREATED,
+    EventType.VETTING_COMPLETED,
+    EventType.MATCH_APPROVED,
+    EventType.MATCH_REJECTED,
+)
+
+
+class DashboardStatsCache:
+    """Per-key TTL cache with stale-while-revalidate and single-flight loads."""
+
+    def __init__(self, ttl: float = DASHBOARD_STATS_TTL_SECONDS, stale_ttl: float = DASHBOARD_STATS_STALE_SECONDS):
+        self.ttl = ttl
+        self.stale_ttl = max(stale_ttl, ttl)
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        # Bumped on invalidation so a load that raced with a change is not stored
+        self._version = 0
+
+    async def _load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        version_before = self._version
+        try:
+            value = await loader()
+        finally:
+            self._inflight.pop(key, None)
+        if self._version == version_before:
+            self._entries[key] = (time.monotonic(), value)
+        return value
+
+    def _start_load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> asyncio.Task:
+        task = self._inflight.get(key)
+        if task is None or task.done():
+            task = asyncio.ensure_future(self._load(key, loader))
+            task.add_done_callback(self._log_load_error)
+            self._inflight[key] = task
+        return task
+
+    async def get(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        if self.ttl <= 0:
+            return await loader()
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            age = time.monotonic() - entry[0]
+            if age < self.ttl:
+                return entry[1]
+            if age < self.stale_ttl:
+                self._start_load(key, loader)
+                return entry[1]
+
+        return await asyncio.shield(self._start_load(key, loader))
+
+    @staticmethod
+    def _log_load_error(task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Dashboard stats load failed: {task.exception()}")
+
+    def invalidate(self, key: Hashable) -> None:
+        self._version += 1
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._version += 1
+        self._entries.clear()
+
+
+dashboard_stats_cache = DashboardStatsCache()
+
+# Key for unscoped (internal staff) dashboard stats
+ALL_PEOPLE_KEY = "all"
+
+
+async def handle_dashboard_invalidation(event: Event) -> None:
+    """Event bus handler: the affected person's entry and the unscoped (staff) entry go stale."""
+    person_id = (event.data or {}).get("person_id")
+    if person_id is None:
+        # Events usually carry only a campaign_id; entries are tiny, so drop them all
+        dashboard_stats_cache.clear()
+    else:
+        dashboard_stats_cache.invalidate(int(person_id))
+        dashboard_stats_cache.invalidate(ALL_PEOPLE_KEY)
+
+
+def register_dashboard_cache_invalidation() -> None:
+    bus = get_event_bus()
+    for event_type in INVALIDATING_EVENTS:
+        bus.subscribe(event_type, handle_dashboard_invalidation)
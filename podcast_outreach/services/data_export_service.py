@@ -0,0 +1,150 @@
+# podcast_outreach/services/data_export_service.py
+
+"""
+GDPR data export jobs.
+
+An export streams the person's rows from server-side cursors into a ZIP of NDJSON
+files (one per section, plus manifest.json), written to a temporary file a batch
+of rows at a time. The finished artifact is uploaded to S3, or kept under
+DATA_EXPORT_LOCAL_DIR when S3 is not configured, and the client downloads it
+through the job's download endpoint. Memory use is bounded by the write batch,
+not by how much data the person has.
+"""
+
+import os
+import json
+import uuid
+import shutil
+import asyncio
+import logging
+import tempfile
+import threading
+import zipfile
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional, Tuple
+
+from podcast_outreach.config import BACKEND_URL
+from podcast_outreach.database.queries import data_exports as export_queries
+from podcast_outreach.database.queries import people as people_queries
+from podcast_outreach.services.email_service import email_service
+from podcast_outreach.services.storage_service import storage_service
+
+logger = logging.getLogger(__name__)
+
+DATA_EXPORT_BATCH_ROWS = int(os.getenv("DATA_EXPORT_BATCH_ROWS", "500"))
+DATA_EXPORT_RETENTION_DAYS = int(os.getenv("DATA_EXPORT_RETENTION_DAYS", "7"))
+DATA_EXPORT_LOCAL_DIR = os.getenv("DATA_EXPORT_LOCAL_DIR", "data_exports")
+# A pending/running job older than this is treated as abandoned and a new export may start
+DATA_EXPORT_STALE_SECONDS = int(os.getenv("DATA_EXPORT_STALE_SECONDS", "3600"))
+
+EXPORT_CONTENT_TYPE = "application/zip"
+
+
+class ExportCancelled(Exception):
+    pass
+
+
+def export_download_url(export_id: uuid.UUID) -> str:
+    return f"{BACKEND_URL}/users/export-data/{export_id}/download"
+
+
+def export_filename(job: Dict[str, Any]) -> str:
+    return f"pgl-data-export-{job['created_at']:%Y%m%d}.zip"
+
+
+async def _write_export_archive(person_id: int, path: str, stop_flag: Optional[threading.Event]) -> Dict[str, int]:
+    """Streams every export section into a ZIP at `path`. Returns row counts per section."""
+    counts = {section: 0 for section in export_queries.EXPORT_SECTIONS}
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        section_file = None
+        current_section = None
+        batch = []
+
+        async def flush():
+            if batch:
+                data = ("\n".join(batch) + "\n").encode()
+                batch.clear()
+                # Compression and disk writes stay off the event loop
+                await asyncio.to_thread(section_file.write, data)
+
+        try:
+            async for section, row_json in export_queries.stream_person_export(person_id, prefetch=DATA_EXPORT_BATCH_ROWS):
+                if section != current_section:
+                    await flush()
+                    if section_file is not None:
+                        section_file.close()
+                    section_file = archive.open(f"{section}.ndjson", "w", force_zip64=True)
+                    current_section = section
+                batch.append(row_json)
+                counts[section] += 1
+                if len(batch) >= DATA_EXPORT_BATCH_ROWS:
+                    await flush()
+                    if stop_flag is not None and stop_flag.is_set():
+                        raise ExportCancelled()
+            await flush()
+        finally:
+            if section_file is not None:
+                section_file.close()
+
+        archive.writestr("manifest.json", json.dumps({
+            "person_id": person_id,
+            "generated_at": datetime.now(timezone.utc).isoformat(),
+            "format": "One JSON object per line in each <section>.ndjson file",
+            "row_counts": counts,
+        }, indent=2))
+    return counts
+
+
+async def _store_artifact(job: Dict[str, Any], tmp_path: str) -> Tuple[str, str]:
+    """Moves the finished archive to S3 (or the local export dir). Returns (storage, object_key)."""
+    if storage_service.s3_client:
+        object_key = f"exports/{job['person_id']}/{job['export_id']}.zip"
+        uploaded = await asyncio.to_thread(storage_service.upload_file, tmp_path, object_key, EXPORT_CONTENT_TYPE)
+        if not uploaded:
+            raise RuntimeError("Uploading the export artifact failed")
+        return "s3", object_key
+
+    os.makedirs(DATA_EXPORT_LOCAL_DIR, exist_ok=True)
+    local_path = os.path.join(DATA_EXPORT_LOCAL_DIR, f"{job['export_id']}.zip")
+    await asyncio.to_thread(shutil.move, tmp_path, local_path)
+    return "local", local_path
+
+
+async def run_data_export(export_id: uuid.UUID, stop_flag: Optional[threading.Event] = None) -> bool:
+    """Builds, stores and announces one export job."""
+    job = await export_queries.get_export_job(export_id)
+    if not job:
+        logger.error(f"[DataExport {export_id}] Job not found.")
+        return False
+
+    person_id = job["person_id"]
+    logger.info(f"[DataExport {export_id}] Starting export for person {person_id}...")
+    await export_queries.mark_export_running(export_id)
+
+    fd, tmp_path = tempfile.mkstemp(prefix="data-export-", suffix=".zip")
+    os.close(fd)
+    try:
+        counts = await _write_export_archive(person_id, tmp_path, stop_flag)
+        size_bytes = os.path.getsize(tmp_path)
+        storage, object_key = await _store_artifact(job, tmp_path)
+        expires_at = datetime.now(timezone.utc) + timedelta(days=DATA_EXPORT_RETENTION_DAYS)
+        await export_queries.mark_export_completed(export_id, storage, object_key, size_bytes, counts, expires_at)
+        logger.info(f"[DataExport {export_id}] Completed: {size_bytes} bytes, rows {counts}.")
+    except ExportCancelled:
+        logger.info(f"[DataExport {export_id}] Cancelled.")
+        await export_queries.mark_export_failed(export_id, "Export was cancelled.")
+        return False
+    except Exception as e:
+        logger.error(f"[DataExport {export_id}] Export failed: {e}", exc_info=True)
+        await export_queries.mark_export_failed(export_id, str(e))
+        return False
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    person = await people_queries.get_person_by_id_from_db(person_id)
+    if person and person.get("email"):
+        await email_service.send_data_export_ready_email(
+            person["email"], person.get("full_name"), export_download_url(export_id), expires_at
+        )
+    return True
@@ -0,0 +1,288 @@
+# podcast_outreach/services/email/outbox_worker.py
+
+"""
+Delivery worker for the transactional email outbox.
+
+EmailService only inserts rows into email_outbox. This worker claims due rows in
+batches and sends them over one authenticated SMTP session that stays open
+between batches (reconnecting only when the server drops it or it sits idle),
+so messages no longer pay for a TCP connect, STARTTLS and AUTH each. smtplib is
+blocking, so the session lives on a dedicated single-thread executor and the
+event loop never waits on SMTP. Failed messages are retried with exponential
+backoff up to EMAIL_OUTBOX_MAX_ATTEMPTS.
+"""
+
+import os
+import time
+import asyncio
+import logging
+import smtplib
+from concurrent.futures import ThreadPoolExecutor
+from email.mime.text import MIMEText
+from email.mime.multipart import MIMEMultipart
+from typing import Any, Dict, List, Optional, Tuple
+
+from podcast_outreach.database.queries import email_outbox as outbox_queries
+
+logger = logging.getLogger(__name__)
+
+EMAIL_OUTBOX_ENABLED = os.getenv("EMAIL_OUTBOX_ENABLED", "true").lower() == "true"
+EMAIL_OUTBOX_BATCH_SIZE = int(os.getenv("EMAIL_OUTBOX_BATCH_SIZE", "50"))
+EMAIL_OUTBOX_POLL_SECONDS = float(os.getenv("EMAIL_OUTBOX_POLL_SECONDS", "5"))
+EMAIL_OUTBOX_MAX_ATTEMPTS = int(os.getenv("EMAIL_OUTBOX_MAX_ATTEMPTS", "6"))
+EMAIL_OUTBOX_BACKOFF_BASE_SECONDS = float(os.getenv("EMAIL_OUTBOX_BACKOFF_BASE_SECONDS", "30"))
+EMAIL_OUTBOX_BACKOFF_MAX_SECONDS = float(os.getenv("EMAIL_OUTBOX_BACKOFF_MAX_SECONDS", "3600"))
+# Rows stuck in 'sending' this long (worker crashed mid-batch) are claimed again
+EMAIL_OUTBOX_STALE_SECONDS = int(os.getenv("EMAIL_OUTBOX_STALE_SECONDS", "600"))
+SMTP_IDLE_TIMEOUT_SECONDS = float(os.getenv("SMTP_IDLE_TIMEOUT_SECONDS", "60"))
+SMTP_TIMEOUT_SECONDS = float(os.getenv("SMTP_TIMEOUT_SECONDS", "30"))
+
+
+def build_message(from_name: str, from_email: str, to_email: str, subject: str, html_body: str, text_body: str) -> MIMEMultipart:
+    msg = MIMEMultipart('alternative')
+    msg['Subject'] = subject
+    msg['From'] = f"{from_name} <{from_email}>"
+    msg['To'] = to_email
+    msg['Reply-To'] = from_email
+    msg.attach(MIMEText(text_body, 'plain'))
+    msg.attach(MIMEText(html_body, 'html'))
+    return msg
+
+
+class SMTPSession:
+    """A reusable SMTP connection. Not thread-safe; only the worker's executor thread uses it."""
+
+    def __init__(
+        self,
+        server: str,
+        port: int,
+        username: Optional[str],
+        password: Optional[str],
+        use_tls: bool = True,
+        timeout: float = SMTP_TIMEOUT_SECONDS,
+        idle_timeout: float = SMTP_IDLE_TIMEOUT_SECONDS,
+    ):
+        self.server = server
+        self.port = port
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+        self.timeout = timeout
+        self.idle_timeout = idle_timeout
+        self._smtp: Optional[smtplib.SMTP] = None
+        self._last_used = 0.0
+        self.connects = 0
+
+    @classmethod
+    def from_env(cls) -> "SMTPSession":
+        return cls(
+            server=os.getenv('SMTP_SERVER', 'smtp.gmail.com'),
+            port=int(os.getenv('SMTP_PORT', '587')),
+            username=os.getenv('SMTP_USERNAME'),
+            password=os.getenv('SMTP_PASSWORD'),
+            use_tls=os.getenv('SMTP_USE_TLS', 'true').lower() == 'true',
+        )
+
+    def _connect(self) -> smtplib.SMTP:
+        smtp = smtplib.SMTP(self.server, self.port, timeout=self.timeout)
+        try:
+            if self.use_tls:
+                smtp.starttls()
+            if self.username and self.password:
+                smtp.login(self.username, self.password)
+        except Exception:
+            smtp.close()
+            raise
+        self.connects += 1
+        logger.debug(f"Opened SMTP session to {self.server}:{self.port}")
+        return smtp
+
+    def _session(self) -> smtplib.SMTP:
+        if self._smtp is not None and time.monotonic() - self._last_used > self.idle_timeout:
+            # Servers drop idle sessions; check before reusing one that sat unused
+            try:
+                if self._smtp.noop()[0] != 250:
+                    self.close()
+            except smtplib.SMTPException:
+                self.close()
+            except OSError:
+                self.close()
+        if self._smtp is None:
+            self._smtp = self._connect()
+        return self._smtp
+
+    def send_batch(self, messages: List[Tuple[int, MIMEMultipart]]) -> List[Tuple[int, Optional[str]]]:
+        """Sends each (outbox_id, message) over the shared session. Returns (outbox_id, error or None)."""
+        results: List[Tuple[int, Optional[str]]] = []
+        for outbox_id, msg in messages:
+            error: Optional[str] = None
+            # One reconnect per message covers a session the server closed since the last send
+            for attempt in (1, 2):
+                try:
+                    self._session().send_message(msg)
+                    error = None
+                    break
+                except (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError, OSError) as e:
+                    self.close()
+                    error = f"{type(e).__name__}: {e}"
+                except smtplib.SMTPException as e:
+                    # Rejected sender/recipient/data; the session itself is still usable
+                    error = f"{type(e).__name__}: {e}"
+                    break
+            results.append((outbox_id, error))
+            self._last_used = time.monotonic()
+        return results
+
+    def close_if_idle(self) -> None:
+        if self._smtp is not None and time.monotonic() - self._last_used > self.idle_timeout:
+            self.close()
+
+    def close(self) -> None:
+        smtp, self._smtp = self._smtp, None
+        if smtp is None:
+            return
+        try:
+            smtp.quit()
+        except Exception:
+            smtp.close()
+
+
+class EmailOutboxWorker:
+    """Background task that drains email_outbox through a persistent SMTP session."""
+
+    def __init__(self, session: Optional[SMTPSession] = None, batch_size: int = EMAIL_OUTBOX_BATCH_SIZE):
+        self.session = session or SMTPSession.from_env()
+        self.batch_size = batch_size
+        self.from_email = os.getenv('FROM_EMAIL', os.getenv('SMTP_USERNAME'))
+        self.from_name = os.getenv('EMAIL_FROM_NAME', 'PGL System')
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._task: Optional[asyncio.Task] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.sent = 0
+        self.failed = 0
+
+    async def start(self) -> None:
+        if self._task is not None and not self._task.done():
+            return
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="smtp-outbox")
+        self._task = asyncio.create_task(self._run())
+        logger.info(f"Email outbox worker started (batch size {self.batch_size}).")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._executor is not None:
+            await self._loop.run_in_executor(self._executor, self.session.close)
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        logger.info("Email outbox worker stopped.")
+
+    def notify(self) -> None:
+        """Wakes the worker after an enqueue so the email goes out without waiting for the next poll."""
+        if self._wake is None or self._loop is None or self._loop.is_closed():
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            self._wake.set()
+        else:
+            self._loop.call_soon_threadsafe(self._wake.set)
+
+    async def process_batch(self) -> int:
+        """Claims, sends and records one batch. Returns the number of emails claimed."""
+        rows = await outbox_queries.claim_due_emails(self.batch_size, EMAIL_OUTBOX_STALE_SECONDS, EMAIL_OUTBOX_MAX_ATTEMPTS)
+        if not rows:
+            return 0
+        messages = [
+            (row['outbox_id'], build_message(
+                self.from_name, self.from_email, row['to_email'], row['subject'], row['html_body'], row['text_body']
+            ))
+            for row in rows
+        ]
+        results = await self._loop.run_in_executor(self._executor, self.session.send_batch, messages)
+
+        sent_ids = [outbox_id for outbox_id, error in results if error is None]
+        failures = [(outbox_id, error) for outbox_id, error in results if error is not None]
+        await outbox_queries.mark_emails_sent(sent_ids)
+        await outbox_queries.mark_emails_failed(
+            failures, EMAIL_OUTBOX_MAX_ATTEMPTS, EMAIL_OUTBOX_BACKOFF_BASE_SECONDS, EMAIL_OUTBOX_BACKOFF_MAX_SECONDS
+        )
+        self.sent += len(sent_ids)
+        self.failed += len(failures)
+        if failures:
+            logger.warning(f"Email outbox: {len(failures)} of {len(rows)} email(s) failed; first error: {failures[0][1]}")
+        logger.info(f"Email outbox: sent {len(sent_ids)} email(s).")
+        return len(rows)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                claimed = await self.process_batch()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Email outbox batch failed: {e}", exc_info=True)
+                claimed = 0
+            if claimed >= self.batch_size:
+                continue  # More may be due; keep draining
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=EMAIL_OUTBOX_POLL_SECONDS)
+            except asyncio.TimeoutError:
+                await self._loop.run_in_executor(self._executor, self.session.close_if_idle)
+                try:
+                    abandoned = await outbox_queries.fail_abandoned_emails(EMAIL_OUTBOX_STALE_SECONDS, EMAIL_OUTBOX_MAX_ATTEMPTS)
+                    if abandoned:
+                        logger.warning(f"Email outbox: failed {abandoned} email(s) abandoned on their last attempt.")
+                except Exception as e:
+                    logger.error(f"Email outbox cleanup failed: {e}", exc_info=True)
+            self._wake.clear()
+
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "running": self.is_running(),
+            "sent": self.sent,
+            "failed": self.failed,
+            "smtp_connects": self.session.connects,
+        }
+
+
+email_outbox_worker = EmailOutboxWorker()
+
+
+async def start_email_outbox_worker() -> None:
+    if EMAIL_OUTBOX_ENABLED:
+        await email_outbox_worker.start()
+
+
+async def send_email_now(to_email: str, subject: str, html_body: str, text_body: str) -> Optional[str]:
+    """
+    Sends one email over a short-lived SMTP session, for processes where the
+    outbox worker is disabled or not running. Returns the error, or None if sent.
+    """
+    session = SMTPSession.from_env()
+    msg = build_message(
+        os.getenv('EMAIL_FROM_NAME', 'PGL System'), os.getenv('FROM_EMAIL', os.getenv('SMTP_USERNAME')),
+        to_email, subject, html_body, text_body
+    )
+    try:
+        [(_, error)] = await asyncio.to_thread(session.send_batch, [(0, msg)])
+    finally:
+        await asyncio.to_thread(session.close)
+    return error
+
+
+async def stop_email_outbox_worker() -> None:
+    await email_outbox_worker.stop()
@@ -1,11 +1,12 @@
 import logging
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
 from typing import Optional, Dict, Any
+from datetime import datetime
 import os
 from dotenv import load_dotenv
 
+from podcast_outreach.database.queries import email_outbox as email_outbox_queries
+from podcast_outreach.services.email.outbox_worker import email_outbox_worker, send_email_now
+
 # Load environment variables
 load_dotenv()
 
@@ -16,8 +17,6 @@ class EmailService:
     
     def __init__(self):
         # Configure these via environment variables
-        self.smtp_server = os.getenv('SMTP_SERVER', 'smtp.gmail.com')
-        self.smtp_port = int(os.getenv('SMTP_PORT', '587'))
         self.smtp_username = os.getenv('SMTP_USERNAME')
         self.smtp_password = os.getenv('SMTP_PASSWORD')
         self.from_email = os.getenv('FROM_EMAIL', self.smtp_username)
@@ -78,42 +77,73 @@ class EmailService:
             logger.error(f"Failed to send password reset email to {to_email}: {e}")
             return False
     
-    async def _send_email(self, to_email: str, subject: str, html_body: str, text_body: str) -> bool:
-        """Send email using SMTP"""
+    async def send_data_export_ready_email(self, to_email: str, full_name: Optional[str], download_url: str, expires_at: datetime) -> bool:
+        """Send the link to a finished data export"""
         try:
-            # Validate credentials
-            if not self.smtp_username or not self.smtp_password:
-                logger.error("SMTP credentials not configured properly")
-                return False
-                
-            # Create message
-            msg = MIMEMultipart('alternative')
-            msg['Subject'] = subject
-            # Format the From field with name and email
-            msg['From'] = f"{self.from_name} <{self.from_email}>"
-            msg['To'] = to_email
-            # Add Reply-To header
-            msg['Reply-To'] = self.from_email
-            
-            # Add text and HTML parts
-            text_part = MIMEText(text_body, 'plain')
-            html_part = MIMEText(html_body, 'html')
-            
-            msg.attach(text_part)
-            msg.attach(html_part)
-            
-            # Send email
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.smtp_username, self.smtp_password)
-                server.send_message(msg)
-            
-            logger.info(f"Email sent successfully to {to_email}: {subject}")
-            return True
+            subject = "Your PGL System Data Export is Ready"
+            expires_text = expires_at.strftime('%B %d, %Y')
+            
+            html_body = f"""
+            <html>
+            <body>
+                <h2>Your Data Export is Ready</h2>
+                <p>Hello {full_name or 'there'},</p>
+                <p>The export of your PGL System data you requested is ready to download.</p>
+                <p><a href="{download_url}" style="background-color: #007bff; color: white; padding: 10px 20px; text-decoration: none; border-radius: 5px;">Download My Data</a></p>
+                <p>Or copy and paste this link into your browser (you will need to be signed in):</p>
+                <p>{download_url}</p>
+                <p><strong>This download is available until {expires_text}.</strong></p>
+                <p>The ZIP file contains one JSON-lines file per type of data and a manifest.json describing it.</p>
+                <p>Best regards,<br>The PGL System Team</p>
+            </body>
+            </html>
+            """
+            
+            text_body = f"""
+            Your Data Export is Ready
+            
+            Hello {full_name or 'there'},
+            
+            The export of your PGL System data you requested is ready to download.
+            
+            Download it here (you will need to be signed in):
+            {download_url}
+            
+            This download is available until {expires_text}.
+            
+            Best regards,
+            The PGL System Team
+            """
+            
+            return await self._send_email(to_email, subject, html_body, text_body)
             
         except Exception as e:
-            logger.error(f"SMTP error sending email to {to_email}: {e}")
+            logger.error(f"Failed to send data export email to {to_email}: {e}")
+            return False
+    
+    async def _send_email(self, to_email: str, subject: str, html_body: str, text_body: str) -> bool:
+        """Queue an email in the outbox; the outbox worker delivers it over a reused SMTP session"""
+        # Validate credentials
+        if not self.smtp_username or not self.smtp_password:
+            logger.error("SMTP credentials not configured properly")
+            return False
+
+        if not email_outbox_worker.is_running():
+            # Outbox disabled, or a script/entrypoint without the lifespan worker: nothing would deliver a queued row
+            error = await send_email_now(to_email, subject, html_body, text_body)
+            if error:
+                logger.error(f"Failed to send email to {to_email}: {error}")
+                return False
+            logger.info(f"Email sent to {to_email}: {subject}")
+            return True
+
+        outbox_id = await email_outbox_queries.enqueue_email(to_email, subject, html_body, text_body)
+        if outbox_id is None:
             return False
+
+        email_outbox_worker.notify()
+        logger.info(f"Email to {to_email} queued for delivery (outbox_id={outbox_id}): {subject}")
+        return True
     
     async def send_verification_email(self, to_email: str, token: str, full_name: str) -> bool:
         """Send email verification email"""
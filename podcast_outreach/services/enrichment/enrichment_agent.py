@@ -23,6 +23,7 @@ from podcast_outreach.database.queries import media as media_queries
 
 # Tavily search
 from podcast_outreach.services.ai.tavily_client import async_tavily_search
+from podcast_outreach.utils.http_sessions import get_http_session
 from dotenv import load_dotenv
 
 logger = logging.getLogger(__name__)
@@ -95,25 +96,25 @@ class EnrichmentAgent:
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(rss_url, headers=headers, timeout=aiohttp.ClientTimeout(total=10)) as response:
-                    if response.status != 200:
-                        return None
-                    
-                    content = await response.text()
-                    soup = BeautifulSoup(content, 'xml')
-                    
-                    # Try various title fields in RSS
-                    title_fields = ['title', 'itunes:title']
-                    for field in title_fields:
-                        title_elem = soup.find(field)
-                        if title_elem and title_elem.get_text():
-                            title = title_elem.get_text().strip()
-                            if title and title.lower() not in ['', 'none', 'null']:
-                                return title
-                    
+            session = get_http_session("rss")
+            async with session.get(rss_url, headers=headers, timeout=aiohttp.ClientTimeout(total=10)) as response:
+                if response.status != 200:
                     return None
-                    
+                
+                content = await response.text()
+                soup = BeautifulSoup(content, 'xml')
+                
+                # Try various title fields in RSS
+                title_fields = ['title', 'itunes:title']
+                for field in title_fields:
+                    title_elem = soup.find(field)
+                    if title_elem and title_elem.get_text():
+                        title = title_elem.get_text().strip()
+                        if title and title.lower() not in ['', 'none', 'null']:
+                            return title
+                
+                return None
+                
         except Exception as e:
             logger.debug(f"Error discovering podcast name from RSS {rss_url}: {e}")
             return None
@@ -13,11 +13,10 @@ from typing import Dict, Any, Optional, List
 # Import specific query functions from the modular queries packages
 from podcast_outreach.database.queries import media as media_queries
 from podcast_outreach.database.queries.episodes import flag_specific_episodes_for_transcription
-from podcast_outreach.database.models.media_models import EnrichedPodcastProfile
 
 # Import services
 from .enrichment_agent import EnrichmentAgent
-from .quality_score import QualityService
+from .quality_score import QualityService, quality_input_arrays, compute_quality_score_arrays
 from .social_scraper import SocialDiscoveryService
 from .host_confidence_verifier import HostConfidenceVerifier
 
@@ -63,8 +62,30 @@ class EnrichmentOrchestrator:
         
         return cleaned_data
 
+    # Media URL column, and the media column each platform's follower count is written to
+    SOCIAL_REFRESH_PLATFORMS = {
+        "twitter": ("podcast_twitter_url", "twitter_followers"),
+        "instagram": ("podcast_instagram_url", "instagram_followers"),
+        "tiktok": ("podcast_tiktok_url", "tiktok_followers"),
+        "linkedin": ("podcast_linkedin_url", "linkedin_connections"),
+    }
+
+    def _plan_social_refresh(self, media_batch: List[Dict[str, Any]]) -> Dict[str, Dict[str, List[int]]]:
+        """Groups the batch's profile URLs per platform: {platform: {url: [media_id, ...]}}."""
+        plan: Dict[str, Dict[str, List[int]]] = {platform: {} for platform in self.SOCIAL_REFRESH_PLATFORMS}
+        for media_data in media_batch:
+            for platform, (url_column, _) in self.SOCIAL_REFRESH_PLATFORMS.items():
+                url = media_data.get(url_column)
+                if url:
+                    plan[platform].setdefault(url, []).append(media_data['media_id'])
+        return {platform: urls for platform, urls in plan.items() if urls}
+
     async def run_social_stats_refresh(self, batch_size: int = 20):
-        """Refreshes only social media follower counts for stale records."""
+        """
+        Refreshes only social media follower counts for stale records.
+        Stale URLs from the whole batch are grouped per platform so each platform costs one
+        actor run per chunk rather than one per media, and results are written in one bulk update.
+        """
         logger.info("Starting social stats refresh batch...")
         refresh_interval = ORCHESTRATOR_CONFIG["social_stats_refresh_interval_hours"]
         media_to_refresh = await media_queries.get_media_for_social_refresh(batch_size, refresh_interval)
@@ -73,67 +94,58 @@ class EnrichmentOrchestrator:
             logger.info("No media items found needing social stats refresh.")
             return
 
-        for media_data in media_to_refresh:
-            media_id = media_data['media_id']
-            logger.info(f"Refreshing social stats for media_id: {media_id}")
-            
-            try:
-                social_urls_to_scrape = {
-                    "twitter": media_data.get("podcast_twitter_url"),
-                    "instagram": media_data.get("podcast_instagram_url"),
-                    "tiktok": media_data.get("podcast_tiktok_url"),
-                    "linkedin": media_data.get("podcast_linkedin_url"),
-                }
-                
-                update_payload = {}
-                
-                # Twitter
-                if url := social_urls_to_scrape.get("twitter"):
-                    twitter_data_map = await self.social_discovery_service.get_twitter_data_for_urls([url])
-                    if twitter_data_map and (twitter_data := twitter_data_map.get(url)):
-                        update_payload["twitter_followers"] = twitter_data.get('followers_count')
-
-                # Instagram
-                if url := social_urls_to_scrape.get("instagram"):
-                    insta_data_map = await self.social_discovery_service.get_instagram_data_for_urls([url])
-                    if insta_data_map and (insta_data := insta_data_map.get(url)):
-                        update_payload["instagram_followers"] = insta_data.get('followers_count')
-                
-                # TikTok
-                if url := social_urls_to_scrape.get("tiktok"):
-                    tiktok_data_map = await self.social_discovery_service.get_tiktok_data_for_urls([url])
-                    if tiktok_data_map and (tiktok_data := tiktok_data_map.get(url)):
-                        update_payload["tiktok_followers"] = tiktok_data.get('followers_count')
-
-                # LinkedIn
-                if url := social_urls_to_scrape.get("linkedin"):
-                    linkedin_data_map = await self.social_discovery_service.get_linkedin_data_for_urls([url])
-                    if linkedin_data_map and (linkedin_data := linkedin_data_map.get(url)):
-                        update_payload["linkedin_connections"] = linkedin_data.get('followers_count') or linkedin_data.get('connections_count')
-
-                # Always update the timestamp to prevent immediate re-checking
-                update_payload["social_stats_last_fetched_at"] = datetime.now(timezone.utc)
-                
-                if len(update_payload) > 1: # Only update if new data was actually fetched
-                    await media_queries.update_media_enrichment_data(media_id, update_payload)
-                    logger.info(f"Successfully updated social stats for media_id: {media_id}. Payload: {update_payload}")
-                    
-                    # Trigger quality score update since social stats affect quality calculation
-                    try:
-                        # Get updated media data for quality score calculation
-                        updated_media_data = await media_queries.get_media_by_id_from_db(media_id)
-                        if updated_media_data:
-                            await self._update_quality_score_for_media(updated_media_data)
-                            logger.info(f"Triggered quality score update after social refresh for media_id: {media_id}")
-                    except Exception as quality_e:
-                        logger.error(f"Error updating quality score after social refresh for media_id {media_id}: {quality_e}")
-                        
-                else: # Otherwise, just update the timestamp
-                    await media_queries.update_media_enrichment_data(media_id, {"social_stats_last_fetched_at": datetime.now(timezone.utc)})
+        plan = self._plan_social_refresh(media_to_refresh)
+        logger.info(
+            f"Social refresh plan for {len(media_to_refresh)} media: "
+            + ", ".join(f"{platform}={len(urls)} URLs" for platform, urls in plan.items())
+        )
+        platforms = list(plan)
+        fetched = await asyncio.gather(
+            *(self.social_discovery_service.get_data_for_platform_urls(platform, list(plan[platform])) for platform in platforms),
+            return_exceptions=True,
+        )
 
-            except Exception as e:
-                logger.error(f"Error refreshing social stats for media_id {media_id}: {e}", exc_info=True)
-            await asyncio.sleep(0.5)
+        # Every media in the batch gets a row so its fetch timestamp moves forward even without new data
+        stats_by_media: Dict[int, Dict[str, Any]] = {m['media_id']: {"media_id": m['media_id']} for m in media_to_refresh}
+        for platform, results in zip(platforms, fetched):
+            if isinstance(results, Exception):
+                logger.error(f"Social refresh for {platform} failed: {results}")
+                continue
+            stat_column = self.SOCIAL_REFRESH_PLATFORMS[platform][1]
+            for url, media_ids in plan[platform].items():
+                profile = (results or {}).get(url)
+                if not profile:
+                    continue
+                count = profile.get('followers_count')
+                if platform == "linkedin":
+                    count = count or profile.get('connections_count')
+                if count is not None:
+                    for media_id in media_ids:
+                        stats_by_media[media_id][stat_column] = count
+
+        changed_ids = [media_id for media_id, row in stats_by_media.items() if len(row) > 1]
+        try:
+            await media_queries.bulk_update_media_social_stats(list(stats_by_media.values()))
+        except Exception:
+            logger.warning("Bulk social stats update failed; falling back to per-media updates.")
+            for media_id, row in stats_by_media.items():
+                payload = {k: v for k, v in row.items() if k != "media_id"}
+                payload["social_stats_last_fetched_at"] = datetime.now(timezone.utc)
+                try:
+                    await media_queries.update_media_enrichment_data(media_id, payload)
+                except Exception as e:
+                    logger.error(f"Error refreshing social stats for media_id {media_id}: {e}", exc_info=True)
+        logger.info(f"Social stats updated for {len(changed_ids)} of {len(stats_by_media)} media.")
+
+        # Social stats feed the quality score, so rescore the media that received new counts
+        if changed_ids:
+            try:
+                await self.rescore_quality_bulk(
+                    media_ids=changed_ids,
+                    min_transcribed_episodes=ORCHESTRATOR_CONFIG["quality_score_min_transcribed_episodes"],
+                )
+            except Exception as quality_e:
+                logger.error(f"Error updating quality scores after social refresh: {quality_e}")
         logger.info("Social stats refresh batch finished.")
 
     async def run_core_details_enrichment(self, batch_size: int = 10):
@@ -188,40 +200,67 @@ class EnrichmentOrchestrator:
         successful = sum(1 for r in results if r.get("status") == "success")
         logger.info(f"Host verification batch completed: {successful}/{len(results)} successful")
         
+    async def rescore_quality_bulk(
+        self,
+        media_ids: Optional[List[int]] = None,
+        stale_hours: Optional[int] = None,
+        min_transcribed_episodes: Optional[int] = None,
+        max_media: Optional[int] = None,
+        chunk_size: int = 5000,
+    ) -> int:
+        """
+        Recomputes quality scores set-wise: loads scoring columns in chunks, scores each chunk
+        with NumPy and writes it back with one bulk UPDATE. With no filters this rescores the
+        whole catalog. Returns the number of media scored.
+        """
+        scored = 0
+        after_media_id = 0
+        while max_media is None or scored < max_media:
+            limit = chunk_size if max_media is None else min(chunk_size, max_media - scored)
+            rows = await media_queries.get_media_quality_inputs(
+                media_ids=media_ids,
+                stale_hours=stale_hours,
+                min_transcribed_episodes=min_transcribed_episodes,
+                after_media_id=after_media_id,
+                limit=limit,
+            )
+            if not rows:
+                break
+            components = compute_quality_score_arrays(quality_input_arrays(rows))
+            score_rows = [
+                (row['media_id'],) + tuple(float(components[key][i]) for key in (
+                    "quality_score", "quality_score_recency", "quality_score_frequency",
+                    "quality_score_audience", "quality_score_social",
+                ))
+                for i, row in enumerate(rows)
+            ]
+            updated = await media_queries.bulk_update_media_quality_scores(score_rows)
+            scored += len(rows)
+            if len(rows) < limit:
+                break
+            if stale_hours is None:
+                after_media_id = rows[-1]['media_id']
+            elif updated < len(rows):
+                # Stale mode pages by re-querying (scored media stop being stale); rows that were
+                # not updated would come back again
+                break
+        logger.info(f"Bulk quality rescoring finished: {scored} media scored.")
+        return scored
+
     async def run_quality_score_updates(self, batch_size: int = 20):
         """Refreshes quality scores for records where the score is stale."""
         logger.info("Starting quality score update batch...")
         update_interval = ORCHESTRATOR_CONFIG["quality_score_update_interval_hours"]
-        media_to_score = await media_queries.get_media_for_quality_score_update(batch_size, update_interval)
-        
-        if not media_to_score:
+        scored = await self.rescore_quality_bulk(stale_hours=update_interval, max_media=batch_size)
+        if not scored:
             logger.info("No media items found for quality score update in this batch.")
-            return
-
-        for media_data in media_to_score:
-            media_id = media_data['media_id']
-            try:
-                # Clean the data before validation (same logic as in data_merger)
-                cleaned_media_data = self._clean_media_data_for_validation(media_data)
-                profile = EnrichedPodcastProfile(**cleaned_media_data)
-                
-                quality_score_val, score_components = self.quality_service.calculate_podcast_quality_score(profile)
-                
-                if quality_score_val is not None:
-                    # Use update_media_quality_score which also compiles episode summaries
-                    success = await media_queries.update_media_quality_score(media_id, quality_score_val)
-                    if success:
-                        logger.info(f"Updated quality score and compiled episode summaries for media_id: {media_id}")
-                    else:
-                        logger.error(f"Failed to update quality score for media_id: {media_id}")
-                else:
-                    logger.warning(f"Quality score calculation returned None for media_id: {media_id}")
-
-            except Exception as e:
-                logger.error(f"Error updating quality score for media_id {media_id}: {e}", exc_info=True)
-            await asyncio.sleep(0.2)
         logger.info("Quality score update batch finished.")
 
+    async def run_episode_summary_compilation(self, batch_size: int = 500):
+        """Recompiles episode summaries for media whose episodes changed since the last compilation."""
+        compiled = await media_queries.compile_episode_summaries_if_changed(limit=batch_size)
+        logger.info(f"Episode summary compilation finished: {compiled} media recompiled.")
+
     async def _manage_transcription_flags(self):
         """Identifies media that might need new episodes flagged for transcription."""
         logger.info("Checking for media items to flag new episodes for transcription...")
@@ -262,30 +301,13 @@ class EnrichmentOrchestrator:
 
         logger.info(f"Starting quality score update for single media_id: {media_id}")
         try:
-            transcribed_count = await media_queries.count_transcribed_episodes_for_media(media_id)
-            
-            if transcribed_count >= ORCHESTRATOR_CONFIG["quality_score_min_transcribed_episodes"]:
-                try:
-                    # Clean the data before validation (same as in data_merger)
-                    cleaned_media_data = self._clean_media_data_for_validation(media_data_dict)
-                    profile_for_scoring = EnrichedPodcastProfile(**cleaned_media_data)
-                except Exception as val_err:
-                    logger.error(f"Could not construct EnrichedPodcastProfile for media_id {media_id} from DB data for quality scoring: {val_err}")
-                    return
-
-                quality_score_val, score_components = self.quality_service.calculate_podcast_quality_score(profile_for_scoring)
-                
-                if quality_score_val is not None:
-                    # Use update_media_quality_score which also compiles episode summaries
-                    success = await media_queries.update_media_quality_score(media_id, quality_score_val)
-                    if success:
-                        logger.info(f"Successfully updated quality score and compiled episode summaries for media_id: {media_id} to {quality_score_val}")
-                    else:
-                        logger.error(f"Failed to update quality score in DB for media_id: {media_id}")
-                else:
-                    logger.warning(f"Quality score calculation returned None for media_id: {media_id}")
+            min_transcribed = ORCHESTRATOR_CONFIG["quality_score_min_transcribed_episodes"]
+            scored = await self.rescore_quality_bulk(media_ids=[media_id], min_transcribed_episodes=min_transcribed)
+            if scored:
+                await media_queries.compile_episode_summaries_if_changed([media_id])
+                logger.info(f"Successfully updated quality score for media_id: {media_id}")
             else:
-                logger.info(f"Skipping quality score for media_id: {media_id}, transcribed episodes: {transcribed_count} (need {ORCHESTRATOR_CONFIG['quality_score_min_transcribed_episodes']}).")
+                logger.info(f"Skipping quality score for media_id: {media_id} (needs {min_transcribed} transcribed episodes).")
         except Exception as e:
             logger.error(f"Error during quality score update for single media_id {media_id}: {e}", exc_info=True)
 
@@ -379,23 +401,7 @@ class EnrichmentOrchestrator:
                         logger.info(f"AI description generated for media_id: {media_id}")
             
             # 4. Update quality score and compile episode summaries
-            # Refetch media data to get latest updates
-            media_data = await media_queries.get_media_by_id_from_db(media_id)
-            transcribed_count = await media_queries.count_transcribed_episodes_for_media(media_id)
-            
-            if transcribed_count >= ORCHESTRATOR_CONFIG.get("quality_score_min_transcribed_episodes", 3):
-                try:
-                    # Clean data and calculate quality score
-                    cleaned_media_data = self._clean_media_data_for_validation(media_data)
-                    profile = EnrichedPodcastProfile(**cleaned_media_data)
-                    quality_score_val, _ = self.quality_service.calculate_podcast_quality_score(profile)
-                    
-                    if quality_score_val is not None:
-                        # Use update_media_quality_score which also compiles episode summaries
-                        await media_queries.update_media_quality_score(media_id, quality_score_val)
-                        logger.info(f"Quality score updated and episode summaries compiled for media_id: {media_id}")
-                except Exception as e:
-                    logger.error(f"Error updating quality score for media {media_id}: {e}")
+            await self._update_quality_score_for_media({"media_id": media_id})
             
             logger.info(f"Enrichment completed successfully for media_id: {media_id}")
             return True
@@ -413,6 +419,7 @@ class EnrichmentOrchestrator:
         await self.run_host_verification_batch()  # Add host verification after core enrichment
         await self.run_social_stats_refresh()
         await self.run_quality_score_updates()
+        await self.run_episode_summary_compilation()
         await self._manage_transcription_flags()
         await self._trigger_match_creation_for_ready_media()
         
@@ -4,6 +4,7 @@ import logging
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, Tuple
 import statistics
+import numpy as np
 from dateutil import parser # For robust date parsing if needed
 
 # Corrected import path for EnrichedPodcastProfile
@@ -254,6 +255,107 @@ class QualityService:
         # The first element of the tuple is still the final score for convenience
         return final_quality_score, detailed_metrics
 
+# --- Vectorized scoring for bulk recomputation ---
+# Column names expected by compute_quality_score_arrays (see media_queries.QUALITY_SCORE_INPUT_QUERY).
+QUALITY_INPUT_COLUMNS = (
+    "days_since_last", "active_days", "total_episodes", "publishing_frequency_days",
+    "listen_score", "audience_size",
+    "itunes_rating_average", "itunes_rating_count",
+    "spotify_rating_average", "spotify_rating_count",
+    "twitter_followers", "instagram_followers", "youtube_subscribers",
+    "tiktok_followers", "facebook_likes",
+)
+
+def quality_input_arrays(rows) -> Dict[str, np.ndarray]:
+    """Turns rows (mappings with QUALITY_INPUT_COLUMNS) into float arrays; NULL becomes NaN."""
+    return {
+        column: np.array([row[column] for row in rows], dtype=float)
+        for column in QUALITY_INPUT_COLUMNS
+    }
+
+def _normalize_array(values: np.ndarray, max_value: float) -> np.ndarray:
+    """Array version of QualityService._normalize_score: clamp to [0, max] and scale, NaN -> 0."""
+    return np.nan_to_num(np.clip(values, 0.0, max_value) / max_value, nan=0.0)
+
+def compute_quality_score_arrays(inputs: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """
+    Computes the same components as QualityService.calculate_podcast_quality_score for a
+    whole batch at once. Returns arrays for quality_score (0-100) and the 0-1 components.
+    """
+    cfg = QUALITY_CONFIG
+    with np.errstate(invalid="ignore", divide="ignore"):
+        # Recency: 1.0 up to ideal, linear to 0.5 at good, linear to 0.1 at stale, then 0.
+        days = inputs["days_since_last"]
+        ideal, good, stale = cfg["recency_max_days_ideal"], cfg["recency_max_days_good"], cfg["recency_max_days_stale"]
+        recency = np.select(
+            [days <= ideal, days <= good, days <= stale],
+            [
+                1.0,
+                np.maximum(0.5, 1.0 - 0.5 * (days - ideal) / (good - ideal)),
+                np.maximum(0.1, 0.5 - 0.4 * (days - good) / (stale - good)),
+            ],
+            default=0.0,
+        )
+
+        # Frequency: explicit publishing_frequency_days, else span / (episodes - 1).
+        total = inputs["total_episodes"]
+        span = inputs["active_days"]
+        derivable = (total >= cfg["frequency_min_episodes_for_calc"]) & (total > 1) & (span > 0)
+        derived = np.where(derivable, span / (total - 1), np.nan)
+        freq_days = np.where(np.isnan(inputs["publishing_frequency_days"]), derived, inputs["publishing_frequency_days"])
+        f_ideal, f_good = cfg["frequency_ideal_days"], cfg["frequency_good_days"]
+        f_stale = f_good * 2.5
+        frequency = np.select(
+            [freq_days <= f_ideal, freq_days <= f_good, freq_days > f_good],
+            [
+                1.0,
+                np.maximum(0.5, 1.0 - 0.5 * (freq_days - f_ideal) / (f_good - f_ideal)),
+                np.maximum(0.0, 0.5 * (1 - (freq_days - f_good) / (f_stale - f_good))),
+            ],
+            default=0.0,
+        )
+
+        # Audience: listen score, audience size and rating components (ratings need both average and count).
+        acfg = cfg["audience_metrics"]
+        audience = (
+            _normalize_array(inputs["listen_score"], acfg["listen_score_norm_max"]) * acfg["listen_score_weight"]
+            + _normalize_array(inputs["audience_size"], acfg["audience_size_norm_high"]) * acfg["audience_size_weight"]
+        )
+        for platform in ("itunes", "spotify"):
+            average = inputs[f"{platform}_rating_average"]
+            count = inputs[f"{platform}_rating_count"]
+            component = _normalize_array(average, 5.0) * 0.7 + _normalize_array(count, acfg["rating_count_norm_high"]) * 0.3
+            has_rating = ~np.isnan(average) & ~np.isnan(count)
+            audience = audience + np.where(has_rating, component, 0.0) * acfg[f"{platform}_rating_weight"]
+        audience = np.clip(audience, 0.0, 1.0)
+
+        # Social: total followers across platforms, zero below the minimum.
+        scfg = cfg["social_metrics"]
+        followers = np.nansum(
+            np.vstack([inputs[c] for c in ("twitter_followers", "instagram_followers", "youtube_subscribers", "tiktok_followers", "facebook_likes")]),
+            axis=0,
+        )
+        social = np.where(
+            followers < scfg["min_followers_for_score"],
+            0.0,
+            _normalize_array(followers, scfg["total_followers_norm_high"]),
+        )
+
+    weights = cfg["weights"]
+    overall = (
+        recency * weights["recency_score"]
+        + frequency * weights["frequency_score"]
+        + audience * weights["audience_score"]
+        + social * weights["social_score"]
+    )
+    return {
+        "quality_score": np.clip(overall * 100, 0.0, 100.0),
+        "quality_score_recency": recency,
+        "quality_score_frequency": frequency,
+        "quality_score_audience": audience,
+        "quality_score_social": social,
+    }
+
 # Example Usage (for direct testing of this service module)
 if __name__ == '__main__':
     # Import EnrichedPodcastProfile for testing purposes
@@ -18,6 +18,16 @@ logger = logging.getLogger(__name__)
 # Load environment variables
 load_dotenv()
 
+# Maximum profile URLs sent to a single actor run; larger batches are split into chunks.
+SOCIAL_ACTOR_MAX_URLS = {
+    "twitter": int(os.getenv("APIFY_TWITTER_MAX_URLS_PER_RUN", "50")),
+    "instagram": int(os.getenv("APIFY_INSTAGRAM_MAX_URLS_PER_RUN", "50")),
+    "linkedin": int(os.getenv("APIFY_LINKEDIN_MAX_URLS_PER_RUN", "25")),
+    "tiktok": int(os.getenv("APIFY_TIKTOK_MAX_URLS_PER_RUN", "50")),
+}
+# The TikTok actor takes one profile per run; this bounds how many run at once.
+APIFY_TIKTOK_CONCURRENCY = int(os.getenv("APIFY_TIKTOK_CONCURRENCY", "3"))
+
 class SocialDiscoveryService:
     """Discovers and analyzes social media profiles using Apify."""
 
@@ -426,23 +436,53 @@ class SocialDiscoveryService:
 
     async def get_tiktok_data_for_urls(self, tiktok_urls: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
         # Actor: 'apidojo/tiktok-scraper', Input: 'startUrls' (list of strings)
-        # Note: This scraper processes one URL at a time, so we need to run them individually
+        # Note: This scraper processes one URL at a time, so runs are issued per URL with bounded concurrency
+        semaphore = asyncio.Semaphore(max(1, APIFY_TIKTOK_CONCURRENCY))
+
+        async def scrape_one(url: str) -> Dict[str, Optional[Dict[str, Any]]]:
+            async with semaphore:
+                try:
+                    return await self._fetch_social_data_batch_generic(
+                        [url], 
+                        'apidojo/tiktok-scraper', 
+                        {"startUrls": [url], "maxItems": 1}, # Single URL input for this actor
+                        self._map_tiktok_result,
+                        actor_item_url_key_candidates=['channel.url', 'postPage']
+                    )
+                except Exception as e:
+                    logger.error(f"Error scraping TikTok URL {url}: {e}")
+                    return {url: None}
+
         results = {}
-        
-        for url in tiktok_urls:
+        for single_result in await asyncio.gather(*(scrape_one(url) for url in tiktok_urls)):
+            results.update(single_result)
+        return results
+
+    async def get_data_for_platform_urls(self, platform: str, urls: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Fetches profile data for every URL of one platform, issuing one actor run per
+        chunk of SOCIAL_ACTOR_MAX_URLS[platform] URLs instead of one run per URL.
+        """
+        fetchers = {
+            "twitter": self.get_twitter_data_for_urls,
+            "instagram": self.get_instagram_data_for_urls,
+            "tiktok": self.get_tiktok_data_for_urls,
+            "linkedin": self.get_linkedin_data_for_urls,
+        }
+        fetcher = fetchers.get(platform)
+        if fetcher is None:
+            raise ValueError(f"Unsupported social platform: {platform}")
+
+        unique_urls = list(dict.fromkeys(url for url in urls if url))
+        chunk_size = max(1, SOCIAL_ACTOR_MAX_URLS.get(platform, len(unique_urls) or 1))
+        results: Dict[str, Optional[Dict[str, Any]]] = {}
+        for start in range(0, len(unique_urls), chunk_size):
+            chunk = unique_urls[start:start + chunk_size]
             try:
-                single_result = await self._fetch_social_data_batch_generic(
-                    [url], 
-                    'apidojo/tiktok-scraper', 
-                    {"startUrls": [url], "maxItems": 1}, # Single URL input for this actor
-                    self._map_tiktok_result,
-                    actor_item_url_key_candidates=['channel.url', 'postPage']
-                )
-                results.update(single_result)
+                results.update(await fetcher(chunk) or {})
             except Exception as e:
-                logger.error(f"Error scraping TikTok URL {url}: {e}")
-                results[url] = None
-        
+                logger.error(f"Error fetching {platform} data for {len(chunk)} URLs: {e}", exc_info=True)
+                results.update({url: None for url in chunk})
         return results
 
     async def get_facebook_data_for_urls(self, facebook_urls: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
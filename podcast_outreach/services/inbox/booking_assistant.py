@@ -11,6 +11,8 @@ from typing import Dict, Any, Optional, List
 from datetime import datetime
 from dotenv import load_dotenv
 
+from podcast_outreach.utils.http_sessions import get_http_session
+
 # Load environment variables
 load_dotenv()
 
@@ -88,107 +90,108 @@ class BookingAssistantService:
             headers["Authorization"] = f"Bearer {self.api_key}"
         
         try:
-            async with aiohttp.ClientSession(timeout=self.timeout) as session:
-                async with session.post(
-                    f"{self.base_url}/start_agent_v2",
-                    json=payload,
-                    headers=headers
-                ) as response:
+            session = get_http_session("booking_assistant")
+            async with session.post(
+                f"{self.base_url}/start_agent_v2",
+                json=payload,
+                headers=headers,
+                timeout=self.timeout
+            ) as response:
+                
+                if response.status == 200:
+                    result = await response.json()
                     
-                    if response.status == 200:
-                        result = await response.json()
-                        
-                        # Check if email was already processed (duplicate detection)
-                        if result.get("status") == "skipped":
-                            logger.info(f"Email already processed: {result.get('message', 'Duplicate detected')}")
-                            return {
-                                "status": "skipped",
-                                "message": result.get("message", "Email already processed"),
-                                "classification": "duplicate",
-                                "duplicate": True
-                            }
-                        
-                        # Handle the new standardized response format
-                        # API now returns classification at top level AND in result object
-                        classification = result.get("classification")
-                        confidence = result.get("confidence", 0.95)
-                        draft = result.get("generated_response")
-                        
-                        # Fallback to result object if top-level fields missing
-                        if not classification and "result" in result and isinstance(result["result"], dict):
-                            inner_result = result["result"]
-                            classification = inner_result.get("label", inner_result.get("classification"))
-                            confidence = inner_result.get("confidence", confidence)
-                            draft = draft or inner_result.get("final_draft", inner_result.get("draft"))
-                        
-                        # Extract additional fields
-                        relevant_threads = []
-                        draft_id = None
-                        if "result" in result and isinstance(result["result"], dict):
-                            relevant_threads = result["result"].get("relevant_threads", [])
-                            # Extract draft ID from draft_status if present
-                            draft_status = result["result"].get("draft_status", "")
-                            if "Draft created with ID:" in draft_status:
-                                draft_id = draft_status.split("ID:")[1].strip()
-                        
-                        # Log if no classification returned
-                        if not classification:
-                            logger.warning(f"No classification returned from BookingAssistant for email: {email_data.get('subject', 'No subject')}")
-                            classification = "unknown"
-                            confidence = 0.0
-                        
+                    # Check if email was already processed (duplicate detection)
+                    if result.get("status") == "skipped":
+                        logger.info(f"Email already processed: {result.get('message', 'Duplicate detected')}")
                         return {
-                            "status": result.get("status", "success"),
-                            "classification": classification,
-                            "draft": draft,
-                            "draft_id": draft_id,
-                            "confidence": confidence,
-                            "context_used": result.get("context_used", False),
-                            "relevant_threads": relevant_threads,
-                            "processing_time": result.get("processing_time_ms", 0),
-                            "session_id": result.get("session_id"),
-                            "raw_response": result,
-                            "sender_email": email_data.get("sender_email"),
-                            "sender_name": email_data.get("sender_name"),
-                            "subject": email_data.get("subject")
+                            "status": "skipped",
+                            "message": result.get("message", "Email already processed"),
+                            "classification": "duplicate",
+                            "duplicate": True
                         }
                     
-                    elif response.status == 400:
-                        error_data = await response.json()
-                        error_detail = error_data.get("detail", "Bad request")
-                        
-                        # Provide helpful error messages for common issues
-                        if "email" in str(error_detail).lower() and "required" in str(error_detail).lower():
-                            logger.error("Missing required 'email' field. Make sure to pass email content.")
-                            error_detail = "Missing required email content. Pass 'email_text' or 'email' field."
-                        elif "sender_email" in str(error_detail).lower() and "required" in str(error_detail).lower():
-                            logger.error("Missing required 'sender_email' field.")
-                            error_detail = "Missing required sender_email field."
-                        
-                        logger.warning(f"Bad request to BookingAssistant: {error_data}")
-                        return {
-                            "status": "error",
-                            "error": error_detail,
-                            "classification": "unknown",
-                            "hint": "Check that email content and sender_email are provided"
-                        }
+                    # Handle the new standardized response format
+                    # API now returns classification at top level AND in result object
+                    classification = result.get("classification")
+                    confidence = result.get("confidence", 0.95)
+                    draft = result.get("generated_response")
                     
-                    elif response.status == 503:
-                        logger.error("BookingAssistant service unavailable")
-                        return {
-                            "status": "error",
-                            "error": "BookingAssistant service unavailable",
-                            "classification": "unknown"
-                        }
+                    # Fallback to result object if top-level fields missing
+                    if not classification and "result" in result and isinstance(result["result"], dict):
+                        inner_result = result["result"]
+                        classification = inner_result.get("label", inner_result.get("classification"))
+                        confidence = inner_result.get("confidence", confidence)
+                        draft = draft or inner_result.get("final_draft", inner_result.get("draft"))
+                    
+                    # Extract additional fields
+                    relevant_threads = []
+                    draft_id = None
+                    if "result" in result and isinstance(result["result"], dict):
+                        relevant_threads = result["result"].get("relevant_threads", [])
+                        # Extract draft ID from draft_status if present
+                        draft_status = result["result"].get("draft_status", "")
+                        if "Draft created with ID:" in draft_status:
+                            draft_id = draft_status.split("ID:")[1].strip()
+                    
+                    # Log if no classification returned
+                    if not classification:
+                        logger.warning(f"No classification returned from BookingAssistant for email: {email_data.get('subject', 'No subject')}")
+                        classification = "unknown"
+                        confidence = 0.0
+                    
+                    return {
+                        "status": result.get("status", "success"),
+                        "classification": classification,
+                        "draft": draft,
+                        "draft_id": draft_id,
+                        "confidence": confidence,
+                        "context_used": result.get("context_used", False),
+                        "relevant_threads": relevant_threads,
+                        "processing_time": result.get("processing_time_ms", 0),
+                        "session_id": result.get("session_id"),
+                        "raw_response": result,
+                        "sender_email": email_data.get("sender_email"),
+                        "sender_name": email_data.get("sender_name"),
+                        "subject": email_data.get("subject")
+                    }
+                
+                elif response.status == 400:
+                    error_data = await response.json()
+                    error_detail = error_data.get("detail", "Bad request")
+                    
+                    # Provide helpful error messages for common issues
+                    if "email" in str(error_detail).lower() and "required" in str(error_detail).lower():
+                        logger.error("Missing required 'email' field. Make sure to pass email content.")
+                        error_detail = "Missing required email content. Pass 'email_text' or 'email' field."
+                    elif "sender_email" in str(error_detail).lower() and "required" in str(error_detail).lower():
+                        logger.error("Missing required 'sender_email' field.")
+                        error_detail = "Missing required sender_email field."
+                    
+                    logger.warning(f"Bad request to BookingAssistant: {error_data}")
+                    return {
+                        "status": "error",
+                        "error": error_detail,
+                        "classification": "unknown",
+                        "hint": "Check that email content and sender_email are provided"
+                    }
+                
+                elif response.status == 503:
+                    logger.error("BookingAssistant service unavailable")
+                    return {
+                        "status": "error",
+                        "error": "BookingAssistant service unavailable",
+                        "classification": "unknown"
+                    }
+                
+                else:
+                    logger.error(f"Unexpected status from BookingAssistant: {response.status}")
+                    return {
+                        "status": "error",
+                        "error": f"Unexpected status: {response.status}",
+                        "classification": "unknown"
+                    }
                     
-                    else:
-                        logger.error(f"Unexpected status from BookingAssistant: {response.status}")
-                        return {
-                            "status": "error",
-                            "error": f"Unexpected status: {response.status}",
-                            "classification": "unknown"
-                        }
-                        
         except aiohttp.ClientError as e:
             # Check if it's a timeout error
             if "timeout" in str(e).lower():
@@ -248,11 +251,11 @@ class BookingAssistantService:
             True if service is available, False otherwise
         """
         try:
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=5)) as session:
-                # Try the root endpoint since /health might have dependencies
-                async with session.get(f"{self.base_url}/") as response:
-                    # Accept 200 or 500 (500 might mean some services aren't ready but API is up)
-                    return response.status in [200, 500]
+            session = get_http_session("booking_assistant")
+            # Try the root endpoint since /health might have dependencies
+            async with session.get(f"{self.base_url}/", timeout=aiohttp.ClientTimeout(total=5)) as response:
+                # Accept 200 or 500 (500 might mean some services aren't ready but API is up)
+                return response.status in [200, 500]
         except:
             return False
     
@@ -267,14 +270,15 @@ class BookingAssistantService:
             Dictionary containing dashboard statistics
         """
         try:
-            async with aiohttp.ClientSession(timeout=self.timeout) as session:
-                async with session.get(
-                    f"{self.base_url}/api/overview",
-                    params={"days": days}
-                ) as response:
-                    if response.status == 200:
-                        return await response.json()
-                    return {}
+            session = get_http_session("booking_assistant")
+            async with session.get(
+                f"{self.base_url}/api/overview",
+                params={"days": days},
+                timeout=self.timeout
+            ) as response:
+                if response.status == 200:
+                    return await response.json()
+                return {}
         except Exception as e:
             logger.error(f"Error fetching dashboard stats: {e}")
             return {}
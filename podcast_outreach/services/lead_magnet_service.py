@@ -0,0 +1,230 @@
+# podcast_outreach/services/lead_magnet_service.py
+
+"""
+Background processing of public lead magnet submissions.
+
+The public form only queues a lead_magnet_jobs row and gets its tracking token
+back. This worker claims queued jobs (FOR UPDATE SKIP LOCKED, so every API
+process can run one) and creates the prospect person, campaign and media kit,
+at most LEAD_MAGNET_WORKER_CONCURRENCY at a time per process and on the
+PIPELINE pool. A burst of submissions therefore waits in the table instead of
+holding API workers and interactive connections for the length of a multi-LLM
+media kit generation.
+"""
+
+import os
+import uuid
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional
+
+from podcast_outreach.database.connection import use_workload, Workload
+from podcast_outreach.database.queries import campaigns as campaign_queries
+from podcast_outreach.database.queries import lead_magnet_jobs as job_queries
+from podcast_outreach.database.queries import people as people_queries
+from podcast_outreach.services.campaigns.questionnaire_processor import construct_mock_interview_from_questionnaire
+
+logger = logging.getLogger(__name__)
+
+LEAD_MAGNET_WORKER_ENABLED = os.getenv("LEAD_MAGNET_WORKER_ENABLED", "true").lower() == "true"
+LEAD_MAGNET_WORKER_CONCURRENCY = int(os.getenv("LEAD_MAGNET_WORKER_CONCURRENCY", "2"))
+LEAD_MAGNET_POLL_SECONDS = float(os.getenv("LEAD_MAGNET_POLL_SECONDS", "5"))
+# A job running this long is assumed to have lost its worker and is claimed again
+LEAD_MAGNET_JOB_STALE_SECONDS = int(os.getenv("LEAD_MAGNET_JOB_STALE_SECONDS", "900"))
+LEAD_MAGNET_MAX_ATTEMPTS = int(os.getenv("LEAD_MAGNET_MAX_ATTEMPTS", "2"))
+# Delay before a job whose attempt failed (LLM or DB error) is tried again
+LEAD_MAGNET_RETRY_DELAY_SECONDS = float(os.getenv("LEAD_MAGNET_RETRY_DELAY_SECONDS", "60"))
+# Submissions accepted per client IP within the window
+LEAD_MAGNET_RATE_LIMIT = int(os.getenv("LEAD_MAGNET_RATE_LIMIT", "5"))
+LEAD_MAGNET_RATE_WINDOW_SECONDS = int(os.getenv("LEAD_MAGNET_RATE_WINDOW_SECONDS", "3600"))
+
+EXISTING_ACCOUNT_MESSAGE = (
+    "An account with this email already exists. Please log in or use a different email for the media kit preview."
+)
+GENERIC_FAILURE_MESSAGE = "Error generating your media kit preview. Please try again later."
+
+
+class LeadMagnetError(Exception):
+    """A failure whose message can be shown to the person who submitted the form."""
+
+
+class LeadMagnetJobLost(Exception):
+    """The job was claimed again after this attempt went stale; this worker must leave it alone."""
+
+
+async def process_lead_magnet_job(job: Dict[str, Any], media_kit_service) -> str:
+    """
+    Creates the prospect person, campaign and media kit for a claimed job and
+    returns the media kit slug. Steps already recorded on the job are skipped.
+    """
+    job_id = job["job_id"]
+    attempt = job["attempts"]
+    person_id = job.get("person_id")
+    if not person_id:
+        # Checked again here: another submission for the email may have completed since this one was queued
+        if await people_queries.get_person_by_email_from_db(job["email"]):
+            raise LeadMagnetError(EXISTING_ACCOUNT_MESSAGE)
+        new_person = await people_queries.create_person_in_db({
+            "full_name": job["full_name"],
+            "email": job["email"],
+            "dashboard_username": job["email"],  # Using email as username
+            "role": "prospect",
+            "dashboard_password_hash": None  # No password yet
+        })
+        if not new_person or not new_person.get("person_id"):
+            raise RuntimeError(f"Failed to create prospect person record for {job['email']}")
+        person_id = new_person["person_id"]
+        if not await job_queries.record_lead_magnet_progress(job_id, attempt, person_id=person_id):
+            raise LeadMagnetJobLost()
+        logger.info(f"[LeadMagnet {job_id}] Created prospect person {person_id}")
+
+    campaign_id = job.get("campaign_id")
+    if not campaign_id:
+        questionnaire_data = job.get("questionnaire_data") or {}
+        prospect_campaign = await campaign_queries.create_campaign_in_db({
+            "campaign_id": uuid.uuid4(),
+            "person_id": person_id,
+            "campaign_name": f"{job['full_name']}'s Media Kit Preview",
+            "campaign_type": "lead_magnet_prospect",
+            "questionnaire_responses": questionnaire_data,
+            "mock_interview_transcript": construct_mock_interview_from_questionnaire(questionnaire_data) if questionnaire_data else ""
+        })
+        if not prospect_campaign or not prospect_campaign.get("campaign_id"):
+            raise RuntimeError(f"Failed to create prospect campaign for person {person_id}")
+        campaign_id = prospect_campaign["campaign_id"]
+        if not await job_queries.record_lead_magnet_progress(job_id, attempt, campaign_id=campaign_id):
+            raise LeadMagnetJobLost()
+        logger.info(f"[LeadMagnet {job_id}] Created prospect campaign {campaign_id}")
+
+    created_media_kit = await media_kit_service.create_or_update_media_kit(
+        campaign_id=campaign_id,
+        editable_content={
+            "title": f"{job['full_name']} - Media Kit Preview",
+            "is_public": True,
+        },
+    )
+    if not created_media_kit or not created_media_kit.get("slug"):
+        raise RuntimeError(f"Failed to create media kit or get slug for campaign {campaign_id}")
+    return created_media_kit["slug"]
+
+
+class LeadMagnetWorker:
+    """Runs queued lead magnet jobs with bounded concurrency."""
+
+    def __init__(self, concurrency: int = LEAD_MAGNET_WORKER_CONCURRENCY):
+        self.concurrency = max(1, concurrency)
+        self._runners: List[asyncio.Task] = []
+        self._wake: Optional[asyncio.Event] = None
+        self._media_kit_service = None
+        self.completed = 0
+        self.failed = 0
+        self.retried = 0
+
+    async def start(self) -> None:
+        if self._runners:
+            return
+        from podcast_outreach.services.media_kits.generator import MediaKitService
+        self._media_kit_service = MediaKitService()
+        self._wake = asyncio.Event()
+        # Runners inherit the PIPELINE workload, keeping job queries off the API pool
+        with use_workload(Workload.PIPELINE):
+            self._runners = [asyncio.create_task(self._run()) for _ in range(self.concurrency)]
+        logger.info(f"Lead magnet worker started ({self.concurrency} concurrent jobs).")
+
+    async def stop(self) -> None:
+        for runner in self._runners:
+            runner.cancel()
+        await asyncio.gather(*self._runners, return_exceptions=True)
+        self._runners = []
+        logger.info("Lead magnet worker stopped.")
+
+    def notify(self) -> None:
+        """Wakes the runners after a submission so it starts without waiting for the next poll."""
+        if self._wake is not None:
+            self._wake.set()
+
+    async def _process(self, job: Dict[str, Any]) -> None:
+        job_id = job["job_id"]
+        attempt = job["attempts"]
+        logger.info(f"[LeadMagnet {job_id}] Processing submission for {job['email']} (attempt {attempt})")
+        try:
+            slug = await process_lead_magnet_job(job, self._media_kit_service)
+        except LeadMagnetJobLost:
+            self._log_lost(job_id, attempt)
+            return
+        except LeadMagnetError as e:
+            logger.info(f"[LeadMagnet {job_id}] Rejected: {e}")
+            if await job_queries.mark_lead_magnet_failed(job_id, attempt, str(e)):
+                self.failed += 1
+            else:
+                self._log_lost(job_id, attempt)
+            return
+        except Exception as e:
+            if attempt < LEAD_MAGNET_MAX_ATTEMPTS:
+                # Usually transient (Gemini, DB); the retry reuses the person/campaign already recorded
+                logger.warning(f"[LeadMagnet {job_id}] Attempt {attempt} failed, retrying in {LEAD_MAGNET_RETRY_DELAY_SECONDS}s: {e}")
+                if await job_queries.retry_lead_magnet_job(job_id, attempt, str(e), LEAD_MAGNET_RETRY_DELAY_SECONDS):
+                    self.retried += 1
+                else:
+                    self._log_lost(job_id, attempt)
+                return
+            logger.exception(f"[LeadMagnet {job_id}] Media kit generation failed: {e}")
+            if await job_queries.mark_lead_magnet_failed(job_id, attempt, GENERIC_FAILURE_MESSAGE):
+                self.failed += 1
+            else:
+                self._log_lost(job_id, attempt)
+            return
+        if not await job_queries.mark_lead_magnet_completed(job_id, attempt, slug):
+            self._log_lost(job_id, attempt)
+            return
+        self.completed += 1
+        logger.info(f"[LeadMagnet {job_id}] Media kit '{slug}' ready")
+
+    @staticmethod
+    def _log_lost(job_id: uuid.UUID, attempt: int) -> None:
+        logger.warning(f"[LeadMagnet {job_id}] Attempt {attempt} went stale and the job was claimed again; leaving it to the newer attempt")
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                job = await job_queries.claim_next_lead_magnet_job(LEAD_MAGNET_JOB_STALE_SECONDS, LEAD_MAGNET_MAX_ATTEMPTS)
+                if job:
+                    await self._process(job)
+                    continue
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Lead magnet worker error: {e}", exc_info=True)
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=LEAD_MAGNET_POLL_SECONDS)
+                self._wake.clear()
+            except asyncio.TimeoutError:
+                try:
+                    abandoned = await job_queries.fail_abandoned_lead_magnet_jobs(
+                        LEAD_MAGNET_JOB_STALE_SECONDS, LEAD_MAGNET_MAX_ATTEMPTS
+                    )
+                    if abandoned:
+                        logger.warning(f"Failed {abandoned} lead magnet job(s) abandoned on their last attempt.")
+                except Exception as e:
+                    logger.error(f"Lead magnet worker error: {e}", exc_info=True)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "running": any(not runner.done() for runner in self._runners),
+            "concurrency": self.concurrency,
+            "completed": self.completed,
+            "failed": self.failed,
+            "retried": self.retried,
+        }
+
+
+lead_magnet_worker = LeadMagnetWorker()
+
+
+async def start_lead_magnet_worker() -> None:
+    if LEAD_MAGNET_WORKER_ENABLED:
+        await lead_magnet_worker.start()
+
+
+async def stop_lead_magnet_worker() -> None:
+    await lead_magnet_worker.stop()
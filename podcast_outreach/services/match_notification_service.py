@@ -3,6 +3,8 @@ Match Notification Service
 Sends email notifications to clients when they have match suggestions to review
 """
 
+import os
+import asyncio
 import logging
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timezone, timedelta
@@ -15,6 +17,9 @@ from podcast_outreach.database.queries import campaigns as campaign_queries
 
 logger = logging.getLogger(__name__)
 
+# Notification emails in flight at once during a dispatch run
+MATCH_NOTIFICATION_CONCURRENCY = int(os.getenv("MATCH_NOTIFICATION_CONCURRENCY", "5"))
+
 class MatchNotificationService:
     """Service for sending match suggestion notifications to clients"""
     
@@ -46,14 +51,6 @@ class MatchNotificationService:
                 WHERE ms.status = 'pending_client_review'
                 AND ms.client_approved = false
                 GROUP BY c.campaign_id, c.campaign_name, c.person_id
-            ),
-            notification_tracking AS (
-                -- Track when we last sent notification for this campaign
-                SELECT 
-                    campaign_id,
-                    MAX(sent_at) as last_notification_sent
-                FROM match_notification_log
-                GROUP BY campaign_id
             )
             SELECT 
                 pm.*,
@@ -66,7 +63,15 @@ class MatchNotificationService:
             FROM pending_matches pm
             JOIN people p ON pm.person_id = p.person_id
             LEFT JOIN client_profiles cp ON p.person_id = cp.person_id
-            LEFT JOIN notification_tracking nt ON pm.campaign_id = nt.campaign_id
+            -- Last notification for this campaign: one probe of the
+            -- (campaign_id, sent_at DESC) index instead of aggregating the whole log
+            LEFT JOIN LATERAL (
+                SELECT mnl.sent_at AS last_notification_sent
+                FROM match_notification_log mnl
+                WHERE mnl.campaign_id = pm.campaign_id
+                ORDER BY mnl.sent_at DESC
+                LIMIT 1
+            ) nt ON true
             WHERE 
                 -- Check if notifications are enabled
                 (cp.match_notification_enabled IS NULL OR cp.match_notification_enabled = true)
@@ -81,16 +86,37 @@ class MatchNotificationService:
             
             async with pool.acquire() as conn:
                 rows = await conn.fetch(query)
-                
-                for row in rows:
-                    await self._send_match_notification(dict(row))
-                    
-                logger.info(f"Processed match notifications for {len(rows)} campaigns")
+            
+            campaigns = [dict(row) for row in rows]
+            if not campaigns:
+                logger.info("Processed match notifications for 0 campaigns")
+                return
+            
+            sample_matches = await self._get_sample_matches_for_campaigns(
+                [c['campaign_id'] for c in campaigns], limit=5
+            )
+            
+            # Emails are sent concurrently (bounded); successes are logged in one batch
+            semaphore = asyncio.Semaphore(MATCH_NOTIFICATION_CONCURRENCY)
+            
+            async def send(campaign_data: Dict[str, Any]) -> bool:
+                async with semaphore:
+                    return await self._send_match_notification(
+                        campaign_data, sample_matches.get(campaign_data['campaign_id'], [])
+                    )
+            
+            results = await asyncio.gather(*(send(c) for c in campaigns))
+            sent = [c for c, success in zip(campaigns, results) if success]
+            await self._log_notifications(sent)
+            
+            logger.info(
+                f"Processed match notifications for {len(campaigns)} campaigns ({len(sent)} sent)"
+            )
                 
         except Exception as e:
             logger.error(f"Error checking match notifications: {e}", exc_info=True)
     
-    async def _send_match_notification(self, campaign_data: Dict[str, Any]) -> bool:
+    async def _send_match_notification(self, campaign_data: Dict[str, Any], sample_matches: List[Dict[str, Any]]) -> bool:
         """Send notification email for a specific campaign"""
         try:
             campaign_id = campaign_data['campaign_id']
@@ -100,9 +126,6 @@ class MatchNotificationService:
             pending_count = campaign_data['pending_count']
             plan_type = campaign_data.get('plan_type', 'free')
             
-            # Get some sample matches for the email
-            sample_matches = await self._get_sample_matches(campaign_id, limit=5)
-            
             # Send the email
             success = await self.email_service.send_match_notification_email(
                 to_email=email,
@@ -114,8 +137,6 @@ class MatchNotificationService:
             )
             
             if success:
-                # Log the notification
-                await self._log_notification(campaign_id, campaign_data['person_id'], pending_count)
                 logger.info(f"Sent match notification to {email} for campaign {campaign_id}")
             else:
                 logger.error(f"Failed to send match notification to {email}")
@@ -126,57 +147,76 @@ class MatchNotificationService:
             logger.error(f"Error sending match notification: {e}", exc_info=True)
             return False
     
-    async def _get_sample_matches(self, campaign_id: uuid.UUID, limit: int = 5) -> List[Dict[str, Any]]:
-        """Get sample match suggestions for the email"""
+    async def _get_sample_matches_for_campaigns(
+        self, campaign_ids: List[uuid.UUID], limit: int = 5
+    ) -> Dict[uuid.UUID, List[Dict[str, Any]]]:
+        """Get the top `limit` sample match suggestions of each campaign in one query"""
         query = """
-        SELECT 
-            ms.match_id,
-            ms.vetting_score,
-            ms.created_at,
-            m.name as podcast_name,
-            m.description,
-            m.category,
-            m.listen_score,
-            m.audience_size
-        FROM match_suggestions ms
-        JOIN media m ON ms.media_id = m.media_id
-        WHERE ms.campaign_id = $1
-        AND ms.status = 'pending_client_review'
-        AND ms.client_approved = false
-        ORDER BY ms.vetting_score DESC, ms.created_at DESC
-        LIMIT $2
+        SELECT *
+        FROM (
+            SELECT 
+                ms.campaign_id,
+                ms.match_id,
+                ms.vetting_score,
+                ms.created_at,
+                m.name as podcast_name,
+                m.description,
+                m.category,
+                m.listen_score,
+                m.audience_size,
+                row_number() OVER (
+                    PARTITION BY ms.campaign_id
+                    ORDER BY ms.vetting_score DESC, ms.created_at DESC
+                ) AS sample_rank
+            FROM match_suggestions ms
+            JOIN media m ON ms.media_id = m.media_id
+            WHERE ms.campaign_id = ANY($1::uuid[])
+            AND ms.status = 'pending_client_review'
+            AND ms.client_approved = false
+        ) ranked
+        WHERE sample_rank <= $2
+        ORDER BY campaign_id, sample_rank
         """
         
         pool = await get_db_pool()
         async with pool.acquire() as conn:
-            rows = await conn.fetch(query, campaign_id, limit)
-            return [dict(row) for row in rows]
+            rows = await conn.fetch(query, campaign_ids, limit)
+        
+        samples: Dict[uuid.UUID, List[Dict[str, Any]]] = {}
+        for row in rows:
+            match = dict(row)
+            match.pop('sample_rank', None)
+            samples.setdefault(match['campaign_id'], []).append(match)
+        return samples
     
-    async def _log_notification(self, campaign_id: uuid.UUID, person_id: int, match_count: int):
-        """Log that a notification was sent"""
-        query = """
-        INSERT INTO match_notification_log (
-            campaign_id, person_id, match_count, sent_at
-        ) VALUES ($1, $2, $3, $4)
+    async def _log_notifications(self, sent: List[Dict[str, Any]]):
+        """Log the sent notifications and stamp the clients' profiles in one transaction"""
+        if not sent:
+            return
+        
+        insert_log = """
+        INSERT INTO match_notification_log (campaign_id, person_id, match_count, sent_at)
+        SELECT campaign_id, person_id, match_count, $4
+        FROM unnest($1::uuid[], $2::int[], $3::int[]) AS t(campaign_id, person_id, match_count)
+        """
+        update_profiles = """
+        UPDATE client_profiles 
+        SET last_match_notification_sent = $1
+        WHERE person_id = ANY($2::int[])
         """
         
+        sent_at = datetime.now(timezone.utc)
         pool = await get_db_pool()
         async with pool.acquire() as conn:
-            await conn.execute(
-                query,
-                campaign_id,
-                person_id,
-                match_count,
-                datetime.now(timezone.utc)
-            )
-            
-            # Also update client_profiles last notification timestamp
-            update_profile = """
-            UPDATE client_profiles 
-            SET last_match_notification_sent = $1
-            WHERE person_id = $2
-            """
-            await conn.execute(update_profile, datetime.now(timezone.utc), person_id)
+            async with conn.transaction():
+                await conn.execute(
+                    insert_log,
+                    [c['campaign_id'] for c in sent],
+                    [c['person_id'] for c in sent],
+                    [c['pending_count'] for c in sent],
+                    sent_at
+                )
+                await conn.execute(update_profiles, sent_at, list({c['person_id'] for c in sent}))
     
     async def get_notification_stats(self, campaign_id: uuid.UUID) -> Dict[str, Any]:
         """Get notification statistics for a campaign"""
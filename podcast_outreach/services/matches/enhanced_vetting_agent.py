@@ -1,14 +1,18 @@
 # podcast_outreach/services/matches/enhanced_vetting_agent.py
 import logging
 import json
+import asyncio
+import hashlib
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timezone
 
+from cachetools import TTLCache
 from pydantic import BaseModel, Field
 
 from podcast_outreach.services.ai.gemini_client import GeminiService
 from podcast_outreach.database.queries import media as media_queries
 from podcast_outreach.database.queries import episodes as episode_queries
+from podcast_outreach.database.queries import vetting_checklists as checklist_queries
 
 logger = logging.getLogger(__name__)
 
@@ -32,15 +36,83 @@ class VettingAnalysis(BaseModel):
     final_summary: str = Field(description="A final summary of the podcast's fit, explaining the overall score.")
     topic_match_analysis: str = Field(description="Specific analysis of how well the podcast topics match the client's expertise areas.")
 
+class PodcastVettingAnalysis(VettingAnalysis):
+    podcast_id: int = Field(description="The PODCAST_ID of the podcast this analysis is for, exactly as given in the evidence.")
+
+class BatchVettingAnalysis(BaseModel):
+    analyses: List[PodcastVettingAnalysis] = Field(description="One analysis per podcast in the evidence, in the same order.")
+
 # --- Enhanced Vetting Agent Service ---
 
+# Bump when the checklist prompt changes so previously cached checklists are not reused
+CHECKLIST_PROMPT_VERSION = "v1"
+
 class EnhancedVettingAgent:
     """An intelligent agent to vet podcast opportunities using comprehensive questionnaire data."""
 
+    # Shared across instances: agents are created per vetting run, checklists outlive them
+    _checklist_cache: TTLCache = TTLCache(maxsize=256, ttl=6 * 3600)
+    # Expiring so locks for one-off profiles and finished event loops do not pile up
+    _checklist_locks: TTLCache = TTLCache(maxsize=1024, ttl=15 * 60)
+
     def __init__(self):
         self.gemini_service = GeminiService()
         logger.info("EnhancedVettingAgent initialized.")
 
+    @staticmethod
+    def _client_profile_hash(client_profile: Dict[str, Any]) -> str:
+        """Stable hash of a client profile; list order from set() de-duplication is normalized away."""
+        def _normalize(value):
+            if isinstance(value, dict):
+                return {k: _normalize(v) for k, v in sorted(value.items())}
+            if isinstance(value, (list, tuple, set)):
+                return sorted((_normalize(v) for v in value), key=lambda v: json.dumps(v, sort_keys=True, default=str))
+            if isinstance(value, str):
+                return value.strip()
+            return value
+
+        payload = json.dumps(
+            {"version": CHECKLIST_PROMPT_VERSION, "profile": _normalize(client_profile)},
+            sort_keys=True, default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def _get_or_create_vetting_checklist(
+        self, client_profile: Dict[str, Any], campaign_id: Optional[Any] = None
+    ) -> Optional[VettingChecklist]:
+        """Returns the checklist for a client profile from memory, then the DB, generating it only once."""
+        profile_hash = self._client_profile_hash(client_profile)
+
+        cached = self._checklist_cache.get(profile_hash)
+        if cached is not None:
+            return cached
+
+        # Locks are per event loop: background tasks may run on their own loops
+        lock_key = (id(asyncio.get_running_loop()), profile_hash)
+        lock = self._checklist_locks.get(lock_key)
+        if lock is None:
+            lock = self._checklist_locks[lock_key] = asyncio.Lock()
+        async with lock:
+            cached = self._checklist_cache.get(profile_hash)
+            if cached is not None:
+                return cached
+
+            stored = await checklist_queries.get_checklist_by_hash(profile_hash)
+            if stored:
+                try:
+                    checklist = VettingChecklist.model_validate(stored)
+                    self._checklist_cache[profile_hash] = checklist
+                    logger.debug(f"Loaded cached vetting checklist {profile_hash[:12]} for campaign {campaign_id}")
+                    return checklist
+                except Exception as e:
+                    logger.warning(f"Discarding invalid cached vetting checklist {profile_hash[:12]}: {e}")
+
+            checklist = await self._generate_enhanced_vetting_checklist(client_profile)
+            if checklist:
+                self._checklist_cache[profile_hash] = checklist
+                await checklist_queries.upsert_checklist(profile_hash, campaign_id, checklist.model_dump())
+            return checklist
+
     def _extract_comprehensive_client_profile(self, campaign_data: Dict[str, Any]) -> Dict[str, Any]:
         """Extract all relevant information from questionnaire responses for vetting."""
         questionnaire = campaign_data.get('questionnaire_responses', {})
@@ -189,7 +261,7 @@ class EnhancedVettingAgent:
 
     async def _gather_enhanced_podcast_evidence(self, media_id: int) -> str:
         """Gather comprehensive podcast data including episode themes and guest patterns."""
-        media_record = await media_queries.get_media_by_id_from_db(media_id)
+        media_record = await media_queries.get_media_light_by_id_cached(media_id)
         if not media_record:
             return "No media data available."
 
@@ -352,8 +424,31 @@ class EnhancedVettingAgent:
         normalized_score = total_score / total_weight
         return round(normalized_score)
 
-    async def vet_match_enhanced(self, campaign_data: Dict[str, Any], media_id: int) -> Optional[Dict[str, Any]]:
-        """Enhanced vetting that uses comprehensive questionnaire data."""
+    def _compile_vetting_results(
+        self, analysis: VettingAnalysis, checklist: VettingChecklist, client_profile: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Builds the stored vetting result from an analysis and its checklist."""
+        final_score = self._calculate_final_weighted_score(analysis, checklist)
+        return {
+            "vetting_score": final_score,
+            "vetting_reasoning": analysis.final_summary,
+            "topic_match_analysis": analysis.topic_match_analysis,
+            "vetting_checklist": checklist.model_dump(),
+            "vetting_criteria_scores": [
+                {
+                    "criterion": score.criterion,
+                    "score": score.score,
+                    "justification": score.justification
+                } for score in analysis.scores
+            ],
+            "client_expertise_matched": client_profile['expertise_topics'][:10]  # Top 10 for storage
+            # Note: last_vetted_at is handled by the database with vetted_at = NOW()
+        }
+
+    async def vet_match_enhanced(
+        self, campaign_data: Dict[str, Any], media_id: int, evidence: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Enhanced vetting that uses comprehensive questionnaire data. `evidence` may be prefetched by the caller."""
         try:
             # 1. Extract comprehensive client profile
             client_profile = self._extract_comprehensive_client_profile(campaign_data)
@@ -362,46 +457,132 @@ class EnhancedVettingAgent:
                 logger.warning(f"Campaign {campaign_data['campaign_id']} lacks sufficient data for vetting")
                 return None
 
-            # 2. Generate enhanced checklist
-            checklist = await self._generate_enhanced_vetting_checklist(client_profile)
+            # 2. Get the campaign's checklist (cached per client profile)
+            checklist = await self._get_or_create_vetting_checklist(client_profile, campaign_data.get('campaign_id'))
             if not checklist:
                 return None
 
             # 3. Gather comprehensive evidence
-            evidence = await self._gather_enhanced_podcast_evidence(media_id)
+            if evidence is None:
+                evidence = await self._gather_enhanced_podcast_evidence(media_id)
 
             # 4. Score with topic matching analysis
             analysis = await self._score_with_topic_matching(checklist, evidence, client_profile)
             if not analysis:
                 return None
 
-            # 5. Calculate final score
-            final_score = self._calculate_final_weighted_score(analysis, checklist)
-
-            # 6. Compile comprehensive results
-            vetting_results = {
-                "vetting_score": final_score,
-                "vetting_reasoning": analysis.final_summary,
-                "topic_match_analysis": analysis.topic_match_analysis,
-                "vetting_checklist": checklist.model_dump(),
-                "vetting_criteria_scores": [
-                    {
-                        "criterion": score.criterion,
-                        "score": score.score,
-                        "justification": score.justification
-                    } for score in analysis.scores
-                ],
-                "client_expertise_matched": client_profile['expertise_topics'][:10]  # Top 10 for storage
-                # Note: last_vetted_at is handled by the database with vetted_at = NOW()
-            }
-            
-            return vetting_results
+            # 5. Calculate final score and compile comprehensive results
+            return self._compile_vetting_results(analysis, checklist, client_profile)
             
         except Exception as e:
             logger.error(f"Error in enhanced vetting for media {media_id}: {e}", exc_info=True)
             return None
+
+    async def _score_batch_with_topic_matching(
+        self,
+        checklist: VettingChecklist,
+        evidence_by_media: Dict[int, str],
+        client_profile: Dict[str, Any]
+    ) -> Dict[int, VettingAnalysis]:
+        """Scores several podcasts against one checklist in a single LLM call."""
+        checklist_str = json.dumps(checklist.model_dump(), indent=2).replace('{', '{{').replace('}', '}}')
+
+        prompt_template = """
+        You are an expert podcast vetting analyst. Evaluate EACH of the following podcasts independently against the same checklist, with special attention to topic matching.
+
+        {user_query}
+
+        For each podcast and each criterion:
+        1. Provide a score from 0 (no fit) to 100 (perfect fit) using this scale:
+           - 0-20: No alignment or very poor fit
+           - 21-40: Minimal alignment, significant gaps
+           - 41-60: Moderate alignment, some relevant overlap  
+           - 61-80: Strong alignment, good fit with minor gaps
+           - 81-100: Excellent alignment, near-perfect or perfect fit
+        2. Justify your score with specific evidence from that podcast's data only
+        3. Be generous with scoring - if there's reasonable alignment, score in the 70-80 range
+
+        Return exactly one analysis per podcast, each with its PODCAST_ID, a topic match analysis and a final summary.
+
+        Generate a JSON object that adheres to the BatchVettingAnalysis schema.
+        """
+
+        podcast_sections = "\n".join(
+            f"=== PODCAST_ID: {media_id} ===\n{evidence}\n"
+            for media_id, evidence in evidence_by_media.items()
+        )
+        context = f"""**Client's Expertise Areas:**
+        - Primary Expertise: {', '.join(client_profile['expertise_topics'][:10])}
+        - Suggested Topics: {', '.join(client_profile['suggested_topics'][:10])}
+        - Content Themes: {', '.join(client_profile['content_themes'][:5])}
+
+        **Vetting Checklist:**
+        {checklist_str}
+
+        **Podcasts:**
+        {podcast_sections}"""
+
+        try:
+            batch_obj = await self.gemini_service.get_structured_data(
+                prompt_template_str=prompt_template,
+                user_query=context,
+                output_model=BatchVettingAnalysis,
+                workflow="enhanced_vetting_scoring_batch"
+            )
+        except Exception as e:
+            logger.error(f"Failed to batch score {len(evidence_by_media)} podcasts: {e}", exc_info=True)
+            return {}
+
+        results: Dict[int, VettingAnalysis] = {}
+        for item in (batch_obj.analyses if batch_obj else []):
+            if item.podcast_id in evidence_by_media:
+                results[item.podcast_id] = item
+        return results
+
+    async def vet_media_batch(
+        self,
+        campaign_data: Dict[str, Any],
+        media_ids: List[int],
+        batch_size: int = 3,
+        evidence_by_media: Optional[Dict[int, Optional[str]]] = None
+    ) -> Dict[int, Optional[Dict[str, Any]]]:
+        """
+        Vets several media for one campaign against a single cached checklist.
+        Podcasts are scored `batch_size` at a time in one LLM call; any podcast missing
+        from a batch response is re-scored individually. `evidence_by_media` may be
+        prefetched by the caller; missing entries are gathered here.
+        """
+        prefetched = evidence_by_media or {}
+        results: Dict[int, Optional[Dict[str, Any]]] = {media_id: None for media_id in media_ids}
+        client_profile = self._extract_comprehensive_client_profile(campaign_data)
+        if not client_profile['ideal_podcast_description'] and not client_profile['expertise_topics']:
+            logger.warning(f"Campaign {campaign_data.get('campaign_id')} lacks sufficient data for vetting")
+            return results
+
+        checklist = await self._get_or_create_vetting_checklist(client_profile, campaign_data.get('campaign_id'))
+        if not checklist:
+            return results
+
+        for start in range(0, len(media_ids), max(1, batch_size)):
+            chunk = media_ids[start:start + max(1, batch_size)]
+            chunk_evidence = {m: prefetched.get(m) for m in chunk}
+            missing = [m for m, evidence in chunk_evidence.items() if evidence is None]
+            if missing:
+                gathered = await asyncio.gather(*(self._gather_enhanced_podcast_evidence(m) for m in missing))
+                chunk_evidence.update(zip(missing, gathered))
+
+            analyses = await self._score_batch_with_topic_matching(checklist, chunk_evidence, client_profile) if len(chunk) > 1 else {}
+            for media_id in chunk:
+                analysis = analyses.get(media_id)
+                if analysis is None:
+                    analysis = await self._score_with_topic_matching(checklist, chunk_evidence[media_id], client_profile)
+                if analysis:
+                    results[media_id] = self._compile_vetting_results(analysis, checklist, client_profile)
+        return results
     
-    async def vet_match(self, campaign_data: Dict[str, Any], media_id: int) -> Optional[Dict[str, Any]]:
+    async def vet_match(
+        self, campaign_data: Dict[str, Any], media_id: int, evidence: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
         """Compatibility method that calls vet_match_enhanced."""
         # Ensure we have minimum required data
         if not campaign_data:
@@ -413,7 +594,7 @@ class EnhancedVettingAgent:
             logger.warning(f"Campaign {campaign_data.get('campaign_id')} lacks both ideal_podcast_description and questionnaire_responses")
             return None
             
-        return await self.vet_match_enhanced(campaign_data, media_id)
+        return await self.vet_match_enhanced(campaign_data, media_id, evidence)
     
     async def vet_media_for_campaign(self, media_id: int, campaign_data: Dict[str, Any]) -> Dict[str, Any]:
         """Compatibility method with reversed parameters."""
@@ -1,8 +1,9 @@
 # podcast_outreach/services/matches/enhanced_vetting_orchestrator.py
 
+import os
 import logging
 import asyncio
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from datetime import datetime, timezone
 
 from podcast_outreach.database.queries import campaign_media_discoveries as cmd_queries
@@ -12,9 +13,14 @@ from podcast_outreach.database.queries import match_suggestions as match_queries
 from podcast_outreach.database.queries import review_tasks as review_task_queries
 from .enhanced_vetting_agent import EnhancedVettingAgent
 from .episode_matcher import EpisodeMatcher
+from podcast_outreach.services.ai.rate_limiter import get_llm_limiter
 
 logger = logging.getLogger(__name__)
 
+VETTING_CONCURRENCY = int(os.getenv("VETTING_CONCURRENCY", "4"))
+VETTING_FLUSH_SIZE = int(os.getenv("VETTING_FLUSH_SIZE", "20"))
+VETTING_BATCH_SIZE = int(os.getenv("VETTING_BATCH_SIZE", "3"))
+
 class EnhancedVettingOrchestrator:
     """
     Enhanced vetting orchestrator that works with campaign_media_discoveries
@@ -27,7 +33,7 @@ class EnhancedVettingOrchestrator:
         self.episode_matcher = EpisodeMatcher()
         logger.info("EnhancedVettingOrchestrator initialized.")
 
-    async def run_vetting_pipeline(self, batch_size: int = 10):
+    async def run_vetting_pipeline(self, batch_size: int = 10, concurrency: Optional[int] = None):
         """
         Process discoveries that are ready for vetting.
         Looks for records in campaign_media_discoveries where:
@@ -35,6 +41,13 @@ class EnhancedVettingOrchestrator:
         - vetting_status = 'pending'
         - media has ai_description
         - campaign has ideal_podcast_description
+
+        Discoveries in the acquired batch are grouped per campaign and vetted
+        VETTING_BATCH_SIZE at a time against the campaign's cached checklist.
+        Groups run concurrently, bounded by `concurrency` (defaults to
+        VETTING_CONCURRENCY, capped by the shared LLM limiter). Podcast evidence
+        is prefetched ahead of the LLM calls and the results are written back
+        with one bulk update per flush.
         """
         logger.info("Starting enhanced vetting pipeline run...")
         
@@ -51,133 +64,143 @@ class EnhancedVettingOrchestrator:
             logger.info("No discoveries ready for vetting at this time.")
             return
         
-        logger.info(f"Found {len(discoveries_to_vet)} discoveries to vet.")
-        
-        processed = 0
-        successful = 0
-        
-        for discovery in discoveries_to_vet:
-            discovery_id = discovery['id']
-            campaign_id = discovery['campaign_id']
-            media_id = discovery['media_id']
-            
-            logger.info(f"Vetting discovery_id: {discovery_id} (campaign: {campaign_id}, media: {media_id})")
-            
-            try:
-                # Update vetting status to in_progress (not enrichment!)
-                # This was a bug - we were updating enrichment_status instead of vetting_status
-                await cmd_queries.update_vetting_status(discovery_id, "in_progress")
-                
-                # Get full campaign data including questionnaire responses
-                campaign_data = await campaign_queries.get_campaign_by_id(campaign_id)
-                if not campaign_data:
-                    logger.error(f"Could not find campaign {campaign_id}. Skipping.")
-                    await self._mark_vetting_failed(
-                        discovery_id, 
-                        "Campaign data not found"
-                    )
-                    continue
-                
-                # Ensure we have ideal_podcast_description
-                if not campaign_data.get('ideal_podcast_description'):
-                    logger.error(f"Campaign {campaign_id} missing ideal_podcast_description. Skipping.")
-                    await self._mark_vetting_failed(
-                        discovery_id,
-                        "Campaign missing ideal_podcast_description"
-                    )
-                    continue
-                
-                # Run the vetting agent
-                vetting_results = await self.vetting_agent.vet_match(campaign_data, media_id)
-                
-                if vetting_results:
-                    # Update discovery with vetting results
-                    # Store ALL vetting data in vetting_criteria_met for backward compatibility
-                    vetting_criteria_met = {
-                        'vetting_checklist': vetting_results.get('vetting_checklist', {}),
-                        'topic_match_analysis': vetting_results.get('topic_match_analysis', ''),
-                        'vetting_criteria_scores': vetting_results.get('vetting_criteria_scores', []),
-                        'client_expertise_matched': vetting_results.get('client_expertise_matched', [])
-                    }
-                    
-                    # Check if we have the enhanced columns available
-                    try:
-                        # Try to use the enhanced function first
-                        await cmd_queries.update_vetting_results_enhanced(
-                            discovery_id,
-                            vetting_results['vetting_score'],
-                            vetting_results.get('vetting_reasoning', ''),
-                            vetting_criteria_met,
-                            vetting_results.get('topic_match_analysis', ''),
-                            vetting_results.get('vetting_criteria_scores', []),
-                            vetting_results.get('client_expertise_matched', []),
-                            'completed'
-                        )
-                    except Exception as e:
-                        # Fall back to regular function if enhanced columns don't exist
-                        logger.warning(f"Enhanced vetting update failed, falling back to regular update: {e}")
-                        await cmd_queries.update_vetting_results(
-                            discovery_id,
-                            vetting_results['vetting_score'],
-                            vetting_results.get('vetting_reasoning', ''),
-                            vetting_criteria_met,
-                            'completed'
-                        )
-                    
-                    logger.info(
-                        f"Successfully vetted discovery {discovery_id}. "
-                        f"Score: {vetting_results['vetting_score']}"
-                    )
-                    
-                    successful += 1
-                    
-                    # If score is high enough, automatically create match suggestion
-                    if vetting_results['vetting_score'] >= 50:
-                        match_created = await self._create_match_suggestion(
-                            discovery, 
-                            vetting_results
+        limit = min(concurrency or VETTING_CONCURRENCY, get_llm_limiter().max_concurrency)
+        logger.info(f"Found {len(discoveries_to_vet)} discoveries to vet (concurrency={limit}).")
+
+        vetting_semaphore = asyncio.Semaphore(max(1, limit))
+        # Evidence is DB-only, so it may run ahead of the LLM-bound vetting calls
+        prefetch_semaphore = asyncio.Semaphore(max(1, limit) * 2)
+        pending_writes: List[Dict[str, Any]] = []
+        vetted: List[tuple] = []
+
+        async def _prefetch_evidence(media_id: int) -> Optional[str]:
+            async with prefetch_semaphore:
+                try:
+                    return await self.vetting_agent._gather_enhanced_podcast_evidence(media_id)
+                except Exception as e:
+                    logger.warning(f"Evidence prefetch failed for media {media_id}: {e}")
+                    return None
+
+        evidence_tasks = {
+            discovery['id']: asyncio.create_task(_prefetch_evidence(discovery['media_id']))
+            for discovery in discoveries_to_vet
+        }
+
+        async def _vet_chunk(campaign_id: Any, chunk: List[Dict[str, Any]]) -> None:
+            async with vetting_semaphore:
+                discovery_ids = ", ".join(str(d['id']) for d in chunk)
+                logger.info(f"Vetting discovery_ids: {discovery_ids} (campaign: {campaign_id})")
+                try:
+                    # Get full campaign data including questionnaire responses
+                    campaign_data = await campaign_queries.get_campaign_by_id_cached(campaign_id)
+                    if not campaign_data:
+                        logger.error(f"Could not find campaign {campaign_id}. Skipping.")
+                        pending_writes.extend(self._failed_result(d['id'], "Campaign data not found") for d in chunk)
+                        return
+
+                    # Ensure we have ideal_podcast_description
+                    if not campaign_data.get('ideal_podcast_description'):
+                        logger.error(f"Campaign {campaign_id} missing ideal_podcast_description. Skipping.")
+                        pending_writes.extend(
+                            self._failed_result(d['id'], "Campaign missing ideal_podcast_description") for d in chunk
                         )
-                        if match_created:
-                            logger.info(f"Match suggestion created for discovery {discovery_id}")
-                        
-                    # Publish vetting completed event
-                    await self._publish_vetting_event(discovery, vetting_results)
-                    
-                else:
-                    # Vetting failed to produce results
-                    await self._mark_vetting_failed(
-                        discovery_id,
-                        "Vetting agent failed to produce results"
+                        return
+
+                    evidence_by_media = {d['media_id']: await evidence_tasks[d['id']] for d in chunk}
+                    results_by_media = await self.vetting_agent.vet_media_batch(
+                        campaign_data,
+                        [d['media_id'] for d in chunk],
+                        batch_size=len(chunk),
+                        evidence_by_media=evidence_by_media
                     )
+                except Exception as e:
+                    logger.error(f"Error vetting discoveries {discovery_ids}: {e}", exc_info=True)
+                    pending_writes.extend(self._failed_result(d['id'], f"Vetting error: {str(e)}") for d in chunk)
+                    return
+
+            for discovery in chunk:
+                discovery_id = discovery['id']
+                vetting_results = results_by_media.get(discovery['media_id'])
+                if not vetting_results:
                     logger.error(f"Vetting failed for discovery {discovery_id}")
-                
-            except Exception as e:
-                logger.error(f"Error vetting discovery {discovery_id}: {e}", exc_info=True)
-                await self._mark_vetting_failed(
-                    discovery_id,
-                    f"Vetting error: {str(e)}"
-                )
-            
-            processed += 1
-            
-            # Small delay between vettings to avoid overwhelming AI services
-            if processed < len(discoveries_to_vet):
-                await asyncio.sleep(1)
+                    pending_writes.append(self._failed_result(discovery_id, "Vetting agent failed to produce results"))
+                    continue
+
+                # Store ALL vetting data in vetting_criteria_met for backward compatibility
+                vetting_criteria_met = {
+                    'vetting_checklist': vetting_results.get('vetting_checklist', {}),
+                    'topic_match_analysis': vetting_results.get('topic_match_analysis', ''),
+                    'vetting_criteria_scores': vetting_results.get('vetting_criteria_scores', []),
+                    'client_expertise_matched': vetting_results.get('client_expertise_matched', [])
+                }
+                pending_writes.append({
+                    'discovery_id': discovery_id,
+                    'status': 'completed',
+                    'vetting_score': vetting_results['vetting_score'],
+                    'vetting_reasoning': vetting_results.get('vetting_reasoning', ''),
+                    'vetting_criteria_met': vetting_criteria_met,
+                    'topic_match_analysis': vetting_results.get('topic_match_analysis', ''),
+                    'vetting_criteria_scores': vetting_results.get('vetting_criteria_scores', []),
+                    'client_expertise_matched': vetting_results.get('client_expertise_matched', []),
+                })
+                vetted.append((discovery, vetting_results))
+                logger.info(f"Successfully vetted discovery {discovery_id}. Score: {vetting_results['vetting_score']}")
+
+            if len(pending_writes) >= VETTING_FLUSH_SIZE:
+                await self._flush_vetting_results(pending_writes)
+
+        # One checklist per campaign, so podcasts of the same campaign share a scoring call
+        by_campaign: Dict[Any, List[Dict[str, Any]]] = {}
+        for discovery in discoveries_to_vet:
+            by_campaign.setdefault(discovery['campaign_id'], []).append(discovery)
+        chunk_size = max(1, VETTING_BATCH_SIZE)
+        chunks = [
+            (campaign_id, group[i:i + chunk_size])
+            for campaign_id, group in by_campaign.items()
+            for i in range(0, len(group), chunk_size)
+        ]
+
+        try:
+            await asyncio.gather(*(_vet_chunk(campaign_id, chunk) for campaign_id, chunk in chunks))
+        finally:
+            for task in evidence_tasks.values():
+                task.cancel()
+            await self._flush_vetting_results(pending_writes)
+
+        # Follow-up writes only after results are durable
+        async def _follow_up(discovery: Dict[str, Any], vetting_results: Dict[str, Any]) -> None:
+            async with vetting_semaphore:
+                # If score is high enough, automatically create match suggestion
+                if vetting_results['vetting_score'] >= 50:
+                    if await self._create_match_suggestion(discovery, vetting_results):
+                        logger.info(f"Match suggestion created for discovery {discovery['id']}")
+                # Publish vetting completed event
+                await self._publish_vetting_event(discovery, vetting_results)
+
+        await asyncio.gather(*(_follow_up(d, r) for d, r in vetted))
         
         logger.info(
             f"Vetting pipeline completed. "
-            f"Processed: {processed}, Successful: {successful}"
-        )
-    
-    async def _mark_vetting_failed(self, discovery_id: int, error_message: str):
-        """Mark a discovery as having failed vetting."""
-        await cmd_queries.update_vetting_results(
-            discovery_id,
-            0.0,  # score
-            error_message,  # reasoning
-            {},  # criteria_met
-            'failed'  # status
+            f"Processed: {len(discoveries_to_vet)}, Successful: {len(vetted)}"
         )
+
+    @staticmethod
+    def _failed_result(discovery_id: int, error_message: str) -> Dict[str, Any]:
+        return {
+            'discovery_id': discovery_id,
+            'status': 'failed',
+            'vetting_score': 0.0,
+            'vetting_reasoning': error_message,
+            'vetting_criteria_met': {},
+        }
+
+    async def _flush_vetting_results(self, pending_writes: List[Dict[str, Any]]) -> None:
+        """Writes buffered vetting results in one bulk update."""
+        if not pending_writes:
+            return
+        batch = pending_writes[:]
+        del pending_writes[:len(batch)]
+        await cmd_queries.bulk_update_vetting_results(batch)
     
     async def _create_match_suggestion(
         self, 
@@ -26,7 +26,7 @@ class EpisodeMatcher:
         """
         try:
             # Get campaign embedding
-            campaign = await campaign_queries.get_campaign_by_id(campaign_id)
+            campaign = await campaign_queries.get_campaign_by_id_cached(campaign_id)
             if not campaign:
                 logger.warning(f"Campaign {campaign_id} not found")
                 return None
@@ -119,7 +119,7 @@ class MatchCreationService:
         Processes one campaign against multiple media records to create/update match suggestions.
         """
         processed_matches = []
-        campaign = await campaign_queries.get_campaign_by_id(campaign_id)
+        campaign = await campaign_queries.get_campaign_by_id_cached(campaign_id)
         if not campaign or not campaign.get("embedding") or not campaign.get("campaign_keywords"):
             logger.warning(f"Campaign {campaign_id} has no embedding or keywords. Skipping match creation.")
             return []
@@ -332,14 +332,14 @@ class DetermineFitProcessor:
             media_id = match_suggestion.get('media_id')
             best_episode_id = match_suggestion.get('best_matching_episode_id')
 
-            campaign_record = await campaign_queries.get_campaign_by_id(campaign_id)
+            campaign_record = await campaign_queries.get_campaign_by_id_cached(campaign_id)
             if not campaign_record:
                 result['error_reason'] = f"Campaign record {campaign_id} not found for match {match_suggestion_id}."
                 logger.error(result['error_reason'])
                 await review_task_queries.update_review_task_status_in_db(review_task_id, "failed", result['error_reason'])
                 return result
             
-            media_record = await media_queries.get_media_by_id_from_db(media_id)
+            media_record = await media_queries.get_media_light_by_id_cached(media_id)
             if not media_record:
                 result['error_reason'] = f"Media record {media_id} not found for match {match_suggestion_id}."
                 logger.error(result['error_reason'])
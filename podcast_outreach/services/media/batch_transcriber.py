@@ -15,7 +15,6 @@ import os
 import tempfile
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timezone, timedelta
-import aiohttp
 import requests
 from urllib.parse import urlparse
 
@@ -23,6 +22,7 @@ from podcast_outreach.database.queries import episodes as episode_queries
 from podcast_outreach.services.media.transcriber import MediaTranscriber, AudioNotFoundError
 from podcast_outreach.logging_config import get_logger
 from podcast_outreach.utils.memory_monitor import get_memory_info
+from podcast_outreach.utils.http_sessions import get_http_session
 
 logger = get_logger(__name__)
 
@@ -449,14 +449,14 @@ class BatchTranscriptionService:
         Check if a URL is available without downloading the full file.
         """
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.head(url, allow_redirects=True, timeout=30) as response:
-                    if response.status == 404:
-                        return {"status": "not_found", "error": "404 Not Found"}
-                    elif response.status >= 400:
-                        return {"status": "error", "error": f"HTTP {response.status}"}
-                    else:
-                        return {"status": "available", "content_type": response.headers.get('content-type')}
+            session = get_http_session("audio")
+            async with session.head(url, allow_redirects=True) as response:
+                if response.status == 404:
+                    return {"status": "not_found", "error": "404 Not Found"}
+                elif response.status >= 400:
+                    return {"status": "error", "error": f"HTTP {response.status}"}
+                else:
+                    return {"status": "available", "content_type": response.headers.get('content-type')}
         except Exception as e:
             return {"status": "error", "error": str(e)}
     
@@ -18,6 +18,7 @@ from podcast_outreach.integrations.podscan import PodscanAPIClient # Use new int
 from podcast_outreach.utils.exceptions import APIClientError # Use new utils path
 from podcast_outreach.utils.data_processor import parse_date as fallback_parse_date # Use new utils path
 from podcast_outreach.services.media.episode_handler import EpisodeHandlerService
+from podcast_outreach.utils.http_sessions import get_http_session
 
 # --- Configuration ---
 logging.basicConfig(level=logging.INFO,
@@ -300,27 +301,27 @@ async def main_episode_sync_orchestrator():
 
     media_fetcher_instance = MediaFetcher() # Create an instance of MediaFetcher
 
-    async with aiohttp.ClientSession() as http_session: # Create one session for all RSS fetches
-        media_to_sync = await media_queries.get_media_to_sync_episodes(interval_hours=DEFAULT_SYNC_INTERVAL_HOURS)
+    http_session = get_http_session("rss") # Shared pooled session for all RSS fetches
+    media_to_sync = await media_queries.get_media_to_sync_episodes(interval_hours=DEFAULT_SYNC_INTERVAL_HOURS)
+    
+    if not media_to_sync:
+        logger.info("No media items found requiring an episode sync at this time.")
+    else:
+        logger.info(f"Found {len(media_to_sync)} media items to process for episode sync.")
         
-        if not media_to_sync:
-            logger.info("No media items found requiring an episode sync at this time.")
-        else:
-            logger.info(f"Found {len(media_to_sync)} media items to process for episode sync.")
-            
-            tasks = [
-                media_fetcher_instance.sync_episodes_for_media(media_item, http_session, sync_semaphore)
-                for media_item in media_to_sync
-            ]
-            
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            for i, result in enumerate(results):
-                media_name = media_to_sync[i].get('name', f"Media ID {media_to_sync[i]['media_id']}")
-                if isinstance(result, Exception):
-                    logger.error(f"Error processing media '{media_name}': {result}", exc_info=result)
-                else:
-                    logger.debug(f"Successfully completed episode sync for media '{media_name}'.")
+        tasks = [
+            media_fetcher_instance.sync_episodes_for_media(media_item, http_session, sync_semaphore)
+            for media_item in media_to_sync
+        ]
+        
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        
+        for i, result in enumerate(results):
+            media_name = media_to_sync[i].get('name', f"Media ID {media_to_sync[i]['media_id']}")
+            if isinstance(result, Exception):
+                logger.error(f"Error processing media '{media_name}': {result}", exc_info=result)
+            else:
+                logger.debug(f"Successfully completed episode sync for media '{media_name}'.")
 
     await close_db_pool()
     logger.info("--- Smart Episode Sync Process Finished ---")
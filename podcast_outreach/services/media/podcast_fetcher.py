@@ -25,6 +25,7 @@ from podcast_outreach.integrations.podscan import PodscanAPIClient
 from podcast_outreach.utils.exceptions import APIClientError, RateLimitError
 from podcast_outreach.services.ai.utils import generate_genre_ids, generate_podscan_category_ids
 from podcast_outreach.utils.data_processor import parse_date
+from podcast_outreach.utils.http_sessions import get_http_session
 from podcast_outreach.services.media.episode_handler import EpisodeHandlerService # ENSURED IMPORT
 from podcast_outreach.services.events.event_bus import get_event_bus, Event, EventType
 
@@ -159,13 +160,13 @@ class MediaFetcher:
                 "Accept": "application/xml,text/xml,application/rss+xml"
             }
             
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.get(rss_url, headers=headers) as response:
-                    if response.status != 200:
-                        logger.debug(f"RSS email discovery failed for {rss_url}: HTTP {response.status}")
-                        return None
-                        
-                    content = await response.text()
+            session = get_http_session("rss")
+            async with session.get(rss_url, headers=headers, timeout=timeout) as response:
+                if response.status != 200:
+                    logger.debug(f"RSS email discovery failed for {rss_url}: HTTP {response.status}")
+                    return None
+                    
+                content = await response.text()
                     
             # Parse XML content
             soup = BeautifulSoup(content, 'xml')
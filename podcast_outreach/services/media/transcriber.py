@@ -33,6 +33,7 @@ from podcast_outreach.services.enrichment.quality_score import QualityService
 from podcast_outreach.database.models.media_models import EnrichedPodcastProfile
 from podcast_outreach.config import ORCHESTRATOR_CONFIG, FFMPEG_PATH, FFPROBE_PATH
 from podcast_outreach.utils.memory_monitor import check_memory_usage, memory_guard, cleanup_memory
+from podcast_outreach.utils.http_sessions import get_sync_session
 
 logger = logging.getLogger(__name__)
 
@@ -125,17 +126,18 @@ class MediaTranscriber:
         tmp_path = tmp_file.name
         tmp_file.close()
         
-        session = requests.Session()
-        session.headers.update({
+        # Shared pooled session: headers go per request so other "audio" users are unaffected
+        session = get_sync_session("audio")
+        headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        })
+        }
         
         download_successful = False
         needs_compression = False
         
         try:
             # Check file size BEFORE download
-            head_resp = session.head(url, allow_redirects=True, timeout=30)
+            head_resp = session.head(url, headers=headers, allow_redirects=True, timeout=30)
             logger.info(f"HEAD request status: {head_resp.status_code}, final URL: {head_resp.url}")
             
             # Check Content-Length if available
@@ -160,23 +162,24 @@ class MediaTranscriber:
                 logger.info(f"File size from HEAD: {file_size_mb:.1f} MB")
             
             # Download the file
-            response = session.get(url, allow_redirects=True, timeout=600, stream=True)
-            response.raise_for_status()
-            
-            logger.info(f"Download response status: {response.status_code}, content-type: {response.headers.get('content-type', 'unknown')}")
-            
-            # Download in chunks
-            total_size = int(response.headers.get('content-length', 0))
-            downloaded = 0
-            
-            with open(tmp_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
-                        downloaded += len(chunk)
-                        if total_size > 0 and downloaded % (5 * 1024 * 1024) == 0:  # Log every 5MB
-                            progress = (downloaded / total_size) * 100
-                            logger.debug(f"Download progress: {progress:.1f}% ({downloaded}/{total_size} bytes)")
+            # Closing the streamed response returns its connection to the shared pool
+            with session.get(url, headers=headers, allow_redirects=True, timeout=600, stream=True) as response:
+                response.raise_for_status()
+                
+                logger.info(f"Download response status: {response.status_code}, content-type: {response.headers.get('content-type', 'unknown')}")
+                
+                # Download in chunks
+                total_size = int(response.headers.get('content-length', 0))
+                downloaded = 0
+                
+                with open(tmp_path, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=8192):
+                        if chunk:
+                            f.write(chunk)
+                            downloaded += len(chunk)
+                            if total_size > 0 and downloaded % (5 * 1024 * 1024) == 0:  # Log every 5MB
+                                progress = (downloaded / total_size) * 100
+                                logger.debug(f"Download progress: {progress:.1f}% ({downloaded}/{total_size} bytes)")
             
             # Validate downloaded file
             if not os.path.exists(tmp_path) or os.path.getsize(tmp_path) < 1024:
@@ -203,8 +206,6 @@ class MediaTranscriber:
             return None
             
         finally:
-            session.close()
-            
             # CRITICAL FIX: Always clean up temp file if download wasn't successful
             if not download_successful and tmp_path and os.path.exists(tmp_path):
                 try:
@@ -17,9 +17,17 @@ from podcast_outreach.utils.data_processor import extract_document_id
 # LLM Service
 from podcast_outreach.services.ai.gemini_client import GeminiService
 from podcast_outreach.services.enrichment.social_scraper import SocialDiscoveryService
+from podcast_outreach.database.queries import media_kit_sections as media_kit_section_queries
+from podcast_outreach.services.media_kits.section_graph import Section, SectionGraph
 
 logger = get_logger(__name__)
 
+# Canned section outputs used when the LLM fails; never stored in the section cache
+FALLBACK_KEYWORDS = ["expert", "speaker", "thought-leader", "professional", "industry-expert"] * 4
+FALLBACK_TAGLINE = "Expert Podcast Guest"
+FALLBACK_LONG_BIO = "Professional bio coming soon."
+FALLBACK_TESTIMONIALS = "Experienced professional with proven expertise in their field."
+
 def generate_slug(text: str) -> str:
     """Generate URL-friendly slug from text."""
     # Convert to lowercase, replace spaces with hyphens, remove non-alphanumeric characters
@@ -143,11 +151,11 @@ Please respond with exactly 20 keywords separated by commas. Provide only the co
                 return keywords
             else:
                 logger.warning(f"Empty response from LLM for keywords generation for campaign {campaign_id}")
-                return ["expert", "speaker", "thought-leader", "professional", "industry-expert"] * 4  # Fallback
+                return list(FALLBACK_KEYWORDS)  # Fallback
 
         except Exception as e:
             logger.error(f"Error generating keywords for campaign {campaign_id}: {e}")
-            return ["expert", "speaker", "thought-leader", "professional", "industry-expert"] * 4  # Fallback
+            return list(FALLBACK_KEYWORDS)  # Fallback
 
     async def _generate_tagline(self, questionnaire_content: str, campaign_id: uuid.UUID) -> str:
         """Generate a compelling tagline using LLM."""
@@ -175,11 +183,11 @@ Please respond with just the tagline, no additional text, and no asterisks or ma
                 return tagline
             else:
                 logger.warning(f"Empty response from LLM for tagline generation for campaign {campaign_id}")
-                return "Expert Podcast Guest"
+                return FALLBACK_TAGLINE
 
         except Exception as e:
             logger.error(f"Error generating tagline for campaign {campaign_id}: {e}")
-            return "Expert Podcast Guest"
+            return FALLBACK_TAGLINE
 
     async def _generate_comprehensive_bio(self, questionnaire_content: str, campaign_id: uuid.UUID) -> Dict[str, str]:
         """Generate comprehensive bio sections using LLM."""
@@ -221,14 +229,14 @@ Ensure no other text, conversation, or markdown (like asterisks) is included bey
             else:
                 logger.warning(f"Empty response from LLM for bio generation for campaign {campaign_id}")
                 return {
-                    "long_bio": "Professional bio coming soon.",
+                    "long_bio": FALLBACK_LONG_BIO,
                     "short_bio": "Expert guest."
                 }
 
         except Exception as e:
             logger.error(f"Error generating bio for campaign {campaign_id}: {e}")
             return {
-                "long_bio": "Professional bio coming soon.",
+                "long_bio": FALLBACK_LONG_BIO,
                 "short_bio": "Expert guest."
             }
 
@@ -258,13 +266,13 @@ Ensure no other text, conversation, or markdown (like asterisks) is included bey
                     short_bio = response[:200] + "..." if len(response) > 200 else response.strip()
             
             return {
-                "long_bio": long_bio or "Professional bio coming soon.",
+                "long_bio": long_bio or FALLBACK_LONG_BIO,
                 "short_bio": short_bio or "Expert guest."
             }
         except Exception as e:
             logger.error(f"Error parsing bio response: {e}")
             return {
-                "long_bio": "Professional bio coming soon.",
+                "long_bio": FALLBACK_LONG_BIO,
                 "short_bio": "Expert guest."
             }
     
@@ -606,11 +614,11 @@ Provide *only* the final, professional social proof section content below, with
                 return testimonials_section
             else:
                 logger.warning(f"Empty response from LLM for testimonials generation for campaign {campaign_id}")
-                return "Experienced professional with proven expertise in their field."
+                return FALLBACK_TESTIMONIALS
 
         except Exception as e:
             logger.error(f"Error generating testimonials section for campaign {campaign_id}: {e}")
-            return "Experienced professional with proven expertise in their field."
+            return FALLBACK_TESTIMONIALS
 
     async def _format_contact_information(self, questionnaire_data: Dict[str, Any]) -> Dict[str, str]:
         """Format contact information for booking, looking into nested structures."""
@@ -715,10 +723,10 @@ Provide *only* the final, professional social proof section content below, with
             logger.error(f"Error generating key_achievements with LLM for campaign {campaign_id}: {e}")
             return []
 
-    async def _generate_short_bio_from_long(self, long_bio: str, campaign_id: uuid.UUID, target_words: int = 60) -> str:
-        """Generate a short bio summary from a long bio using LLM."""
+    async def _generate_short_bio_from_long(self, long_bio: str, campaign_id: uuid.UUID, target_words: int = 60) -> Optional[str]:
+        """Generate a short bio summary from a long bio using LLM. Returns None if nothing was generated."""
         if not long_bio.strip():
-            return "A professional in their field."
+            return None
         try:
             prompt = f"""
             Based on the following long professional bio, create a concise SHORT BIO (around {target_words} words) suitable for quick introductions or social media.
@@ -739,15 +747,15 @@ Provide *only* the final, professional social proof section content below, with
                 return short_bio
             else:
                 logger.warning(f"Empty response from LLM for short bio generation for campaign {campaign_id}")
-                return long_bio[:250] + "..." # Fallback to truncated long bio
+                return None
         except Exception as e:
             logger.error(f"Error generating short bio from long for campaign {campaign_id}: {e}")
-            return long_bio[:250] + "..." # Fallback
+            return None
     
-    async def _generate_summary_bio_from_long(self, long_bio: str, campaign_id: uuid.UUID) -> str:
-        """Generate a summary bio (2 paragraphs) from a long bio using LLM."""
+    async def _generate_summary_bio_from_long(self, long_bio: str, campaign_id: uuid.UUID) -> Optional[str]:
+        """Generate a summary bio (2 paragraphs) from a long bio using LLM. Returns None if nothing was generated."""
         if not long_bio.strip():
-            return "A professional with expertise in their field."
+            return None
         try:
             prompt = f"""
             Based on the following full professional bio, create a SUMMARY BIO (exactly 2 paragraphs) that highlights their expertise and authority.
@@ -769,14 +777,132 @@ Provide *only* the final, professional social proof section content below, with
                 return summary_bio
             else:
                 logger.warning(f"Empty response when generating summary bio for campaign {campaign_id}")
-                # Fallback: use first two paragraphs of long bio
-                paragraphs = long_bio.split('\n\n')
-                if len(paragraphs) >= 2:
-                    return '\n\n'.join(paragraphs[:2])
-                return long_bio
+                return None
         except Exception as e:
             logger.error(f"Error generating summary bio from long for campaign {campaign_id}: {e}")
-            return "A professional with expertise in their field."
+            return None
+
+    def _build_section_graph(
+        self,
+        campaign_id: uuid.UUID,
+        questionnaire_content: str,
+        questionnaire_responses: Dict[str, Any],
+        gdoc_bio_content: Optional[str],
+        introduction_source_content: str,
+        talking_points_content: str,
+    ) -> Dict[str, Section]:
+        """Declares every media kit section with the inputs it is generated from."""
+
+        async def bio(questionnaire_content: str, gdoc_bio_content: Optional[str]) -> Dict[str, str]:
+            # Bio sections: Prioritize GDoc bio, then LLM, then fallback
+            if gdoc_bio_content:
+                parsed_sections = self._parse_gdoc_bio_sections(gdoc_bio_content)
+                logger.info(f"Using parsed GDoc bio sections for campaign {campaign_id}")
+                return {
+                    "long_bio": parsed_sections.get("full_bio", ""),
+                    "summary_bio": parsed_sections.get("summary_bio", ""),
+                    "short_bio": parsed_sections.get("short_bio", "")
+                }
+            logger.info(f"GDoc bio not available or failed to fetch, generating bio with LLM for campaign {campaign_id}")
+            return await self._generate_comprehensive_bio(questionnaire_content, campaign_id)
+
+        # GDoc bios may lack the shorter variants; generate only what is missing.
+        # Output is {"text", "fallback"}; text cut from the long bio after an LLM failure is not cached.
+        async def short_bio(bio: Dict[str, str], gdoc_bio_content: Optional[str]) -> Optional[Dict[str, Any]]:
+            long_bio = bio.get("long_bio")
+            if not (gdoc_bio_content and long_bio and not bio.get("short_bio")):
+                return None
+            generated = await self._generate_short_bio_from_long(long_bio, campaign_id)
+            if generated is None:
+                return {"text": long_bio[:250] + "..." if len(long_bio) > 250 else long_bio, "fallback": True}
+            return {"text": generated, "fallback": False}
+
+        async def summary_bio(bio: Dict[str, str], gdoc_bio_content: Optional[str]) -> Optional[Dict[str, Any]]:
+            long_bio = bio.get("long_bio")
+            if not (gdoc_bio_content and long_bio and not bio.get("summary_bio")):
+                return None
+            generated = await self._generate_summary_bio_from_long(long_bio, campaign_id)
+            if generated is None:
+                # First two paragraphs of the long bio
+                return {"text": '\n\n'.join(long_bio.split('\n\n')[:2]), "fallback": True}
+            return {"text": generated, "fallback": False}
+
+        def generated_bio_cacheable(out: Optional[Dict[str, Any]]) -> bool:
+            return bool(out) and not out.get("fallback")
+
+        return {
+            "keywords": Section(
+                "keywords",
+                lambda questionnaire_content: self._generate_keywords(questionnaire_content, campaign_id),
+                inputs={"questionnaire_content": questionnaire_content},
+                cacheable=lambda out: bool(out) and out != FALLBACK_KEYWORDS,
+            ),
+            "tagline": Section(
+                "tagline",
+                lambda questionnaire_content: self._generate_tagline(questionnaire_content, campaign_id),
+                inputs={"questionnaire_content": questionnaire_content},
+                cacheable=lambda out: bool(out) and out != FALLBACK_TAGLINE,
+            ),
+            "bio": Section(
+                "bio",
+                bio,
+                inputs={"questionnaire_content": questionnaire_content, "gdoc_bio_content": gdoc_bio_content},
+                cacheable=lambda out: bool(out) and out.get("long_bio") != FALLBACK_LONG_BIO,
+            ),
+            "short_bio": Section(
+                "short_bio",
+                short_bio,
+                inputs={"gdoc_bio_content": gdoc_bio_content},
+                depends_on=("bio",),
+                cacheable=generated_bio_cacheable,
+            ),
+            "summary_bio": Section(
+                "summary_bio",
+                summary_bio,
+                inputs={"gdoc_bio_content": gdoc_bio_content},
+                depends_on=("bio",),
+                cacheable=generated_bio_cacheable,
+            ),
+            "introduction": Section(
+                "introduction",
+                lambda bio_content: self._generate_introduction(bio_content, campaign_id),
+                inputs={"bio_content": introduction_source_content},
+            ),
+            "key_achievements": Section(
+                "key_achievements",
+                lambda questionnaire_responses, bio_content: self._generate_key_achievements(questionnaire_responses, bio_content, campaign_id),
+                inputs={"questionnaire_responses": questionnaire_responses, "bio_content": introduction_source_content},
+            ),
+            "talking_points": Section(
+                "talking_points",
+                lambda content: self._generate_talking_points(content, campaign_id),
+                inputs={"content": talking_points_content},
+            ),
+            "sample_questions": Section(
+                "sample_questions",
+                lambda questionnaire_content: self._generate_sample_questions(questionnaire_content, campaign_id),
+                inputs={"questionnaire_content": questionnaire_content},
+            ),
+            # Pure formatting of questionnaire data; cheaper to recompute than to cache
+            "media_appearances": Section(
+                "media_appearances",
+                self._process_media_appearances,
+                inputs={"questionnaire_content": questionnaire_content, "questionnaire_data": questionnaire_responses},
+                cache=False,
+            ),
+            "testimonials": Section(
+                "testimonials",
+                lambda questionnaire_content, questionnaire_data: self._generate_testimonials_section(questionnaire_content, questionnaire_data, campaign_id),
+                inputs={"questionnaire_content": questionnaire_content, "questionnaire_data": questionnaire_responses},
+                cacheable=lambda out: bool(out) and out != FALLBACK_TESTIMONIALS,
+            ),
+            "contact": Section(
+                "contact",
+                self._format_contact_information,
+                inputs={"questionnaire_data": questionnaire_responses},
+                cache=False,
+            ),
+        }
 
     async def create_or_update_media_kit(
         self,
@@ -884,46 +1010,11 @@ Provide *only* the final, professional social proof section content below, with
                 except Exception as e_gdoc_bio:
                     logger.error(f"Error fetching GDoc bio content from {campaign_bio_gdoc_link}: {e_gdoc_bio}")
         
-        # Generate all sections using LLM or GDoc content
+        # Generate all sections using LLM or GDoc content. Each section declares its inputs, so
+        # independent sections run concurrently and unchanged ones are reused from the cache.
         try:
-            # Generate keywords (20 from questionnaire)
-            keywords = await self._generate_keywords(questionnaire_content, campaign_id)
-            
-            # Generate cover page elements
-            tagline = await self._generate_tagline(questionnaire_content, campaign_id)
-            
-            # Bio sections: Prioritize GDoc bio, then LLM, then fallback
-            if gdoc_bio_content_str:
-                # Parse GDoc bio content to extract individual bio sections
-                parsed_sections = self._parse_gdoc_bio_sections(gdoc_bio_content_str)
-                
-                # Map parsed sections to expected format
-                bio_sections = {
-                    "long_bio": parsed_sections.get("full_bio", ""), 
-                    "summary_bio": parsed_sections.get("summary_bio", ""),
-                    "short_bio": parsed_sections.get("short_bio", "")
-                }
-                
-                # Generate missing sections if needed
-                if bio_sections["long_bio"] and not bio_sections["short_bio"]:
-                    bio_sections["short_bio"] = await self._generate_short_bio_from_long(bio_sections["long_bio"], campaign_id)
-                
-                if bio_sections["long_bio"] and not bio_sections["summary_bio"]:
-                    # Summary bio is typically between full and short, so generate if missing
-                    bio_sections["summary_bio"] = await self._generate_summary_bio_from_long(bio_sections["long_bio"], campaign_id)
-                
-                logger.info(f"Using parsed GDoc bio sections for campaign {campaign_id}")
-            else:
-                logger.info(f"GDoc bio not available or failed to fetch, generating bio with LLM for campaign {campaign_id}")
-                bio_sections = await self._generate_comprehensive_bio(questionnaire_content, campaign_id)
-            
-            # Generate Introduction
             # Prioritize GDoc bio content if available for the introduction source
             introduction_source_content = gdoc_bio_content_str if gdoc_bio_content_str else questionnaire_content
-            introduction = await self._generate_introduction(introduction_source_content, campaign_id)
-
-            # Generate Key Achievements
-            key_achievements_list = await self._generate_key_achievements(questionnaire_responses, introduction_source_content, campaign_id)
 
             # Prepare focused content for talking points generation
             talking_points_input_parts = []
@@ -939,20 +1030,36 @@ Provide *only* the final, professional social proof section content below, with
             
             focused_content_for_talking_points = "\n".join(talking_points_input_parts) if talking_points_input_parts else questionnaire_content
 
-            # Generate talking points
-            talking_points = await self._generate_talking_points(focused_content_for_talking_points, campaign_id)
-            
-            # Generate sample questions
-            sample_questions = await self._generate_sample_questions(questionnaire_content, campaign_id)
-            
-            # Process media appearances
-            media_appearances = await self._process_media_appearances(questionnaire_content, questionnaire_responses)
-            
-            # Generate testimonials section
-            testimonials_section = await self._generate_testimonials_section(questionnaire_content, questionnaire_responses, campaign_id)
-            
-            # Format contact information
-            contact_details_processed = await self._format_contact_information(questionnaire_responses)
+            section_graph = SectionGraph(
+                self._build_section_graph(
+                    campaign_id,
+                    questionnaire_content,
+                    questionnaire_responses,
+                    gdoc_bio_content_str,
+                    introduction_source_content,
+                    focused_content_for_talking_points,
+                ),
+                stored=await media_kit_section_queries.get_section_cache(campaign_id),
+            )
+            sections = await section_graph.run()
+            await media_kit_section_queries.upsert_section_cache(campaign_id, section_graph.fresh_entries)
+
+            keywords = sections["keywords"]
+            tagline = sections["tagline"]
+
+            bio_sections = dict(sections["bio"])
+            if sections["short_bio"]:
+                bio_sections["short_bio"] = sections["short_bio"]["text"]
+            if sections["summary_bio"]:
+                bio_sections["summary_bio"] = sections["summary_bio"]["text"]
+
+            introduction = sections["introduction"]
+            key_achievements_list = sections["key_achievements"]
+            talking_points = sections["talking_points"]
+            sample_questions = sections["sample_questions"]
+            media_appearances = sections["media_appearances"]
+            testimonials_section = sections["testimonials"]
+            contact_details_processed = sections["contact"]
             person_social_links_raw = contact_details_processed.get("person_social_links", [])
             
             # Convert social links to proper schema format
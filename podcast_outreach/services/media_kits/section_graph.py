@@ -0,0 +1,110 @@
+# podcast_outreach/services/media_kits/section_graph.py
+"""
+Small dependency-graph runner for media kit sections.
+
+Each section declares the literal inputs it is generated from and the other
+sections it depends on. Independent sections run concurrently (LLM calls are
+already bounded by the shared limiter), and a section whose input hash matches
+a previously stored one reuses the stored output instead of regenerating.
+"""
+import asyncio
+import hashlib
+import json
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from podcast_outreach.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Bump when prompts or parsing change so stored outputs are regenerated
+SECTION_CACHE_VERSION = "v1"
+
+
+@dataclass
+class Section:
+    """One node of the graph. `run` is called with `inputs` plus each dependency's output as keyword arguments."""
+    name: str
+    run: Callable[..., Awaitable[Any]]
+    inputs: Dict[str, Any] = field(default_factory=dict)
+    depends_on: Tuple[str, ...] = ()
+    cache: bool = True
+    # Outputs for which this returns False (e.g. canned fallbacks after an LLM error) are not stored
+    cacheable: Callable[[Any], bool] = bool
+
+
+class SectionGraph:
+    def __init__(self, sections: Dict[str, Section], stored: Optional[Dict[str, Dict[str, Any]]] = None):
+        self.sections = sections
+        self.stored = stored or {}
+        self.fresh_entries: Dict[str, Dict[str, Any]] = {}
+        self.reused: list = []
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._check_acyclic()
+
+    def _check_acyclic(self) -> None:
+        visiting, done = set(), set()
+
+        def visit(name: str) -> None:
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"Cycle in media kit section graph at '{name}'")
+            if name not in self.sections:
+                raise ValueError(f"Unknown media kit section dependency '{name}'")
+            visiting.add(name)
+            for dep in self.sections[name].depends_on:
+                visit(dep)
+            visiting.discard(name)
+            done.add(name)
+
+        for name in self.sections:
+            visit(name)
+
+    @staticmethod
+    def input_hash(name: str, values: Dict[str, Any]) -> str:
+        payload = json.dumps(
+            {"section": name, "version": SECTION_CACHE_VERSION, "inputs": values},
+            sort_keys=True, default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def _run_section(self, name: str) -> Any:
+        section = self.sections[name]
+        dep_outputs = {}
+        for dep in section.depends_on:
+            dep_outputs[dep] = await self._task(dep)
+        kwargs = {**section.inputs, **dep_outputs}
+
+        digest = None
+        if section.cache:
+            digest = self.input_hash(name, kwargs)
+            stored = self.stored.get(name)
+            if stored and stored.get("hash") == digest:
+                self.reused.append(name)
+                return stored.get("output")
+
+        output = await section.run(**kwargs)
+        if digest is not None and section.cacheable(output):
+            self.fresh_entries[name] = {"hash": digest, "output": output}
+        return output
+
+    def _task(self, name: str) -> "asyncio.Task":
+        task = self._tasks.get(name)
+        if task is None:
+            task = asyncio.ensure_future(self._run_section(name))
+            self._tasks[name] = task
+        return task
+
+    async def run(self) -> Dict[str, Any]:
+        """Runs every section and returns {name: output}; the first failure is raised."""
+        names = list(self.sections)
+        try:
+            results = await asyncio.gather(*(self._task(name) for name in names))
+        except Exception:
+            for task in self._tasks.values():
+                task.cancel()
+            raise
+        if self.reused:
+            logger.info(f"Media kit sections reused from cache: {', '.join(sorted(self.reused))}")
+        return dict(zip(names, results))
@@ -9,6 +9,7 @@ from enum import Enum
 
 from podcast_outreach.services.tasks.manager import TaskManager
 from podcast_outreach.services.database_service import DatabaseService
+from podcast_outreach.database.connection import Workload, use_workload
 
 logger = logging.getLogger(__name__)
 
@@ -240,7 +241,8 @@ class TaskScheduler:
     async def _run_task(self, scheduled_task: ScheduledTask, current_time: datetime):
         """Run a scheduled task"""
         try:
-            await scheduled_task.task_function()
+            with use_workload(Workload.PIPELINE):
+                await scheduled_task.task_function()
             scheduled_task.last_run = current_time
         except Exception as e:
             logger.error(f"Error running scheduled task {scheduled_task.name}: {e}", exc_info=True)
@@ -66,6 +66,54 @@ class StorageService:
             logger.error(f"Unexpected error generating presigned URL for {object_key}: {e}", exc_info=True)
             return None
 
+    def upload_file(self, local_path: str, object_key: str, content_type: Optional[str] = None) -> bool:
+        """
+        Uploads a local file to S3. Large files go up as a multipart upload streamed from
+        disk, so memory use does not depend on file size. Blocking; call via asyncio.to_thread.
+        """
+        if not self.s3_client:
+            logger.error("S3 client not configured. Cannot upload file.")
+            return False
+
+        try:
+            extra_args = {'ContentType': content_type} if content_type else None
+            self.s3_client.upload_file(local_path, self.bucket_name, object_key, ExtraArgs=extra_args)
+            return True
+        except ClientError as e:
+            logger.error(f"Boto3 ClientError uploading {object_key}: {e.response['Error']['Code']} - {e.response['Error']['Message']}", exc_info=True)
+            return False
+        except Exception as e:
+            logger.error(f"Unexpected error uploading {object_key}: {e}", exc_info=True)
+            return False
+
+    def generate_presigned_download_url(self, object_key: str, expiration: int = 3600, filename: Optional[str] = None) -> Optional[str]:
+        """
+        Generate a presigned URL to download a private S3 object.
+
+        Args:
+            object_key: The key (path/filename) for the object in S3.
+            expiration: Time in seconds for the presigned URL to remain valid.
+            filename: Optional download filename (Content-Disposition).
+
+        Returns:
+            The presigned URL as a string, or None if an error occurred.
+        """
+        if not self.s3_client:
+            logger.error("S3 client not configured. Cannot generate presigned URL.")
+            return None
+
+        params = {'Bucket': self.bucket_name, 'Key': object_key}
+        if filename:
+            params['ResponseContentDisposition'] = f'attachment; filename="{filename}"'
+        try:
+            return self.s3_client.generate_presigned_url('get_object', Params=params, ExpiresIn=expiration)
+        except ClientError as e:
+            logger.error(f"Boto3 ClientError generating presigned download URL for {object_key}: {e.response['Error']['Code']} - {e.response['Error']['Message']}", exc_info=True)
+            return None
+        except Exception as e:
+            logger.error(f"Unexpected error generating presigned download URL for {object_key}: {e}", exc_info=True)
+            return None
+
     def get_object_url(self, object_key: str) -> str:
         """
         Constructs the public-access URL for an object in S3.
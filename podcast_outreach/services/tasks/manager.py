@@ -10,8 +10,9 @@ import asyncio
 from concurrent.futures import ThreadPoolExecutor
 
 # Database and service imports
-from podcast_outreach.database.connection import get_background_task_pool, close_background_task_pool
+from podcast_outreach.database.connection import get_background_task_pool, close_background_task_pool, Workload, use_workload
 from podcast_outreach.services.database_service import DatabaseService
+from podcast_outreach.utils.http_sessions import close_http_sessions, is_primary_loop
 
 # Business logic imports
 from podcast_outreach.services.business_logic.campaign_processing import (
@@ -35,6 +36,7 @@ from podcast_outreach.services.business_logic.pitch_processing import (
     generate_pitches as generate_pitches_logic,
     send_pitches as send_pitches_logic
 )
+from podcast_outreach.services.data_export_service import run_data_export as run_data_export_logic
 
 logger = logging.getLogger(__name__)
 
@@ -89,13 +91,18 @@ class TaskManager:
                 await self.initialize()
             
             logger.info(f"Starting background task: {task_func.__name__}")
-            result = await task_func(self.db_service, *args, **kwargs)
+            with use_workload(Workload.PIPELINE):
+                result = await task_func(self.db_service, *args, **kwargs)
             logger.info(f"Background task completed: {task_func.__name__}")
             return result
                 
         except Exception as e:
             logger.error(f"Error in business logic task {task_func.__name__}: {e}", exc_info=True)
             return False
+        finally:
+            # Tasks that fell back to asyncio.run own a throwaway loop; release its HTTP sessions
+            if not is_primary_loop():
+                await close_http_sessions()
     
     
     def run_angles_bio_generation(self, task_id: str, campaign_id_str: str):
@@ -399,6 +406,23 @@ class TaskManager:
             logger.warning("No event loop running for ai_description_completion")
             return self._executor.submit(asyncio.run, _cleanup_wrapper())
     
+    def run_data_export(self, task_id: str, export_id: uuid.UUID):
+        """Run a GDPR data export job (streams to a ZIP artifact; see data_export_service)"""
+        async def _cleanup_wrapper():
+            try:
+                with use_workload(Workload.BULK):
+                    await _run_async_background_task(run_data_export_logic(export_id, self.get_stop_flag(task_id)))
+            finally:
+                self.cleanup_task(task_id)
+        
+        try:
+            loop = asyncio.get_event_loop()
+            task = loop.create_task(_cleanup_wrapper())
+            return task
+        except RuntimeError:
+            logger.warning("No event loop running for data_export")
+            return self._executor.submit(asyncio.run, _cleanup_wrapper())
+    
     def start_task(self, task_id: str, action: str) -> None:
         with self._lock:
             self.tasks[task_id] = {
@@ -0,0 +1,168 @@
+# podcast_outreach/utils/http_sessions.py
+
+"""
+Registry of long-lived, pooled HTTP sessions for outbound integrations.
+
+Opening a ClientSession per request throws away the connection pool, so every
+call pays for DNS, TCP and TLS again. Call sites instead borrow a shared
+session per upstream from this registry and must not close it themselves.
+
+aiohttp sessions are bound to the event loop that created them, and background
+tasks may run on their own loops (TaskManager falls back to asyncio.run in a
+thread), so async sessions are kept per loop. The API lifespan and the worker
+startup warm the sessions on their loop and close them on shutdown; short-lived
+loops close theirs with close_http_sessions() before exiting.
+
+Synchronous clients (requests) share one pooled requests.Session per upstream.
+"""
+
+import os
+import asyncio
+import threading
+import weakref
+from typing import Dict, Optional
+
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
+
+from podcast_outreach.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+HTTP_POOL_LIMIT = int(os.getenv("HTTP_POOL_LIMIT", "100"))
+HTTP_POOL_LIMIT_PER_HOST = int(os.getenv("HTTP_POOL_LIMIT_PER_HOST", "10"))
+HTTP_DNS_CACHE_TTL_SECONDS = int(os.getenv("HTTP_DNS_CACHE_TTL_SECONDS", "300"))
+HTTP_KEEPALIVE_TIMEOUT_SECONDS = float(os.getenv("HTTP_KEEPALIVE_TIMEOUT_SECONDS", "30"))
+HTTP_DEFAULT_TIMEOUT_SECONDS = float(os.getenv("HTTP_DEFAULT_TIMEOUT_SECONDS", "30"))
+
+# Per-upstream overrides: (total timeout seconds, connections per host).
+# Upstreams not listed here use the defaults above.
+UPSTREAM_SETTINGS: Dict[str, Dict[str, float]] = {
+    "booking_assistant": {"timeout": 30, "limit_per_host": 10},
+    # RSS feeds and audio files are spread over many hosts; keep requests short.
+    "rss": {"timeout": 15, "limit_per_host": 4},
+    "audio": {"timeout": 30, "limit_per_host": 4},
+    "attio": {"timeout": 10, "limit_per_host": 10},
+    # Nylas email sends (sync client) and OAuth token exchange / grant revoke (async).
+    "nylas": {"timeout": 20, "limit_per_host": 10},
+    # Docs/Drive/Sheets (integrations/google_workspace.py); uploads and batches are larger requests.
+    "google": {"timeout": 60, "limit_per_host": 10},
+}
+
+DEFAULT_UPSTREAM = "default"
+
+
+def _settings(upstream: str) -> Dict[str, float]:
+    settings = UPSTREAM_SETTINGS.get(upstream, {})
+    return {
+        "timeout": settings.get("timeout", HTTP_DEFAULT_TIMEOUT_SECONDS),
+        "limit_per_host": int(settings.get("limit_per_host", HTTP_POOL_LIMIT_PER_HOST)),
+    }
+
+
+# --- Async (aiohttp) sessions, one set per event loop ---
+_async_sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, aiohttp.ClientSession]]" = weakref.WeakKeyDictionary()
+_primary_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _new_async_session(upstream: str) -> aiohttp.ClientSession:
+    settings = _settings(upstream)
+    connector = aiohttp.TCPConnector(
+        limit=HTTP_POOL_LIMIT,
+        limit_per_host=settings["limit_per_host"],
+        ttl_dns_cache=HTTP_DNS_CACHE_TTL_SECONDS,
+        keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT_SECONDS,
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(total=settings["timeout"]),
+    )
+
+
+def get_http_session(upstream: str = DEFAULT_UPSTREAM) -> aiohttp.ClientSession:
+    """
+    Returns the shared aiohttp session for `upstream` on the running loop.
+    Callers use it directly (`async with session.get(...)`) and never close it.
+    """
+    loop = asyncio.get_running_loop()
+    sessions = _async_sessions.get(loop)
+    if sessions is None:
+        sessions = {}
+        _async_sessions[loop] = sessions
+    session = sessions.get(upstream)
+    if session is None or session.closed:
+        session = _new_async_session(upstream)
+        sessions[upstream] = session
+    return session
+
+
+async def init_http_sessions(*upstreams: str) -> None:
+    """Marks the running loop as long-lived and warms sessions for the given upstreams."""
+    global _primary_loop
+    if _primary_loop is None:
+        _primary_loop = asyncio.get_running_loop()
+    for upstream in upstreams or (DEFAULT_UPSTREAM,):
+        get_http_session(upstream)
+    logger.info(f"HTTP session registry ready (upstreams: {', '.join(upstreams or (DEFAULT_UPSTREAM,))}).")
+
+
+def is_primary_loop() -> bool:
+    """True when running on the loop that owns the long-lived sessions."""
+    try:
+        return asyncio.get_running_loop() is _primary_loop
+    except RuntimeError:
+        return False
+
+
+async def close_http_sessions() -> None:
+    """Closes the async sessions owned by the running loop."""
+    global _primary_loop
+    loop = asyncio.get_running_loop()
+    sessions = _async_sessions.pop(loop, None) or {}
+    for upstream, session in sessions.items():
+        if not session.closed:
+            try:
+                await session.close()
+            except Exception as e:
+                logger.warning(f"Error closing HTTP session for '{upstream}': {e}")
+    if loop is _primary_loop:
+        _primary_loop = None
+        close_sync_sessions()
+
+
+# --- Sync (requests) sessions, shared across threads ---
+_sync_sessions: Dict[str, requests.Session] = {}
+_sync_lock = threading.Lock()
+
+
+def get_sync_session(upstream: str = DEFAULT_UPSTREAM) -> requests.Session:
+    """Returns the shared, pooled requests.Session for `upstream`."""
+    session = _sync_sessions.get(upstream)
+    if session is not None:
+        return session
+    with _sync_lock:
+        session = _sync_sessions.get(upstream)
+        if session is None:
+            settings = _settings(upstream)
+            adapter = HTTPAdapter(
+                pool_connections=settings["limit_per_host"],
+                pool_maxsize=settings["limit_per_host"],
+            )
+            session = requests.Session()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _sync_sessions[upstream] = session
+        return session
+
+
+def get_upstream_timeout(upstream: str = DEFAULT_UPSTREAM) -> float:
+    """Uniform per-upstream timeout, for sync clients that pass it per request."""
+    return _settings(upstream)["timeout"]
+
+
+def close_sync_sessions() -> None:
+    with _sync_lock:
+        for session in _sync_sessions.values():
+            session.close()
+        _sync_sessions.clear()